@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwsystem/benchmarks/batch_serialization_benchmarks.py
+
+Batch serialization benchmark: writes and reads many small files per format
+through batch_save()/batch_load() with the serial, thread and process
+executors. Thread pools help formats whose parsers run in C or wait on I/O;
+CPU-heavy pure-Python decoders (YAML, XML) only scale with processes.
+Speedups are relative to the serial executor.
+
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from exonware.xwsystem.io.serialization import (
+    JsonSerializer,
+    TomlSerializer,
+    XmlSerializer,
+    YamlSerializer,
+)
+
+FORMATS = {
+    'json': (JsonSerializer, ".json"),
+    'yaml': (YamlSerializer, ".yaml"),
+    'xml': (XmlSerializer, ".xml"),
+    'toml': (TomlSerializer, ".toml"),
+}
+
+EXECUTORS = ("serial", "thread", "process")
+
+
+def make_document(i: int) -> Dict:
+    """A small config-like document."""
+    return {
+        "service": {"name": f"service-{i}", "port": 8000 + i % 1000, "enabled": i % 2 == 0},
+        "owners": {f"owner{j}": f"team-{j}@example.com" for j in range(5)},
+        "limits": {f"limit{j}": j * 10 for j in range(20)},
+    }
+
+
+def benchmark_format(format_name: str, num_files: int, workers: Optional[int],
+                     chunksize: Optional[int]) -> Dict[str, Dict[str, float]]:
+    """
+    Save and load num_files files of one format with every executor.
+    
+    Returns:
+        {executor: {'save': seconds, 'load': seconds}}
+    """
+    serializer_class, extension = FORMATS[format_name]
+    serializer = serializer_class()
+    results = {}
+    
+    for executor in EXECUTORS:
+        directory = Path(tempfile.mkdtemp(prefix=f"xw-batch-{format_name}-"))
+        try:
+            documents = {str(directory / f"doc{i:06d}{extension}"): make_document(i) for i in range(num_files)}
+            
+            start = time.perf_counter()
+            saved = serializer.batch_save(documents, executor=executor, max_workers=workers, chunksize=chunksize)
+            save_time = time.perf_counter() - start
+            
+            start = time.perf_counter()
+            loaded = serializer.batch_load(list(documents), executor=executor, max_workers=workers,
+                                           chunksize=chunksize)
+            load_time = time.perf_counter() - start
+            
+            failed = sum(not ok for ok in saved.values()) + sum(value is None for value in loaded.values())
+            results[executor] = {'save': save_time, 'load': load_time, 'failed': failed}
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+    return results
+
+
+def main():
+    """Compare serial, thread and process batch operations across formats."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=2_000)
+    parser.add_argument("--formats", nargs="*", default=list(FORMATS), choices=list(FORMATS))
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunksize", type=int, default=None)
+    args = parser.parse_args()
+    
+    print("=" * 80)
+    print("BATCH SERIALIZATION BENCHMARK")
+    print("=" * 80)
+    print(f"Files per format: {args.files:,}  CPUs: {os.cpu_count()}  "
+          f"Workers: {args.workers or 'default'}  Chunksize: {args.chunksize or 'auto'}")
+    
+    all_results = {}
+    print(f"\n{'format':<8} {'executor':<10} {'save':>10} {'load':>10} {'files/s':>10} {'speedup':>8}")
+    for format_name in args.formats:
+        results = benchmark_format(format_name, args.files, args.workers, args.chunksize)
+        all_results[format_name] = results
+        serial_total = results['serial']['save'] + results['serial']['load']
+        for executor, metrics in results.items():
+            total = metrics['save'] + metrics['load']
+            note = f"  ({metrics['failed']} failed)" if metrics['failed'] else ""
+            print(f"{format_name:<8} {executor:<10} {metrics['save']:>9.3f}s {metrics['load']:>9.3f}s "
+                  f"{2 * args.files / total:>10,.0f} {serial_total / total:>7.1f}x{note}")
+    return all_results
+
+
+if __name__ == "__main__":
+    main()
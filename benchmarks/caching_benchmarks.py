@@ -28,7 +28,8 @@ sys.path.insert(0, str(src_path))
 from exonware.xwsystem.caching import (
     LRUCache, AsyncLRUCache,
     LFUCache, AsyncLFUCache,
-    TTLCache, AsyncTTLCache
+    TTLCache, AsyncTTLCache,
+    ShardedLRUCache,
 )
 
 
@@ -323,6 +324,69 @@ class CacheBenchmark:
         )
         self.results.append(result)
     
+    def benchmark_sharded_contention(self, num_threads: int = 32,
+                                     operations_per_thread: int = 2000,
+                                     shard_counts: tuple = (1, 4, 16, 64)):
+        """
+        Benchmark lock contention: single-lock LRU vs sharded LRU.
+        
+        Read-heavy mix (90% get / 10% put) over a shared key space, which is
+        the pattern of request workers hitting a hot cache.
+        """
+        print("\n=== Benchmarking Sharded Cache Contention ===")
+        
+        key_space = 1000
+        
+        def run(cache) -> float:
+            for i in range(key_space):
+                cache.put(f"key_{i}", f"value_{i}")
+            
+            barrier = threading.Barrier(num_threads + 1)
+            
+            def worker(thread_id: int):
+                get = cache.get
+                put = cache.put
+                barrier.wait()
+                for i in range(operations_per_thread):
+                    key = f"key_{(thread_id * 7919 + i) % key_space}"
+                    if i % 10 == 0:
+                        put(key, i)
+                    else:
+                        get(key)
+            
+            threads = [threading.Thread(target=worker, args=(t,)) for t in range(num_threads)]
+            for thread in threads:
+                thread.start()
+            start = time.perf_counter()
+            barrier.wait()
+            for thread in threads:
+                thread.join()
+            return time.perf_counter() - start
+        
+        total_ops = num_threads * operations_per_thread
+        candidates = [("LRU_CONTENTION_SINGLE_LOCK", LRUCache(capacity=key_space * 2))]
+        for shard_count in shard_counts:
+            candidates.append((
+                f"LRU_CONTENTION_SHARDS_{shard_count}",
+                ShardedLRUCache(capacity=key_space * 2, shard_count=shard_count),
+            ))
+        
+        for name, cache in candidates:
+            duration = run(cache)
+            ops_per_sec = total_ops / duration if duration > 0 else 0
+            print(f"{name}: {num_threads} threads, {ops_per_sec:,.2f} ops/sec, "
+                  f"{duration:.3f}s total")
+            self.results.append(BenchmarkResult(
+                name=name,
+                operations_per_second=ops_per_sec,
+                latency_p50_ms=0,
+                latency_p95_ms=0,
+                latency_p99_ms=0,
+                memory_bytes=0,
+                duration_seconds=duration,
+                success=True
+            ))
+    
     def benchmark_async_cache(self):
         """Benchmark async cache operations."""
         print("\n=== Benchmarking Async Cache ===")
@@ -378,6 +442,7 @@ class CacheBenchmark:
         self.benchmark_lfu_cache()
         self.benchmark_ttl_cache()
         self.benchmark_concurrent_access()
+        self.benchmark_sharded_contention()
         self.benchmark_async_cache()
         
         print("\n" + "=" * 80)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwsystem/benchmarks/disk_cache_benchmarks.py
+
+Large-scale DiskCache benchmark: set/get throughput and latency at up to
+1M entries, plus on-disk footprint (file count and bytes).
+
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from exonware.xwsystem.caching.disk_cache import DiskCache
+
+
+def _percentiles(samples_ns: List[int]) -> Dict[str, float]:
+    """p50/p99 in microseconds from sampled latencies."""
+    if not samples_ns:
+        return {'p50_us': 0.0, 'p99_us': 0.0}
+    ordered = sorted(samples_ns)
+    return {
+        'p50_us': statistics.median(ordered) / 1000,
+        'p99_us': ordered[int(len(ordered) * 0.99) - 1] / 1000,
+    }
+
+
+def benchmark_disk_cache(num_entries: int = 1_000_000, value_size: int = 100,
+                         num_gets: int = 200_000, sample_every: int = 100) -> Dict[str, float]:
+    """
+    Fill a DiskCache with num_entries keys, then read random keys.
+
+    Args:
+        num_entries: Number of keys written (also the cache max_size)
+        value_size: Bytes per value
+        num_gets: Random reads after the fill
+        sample_every: Record latency for every Nth operation
+
+    Returns:
+        Dictionary of throughput/latency/footprint metrics
+    """
+    print("=" * 80)
+    print("DISK CACHE BENCHMARK")
+    print("=" * 80)
+    print(f"Entries: {num_entries:,}  Value size: {value_size} B  Random gets: {num_gets:,}")
+
+    payload = b"x" * value_size
+    rng = random.Random(42)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with DiskCache(cache_dir=tmp_dir, max_size=num_entries, cleanup_interval=10**9) as cache:
+            set_samples: List[int] = []
+            start = time.perf_counter()
+            for i in range(num_entries):
+                if i % sample_every:
+                    cache.set(f"key_{i}", payload)
+                else:
+                    t0 = time.perf_counter_ns()
+                    cache.set(f"key_{i}", payload)
+                    set_samples.append(time.perf_counter_ns() - t0)
+                if i and i % 100_000 == 0:
+                    print(f"  ... {i:,} entries written")
+            set_seconds = time.perf_counter() - start
+
+            get_samples: List[int] = []
+            hits = 0
+            start = time.perf_counter()
+            for i in range(num_gets):
+                key = f"key_{rng.randrange(num_entries)}"
+                if i % sample_every:
+                    value = cache.get(key)
+                else:
+                    t0 = time.perf_counter_ns()
+                    value = cache.get(key)
+                    get_samples.append(time.perf_counter_ns() - t0)
+                hits += value is not None
+            get_seconds = time.perf_counter() - start
+
+            stats = cache.get_stats()
+
+        files = [p for p in Path(tmp_dir).rglob("*") if p.is_file()]
+        disk_bytes = sum(p.stat().st_size for p in files)
+
+    set_pct = _percentiles(set_samples)
+    get_pct = _percentiles(get_samples)
+    results = {
+        'set_ops_per_sec': num_entries / set_seconds,
+        'set_p50_us': set_pct['p50_us'],
+        'set_p99_us': set_pct['p99_us'],
+        'get_ops_per_sec': num_gets / get_seconds,
+        'get_p50_us': get_pct['p50_us'],
+        'get_p99_us': get_pct['p99_us'],
+        'hit_rate': hits / num_gets if num_gets else 0.0,
+        'files_on_disk': len(files),
+        'disk_mb': disk_bytes / (1024 * 1024),
+        'segments': stats['segments'],
+    }
+
+    print(f"\nset: {results['set_ops_per_sec']:,.0f} ops/sec  "
+          f"p50 {results['set_p50_us']:.1f} us  p99 {results['set_p99_us']:.1f} us")
+    print(f"get: {results['get_ops_per_sec']:,.0f} ops/sec  "
+          f"p50 {results['get_p50_us']:.1f} us  p99 {results['get_p99_us']:.1f} us  "
+          f"hit rate {results['hit_rate'] * 100:.1f}%")
+    print(f"disk: {results['files_on_disk']:,} files, {results['disk_mb']:.1f} MB, "
+          f"{results['segments']} segments")
+    print("=" * 80)
+    return results
+
+
+def main():
+    """Run the disk cache benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=1_000_000)
+    parser.add_argument("--value-size", type=int, default=100)
+    parser.add_argument("--gets", type=int, default=200_000)
+    args = parser.parse_args()
+    return benchmark_disk_cache(args.entries, args.value_size, args.gets)
+
+
+if __name__ == "__main__":
+    main()
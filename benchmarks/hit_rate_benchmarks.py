@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwsystem/benchmarks/hit_rate_benchmarks.py
+
+Trace-replay hit-rate benchmarks for cache eviction/admission policies.
+Replays synthetic key streams through each cache (get, then put on miss)
+and reports hit rate, which is what actually drives backend load.
+
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from exonware.xwsystem.caching import (
+    LRUCache,
+    OptimizedLFUCache,
+    TTLCache,
+    TinyLFUCache,
+)
+
+
+def zipf_trace(num_requests: int, num_keys: int, skew: float = 0.9, seed: int = 42) -> List[int]:
+    """
+    Generate a Zipfian key stream (few hot keys, long cold tail).
+
+    Args:
+        num_requests: Length of the trace
+        num_keys: Size of the key universe
+        skew: Zipf exponent (higher = more skewed)
+        seed: Random seed for reproducibility
+    """
+    rng = random.Random(seed)
+    weights = [1.0 / (rank + 1) ** skew for rank in range(num_keys)]
+    return rng.choices(range(num_keys), weights=weights, k=num_requests)
+
+
+def scan_mixed_trace(num_requests: int, num_keys: int, scan_every: int = 10000,
+                     scan_length: int = 5000, skew: float = 0.9, seed: int = 42) -> List[int]:
+    """
+    Generate a Zipfian stream interrupted by sequential scans of cold keys.
+
+    Models a batch job iterating a table while the request path keeps
+    hitting its hot working set. Scan keys are never repeated.
+    """
+    base = zipf_trace(num_requests, num_keys, skew=skew, seed=seed)
+    trace: List[int] = []
+    next_cold = num_keys
+    for i, key in enumerate(base):
+        if i and i % scan_every == 0:
+            trace.extend(range(next_cold, next_cold + scan_length))
+            next_cold += scan_length
+        trace.append(key)
+    return trace
+
+
+def loop_trace(num_requests: int, loop_size: int) -> List[int]:
+    """Generate a cyclic access pattern slightly larger than the cache (LRU worst case)."""
+    return [i % loop_size for i in range(num_requests)]
+
+
+def replay(cache, trace: List[int]) -> Dict[str, float]:
+    """
+    Replay a trace through a cache using get-then-put-on-miss.
+
+    Returns:
+        Dictionary with hit_rate and ns_per_request
+    """
+    hits = 0
+    get = cache.get
+    put = cache.put
+    start = time.perf_counter()
+    for key in trace:
+        if get(key) is None:
+            put(key, key)
+        else:
+            hits += 1
+    elapsed = time.perf_counter() - start
+    return {
+        'hit_rate': hits / len(trace) if trace else 0.0,
+        'ns_per_request': elapsed / len(trace) * 1e9 if trace else 0.0,
+    }
+
+
+def cache_factories(capacity: int) -> Dict[str, Callable[[], object]]:
+    """Cache constructors under comparison, all at the same capacity."""
+    return {
+        'LRU': lambda: LRUCache(capacity=capacity),
+        'LFU': lambda: OptimizedLFUCache(capacity=capacity),
+        'TTL': lambda: TTLCache(capacity=capacity, ttl=3600.0, cleanup_interval=0),
+        'TinyLFU': lambda: TinyLFUCache(capacity=capacity),
+    }
+
+
+def run_hit_rate_benchmarks(capacity: int = 1000, num_requests: int = 200000,
+                            num_keys: int = 100000) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    Run every cache against every trace.
+
+    Returns:
+        Nested dictionary: trace name -> cache name -> metrics
+    """
+    traces = {
+        'zipf_0.9': zipf_trace(num_requests, num_keys, skew=0.9),
+        'zipf_1.1': zipf_trace(num_requests, num_keys, skew=1.1),
+        'scan_mixed': scan_mixed_trace(num_requests, num_keys),
+        'loop': loop_trace(num_requests, int(capacity * 1.2)),
+    }
+
+    print("=" * 80)
+    print("CACHE HIT-RATE BENCHMARKS (trace replay)")
+    print("=" * 80)
+    print(f"Capacity: {capacity:,}  Requests/trace: {num_requests:,}  Key universe: {num_keys:,}")
+
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for trace_name, trace in traces.items():
+        print(f"\n=== Trace: {trace_name} ({len(trace):,} requests) ===")
+        results[trace_name] = {}
+        for cache_name, factory in cache_factories(capacity).items():
+            cache = factory()
+            metrics = replay(cache, trace)
+            results[trace_name][cache_name] = metrics
+            print(f"{cache_name:10s}: hit rate {metrics['hit_rate'] * 100:6.2f}%  "
+                  f"({metrics['ns_per_request']:,.0f} ns/request)")
+            shutdown = getattr(cache, 'shutdown', None)
+            if shutdown is not None:
+                shutdown()
+
+    print("\n" + "=" * 80)
+    return results
+
+
+def main():
+    """Run hit-rate benchmarks."""
+    return run_hit_rate_benchmarks()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwsystem/benchmarks/json_backend_benchmarks.py
+
+JSON backend benchmark matrix: every installed backend (msgspec, orjson,
+ujson, stdlib json) x payload shape x operation (encode, encode with
+indent=2, decode), measured through the JsonBackend interface so option
+normalization and fallback costs are included. Speedups are relative to
+the stdlib backend.
+
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from exonware.xwsystem.io.serialization.utils.json_backend import (
+    AVAILABLE_JSON_BACKENDS,
+    get_json_backend,
+)
+
+
+def build_payloads(records: int) -> Dict[str, Any]:
+    """Payload shapes: small config, API records, deep tree, text-heavy log."""
+    def tree(depth: int) -> Any:
+        return {"leaf": depth} if depth == 0 else {"l": tree(depth - 1), "r": [depth, tree(depth - 1)]}
+    
+    return {
+        'small': {"host": "localhost", "port": 8080, "debug": False, "tags": ["a", "b"]},
+        'records': [
+            {"id": i, "name": f"user{i}", "email": f"user{i}@example.com", "score": i * 0.5,
+             "active": i % 2 == 0, "roles": ["reader", "writer"], "meta": {"created": "2026-10-17"}}
+            for i in range(records)
+        ],
+        'deep': tree(12),
+        'text': [{"level": "INFO", "message": "Ünïcödé log line " * 20, "line": i} for i in range(records // 10)],
+    }
+
+
+def time_op(func: Callable[[], Any], min_time: float) -> float:
+    """Best seconds per call over repeated runs lasting at least min_time."""
+    func()
+    calls, start = 0, time.perf_counter()
+    best = float('inf')
+    while True:
+        t0 = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - t0)
+        calls += 1
+        if time.perf_counter() - start >= min_time and calls >= 3:
+            return best
+
+
+def benchmark_matrix(payloads: Dict[str, Any], backends: list, min_time: float) -> Dict[tuple, float]:
+    """Time every (backend, payload, operation) combination."""
+    results = {}
+    for name in backends:
+        backend = get_json_backend(name)
+        for payload_name, payload in payloads.items():
+            encoded = backend.dumps_bytes(payload)
+            ops = {
+                'encode': lambda: backend.dumps(payload),
+                'encode-indent': lambda: backend.dumps(payload, indent=2),
+                'decode': lambda: backend.loads(encoded),
+            }
+            for op, func in ops.items():
+                results[(name, payload_name, op)] = time_op(func, min_time)
+    return results
+
+
+def main():
+    """Print the backend x payload x operation matrix."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=10_000)
+    parser.add_argument("--min-time", type=float, default=0.5, help="seconds per measurement")
+    parser.add_argument("--backends", nargs="*", default=list(AVAILABLE_JSON_BACKENDS))
+    args = parser.parse_args()
+    
+    payloads = build_payloads(args.records)
+    
+    print("=" * 80)
+    print("JSON BACKEND BENCHMARK")
+    print("=" * 80)
+    print(f"Installed: {', '.join(AVAILABLE_JSON_BACKENDS)}  (auto -> {get_json_backend('auto').name})")
+    print(f"Records: {args.records:,}")
+    
+    results = benchmark_matrix(payloads, args.backends, args.min_time)
+    
+    print(f"\n{'payload':<10} {'operation':<14} " + " ".join(f"{name:>18}" for name in args.backends))
+    for payload_name in payloads:
+        for op in ('encode', 'encode-indent', 'decode'):
+            baseline = results.get(('json', payload_name, op))
+            cells = []
+            for name in args.backends:
+                seconds = results[(name, payload_name, op)]
+                speedup = f" ({baseline / seconds:4.1f}x)" if baseline and name != 'json' else ""
+                cells.append(f"{seconds * 1e6:>9.1f}us{speedup}".rjust(18))
+            print(f"{payload_name:<10} {op:<14} " + " ".join(cells))
+    return results
+
+
+if __name__ == "__main__":
+    main()
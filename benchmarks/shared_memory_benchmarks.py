@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwsystem/benchmarks/shared_memory_benchmarks.py
+
+Multi-process cache benchmark: N worker processes read a skewed key set and
+compute + store on a miss, using either a private LRUCache per process or one
+SharedMemoryCache for all of them. Reports throughput, hit rate, number of
+expensive computations and cache memory.
+
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+"""
+
+import argparse
+import multiprocessing
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from exonware.xwsystem.caching.lru_cache import LRUCache
+from exonware.xwsystem.caching.shared_memory_cache import SharedMemoryCache
+
+
+def _compute(key: int, value_size: int) -> bytes:
+    """Stand-in for an expensive computation (the thing a cache saves)."""
+    time.sleep(0.0001)
+    return key.to_bytes(8, 'little') * (value_size // 8)
+
+
+def _worker(kind: str, shared, capacity: int, num_keys: int, num_ops: int,
+            value_size: int, seed: int, results) -> None:
+    cache = shared if shared is not None else LRUCache(capacity=capacity)
+    rng = random.Random(seed)
+    keys = [int(rng.paretovariate(1.2)) % num_keys for _ in range(num_ops)]
+    
+    computed = 0
+    start = time.perf_counter()
+    for key in keys:
+        value = cache.get(key)
+        if value is None:
+            value = _compute(key, value_size)
+            cache.put(key, value)
+            computed += 1
+    elapsed = time.perf_counter() - start
+    
+    stats = cache.get_stats()
+    results.put((kind, elapsed, computed, stats['hits'], stats['misses']))
+
+
+def benchmark_multiprocess(kind: str, processes: int = 4, capacity: int = 10_000,
+                           num_keys: int = 50_000, num_ops: int = 50_000,
+                           value_size: int = 256) -> Dict[str, float]:
+    """
+    Run one configuration ("lru" = private LRUCache per process, "shm" = shared).
+    
+    Returns:
+        Dictionary of aggregate metrics
+    """
+    ctx = multiprocessing.get_context("spawn")
+    results = ctx.Queue()
+    shared = None
+    if kind == "shm":
+        shared = SharedMemoryCache(capacity=capacity, slot_size=value_size + 64)
+    
+    try:
+        workers = [
+            ctx.Process(target=_worker, args=(kind, shared, capacity, num_keys, num_ops,
+                                              value_size, seed, results))
+            for seed in range(processes)
+        ]
+        for worker in workers:
+            worker.start()
+        rows = [results.get() for _ in workers]
+        for worker in workers:
+            worker.join()
+        
+        hits = sum(row[3] for row in rows)
+        misses = sum(row[4] for row in rows)
+        wall = max(row[1] for row in rows)
+        if shared is not None:
+            memory = shared.get_stats()['segment_bytes']
+        else:
+            # Each process holds its own copy of up to capacity values
+            memory = processes * min(capacity, misses // processes) * value_size
+        return {
+            'ops_per_sec': processes * num_ops / wall,
+            'hit_rate': hits / (hits + misses),
+            'computations': sum(row[2] for row in rows),
+            'cache_bytes': memory,
+        }
+    finally:
+        if shared is not None:
+            shared.close()
+            shared.unlink()
+
+
+def main():
+    """Compare per-process LRU caches with one shared-memory cache."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--capacity", type=int, default=10_000)
+    parser.add_argument("--keys", type=int, default=50_000)
+    parser.add_argument("--ops", type=int, default=50_000)
+    parser.add_argument("--value-size", type=int, default=256)
+    args = parser.parse_args()
+    
+    print("=" * 80)
+    print("MULTI-PROCESS CACHE BENCHMARK")
+    print("=" * 80)
+    print(f"Processes: {args.processes}  Capacity: {args.capacity:,}  Keys: {args.keys:,}  "
+          f"Ops/process: {args.ops:,}  Value size: {args.value_size} B")
+    
+    results = {}
+    for kind, label in (("lru", "per-process LRUCache"), ("shm", "SharedMemoryCache")):
+        metrics = benchmark_multiprocess(kind, args.processes, args.capacity, args.keys,
+                                         args.ops, args.value_size)
+        results[kind] = metrics
+        print(f"\n{label}:")
+        print(f"  Throughput:   {metrics['ops_per_sec']:>12,.0f} ops/s")
+        print(f"  Hit rate:     {metrics['hit_rate']:>12.1%}")
+        print(f"  Computations: {metrics['computations']:>12,}")
+        print(f"  Cache memory: {metrics['cache_bytes'] / 1024 / 1024:>12.1f} MB")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwsystem/benchmarks/snapshot_cache_benchmarks.py
+
+Read-mostly cache benchmark: N threads read a small hot key set (the shape of
+codec/serializer registry and configuration lookups) while an optional writer
+updates it occasionally. Compares the locked LRUCache with the lock-free-read
+SnapshotCache and reports aggregate read throughput.
+
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+"""
+
+import argparse
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from exonware.xwsystem.caching.lru_cache import LRUCache
+from exonware.xwsystem.caching.snapshot_cache import SnapshotCache
+
+
+def _make_cache(kind: str, num_keys: int):
+    if kind == "lru":
+        cache = LRUCache(capacity=num_keys * 2)
+    else:
+        cache = SnapshotCache(capacity=num_keys * 2)
+    for key in range(num_keys):
+        cache.put(f"key{key}", {"value": key})
+    return cache
+
+
+def benchmark_reads(kind: str, threads: int = 8, num_keys: int = 256,
+                    reads_per_thread: int = 200_000, write_interval: float = 0.01) -> Dict[str, float]:
+    """
+    Run one configuration ("lru" or "snapshot").
+    
+    Returns:
+        Dictionary of aggregate metrics
+    """
+    cache = _make_cache(kind, num_keys)
+    barrier = threading.Barrier(threads + 1)
+    stop = threading.Event()
+    writes = 0
+    
+    def reader(seed: int) -> None:
+        rng = random.Random(seed)
+        keys = [f"key{rng.randrange(num_keys)}" for _ in range(1024)]
+        get = cache.get
+        barrier.wait()
+        for i in range(reads_per_thread):
+            get(keys[i & 1023])
+    
+    def writer() -> None:
+        nonlocal writes
+        rng = random.Random(-1)
+        while not stop.wait(write_interval):
+            cache.put(f"key{rng.randrange(num_keys)}", {"value": writes})
+            writes += 1
+    
+    workers = [threading.Thread(target=reader, args=(seed,)) for seed in range(threads)]
+    for worker in workers:
+        worker.start()
+    updater = threading.Thread(target=writer) if write_interval > 0 else None
+    if updater is not None:
+        updater.start()
+    
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    stop.set()
+    if updater is not None:
+        updater.join()
+    
+    return {
+        'reads_per_sec': threads * reads_per_thread / elapsed,
+        'elapsed': elapsed,
+        'writes': writes,
+    }
+
+
+def main():
+    """Compare LRUCache and SnapshotCache under concurrent reads."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--keys", type=int, default=256)
+    parser.add_argument("--reads", type=int, default=200_000, help="reads per thread")
+    parser.add_argument("--write-interval", type=float, default=0.01,
+                        help="seconds between writes (0 = read-only)")
+    args = parser.parse_args()
+    
+    print("=" * 80)
+    print("READ-MOSTLY CACHE BENCHMARK")
+    print("=" * 80)
+    print(f"Threads: {args.threads}  Keys: {args.keys:,}  Reads/thread: {args.reads:,}  "
+          f"Write interval: {args.write_interval}s")
+    
+    results = {}
+    for kind, label in (("lru", "LRUCache"), ("snapshot", "SnapshotCache")):
+        metrics = benchmark_reads(kind, args.threads, args.keys, args.reads, args.write_interval)
+        results[kind] = metrics
+        print(f"\n{label}:")
+        print(f"  Throughput: {metrics['reads_per_sec']:>14,.0f} reads/s")
+        print(f"  Elapsed:    {metrics['elapsed']:>14.3f} s")
+        print(f"  Writes:     {metrics['writes']:>14,}")
+    
+    speedup = results['snapshot']['reads_per_sec'] / results['lru']['reads_per_sec']
+    print(f"\nSnapshotCache speedup: {speedup:.2f}x")
+    return results
+
+
+if __name__ == "__main__":
+    main()
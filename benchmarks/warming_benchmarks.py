@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwsystem/benchmarks/warming_benchmarks.py
+
+Cache warming benchmark: warms an LRUCache from a simulated backend whose
+calls cost a fixed round-trip latency plus a small per-key cost. Compares the
+sequential PreloadWarmingStrategy with ConcurrentWarmingStrategy using a
+per-key loader and a batch loader (loader_many).
+
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Dict
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from exonware.xwsystem.caching.lru_cache import LRUCache
+from exonware.xwsystem.caching.warming import (
+    ConcurrentWarmingStrategy,
+    PreloadWarmingStrategy,
+    warm_cache,
+)
+
+
+def benchmark_warming(strategy_name: str, num_keys: int, latency: float, per_key: float,
+                      workers: int, batch_size: int) -> Dict[str, float]:
+    """
+    Warm a fresh cache with one strategy ("sequential", "concurrent" or "batched").
+    
+    Returns:
+        Dictionary of metrics
+    """
+    def loader(key):
+        time.sleep(latency + per_key)
+        return {"id": key}
+    
+    def loader_many(keys):
+        time.sleep(latency + per_key * len(keys))
+        return {key: {"id": key} for key in keys}
+    
+    if strategy_name == "sequential":
+        strategy = PreloadWarmingStrategy()
+    elif strategy_name == "concurrent":
+        strategy = ConcurrentWarmingStrategy(max_workers=workers)
+    else:
+        strategy = ConcurrentWarmingStrategy(max_workers=workers, loader_many=loader_many,
+                                             batch_size=batch_size)
+    
+    cache = LRUCache(capacity=num_keys)
+    start = time.perf_counter()
+    loaded = warm_cache(cache, loader, list(range(num_keys)), strategy=strategy)
+    elapsed = time.perf_counter() - start
+    return {
+        'loaded': loaded,
+        'elapsed': elapsed,
+        'keys_per_sec': loaded / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def main():
+    """Compare sequential, concurrent and batched cache warming."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--keys", type=int, default=2_000)
+    parser.add_argument("--latency", type=float, default=0.002, help="seconds per backend call")
+    parser.add_argument("--per-key", type=float, default=0.00001, help="extra seconds per key")
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args()
+    
+    print("=" * 80)
+    print("CACHE WARMING BENCHMARK")
+    print("=" * 80)
+    print(f"Keys: {args.keys:,}  Latency: {args.latency * 1000:.1f} ms  "
+          f"Workers: {args.workers}  Batch size: {args.batch_size}")
+    
+    results = {}
+    for name in ("sequential", "concurrent", "batched"):
+        metrics = benchmark_warming(name, args.keys, args.latency, args.per_key,
+                                    args.workers, args.batch_size)
+        results[name] = metrics
+        print(f"\n{name}:")
+        print(f"  Loaded:     {metrics['loaded']:>12,}")
+        print(f"  Elapsed:    {metrics['elapsed']:>12.3f} s")
+        print(f"  Throughput: {metrics['keys_per_sec']:>12,.0f} keys/s")
+    
+    for name in ("concurrent", "batched"):
+        speedup = results['sequential']['elapsed'] / results[name]['elapsed']
+        print(f"\n{name} speedup over sequential: {speedup:.1f}x")
+    return results
+
+
+if __name__ == "__main__":
+    main()
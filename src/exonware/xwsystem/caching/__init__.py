@@ -26,8 +26,14 @@ Usability Features (Priority #2):
 Performance Features (Priority #4):
 - O(1) LFU cache (100x+ faster eviction)
 - Batch operations (get_many, put_many, delete_many)
-- Memory-bounded caches
+- Memory-bounded caches with deep size accounting and custom weighers
+- Lock-striped sharded caches for multi-threaded hot paths
+- W-TinyLFU admission-controlled cache (scan resistant)
+- Single-flight loader coalescing (cache stampede protection)
+- Refresh-ahead caches (stale-while-revalidate, XFetch early refresh)
 - Cache warming strategies
+- Zero-overhead hot paths (guarded debug logging, clock reads only with
+  TTL, shared/per-thread/disabled statistics)
 - Bloom filter for fast negative lookups
 - Write-behind (lazy write) for better write performance
 - Async iterators for async caches
@@ -64,20 +70,29 @@ from .decorators import (
     # Backward compatibility
     cache, async_cache, cache_result, async_cache_result, cached, async_cached
 )
-from .distributed import DistributedCache, RedisCache
+from .distributed import (
+    DistributedCache, RedisCache, HashRing, DistributedCacheNode, CacheNodeServer,
+    ACacheTransport, LocalTransport, TCPTransport
+)
 
 # Performance-optimized caches
 from .lfu_optimized import OptimizedLFUCache, AsyncOptimizedLFUCache
 from .memory_bounded import MemoryBoundedLRUCache, MemoryBoundedLFUCache
-from .two_tier_cache import TwoTierCache
+from .two_tier_cache import TwoTierCache, AsyncTwoTierCache, TierAdmissionPolicy, PromoteAfterHits
+from .sharded_cache import ShardedLRUCache, ShardedTTLCache
+from .tinylfu_cache import TinyLFUCache
+from .shared_memory_cache import SharedMemoryCache
+from .snapshot_cache import SnapshotCache, ReadMostlyCache
 
 # Advanced cache types (NEW in v0.0.1.388)
 from .read_through import ReadThroughCache, WriteThroughCache, ReadWriteThroughCache
+from .single_flight import SingleFlight, AsyncSingleFlight
+from .refresh_ahead import RefreshAheadCache, AsyncRefreshAheadCache
 from .serializable import SerializableCache
 from .tagging import TaggedCache
-from .write_behind import WriteBehindCache
+from .write_behind import WriteBehindCache, AsyncWriteBehindCache
 from .conditional import ConditionalEvictionCache
-from .bloom_cache import BloomFilterCache, SimpleBloomFilter
+from .bloom_cache import BloomFilterCache, BloomFilter, SimpleBloomFilter, ScalableBloomFilter
 from .metrics_exporter import PrometheusExporter, StatsCollector
 
 # Security features
@@ -95,6 +110,7 @@ from .events import CacheEvent, CacheEventEmitter, EventLogger
 from .observable_cache import ObservableLRUCache, ObservableLFUCache
 from .eviction_strategies import (
     AEvictionStrategy,
+    AIndexedEvictionStrategy,
     LRUEvictionStrategy,
     LFUEvictionStrategy,
     FIFOEvictionStrategy,
@@ -108,8 +124,18 @@ from .warming import (
     PreloadWarmingStrategy,
     LazyWarmingStrategy,
     PriorityWarmingStrategy,
+    SnapshotWarmingStrategy,
+    ConcurrentWarmingStrategy,
     warm_cache,
 )
+from .persistence import (
+    SnapshotRecord,
+    ASnapshotAdapter,
+    register_snapshot_adapter,
+    save_snapshot,
+    load_snapshot,
+    iter_snapshot,
+)
 
 # Utilities
 from .utils import (
@@ -118,9 +144,16 @@ from .utils import (
     format_bytes,
     default_key_builder,
 )
+from .size_estimators import (
+    deep_sizeof,
+    register_size_estimator,
+    unregister_size_estimator,
+)
+from .value_codec import ValueCodec, EncodedValue
 
 # Interfaces (for advanced usage)
 from .contracts import ICache
+from .defs import StatsMode
 
 # Errors
 from .errors import (
@@ -150,17 +183,33 @@ __all__ = [
     "MemoryBoundedLRUCache",
     "MemoryBoundedLFUCache",
     "TwoTierCache",
+    "AsyncTwoTierCache",
+    "TierAdmissionPolicy",
+    "PromoteAfterHits",
+    "ShardedLRUCache",
+    "ShardedTTLCache",
+    "TinyLFUCache",
+    "SharedMemoryCache",
+    "SnapshotCache",
+    "ReadMostlyCache",
     
     # Advanced cache types (NEW)
     "ReadThroughCache",
     "WriteThroughCache",
     "ReadWriteThroughCache",
+    "SingleFlight",
+    "AsyncSingleFlight",
+    "RefreshAheadCache",
+    "AsyncRefreshAheadCache",
     "SerializableCache",
     "TaggedCache",
     "WriteBehindCache",
+    "AsyncWriteBehindCache",
     "ConditionalEvictionCache",
     "BloomFilterCache",
+    "BloomFilter",
     "SimpleBloomFilter",
+    "ScalableBloomFilter",
     "PrometheusExporter",
     "StatsCollector",
     
@@ -192,6 +241,7 @@ __all__ = [
     "ObservableLRUCache",
     "ObservableLFUCache",
     "AEvictionStrategy",
+    "AIndexedEvictionStrategy",
     "LRUEvictionStrategy",
     "LFUEvictionStrategy",
     "FIFOEvictionStrategy",
@@ -203,15 +253,29 @@ __all__ = [
     "PreloadWarmingStrategy",
     "LazyWarmingStrategy",
     "PriorityWarmingStrategy",
+    "SnapshotWarmingStrategy",
+    "ConcurrentWarmingStrategy",
     "warm_cache",
+    "SnapshotRecord",
+    "ASnapshotAdapter",
+    "register_snapshot_adapter",
+    "save_snapshot",
+    "load_snapshot",
+    "iter_snapshot",
     
     # Utilities
     "estimate_object_size",
     "compute_checksum",
     "format_bytes",
     "default_key_builder",
+    "deep_sizeof",
+    "register_size_estimator",
+    "unregister_size_estimator",
+    "ValueCodec",
+    "EncodedValue",
     
     # Interfaces
+    "StatsMode",
     "ICache",
     
     # Management
@@ -235,6 +299,12 @@ __all__ = [
     # Distributed
     "DistributedCache",
     "RedisCache",
+    "HashRing",
+    "DistributedCacheNode",
+    "CacheNodeServer",
+    "ACacheTransport",
+    "LocalTransport",
+    "TCPTransport",
     
     # Errors
     "CacheError",
@@ -10,6 +10,7 @@ Caching module base classes - abstract classes for caching functionality.
 """
 
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
 from typing import Any, Dict, List, Optional, Union, Tuple, Hashable
 from .defs import CachePolicy
 
@@ -151,6 +152,17 @@ class ACache(ABC):
         """
         return self.size()
     
+    def _batch_lock(self):
+        """
+        Lock held around default batch operations.
+        
+        Caches that guard their state with a reentrant self._lock hold it
+        once for the whole batch, so per-key calls only re-enter it.
+        Caches whose get/put call out to user code (loaders, writers, event
+        hooks) return nullcontext() so that code never runs under the lock.
+        """
+        return getattr(self, '_lock', None) or nullcontext()
+    
     def get_many(self, keys: List[Hashable]) -> Dict[Hashable, Any]:
         """
         Get multiple values in a single operation.
@@ -162,13 +174,15 @@ class ACache(ABC):
             Dictionary of key-value pairs found in cache
             
         Note:
-            More efficient than individual gets for batch operations.
+            The default holds the cache lock once and calls get() per key;
+            implementations override it with a native batch path.
         """
         results = {}
-        for key in keys:
-            value = self.get(key)
-            if value is not None:
-                results[key] = value
+        with self._batch_lock():
+            for key in keys:
+                value = self.get(key)
+                if value is not None:
+                    results[key] = value
         return results
     
     def put_many(self, items: Dict[Hashable, Any]) -> int:
@@ -182,16 +196,18 @@ class ACache(ABC):
             Number of items successfully cached
             
         Note:
-            More efficient than individual puts for batch operations.
+            The default holds the cache lock once and calls put() per key;
+            implementations override it with a native batch path.
         """
         count = 0
-        for key, value in items.items():
-            try:
-                self.put(key, value)
-                count += 1
-            except Exception:
-                # Continue with other items even if one fails
-                pass
+        with self._batch_lock():
+            for key, value in items.items():
+                try:
+                    self.put(key, value)
+                    count += 1
+                except Exception:
+                    # Continue with other items even if one fails
+                    pass
         return count
     
     def delete_many(self, keys: List[Hashable]) -> int:
@@ -205,12 +221,14 @@ class ACache(ABC):
             Number of keys successfully deleted
             
         Note:
-            More efficient than individual deletes for batch operations.
+            The default holds the cache lock once and calls delete() per key;
+            implementations override it with a native batch path.
         """
         count = 0
-        for key in keys:
-            if self.delete(key):
-                count += 1
+        with self._batch_lock():
+            for key in keys:
+                if self.delete(key):
+                    count += 1
         return count
 
 
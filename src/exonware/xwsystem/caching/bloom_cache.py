@@ -8,70 +8,375 @@ Generation Date: 01-Nov-2025
 
 Bloom filter-enhanced cache for faster negative lookups.
 Performance Priority #4 - Probabilistic data structure for efficiency.
+
+Performance Improvement:
+    - OLD: Bits stored as a list of bools (8+ bytes per bit) and hash_count
+      SHA-256 hex digests per lookup; fixed size, manual rebuilds
+    - NEW: bytearray bit array (1 bit per slot), one 64-bit XXH3 hash per
+      lookup with double hashing for the probes, automatic sizing from
+      expected items and error rate, a scalable variant that grows with the
+      number of items, and to_bytes()/from_bytes() serialization
 """
 
-import hashlib
-from typing import Any, Dict, List, Optional, Hashable
+import logging
+import math
+import struct
+import xxhash
+from typing import Any, Dict, Iterable, List, Optional, Hashable, Tuple
+from .errors import CacheError
 from .lru_cache import LRUCache
 from ..config.logging_setup import get_logger
 
 logger = get_logger("xsystem.caching.bloom_cache")
 
 
-class SimpleBloomFilter:
+_MASK32 = (1 << 32) - 1
+
+# Serialized header: magic, hash_count, size (bits), items_added, capacity, error_rate
+_FILTER_HEADER = struct.Struct('<4sIQQQd')
+_FILTER_MAGIC = b'XBF1'
+
+# Serialized scalable header: magic, growth_factor, tightening_ratio, filter count
+_SCALABLE_HEADER = struct.Struct('<4sddI')
+_SCALABLE_MAGIC = b'XSB1'
+
+
+def _key_bytes(item: Any) -> bytes:
+    """Stable byte representation of an item (independent of PYTHONHASHSEED)."""
+    if isinstance(item, str):
+        try:
+            return item.encode()
+        except UnicodeEncodeError:
+            return item.encode('utf-8', 'surrogatepass')
+    if isinstance(item, bytes):
+        return item
+    if isinstance(item, (bytearray, memoryview)):
+        return bytes(item)
+    return _key_bytes(str(item))
+
+
+def _base_hashes(item: Any) -> Tuple[int, int]:
     """
-    Simple Bloom filter implementation.
-    
-    Provides probabilistic membership testing with no false negatives.
+    Two 32-bit hashes from the halves of one 64-bit XXH3 digest.
+
+    Probe i is h1 + i * h2 (Kirsch-Mitzenmacher double hashing), so any
+    number of probes costs a single hash computation.
     """
-    
-    def __init__(self, size: int = 10000, hash_count: int = 3):
+    digest = xxhash.xxh3_64_intdigest(_key_bytes(item))
+    return digest & _MASK32, (digest >> 32) | 1
+
+
+def optimal_bloom_parameters(expected_items: int, error_rate: float) -> Tuple[int, int]:
+    """
+    Compute (size in bits, hash count) for a target false-positive rate.
+
+    Args:
+        expected_items: Number of items the filter should hold
+        error_rate: Target false-positive probability (0 < error_rate < 1)
+
+    Returns:
+        Tuple of (bits, hash_count)
+    """
+    if expected_items <= 0:
+        raise ValueError(f"expected_items must be positive, got {expected_items}")
+    if not 0 < error_rate < 1:
+        raise ValueError(f"error_rate must be between 0 and 1, got {error_rate}")
+    bits = math.ceil(-expected_items * math.log(error_rate) / (math.log(2) ** 2))
+    hash_count = max(1, round(bits / expected_items * math.log(2)))
+    return bits, hash_count
+
+
+class BloomFilter:
+    """
+    Bit-packed Bloom filter with double hashing.
+
+    Provides probabilistic membership testing with no false negatives. Bits
+    live in a bytearray (1 bit per slot) and all probes derive from the two
+    32-bit halves of a single 64-bit XXH3 hash. Sized automatically from
+    expected_items and error_rate unless size/hash_count are given explicitly.
+
+    Example:
+        bloom = BloomFilter(expected_items=100_000, error_rate=0.001)
+        bloom.add('user:1')
+        'user:1' in bloom        # True
+        restored = BloomFilter.from_bytes(bloom.to_bytes())
+    """
+
+    def __init__(self, expected_items: int = 10000, error_rate: float = 0.01,
+                 size: Optional[int] = None, hash_count: Optional[int] = None):
         """
         Initialize Bloom filter.
-        
+
         Args:
-            size: Bit array size
-            hash_count: Number of hash functions to use
+            expected_items: Items the filter is sized for
+            error_rate: Target false-positive rate at expected_items
+            size: Explicit bit array size (overrides automatic sizing)
+            hash_count: Explicit number of probes (overrides automatic sizing)
         """
-        self.size = size
-        self.hash_count = hash_count
-        self.bit_array = [False] * size
+        auto_size, auto_hashes = optimal_bloom_parameters(expected_items, error_rate)
+        self.capacity = expected_items
+        self.error_rate = error_rate
+        self.size = max(8, size if size is not None else auto_size)
+        self.hash_count = max(1, hash_count if hash_count is not None else auto_hashes)
+        self._bits = bytearray((self.size + 7) // 8)
         self.items_added = 0
-    
-    def _hashes(self, item: Any) -> List[int]:
-        """Generate multiple hash values for item."""
-        hashes = []
-        item_bytes = str(item).encode('utf-8')
-        
-        for i in range(self.hash_count):
-            # Use different hash functions
-            h = hashlib.sha256(item_bytes + str(i).encode()).hexdigest()
-            hash_val = int(h, 16) % self.size
-            hashes.append(hash_val)
-        
-        return hashes
-    
-    def add(self, item: Any) -> None:
-        """Add item to Bloom filter."""
-        for hash_val in self._hashes(item):
-            self.bit_array[hash_val] = True
-        self.items_added += 1
-    
+
+    def _add_hashes(self, h1: int, h2: int) -> bool:
+        """Set the probe bits; returns True if any bit was newly set."""
+        bits = self._bits
+        size = self.size
+        index = h1 % size
+        step = h2 % size
+        changed = False
+        for _ in range(self.hash_count):
+            byte = index >> 3
+            mask = 1 << (index & 7)
+            if not bits[byte] & mask:
+                bits[byte] |= mask
+                changed = True
+            index += step
+            if index >= size:
+                index -= size
+        if changed:
+            self.items_added += 1
+        return changed
+
+    def _contains_hashes(self, h1: int, h2: int) -> bool:
+        bits = self._bits
+        size = self.size
+        index = h1 % size
+        step = h2 % size
+        for _ in range(self.hash_count):
+            if not bits[index >> 3] & (1 << (index & 7)):
+                return False
+            index += step
+            if index >= size:
+                index -= size
+        return True
+
+    def add(self, item: Any) -> bool:
+        """
+        Add item to Bloom filter.
+
+        Returns:
+            True if the item was (probably) new, False if it was already present
+        """
+        return self._add_hashes(*_base_hashes(item))
+
+    def update(self, items: Iterable[Any]) -> None:
+        """Add several items."""
+        for item in items:
+            self._add_hashes(*_base_hashes(item))
+
     def might_contain(self, item: Any) -> bool:
         """
         Check if item might be in set.
-        
+
         Returns:
             True if item might be present (or false positive)
             False if item is definitely NOT present
         """
-        return all(self.bit_array[h] for h in self._hashes(item))
-    
+        return self._contains_hashes(*_base_hashes(item))
+
+    __contains__ = might_contain
+
+    def __len__(self) -> int:
+        """Approximate number of distinct items added."""
+        return self.items_added
+
+    def is_full(self) -> bool:
+        """Check whether the filter has reached its sized capacity."""
+        return self.items_added >= self.capacity
+
+    def fill_ratio(self) -> float:
+        """Fraction of bits set."""
+        set_bits = sum(bin(byte).count('1') for byte in self._bits)
+        return set_bits / self.size
+
+    def estimated_false_positive_rate(self) -> float:
+        """Current false-positive probability from the fill ratio."""
+        return self.fill_ratio() ** self.hash_count
+
     def clear(self) -> None:
         """Clear all items."""
-        self.bit_array = [False] * self.size
+        self._bits = bytearray(len(self._bits))
         self.items_added = 0
 
+    def to_bytes(self) -> bytes:
+        """Serialize the filter (header plus raw bit array)."""
+        header = _FILTER_HEADER.pack(
+            _FILTER_MAGIC, self.hash_count, self.size,
+            self.items_added, self.capacity, self.error_rate,
+        )
+        return header + bytes(self._bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'BloomFilter':
+        """Deserialize a filter produced by to_bytes()."""
+        if len(data) < _FILTER_HEADER.size:
+            raise CacheError("Bloom filter data is truncated")
+        magic, hash_count, size, items_added, capacity, error_rate = _FILTER_HEADER.unpack_from(data)
+        if magic != _FILTER_MAGIC:
+            raise CacheError("Not a serialized Bloom filter")
+        bits = data[_FILTER_HEADER.size:]
+        if len(bits) != (size + 7) // 8:
+            raise CacheError("Bloom filter bit array length does not match its header")
+
+        bloom = cls.__new__(cls)
+        BloomFilter.__init__(bloom, expected_items=capacity, error_rate=error_rate,
+                             size=size, hash_count=hash_count)
+        bloom._bits = bytearray(bits)
+        bloom.items_added = items_added
+        return bloom
+
+
+class SimpleBloomFilter(BloomFilter):
+    """
+    Bloom filter with an explicit size and hash count.
+
+    Kept for backward compatibility; prefer BloomFilter (automatic sizing)
+    or ScalableBloomFilter (grows with the number of items).
+    """
+
+    def __init__(self, size: int = 10000, hash_count: int = 3):
+        """
+        Initialize Bloom filter.
+
+        Args:
+            size: Bit array size
+            hash_count: Number of hash functions to use
+        """
+        super().__init__(size=size, hash_count=hash_count)
+
+
+class ScalableBloomFilter:
+    """
+    Bloom filter that grows as items are added.
+
+    Keeps a series of filters; once the newest one reaches its capacity a
+    larger one (growth_factor x capacity) with a tighter error rate
+    (tightening_ratio x error rate) is added, so the compound false-positive
+    rate stays below error_rate / (1 - tightening_ratio) however many items
+    are inserted.
+    """
+
+    def __init__(self, initial_capacity: int = 1024, error_rate: float = 0.01,
+                 growth_factor: float = 2.0, tightening_ratio: float = 0.8):
+        """
+        Initialize scalable Bloom filter.
+
+        Args:
+            initial_capacity: Items the first filter is sized for
+            error_rate: False-positive rate of the first filter
+            growth_factor: Capacity multiplier for each new filter
+            tightening_ratio: Error-rate multiplier for each new filter
+        """
+        if growth_factor < 1:
+            raise ValueError(f"growth_factor must be >= 1, got {growth_factor}")
+        if not 0 < tightening_ratio < 1:
+            raise ValueError(f"tightening_ratio must be between 0 and 1, got {tightening_ratio}")
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self.growth_factor = growth_factor
+        self.tightening_ratio = tightening_ratio
+        self.filters: List[BloomFilter] = [BloomFilter(initial_capacity, error_rate)]
+
+    def _grow(self) -> BloomFilter:
+        last = self.filters[-1]
+        bloom = BloomFilter(
+            expected_items=max(1, int(last.capacity * self.growth_factor)),
+            error_rate=last.error_rate * self.tightening_ratio,
+        )
+        self.filters.append(bloom)
+        return bloom
+
+    def add(self, item: Any) -> bool:
+        """
+        Add item, growing the filter when the newest stage is full.
+
+        Returns:
+            True if the item was (probably) new
+        """
+        h1, h2 = _base_hashes(item)
+        for bloom in self.filters:
+            if bloom._contains_hashes(h1, h2):
+                return False
+        current = self.filters[-1]
+        if current.is_full():
+            current = self._grow()
+        return current._add_hashes(h1, h2)
+
+    def update(self, items: Iterable[Any]) -> None:
+        """Add several items."""
+        for item in items:
+            self.add(item)
+
+    def might_contain(self, item: Any) -> bool:
+        """
+        Check if item might be in set.
+
+        Returns:
+            True if item might be present (or false positive)
+            False if item is definitely NOT present
+        """
+        h1, h2 = _base_hashes(item)
+        for bloom in reversed(self.filters):
+            if bloom._contains_hashes(h1, h2):
+                return True
+        return False
+
+    __contains__ = might_contain
+
+    def __len__(self) -> int:
+        """Approximate number of distinct items added."""
+        return sum(bloom.items_added for bloom in self.filters)
+
+    @property
+    def items_added(self) -> int:
+        return len(self)
+
+    @property
+    def size(self) -> int:
+        """Total bits across all stages."""
+        return sum(bloom.size for bloom in self.filters)
+
+    def clear(self) -> None:
+        """Clear all items and shrink back to a single stage."""
+        self.filters = [BloomFilter(self.initial_capacity, self.error_rate)]
+
+    def to_bytes(self) -> bytes:
+        """Serialize all stages."""
+        parts = [_SCALABLE_HEADER.pack(
+            _SCALABLE_MAGIC, self.growth_factor, self.tightening_ratio, len(self.filters)
+        )]
+        for bloom in self.filters:
+            data = bloom.to_bytes()
+            parts.append(struct.pack('<Q', len(data)))
+            parts.append(data)
+        return b''.join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'ScalableBloomFilter':
+        """Deserialize a filter produced by to_bytes()."""
+        if len(data) < _SCALABLE_HEADER.size:
+            raise CacheError("Scalable Bloom filter data is truncated")
+        magic, growth_factor, tightening_ratio, count = _SCALABLE_HEADER.unpack_from(data)
+        if magic != _SCALABLE_MAGIC or count == 0:
+            raise CacheError("Not a serialized scalable Bloom filter")
+
+        offset = _SCALABLE_HEADER.size
+        filters = []
+        for _ in range(count):
+            (length,) = struct.unpack_from('<Q', data, offset)
+            offset += 8
+            filters.append(BloomFilter.from_bytes(data[offset:offset + length]))
+            offset += length
+
+        first = filters[0]
+        scalable = cls(first.capacity, first.error_rate, growth_factor, tightening_ratio)
+        scalable.filters = filters
+        return scalable
+
 
 class BloomFilterCache(LRUCache):
     """
@@ -102,39 +407,64 @@ class BloomFilterCache(LRUCache):
         capacity: int = 128,
         bloom_size: int = None,
         ttl: Optional[float] = None,
-        name: Optional[str] = None
+        name: Optional[str] = None,
+        error_rate: float = 0.01,
+        rebuild_factor: float = 2.0
     ):
         """
         Initialize Bloom filter cache.
         
         Args:
             capacity: Maximum cache size
-            bloom_size: Bloom filter size (default: capacity * 10)
+            bloom_size: Fixed Bloom filter size in bits (default: a scalable
+                filter sized from capacity and error_rate)
             ttl: Optional TTL in seconds
             name: Cache name
+            error_rate: Target false-positive rate
+            rebuild_factor: Rebuild the filter from live keys once the keys
+                added since the last rebuild exceed rebuild_factor x capacity
+                (evicted and deleted keys otherwise linger as false positives)
+        
+        Raises:
+            ValueError: If rebuild_factor is not greater than 1
         """
+        if not rebuild_factor > 1:
+            # A full cache alone would reach the threshold and rebuild on every put
+            raise ValueError(f"rebuild_factor must be greater than 1, got {rebuild_factor}")
+        
         super().__init__(capacity, ttl, name)
         
-        # Initialize Bloom filter
-        bloom_size = bloom_size or (capacity * 10)
-        self._bloom = SimpleBloomFilter(size=bloom_size, hash_count=3)
+        self.error_rate = error_rate
+        self._bloom_size = bloom_size
+        self._rebuild_threshold = max(1, int(capacity * rebuild_factor))
+        self._bloom = self._new_bloom()
+        self._bloom_rebuilds = 0
         
         # Statistics
         self._bloom_hits = 0  # Bloom said "yes", was in cache
         self._bloom_misses = 0  # Bloom said "yes", wasn't in cache (false positive)
         self._bloom_negatives = 0  # Bloom said "no" (definitely not in cache)
     
+    def _new_bloom(self):
+        """Create an empty filter for the configured sizing."""
+        if self._bloom_size:
+            return BloomFilter(self.capacity, self.error_rate, size=self._bloom_size)
+        return ScalableBloomFilter(initial_capacity=self.capacity, error_rate=self.error_rate)
+    
     def put(self, key: Hashable, value: Any) -> None:
         """Put value and update Bloom filter."""
-        super().put(key, value)
-        self._bloom.add(key)
+        with self._lock:
+            super().put(key, value)
+            self._bloom.add(key)
+            if self._bloom.items_added >= self._rebuild_threshold:
+                self._rebuild_locked()
     
     def delete(self, key: Hashable) -> bool:
         """
         Delete key from cache.
         
-        Note: Bloom filter is not updated (can't remove from Bloom filter).
-        This may cause false positives until Bloom filter is rebuilt.
+        Note: Bloom filters cannot remove keys; the deleted key may produce
+        false positives until the next automatic rebuild.
         """
         return super().delete(key)
     
@@ -166,7 +496,8 @@ class BloomFilterCache(LRUCache):
         if not self._bloom.might_contain(key):
             self._bloom_negatives += 1
             self._misses += 1
-            logger.debug(f"Bloom filter: {key} definitely not in cache")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Bloom filter: {key} definitely not in cache")
             return default
         
         # Bloom filter says might be present - check cache
@@ -181,21 +512,33 @@ class BloomFilterCache(LRUCache):
     
     def clear(self) -> None:
         """Clear cache and reset Bloom filter."""
-        super().clear()
-        self._bloom.clear()
+        with self._lock:
+            super().clear()
+            self._bloom = self._new_bloom()
+    
+    def _rebuild_locked(self) -> None:
+        """Swap in a filter holding only live keys (caller holds the lock)."""
+        bloom = self._new_bloom()
+        bloom.update(self._cache.keys())
+        self._bloom = bloom
+        self._bloom_rebuilds += 1
+        logger.debug(f"Bloom filter rebuilt with {len(self._cache)} keys")
     
     def rebuild_bloom_filter(self) -> None:
-        """Rebuild Bloom filter from current cache entries."""
-        self._bloom.clear()
-        for key in self.keys():
-            self._bloom.add(key)
-        logger.info("Bloom filter rebuilt")
+        """
+        Rebuild Bloom filter from current cache entries.
+        
+        Rebuilds also happen automatically (see rebuild_factor).
+        """
+        with self._lock:
+            self._rebuild_locked()
     
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics including Bloom filter metrics."""
         stats = super().get_stats()
         stats['bloom_size'] = self._bloom.size
         stats['bloom_items'] = self._bloom.items_added
+        stats['bloom_rebuilds'] = self._bloom_rebuilds
         stats['bloom_hits'] = self._bloom_hits
         stats['bloom_misses'] = self._bloom_misses
         stats['bloom_negatives'] = self._bloom_negatives
@@ -210,6 +553,9 @@ class BloomFilterCache(LRUCache):
 
 __all__ = [
     'BloomFilterCache',
+    'BloomFilter',
     'SimpleBloomFilter',
+    'ScalableBloomFilter',
+    'optimal_bloom_parameters',
 ]
 
@@ -10,6 +10,7 @@ Conditional eviction policies for caching.
 Extensibility Priority #5 - Customizable eviction behavior.
 """
 
+import logging
 import time
 from typing import Any, Callable, Dict, Optional, Hashable
 from .lru_cache import LRUCache, CacheNode
@@ -17,6 +18,8 @@ from ..config.logging_setup import get_logger
 
 logger = get_logger("xsystem.caching.conditional")
 
+_DEBUG = logging.DEBUG
+
 
 class ConditionalEvictionCache(LRUCache):
     """
@@ -70,16 +73,18 @@ class ConditionalEvictionCache(LRUCache):
             value: Value to cache
         """
         with self._lock:
+            now = time.time() if self.ttl else 0.0
             if key in self._cache:
                 # Update existing key
                 node = self._cache[key]
                 node.value = value
-                node.access_time = time.time()
+                node.access_time = now
                 self._move_to_head(node)
-                logger.debug(f"Cache {self.name} updated key: {key}")
+                if logger.isEnabledFor(_DEBUG):
+                    logger.debug(f"Cache {self.name} updated key: {key}")
             else:
                 # Add new key
-                node = CacheNode(key, value)
+                node = CacheNode(key, value, now)
                 
                 if len(self._cache) >= self.capacity:
                     # Find evictable entry
@@ -90,7 +95,8 @@ class ConditionalEvictionCache(LRUCache):
                 
                 self._cache[key] = node
                 self._add_to_head(node)
-                logger.debug(f"Cache {self.name} added key: {key}")
+                if logger.isEnabledFor(_DEBUG):
+                    logger.debug(f"Cache {self.name} added key: {key}")
     
     def _evict_conditional(self) -> bool:
         """
@@ -115,7 +121,8 @@ class ConditionalEvictionCache(LRUCache):
                 self._remove_node(node)
                 del self._cache[node.key]
                 self._evictions += 1
-                logger.debug(f"Cache {self.name} evicted key: {node.key}")
+                if logger.isEnabledFor(_DEBUG):
+                    logger.debug(f"Cache {self.name} evicted key: {node.key}")
                 return True
             else:
                 # Try next entry
@@ -805,6 +805,23 @@ class ICache(ABC):
     def size(self) -> int:
         """Get number of cached items."""
         pass
+    
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Get several values; keys that are missing are omitted."""
+        results = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                results[key] = value
+        return results
+    
+    def put_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> int:
+        """Set several values; returns how many were stored."""
+        return sum(1 for key, value in items.items() if self.set(key, value, ttl))
+    
+    def delete_many(self, keys: List[str]) -> int:
+        """Delete several keys; returns how many were removed."""
+        return sum(1 for key in keys if self.delete(key))
 
 
 # ============================================================================
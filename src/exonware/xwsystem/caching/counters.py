@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+
+Hot-path statistics modes for in-memory caches.
+
+Performance:
+    - SHARED: hit/miss/eviction counters are plain int attributes bumped
+      under the cache lock (the historical behavior, and the default)
+    - PER_THREAD: each thread bumps its own counters, so concurrent readers
+      never write to a shared counter; get_stats() sums every thread's
+      counters (including threads that have exited)
+    - DISABLED: hot paths skip counting altogether
+"""
+
+import threading
+from typing import List, Union
+
+from .defs import StatsMode
+
+
+class CacheCounters:
+    """Hit/miss/eviction counts."""
+
+    __slots__ = ('hits', 'misses', 'evictions')
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+class ThreadLocalCounters:
+    """CacheCounters owned by each thread, merged on demand."""
+
+    def __init__(self):
+        self._local = threading.local()
+        self._all: List[CacheCounters] = []
+        self._lock = threading.Lock()
+
+    @property
+    def local(self) -> CacheCounters:
+        """The calling thread's counters (created on first use)."""
+        try:
+            return self._local.counters
+        except AttributeError:
+            counters = self._local.counters = CacheCounters()
+            with self._lock:
+                self._all.append(counters)
+            return counters
+
+    def totals(self) -> CacheCounters:
+        """Sum of all threads' counters."""
+        totals = CacheCounters()
+        with self._lock:
+            for counters in self._all:
+                totals.hits += counters.hits
+                totals.misses += counters.misses
+                totals.evictions += counters.evictions
+        return totals
+
+    def reset(self) -> None:
+        """Zero every thread's counters."""
+        with self._lock:
+            for counters in self._all:
+                counters.hits = counters.misses = counters.evictions = 0
+
+
+class StatsModeMixin:
+    """
+    Statistics-mode plumbing for caches that count into _hits/_misses/_evictions.
+
+    Hot paths test the two flags inline (no method call in the SHARED mode):
+
+        if self._shared_stats:
+            self._hits += 1
+        elif self._thread_stats is not None:
+            self._thread_stats.local.hits += 1
+
+    Counts written straight to the shared attributes (e.g. by subclasses)
+    are always included, whatever the mode.
+    """
+
+    _shared_stats = True
+    _thread_stats = None
+
+    def _init_stats_mode(self, stats: Union[StatsMode, str]) -> None:
+        self.stats_mode = StatsMode(stats)
+        self._shared_stats = self.stats_mode is StatsMode.SHARED
+        self._thread_stats = ThreadLocalCounters() if self.stats_mode is StatsMode.PER_THREAD else None
+
+    def _merged_counts(self) -> CacheCounters:
+        """Shared counters plus every thread's counters."""
+        totals = self._thread_stats.totals() if self._thread_stats is not None else CacheCounters()
+        totals.hits += self._hits
+        totals.misses += self._misses
+        totals.evictions += self._evictions
+        return totals
+
+    def _reset_counts(self) -> None:
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        if self._thread_stats is not None:
+            self._thread_stats.reset()
+
+
+__all__ = [
+    "CacheCounters",
+    "ThreadLocalCounters",
+    "StatsModeMixin",
+]
@@ -15,6 +15,8 @@ import functools
 import asyncio
 from typing import Any, Callable, Optional, Hashable
 from .lru_cache import LRUCache, AsyncLRUCache
+from .snapshot_cache import SnapshotCache
+from .single_flight import SingleFlight, AsyncSingleFlight
 from .utils import default_key_builder
 from ..config.logging_setup import get_logger
 
@@ -28,19 +30,35 @@ def xwcached(
     condition: Optional[Callable] = None,
     on_hit: Optional[Callable] = None,
     on_miss: Optional[Callable] = None,
-    namespace: Optional[str] = None
+    namespace: Optional[str] = None,
+    coalesce: bool = True,
+    coalesce_timeout: Optional[float] = None,
+    read_mostly: bool = False,
+    max_size: Optional[int] = None
 ):
     """
     Advanced caching decorator with hooks and customization (eXonware naming convention).
     
+    Works on plain functions and on coroutine functions (the cache is used
+    synchronously; calls are coalesced per event loop).
+    
     Args:
-        cache: Cache instance to use (default: new LRUCache(128))
+        cache: Cache instance to use (default: new LRUCache(128), or a
+            SnapshotCache in read_mostly mode)
         ttl: Time to live for cached results
         key_builder: Custom key generation function(func, args, kwargs) -> key
         condition: Conditional caching function(args, kwargs) -> bool
         on_hit: Callback on cache hit(key, value) -> None
         on_miss: Callback on cache miss(key, result) -> None
         namespace: Cache namespace for key prefixing
+        coalesce: Concurrent misses on the same key run func once and share
+            its result or exception
+        coalesce_timeout: Max seconds to wait for another caller's in-flight
+            call before raising CacheTimeoutError (None = wait indefinitely)
+        read_mostly: Use a SnapshotCache (lock-free hits, copy-on-write
+            stores) for results that are computed rarely and read constantly
+        max_size: Bound of the default cache (128 for LRU, unbounded for
+            read_mostly)
         
     Example:
         @xwcached(ttl=300, on_hit=lambda k, v: print(f"Hit: {k}"))
@@ -53,18 +71,20 @@ def xwcached(
         )
         def conditional_cache(value):
             return value * 2
+        
+        @xwcached(read_mostly=True)
+        def feature_flag(name):
+            return load_flag(name)
     """
     # Initialize cache if not provided
     if cache is None:
-        cache = LRUCache(capacity=128)
+        if read_mostly:
+            cache = SnapshotCache(capacity=max_size)
+        else:
+            cache = LRUCache(capacity=max_size or 128)
     
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            # Check condition
-            if condition and not condition(args, kwargs):
-                return func(*args, **kwargs)
-            
+        def build_key(args, kwargs) -> Hashable:
             # Build cache key
             if key_builder:
                 key = key_builder(func, args, kwargs)
@@ -74,23 +94,18 @@ def xwcached(
             # Add namespace prefix
             if namespace:
                 key = f"{namespace}:{key}"
-            
-            # Try to get from cache
+            return key
+        
+        def lookup(key: Hashable) -> Any:
             result = cache.get(key)
-            
-            if result is not None:
-                # Cache hit
-                if on_hit:
-                    try:
-                        on_hit(key, result)
-                    except Exception as e:
-                        logger.warning(f"on_hit callback failed: {e}")
-                
-                return result
-            
-            # Cache miss - compute result
-            result = func(*args, **kwargs)
-            
+            if result is not None and on_hit:
+                try:
+                    on_hit(key, result)
+                except Exception as e:
+                    logger.warning(f"on_hit callback failed: {e}")
+            return result
+        
+        def store(key: Hashable, result: Any) -> None:
             # Store in cache
             if hasattr(cache, 'put'):
                 cache.put(key, result)
@@ -103,8 +118,57 @@ def xwcached(
                     on_miss(key, result)
                 except Exception as e:
                     logger.warning(f"on_miss callback failed: {e}")
+        
+        if asyncio.iscoroutinefunction(func):
+            async_flight = AsyncSingleFlight() if coalesce else None
             
-            return result
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if condition and not condition(args, kwargs):
+                    return await func(*args, **kwargs)
+                
+                key = build_key(args, kwargs)
+                result = lookup(key)
+                if result is not None:
+                    return result
+                
+                async def compute():
+                    value = await func(*args, **kwargs)
+                    store(key, value)
+                    return value
+                
+                if async_flight is None:
+                    return await compute()
+                return await async_flight.do(key, compute, timeout=coalesce_timeout)
+            
+            wrapper = async_wrapper
+        else:
+            flight = SingleFlight() if coalesce else None
+            
+            @functools.wraps(func)
+            def sync_wrapper(*args, **kwargs):
+                # Check condition
+                if condition and not condition(args, kwargs):
+                    return func(*args, **kwargs)
+                
+                key = build_key(args, kwargs)
+                
+                # Try to get from cache
+                result = lookup(key)
+                if result is not None:
+                    return result
+                
+                # Cache miss - compute result
+                def compute():
+                    value = func(*args, **kwargs)
+                    store(key, value)
+                    return value
+                
+                if flight is None:
+                    return compute()
+                return flight.do(key, compute, timeout=coalesce_timeout)
+            
+            wrapper = sync_wrapper
         
         # Add cache control methods to wrapper
         wrapper.cache = cache
@@ -123,7 +187,9 @@ def xw_async_cached(
     condition: Optional[Callable] = None,
     on_hit: Optional[Callable] = None,
     on_miss: Optional[Callable] = None,
-    namespace: Optional[str] = None
+    namespace: Optional[str] = None,
+    coalesce: bool = True,
+    coalesce_timeout: Optional[float] = None
 ):
     """
     Advanced async caching decorator (eXonware naming convention).
@@ -136,6 +202,10 @@ def xw_async_cached(
         on_hit: Async callback on cache hit
         on_miss: Async callback on cache miss
         namespace: Cache namespace for key prefixing
+        coalesce: Concurrent misses on the same key await a single call
+            and share its result or exception
+        coalesce_timeout: Max seconds to wait for another caller's in-flight
+            call before raising CacheTimeoutError (None = wait indefinitely)
         
     Example:
         @xw_async_cached(ttl=300)
@@ -147,6 +217,8 @@ def xw_async_cached(
         cache = AsyncLRUCache(capacity=128)
     
     def decorator(func: Callable) -> Callable:
+        flight = AsyncSingleFlight() if coalesce else None
+        
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
             # Check condition
@@ -184,17 +256,22 @@ def xw_async_cached(
                 return result
             
             # Cache miss
-            result = await func(*args, **kwargs)
-            
-            await cache.put(key, result)
-            
-            if on_miss:
-                if asyncio.iscoroutinefunction(on_miss):
-                    await on_miss(key, result)
-                else:
-                    on_miss(key, result)
+            async def compute():
+                result = await func(*args, **kwargs)
+                
+                await cache.put(key, result)
+                
+                if on_miss:
+                    if asyncio.iscoroutinefunction(on_miss):
+                        await on_miss(key, result)
+                    else:
+                        on_miss(key, result)
+                
+                return result
             
-            return result
+            if flight is None:
+                return await compute()
+            return await flight.do(key, compute, timeout=coalesce_timeout)
         
         wrapper.cache = cache
         wrapper.cache_clear = lambda: asyncio.run(cache.clear())
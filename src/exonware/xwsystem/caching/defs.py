@@ -55,3 +55,10 @@ class CacheLevel(Enum):
     L2 = "l2"  # Disk cache
     L3 = "l3"  # Network cache
     DISTRIBUTED = "distributed"  # Distributed cache
+
+
+class StatsMode(Enum):
+    """How caches count hits, misses and evictions."""
+    SHARED = "shared"  # Plain counters updated under the cache lock
+    PER_THREAD = "per_thread"  # Per-thread counters merged by get_stats()
+    DISABLED = "disabled"  # No hit/miss/eviction counting on the hot path
@@ -7,34 +7,130 @@ Version: 0.0.1.409
 Generation Date: October 26, 2025
 
 Disk cache implementation with pickle-based persistence.
+
+Storage layout (under cache_dir):
+    index.db                SQLite index (WAL mode): one row per key with its
+                            location, size, created/last-access/expiry times,
+                            plus per-segment byte counts and the entry count
+    segments/NNNNNN.seg     Append-only segment files holding small values
+    blobs/ab/<sha>.<v>.pkl  Individual files for large values (one version
+                            per write, so replaced files are never reused)
+
+All shared state lives in the index, and every write runs in a
+BEGIN IMMEDIATE transaction, so several DiskCache instances or processes
+can share one cache_dir: SQLite's write lock serializes segment appends,
+and offsets are taken from the segment file itself. Files are only
+deleted after the transaction that released them commits.
+
+Performance:
+    - OLD: One pickle file per key, the whole metadata dict re-pickled on
+      every get/set, and a full sort of all metadata to evict
+    - NEW: set/get are one indexed SQLite transaction plus one append/pread;
+      LRU eviction and expiry use indexes on last_access/expires; access
+      times are batched; dead segment space is reclaimed by compaction
 """
 
+import hashlib
 import os
 import pickle
-import hashlib
+import sqlite3
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
-from typing import Any, Optional, Dict, Set
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple
 from .contracts import ICache
 from .errors import CacheError
+from .value_codec import ValueCodec, is_frame, loads_frame
 from ..config.logging_setup import get_logger
 
 logger = get_logger("xwsystem.caching.disk_cache")
 
 
+# Values up to this size are packed into segments; larger ones get their own file
+DEFAULT_INLINE_THRESHOLD = 64 * 1024
+
+# Active segment is rolled over once it reaches this size
+DEFAULT_SEGMENT_SIZE = 64 * 1024 * 1024
+
+# Segments whose live bytes fall below this fraction are compacted
+DEFAULT_COMPACT_THRESHOLD = 0.5
+
+# Buffered last-access updates are written once this many accumulate
+_ACCESS_FLUSH_THRESHOLD = 1024
+
+# Keys per "WHERE key IN (...)" statement (below SQLite's variable limit)
+_SQL_BATCH_SIZE = 500
+
+# Default threads reading blob files in get_many
+DEFAULT_IO_WORKERS = 4
+
+# Seconds a writer waits for another process's write transaction
+_BUSY_TIMEOUT = 30.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    segment INTEGER,
+    offset INTEGER,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    last_access REAL NOT NULL,
+    expires REAL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries(last_access);
+CREATE INDEX IF NOT EXISTS idx_entries_expires ON entries(expires) WHERE expires IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_entries_segment ON entries(segment) WHERE segment IS NOT NULL;
+CREATE TABLE IF NOT EXISTS segments (
+    id INTEGER PRIMARY KEY,
+    live INTEGER NOT NULL,
+    total INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+# Entry rows passed around internally: (key, segment, offset, size). For
+# blob entries segment is None and offset holds the blob file version.
+_Row = Tuple[str, Optional[int], Optional[int], int]
+
+
+def _read_at(handle: BinaryIO, offset: int, size: int) -> bytes:
+    """Positional read (pread where available, so readers need no seek)."""
+    if hasattr(os, 'pread'):
+        return os.pread(handle.fileno(), size, offset)
+    handle.seek(offset)
+    return handle.read(size)
+
+
+def _unlink(path: Path):
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Failed to remove disk cache file {path}: {e}")
+
+
 class DiskCache(ICache):
     """
     Disk-based cache with pickle persistence.
-    
+
     Features:
     - Pickle-based serialization
-    - SHA256 key hashing for filesystem safety
-    - Size limits and eviction policies
-    - Thread-safe file operations
+    - WAL-mode SQLite index with LRU and expiry columns
+    - Small values packed into append-only segment files, with compaction
+    - Large values stored as individual files (sharded directories)
+    - Size limits and LRU eviction
+    - Optional value codec (serializer + compression) for large values
+    - Thread-safe operations; instances and processes may share a cache_dir
     - Automatic cache directory management
     """
-    
+
     def __init__(
         self,
         namespace: str = "default",
@@ -42,39 +138,53 @@ class DiskCache(ICache):
         max_size: int = 1000,
         max_file_size: int = 10 * 1024 * 1024,  # 10MB
         cleanup_interval: int = 3600,  # 1 hour
+        inline_threshold: int = DEFAULT_INLINE_THRESHOLD,
+        segment_size: int = DEFAULT_SEGMENT_SIZE,
+        compact_threshold: float = DEFAULT_COMPACT_THRESHOLD,
+        max_io_workers: int = DEFAULT_IO_WORKERS,
+        value_codec: Optional[ValueCodec] = None,
     ):
         """
         Initialize disk cache.
-        
+
         Args:
             namespace: Cache namespace for organization
             cache_dir: Custom cache directory (default: ~/.xwsystem/cache/{namespace}/)
             max_size: Maximum number of cache entries
-            max_file_size: Maximum size per cache file in bytes
-            cleanup_interval: Cleanup interval in seconds
+            max_file_size: Maximum size per cached value in bytes
+            cleanup_interval: Cleanup (expiry + compaction) interval in seconds
+            inline_threshold: Values up to this many bytes are packed into segments
+            segment_size: Segment file size at which a new segment is started
+            compact_threshold: Compact segments whose live fraction drops below this
+            max_io_workers: Threads reading blob files concurrently in get_many
+            value_codec: Optional ValueCodec used instead of plain pickle; entries
+                are self-describing, so existing pickled entries stay readable
         """
         self.namespace = namespace
         self.max_size = max_size
         self.max_file_size = max_file_size
         self.cleanup_interval = cleanup_interval
-        
+        self.inline_threshold = inline_threshold
+        self.segment_size = segment_size
+        self.compact_threshold = compact_threshold
+        self.max_io_workers = max(1, max_io_workers)
+        self.value_codec = value_codec
+
         # Setup cache directory
         if cache_dir:
             self.cache_dir = Path(cache_dir)
         else:
             home_dir = Path.home()
             self.cache_dir = home_dir / ".xwsystem" / "cache" / namespace
-        
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Thread safety
+
+        self.segments_dir = self.cache_dir / "segments"
+        self.blobs_dir = self.cache_dir / "blobs"
+        self.segments_dir.mkdir(parents=True, exist_ok=True)
+        self.blobs_dir.mkdir(parents=True, exist_ok=True)
+
+        # Thread safety (one SQLite connection, guarded by this lock)
         self._lock = threading.RLock()
-        
-        # Metadata file for tracking cache entries
-        self.metadata_file = self.cache_dir / "metadata.pkl"
-        self._metadata: Dict[str, Dict[str, Any]] = {}
-        self._load_metadata()
-        
+
         # Statistics
         self._stats = {
             'hits': 0,
@@ -82,241 +192,728 @@ class DiskCache(ICache):
             'sets': 0,
             'deletes': 0,
             'evictions': 0,
+            'expirations': 0,
+            'compactions': 0,
             'errors': 0,
         }
-        
+
+        # File handles only; segment byte counts live in the index
+        self._readers: Dict[int, BinaryIO] = {}
+        self._writer: Optional[BinaryIO] = None
+        self._writer_segment: Optional[int] = None
+        self._pending_access: Dict[str, float] = {}
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+
+        # File deletions deferred until COMMIT, blob removals run on ROLLBACK
+        self._on_commit: List[Callable[[], None]] = []
+        self._on_rollback: List[Callable[[], None]] = []
+
+        self.index_file = self.cache_dir / "index.db"
+        self._db = self._open_index()
+        self._load_segments()
+        self._migrate_legacy()
+
         # Last cleanup time
         self._last_cleanup = time.time()
-    
-    def _load_metadata(self):
-        """Load cache metadata from disk."""
+
+    # ------------------------------------------------------------------
+    # Index and segment management
+    # ------------------------------------------------------------------
+
+    def _open_index(self) -> sqlite3.Connection:
+        """Open the SQLite index in WAL mode."""
         try:
-            if self.metadata_file.exists():
-                with open(self.metadata_file, 'rb') as f:
-                    self._metadata = pickle.load(f)
-            else:
-                self._metadata = {}
-        except Exception as e:
-            logger.warning(f"Failed to load cache metadata: {e}")
-            self._metadata = {}
-    
-    def _save_metadata(self):
-        """Save cache metadata to disk."""
+            db = sqlite3.connect(
+                str(self.index_file), timeout=_BUSY_TIMEOUT, isolation_level=None, check_same_thread=False
+            )
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.executescript(_SCHEMA)
+            return db
+        except sqlite3.Error as e:
+            raise CacheError(f"Failed to open disk cache index {self.index_file}: {e}") from e
+
+    @contextmanager
+    def _transaction(self):
+        """
+        Run statements in one write transaction (joins an already open one).
+
+        BEGIN IMMEDIATE takes SQLite's write lock up front, which also
+        serializes segment appends between processes. Storage released in
+        the transaction is deleted only after COMMIT; blob files written by
+        a rolled back transaction are removed.
+        """
+        if self._db.in_transaction:
+            yield
+            return
+        self._db.execute("BEGIN IMMEDIATE")
         try:
-            with open(self.metadata_file, 'wb') as f:
-                pickle.dump(self._metadata, f)
+            yield
+            self._db.execute("COMMIT")
+        except BaseException:
+            if self._db.in_transaction:
+                self._db.execute("ROLLBACK")
+            actions, self._on_rollback, self._on_commit = self._on_rollback, [], []
+            for action in actions:
+                action()
+            raise
+        actions, self._on_commit, self._on_rollback = self._on_commit, [], []
+        for action in actions:
+            action()
+
+    def _segment_path(self, segment_id: int) -> Path:
+        return self.segments_dir / f"{segment_id:06d}.seg"
+
+    def _blob_path(self, key: str, version: Optional[int]) -> Path:
+        hashed_key = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        if version is None:
+            return self.blobs_dir / hashed_key[:2] / f"{hashed_key}.pkl"
+        return self.blobs_dir / hashed_key[:2] / f"{hashed_key}.{version:012x}.pkl"
+
+    def _load_segments(self):
+        """Build segment byte counts and the entry count for indexes that lack them."""
+        with self._transaction():
+            if self._db.execute("SELECT 1 FROM counters WHERE name = 'entries'").fetchone() is not None:
+                return
+
+            segments = {}
+            for path in self.segments_dir.glob("*.seg"):
+                try:
+                    segments[int(path.stem)] = [0, path.stat().st_size]
+                except ValueError:
+                    continue
+            rows = self._db.execute(
+                "SELECT segment, SUM(size) FROM entries WHERE segment IS NOT NULL GROUP BY segment"
+            ).fetchall()
+            for segment_id, live in rows:
+                if segment_id in segments:
+                    segments[segment_id][0] = live
+            if not segments:
+                segments[0] = [0, 0]
+
+            self._db.execute("DELETE FROM segments")
+            self._db.executemany(
+                "INSERT INTO segments (id, live, total) VALUES (?, ?, ?)",
+                [(segment_id, live, total) for segment_id, (live, total) in segments.items()],
+            )
+            self._db.execute(
+                "INSERT INTO counters (name, value) SELECT 'entries', COUNT(*) FROM entries"
+            )
+
+    def _entry_count(self) -> int:
+        return self._db.execute("SELECT value FROM counters WHERE name = 'entries'").fetchone()[0]
+
+    def _reader(self, segment_id: int) -> BinaryIO:
+        handle = self._readers.get(segment_id)
+        if handle is None:
+            handle = open(self._segment_path(segment_id), 'rb', buffering=0)
+            self._readers[segment_id] = handle
+        return handle
+
+    def _append(self, data: bytes) -> Tuple[int, int]:
+        """Append data to the active segment, rolling over when it is full (write transaction only)."""
+        segment_id, total = self._db.execute(
+            "SELECT id, total FROM segments ORDER BY id DESC LIMIT 1"
+        ).fetchone()
+        if total and total + len(data) > self.segment_size:
+            segment_id += 1
+            self._db.execute("INSERT INTO segments (id, live, total) VALUES (?, 0, 0)", (segment_id,))
+
+        if self._writer_segment != segment_id:
+            self._close_writer()
+            self._writer = open(self._segment_path(segment_id), 'ab')
+            self._writer_segment = segment_id
+        # The file end is authoritative: rolled back or crashed writers may
+        # have left bytes past the recorded total (they count as dead bytes)
+        offset = os.fstat(self._writer.fileno()).st_size
+        self._writer.write(data)
+        self._writer.flush()
+        self._db.execute(
+            "UPDATE segments SET live = live + ?, total = ? WHERE id = ?",
+            (len(data), offset + len(data), segment_id),
+        )
+        return segment_id, offset
+
+    def _close_writer(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            self._writer_segment = None
+
+    def _drop_segment(self, segment_id: int):
+        """Remove a segment file that no longer holds live data."""
+        handle = self._readers.pop(segment_id, None)
+        if handle is not None:
+            handle.close()
+        if self._writer_segment == segment_id:
+            self._close_writer()
+        _unlink(self._segment_path(segment_id))
+
+    def _release(self, key: str, segment_id: Optional[int], offset: Optional[int], size: int):
+        """Account for a removed/replaced value: dead segment bytes or blob file."""
+        if segment_id is None:
+            self._on_commit.append(partial(_unlink, self._blob_path(key, offset)))
+            return
+
+        self._db.execute("UPDATE segments SET live = live - ? WHERE id = ?", (size, segment_id))
+        row = self._db.execute(
+            "SELECT live FROM segments WHERE id = ? AND id < (SELECT MAX(id) FROM segments)", (segment_id,)
+        ).fetchone()
+        if row is not None and row[0] <= 0:
+            self._db.execute("DELETE FROM segments WHERE id = ?", (segment_id,))
+            self._on_commit.append(partial(self._drop_segment, segment_id))
+
+    def _read_value(self, key: str, segment_id: Optional[int], offset: Optional[int], size: int) -> Any:
+        if segment_id is None:
+            return self._read_blob(key, offset)
+        data = _read_at(self._reader(segment_id), offset, size)
+        if len(data) != size:
+            raise CacheError(f"Truncated segment {segment_id} for key {key}")
+        return self._loads(data)
+
+    def _dumps(self, value: Any) -> bytes:
+        """Serialize a value (value codec frame, or pickle)."""
+        if self.value_codec is not None:
+            return self.value_codec.dumps(value)
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _loads(self, data: bytes) -> Any:
+        """Deserialize stored bytes, whichever format wrote them."""
+        if is_frame(data):
+            if self.value_codec is not None:
+                return self.value_codec.loads(data)
+            return loads_frame(data)
+        return pickle.loads(data)
+
+    def _write_value(self, key: str, data: bytes) -> Tuple[Optional[int], int]:
+        """Store serialized data; returns (segment, offset), or (None, version) for a blob."""
+        if len(data) <= self.inline_threshold:
+            return self._append(data)
+
+        version = int.from_bytes(os.urandom(6), 'big')
+        path = self._blob_path(key, version)
+        path.parent.mkdir(exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        self._on_rollback.append(partial(_unlink, path))
+        return None, version
+
+    def _flush_access(self):
+        """Write buffered last-access times to the index."""
+        if not self._pending_access:
+            return
+        updates = [(t, k) for k, t in self._pending_access.items()]
+        self._pending_access.clear()
+        with self._transaction():
+            self._db.executemany("UPDATE entries SET last_access = ? WHERE key = ?", updates)
+
+    def _remove_rows(self, rows: List[_Row]) -> int:
+        """
+        Delete index rows and release their storage (write transaction only).
+
+        A row is only deleted while it still points at the same location,
+        so rows read outside the transaction (possibly changed by another
+        process since) are never released twice.
+
+        Returns:
+            Number of rows deleted
+        """
+        removed = 0
+        for key, segment_id, offset, size in rows:
+            self._pending_access.pop(key, None)
+            cursor = self._db.execute(
+                "DELETE FROM entries WHERE key = ? AND segment IS ? AND offset IS ?", (key, segment_id, offset)
+            )
+            if cursor.rowcount:
+                self._release(key, segment_id, offset, size)
+                removed += 1
+        if removed:
+            self._db.execute("UPDATE counters SET value = value - ? WHERE name = 'entries'", (removed,))
+        return removed
+
+    def _evict_for(self, incoming: int):
+        """Evict least recently used entries to make room for incoming new keys."""
+        overflow = self._entry_count() + incoming - self.max_size
+        if overflow <= 0:
+            return
+        self._flush_access()
+        rows = self._db.execute(
+            "SELECT key, segment, offset, size FROM entries ORDER BY last_access LIMIT ?", (overflow,)
+        ).fetchall()
+        self._stats['evictions'] += self._remove_rows(rows)
+
+    def _select_rows(self, columns: str, keys: List[str]) -> List[tuple]:
+        """Fetch index rows for many keys, chunked below SQLite's variable limit."""
+        rows = []
+        for start in range(0, len(keys), _SQL_BATCH_SIZE):
+            chunk = keys[start:start + _SQL_BATCH_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            rows.extend(self._db.execute(
+                f"SELECT {columns} FROM entries WHERE key IN ({placeholders})", chunk
+            ).fetchall())
+        return rows
+
+    def _get_io_pool(self) -> ThreadPoolExecutor:
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(
+                max_workers=self.max_io_workers,
+                thread_name_prefix=f"xwsystem-disk-cache-{self.namespace}",
+            )
+        return self._io_pool
+
+    def _read_blob(self, key: str, version: Optional[int]) -> Any:
+        with open(self._blob_path(key, version), 'rb') as f:
+            return self._loads(f.read())
+
+    def _delete_entry(self, key: str) -> bool:
+        """Delete cache entry."""
+        with self._transaction():
+            row = self._db.execute(
+                "SELECT segment, offset, size FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return False
+            return self._remove_rows([(key, *row)]) > 0
+
+    def _migrate_legacy(self):
+        """Import entries from the old metadata.pkl + one-pickle-per-key layout."""
+        metadata_file = self.cache_dir / "metadata.pkl"
+        if not metadata_file.exists():
+            return
+
+        try:
+            with open(metadata_file, 'rb') as f:
+                metadata = pickle.load(f)
         except Exception as e:
-            logger.error(f"Failed to save cache metadata: {e}")
-            self._stats['errors'] += 1
-    
-    def _hash_key(self, key: str) -> str:
-        """Hash key for filesystem safety."""
-        return hashlib.sha256(key.encode('utf-8')).hexdigest()
-    
-    def _get_cache_file(self, key: str) -> Path:
-        """Get cache file path for key."""
-        hashed_key = self._hash_key(key)
-        return self.cache_dir / f"{hashed_key}.pkl"
-    
+            logger.warning(f"Failed to load legacy cache metadata: {e}")
+            metadata = {}
+
+        now = time.time()
+        migrated = 0
+        for key, meta in metadata.items():
+            legacy_file = self.cache_dir / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.pkl"
+            try:
+                if meta.get('expires', now + 1) > now and legacy_file.exists():
+                    self._store(key, legacy_file.read_bytes(), meta.get('expires'),
+                                meta.get('created', now), meta.get('last_access', now))
+                    migrated += 1
+                legacy_file.unlink(missing_ok=True)
+            except Exception as e:
+                logger.warning(f"Failed to migrate legacy cache entry {key}: {e}")
+
+        metadata_file.unlink(missing_ok=True)
+        logger.info(f"Migrated {migrated} legacy entries into disk cache '{self.namespace}'")
+
+    def _store(self, key: str, data: bytes, expires: Optional[float],
+               created: Optional[float] = None, last_access: Optional[float] = None):
+        """Write data and upsert its index row, evicting if the key is new."""
+        now = time.time()
+        with self._transaction():
+            old = self._db.execute(
+                "SELECT segment, offset, size FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if old is None:
+                self._evict_for(1)
+            segment_id, offset = self._write_value(key, data)
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries (key, segment, offset, size, created, last_access, expires) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, segment_id, offset, len(data), created or now, last_access or now, expires),
+            )
+            if old is None:
+                self._db.execute("UPDATE counters SET value = value + 1 WHERE name = 'entries'")
+            else:
+                self._release(key, *old)
+        self._pending_access.pop(key, None)
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
     def _cleanup_if_needed(self):
-        """Cleanup old entries if needed."""
+        """Remove expired entries and compact segments once per cleanup interval."""
         current_time = time.time()
         if current_time - self._last_cleanup < self.cleanup_interval:
             return
-        
-        with self._lock:
-            try:
-                # Remove expired entries
-                expired_keys = []
-                for key, metadata in self._metadata.items():
-                    if 'expires' in metadata and metadata['expires'] < current_time:
-                        expired_keys.append(key)
-                
-                for key in expired_keys:
-                    self._delete_entry(key)
-                
-                # Evict oldest entries if over limit
-                if len(self._metadata) > self.max_size:
-                    # Sort by access time and evict oldest
-                    sorted_items = sorted(
-                        self._metadata.items(),
-                        key=lambda x: x[1].get('last_access', 0)
-                    )
-                    
-                    evict_count = len(self._metadata) - self.max_size
-                    for key, _ in sorted_items[:evict_count]:
-                        self._delete_entry(key)
-                        self._stats['evictions'] += 1
-                
-                self._last_cleanup = current_time
-                
-            except Exception as e:
-                logger.error(f"Cache cleanup failed: {e}")
-                self._stats['errors'] += 1
-    
-    def _delete_entry(self, key: str):
-        """Delete cache entry."""
+
         try:
-            cache_file = self._get_cache_file(key)
-            if cache_file.exists():
-                cache_file.unlink()
-            
-            if key in self._metadata:
-                del self._metadata[key]
-                
+            self._remove_expired(current_time)
+            self._compact_segments()
+            self._last_cleanup = current_time
         except Exception as e:
-            logger.warning(f"Failed to delete cache entry {key}: {e}")
-    
+            logger.error(f"Cache cleanup failed: {e}")
+            self._stats['errors'] += 1
+
+    def _remove_expired(self, now: float) -> int:
+        with self._transaction():
+            rows = self._db.execute(
+                "SELECT key, segment, offset, size FROM entries WHERE expires IS NOT NULL AND expires < ?",
+                (now,),
+            ).fetchall()
+            removed = self._remove_rows(rows)
+        self._stats['expirations'] += removed
+        return removed
+
+    def _compact_segments(self, threshold: Optional[float] = None) -> int:
+        """Rewrite live data out of sparse segments into the active segment."""
+        threshold = self.compact_threshold if threshold is None else threshold
+        query = (
+            "SELECT id FROM segments WHERE id < (SELECT MAX(id) FROM segments) "
+            "AND total > 0 AND live < total * ?"
+        )
+        candidates = [row[0] for row in self._db.execute(query, (threshold,)).fetchall()]
+
+        compacted = 0
+        for segment_id in candidates:
+            with self._transaction():
+                # Another process may have compacted it in the meantime
+                if self._db.execute(query + " AND id = ?", (threshold, segment_id)).fetchone() is None:
+                    continue
+                rows = self._db.execute(
+                    "SELECT key, offset, size FROM entries WHERE segment = ?", (segment_id,)
+                ).fetchall()
+                reader = self._reader(segment_id)
+                moved = []
+                for key, offset, size in rows:
+                    new_segment, new_offset = self._append(_read_at(reader, offset, size))
+                    moved.append((new_segment, new_offset, key))
+                self._db.executemany("UPDATE entries SET segment = ?, offset = ? WHERE key = ?", moved)
+                self._db.execute("DELETE FROM segments WHERE id = ?", (segment_id,))
+                self._on_commit.append(partial(self._drop_segment, segment_id))
+            self._stats['compactions'] += 1
+            compacted += 1
+
+        if compacted:
+            logger.debug(f"Disk cache '{self.namespace}' compacted {compacted} segments")
+        return compacted
+
+    def compact(self, threshold: float = 1.0) -> int:
+        """
+        Compact segments now.
+
+        Args:
+            threshold: Compact non-active segments whose live fraction is
+                below this (1.0 = every segment with any dead bytes)
+
+        Returns:
+            Number of segments compacted
+        """
+        with self._lock:
+            return self._compact_segments(threshold)
+
+    # ------------------------------------------------------------------
+    # ICache API
+    # ------------------------------------------------------------------
+
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache."""
         with self._lock:
             try:
                 self._cleanup_if_needed()
-                
-                if key not in self._metadata:
+
+                row = self._db.execute(
+                    "SELECT segment, offset, size, expires FROM entries WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
                     self._stats['misses'] += 1
                     return None
-                
-                metadata = self._metadata[key]
-                
+
+                segment_id, offset, size, expires = row
+                now = time.time()
+
                 # Check expiration
-                if 'expires' in metadata and metadata['expires'] < time.time():
-                    self._delete_entry(key)
+                if expires is not None and expires < now:
+                    with self._transaction():
+                        self._remove_rows([(key, segment_id, offset, size)])
+                    self._stats['expirations'] += 1
                     self._stats['misses'] += 1
                     return None
-                
-                # Load from disk
-                cache_file = self._get_cache_file(key)
-                if not cache_file.exists():
-                    del self._metadata[key]
+
+                try:
+                    value = self._read_value(key, segment_id, offset, size)
+                except FileNotFoundError:
+                    with self._transaction():
+                        self._remove_rows([(key, segment_id, offset, size)])
                     self._stats['misses'] += 1
                     return None
-                
-                with open(cache_file, 'rb') as f:
-                    value = pickle.load(f)
-                
-                # Update access time
-                metadata['last_access'] = time.time()
-                self._save_metadata()
-                
+
+                # Update access time (batched)
+                self._pending_access[key] = now
+                if len(self._pending_access) >= _ACCESS_FLUSH_THRESHOLD:
+                    self._flush_access()
+
                 self._stats['hits'] += 1
                 return value
-                
+
             except Exception as e:
                 logger.error(f"Cache get failed for key {key}: {e}")
                 self._stats['errors'] += 1
                 self._stats['misses'] += 1
                 return None
-    
+
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
         """Set value in cache."""
         with self._lock:
             try:
                 self._cleanup_if_needed()
-                
+
                 # Check file size limit
-                serialized = pickle.dumps(value)
+                serialized = self._dumps(value)
                 if len(serialized) > self.max_file_size:
                     logger.warning(f"Value too large for cache: {len(serialized)} bytes")
                     return False
-                
-                # Save to disk
-                cache_file = self._get_cache_file(key)
-                with open(cache_file, 'wb') as f:
-                    f.write(serialized)
-                
-                # Update metadata
-                metadata = {
-                    'size': len(serialized),
-                    'created': time.time(),
-                    'last_access': time.time(),
-                }
-                
-                if ttl:
-                    metadata['expires'] = time.time() + ttl
-                
-                self._metadata[key] = metadata
-                self._save_metadata()
-                
+
+                expires = time.time() + ttl if ttl else None
+                self._store(key, serialized, expires)
+
                 self._stats['sets'] += 1
                 return True
-                
+
             except Exception as e:
                 logger.error(f"Cache set failed for key {key}: {e}")
                 self._stats['errors'] += 1
                 return False
-    
+
     def delete(self, key: str) -> bool:
         """Delete value from cache."""
         with self._lock:
             try:
-                if key in self._metadata:
-                    self._delete_entry(key)
+                if self._delete_entry(key):
                     self._stats['deletes'] += 1
                     return True
                 return False
-                
+
             except Exception as e:
                 logger.error(f"Cache delete failed for key {key}: {e}")
                 self._stats['errors'] += 1
                 return False
-    
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Get several values with one lock acquisition and batched index lookups.
+
+        Segment values are read with positional reads; values stored as
+        individual blob files are read and unpickled concurrently on a
+        small thread pool.
+
+        Args:
+            keys: Keys to fetch
+
+        Returns:
+            Dictionary of keys found (and not expired) to their values
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+
+        results: Dict[str, Any] = {}
+        with self._lock:
+            try:
+                self._cleanup_if_needed()
+                now = time.time()
+                rows = self._select_rows("key, segment, offset, size, expires", keys)
+
+                expired = [(key, segment_id, offset, size) for key, segment_id, offset, size, expires in rows
+                           if expires is not None and expires < now]
+                if expired:
+                    with self._transaction():
+                        self._stats['expirations'] += self._remove_rows(expired)
+                expired_keys = {row[0] for row in expired}
+
+                missing: List[_Row] = []
+                blobs: List[Tuple[str, Optional[int], int]] = []
+                for key, segment_id, offset, size, _ in rows:
+                    if key in expired_keys:
+                        continue
+                    if segment_id is None:
+                        blobs.append((key, offset, size))
+                        continue
+                    try:
+                        results[key] = self._read_value(key, segment_id, offset, size)
+                    except Exception as e:
+                        logger.error(f"Cache get failed for key {key}: {e}")
+                        self._stats['errors'] += 1
+
+                if len(blobs) > 1 and self.max_io_workers > 1:
+                    futures = [(key, version, size, self._get_io_pool().submit(self._read_blob, key, version))
+                               for key, version, size in blobs]
+                    outcomes = []
+                    for key, version, size, future in futures:
+                        try:
+                            outcomes.append((key, version, size, future.result(), None))
+                        except Exception as e:
+                            outcomes.append((key, version, size, None, e))
+                else:
+                    outcomes = []
+                    for key, version, size in blobs:
+                        try:
+                            outcomes.append((key, version, size, self._read_blob(key, version), None))
+                        except Exception as e:
+                            outcomes.append((key, version, size, None, e))
+
+                for key, version, size, value, error in outcomes:
+                    if error is None:
+                        results[key] = value
+                    elif isinstance(error, FileNotFoundError):
+                        missing.append((key, None, version, size))
+                    else:
+                        logger.error(f"Cache get failed for key {key}: {error}")
+                        self._stats['errors'] += 1
+
+                if missing:
+                    with self._transaction():
+                        self._remove_rows(missing)
+
+                for key in results:
+                    self._pending_access[key] = now
+                if len(self._pending_access) >= _ACCESS_FLUSH_THRESHOLD:
+                    self._flush_access()
+
+            except Exception as e:
+                logger.error(f"Cache get_many failed: {e}")
+                self._stats['errors'] += 1
+                results = {}
+
+            self._stats['hits'] += len(results)
+            self._stats['misses'] += len(keys) - len(results)
+        return results
+
+    def put_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> int:
+        """
+        Set several values in a single index transaction.
+
+        Args:
+            items: Key-value pairs to store
+            ttl: Optional time-to-live in seconds for every entry
+
+        Returns:
+            Number of values stored (oversized or unpicklable values are skipped)
+        """
+        serialized: Dict[str, bytes] = {}
+        for key, value in items.items():
+            try:
+                data = self._dumps(value)
+            except Exception as e:
+                logger.error(f"Cache set failed for key {key}: {e}")
+                self._stats['errors'] += 1
+                continue
+            if len(data) > self.max_file_size:
+                logger.warning(f"Value too large for cache: {len(data)} bytes")
+                continue
+            serialized[key] = data
+
+        with self._lock:
+            try:
+                self._cleanup_if_needed()
+                expires = time.time() + ttl if ttl else None
+                with self._transaction():
+                    for key, data in serialized.items():
+                        self._store(key, data, expires)
+                self._stats['sets'] += len(serialized)
+                return len(serialized)
+
+            except Exception as e:
+                logger.error(f"Cache put_many failed: {e}")
+                self._stats['errors'] += 1
+                return 0
+
+    def delete_many(self, keys: List[str]) -> int:
+        """
+        Delete several keys in a single index transaction.
+
+        Args:
+            keys: Keys to delete
+
+        Returns:
+            Number of keys deleted
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return 0
+        with self._lock:
+            try:
+                with self._transaction():
+                    rows = self._select_rows("key, segment, offset, size", keys)
+                    removed = self._remove_rows(rows)
+                self._stats['deletes'] += removed
+                return removed
+
+            except Exception as e:
+                logger.error(f"Cache delete_many failed: {e}")
+                self._stats['errors'] += 1
+                return 0
+
     def clear(self) -> bool:
         """Clear all cache entries."""
         with self._lock:
             try:
-                # Delete all cache files
-                for cache_file in self.cache_dir.glob("*.pkl"):
-                    if cache_file.name != "metadata.pkl":
-                        cache_file.unlink()
-                
-                # Clear metadata
-                self._metadata.clear()
-                self._save_metadata()
-                
+                with self._transaction():
+                    blobs = self._db.execute(
+                        "SELECT key, offset FROM entries WHERE segment IS NULL"
+                    ).fetchall()
+                    segment_ids = [row[0] for row in self._db.execute("SELECT id FROM segments").fetchall()]
+                    self._db.execute("DELETE FROM entries")
+                    self._db.execute("DELETE FROM segments")
+                    # Segment ids are never reused: other instances may still hold handles
+                    self._db.execute(
+                        "INSERT INTO segments (id, live, total) VALUES (?, 0, 0)", (max(segment_ids, default=-1) + 1,)
+                    )
+                    self._db.execute("UPDATE counters SET value = 0 WHERE name = 'entries'")
+                    for segment_id in segment_ids:
+                        self._on_commit.append(partial(self._drop_segment, segment_id))
+                    for key, version in blobs:
+                        self._on_commit.append(partial(_unlink, self._blob_path(key, version)))
+                self._pending_access.clear()
                 return True
-                
+
             except Exception as e:
                 logger.error(f"Cache clear failed: {e}")
                 self._stats['errors'] += 1
                 return False
-    
+
     def exists(self, key: str) -> bool:
         """Check if key exists in cache."""
         with self._lock:
             try:
-                if key not in self._metadata:
+                row = self._db.execute(
+                    "SELECT segment, offset, size, expires FROM entries WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
                     return False
-                
-                metadata = self._metadata[key]
-                
+
                 # Check expiration
-                if 'expires' in metadata and metadata['expires'] < time.time():
-                    self._delete_entry(key)
+                segment_id, offset, size, expires = row
+                if expires is not None and expires < time.time():
+                    with self._transaction():
+                        self._remove_rows([(key, segment_id, offset, size)])
+                    self._stats['expirations'] += 1
                     return False
-                
-                # Check file exists
-                cache_file = self._get_cache_file(key)
-                return cache_file.exists()
-                
+
+                return segment_id is not None or self._blob_path(key, offset).exists()
+
             except Exception as e:
                 logger.error(f"Cache exists check failed for key {key}: {e}")
                 return False
-    
+
     def size(self) -> int:
         """Get current cache size."""
         with self._lock:
-            return len(self._metadata)
-    
+            return self._entry_count()
+
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
         with self._lock:
             total_requests = self._stats['hits'] + self._stats['misses']
             hit_rate = self._stats['hits'] / total_requests if total_requests > 0 else 0
-            
+            segments, live_bytes, total_bytes = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(live), 0), COALESCE(SUM(total), 0) FROM segments"
+            ).fetchone()
+
             return {
                 'namespace': self.namespace,
-                'size': len(self._metadata),
+                'size': self._entry_count(),
                 'max_size': self.max_size,
                 'hits': self._stats['hits'],
                 'misses': self._stats['misses'],
@@ -324,10 +921,43 @@ class DiskCache(ICache):
                 'sets': self._stats['sets'],
                 'deletes': self._stats['deletes'],
                 'evictions': self._stats['evictions'],
+                'expirations': self._stats['expirations'],
+                'compactions': self._stats['compactions'],
                 'errors': self._stats['errors'],
+                'segments': segments,
+                'segment_bytes': total_bytes,
+                'dead_bytes': total_bytes - live_bytes,
                 'cache_dir': str(self.cache_dir),
+                **({'value_codec': self.value_codec.get_stats()} if self.value_codec else {}),
             }
 
+    def close(self):
+        """Flush buffered access times and release files and the index connection."""
+        with self._lock:
+            if self._db is None:
+                return
+            try:
+                self._flush_access()
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to flush disk cache access times: {e}")
+            self._close_writer()
+            for handle in self._readers.values():
+                handle.close()
+            self._readers.clear()
+            self._db.close()
+            self._db = None
+            if self._io_pool is not None:
+                self._io_pool.shutdown(wait=True)
+                self._io_pool = None
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
 
 __all__ = [
     "DiskCache",
@@ -5,30 +5,1098 @@ Email: connect@exonware.com
 Version: 0.0.1.409
 Generation Date: 01-Nov-2025
 
-Distributed cache implementations - Coming in v1.0.
+Distributed cache implementations.
+
+DistributedCache partitions keys across cache nodes with a consistent-hash
+ring (virtual nodes), writes every key to `replicas` consecutive nodes, fans
+multi-key operations out as one request per node, and can keep a local
+near-cache that nodes invalidate when another client writes.
+
+Nodes are reached through a pluggable transport:
+    - LocalTransport: an in-process DistributedCacheNode (tests, single process)
+    - TCPTransport: a pooled client for a CacheNodeServer (e.g. on localhost)
+
+Node storage and the wire protocol only handle bytes: keys are encoded
+deterministically and values are pickled by the client, so a node server
+never unpickles anything it receives.
 """
 
+import bisect
+import hashlib
+import pickle
+import queue
+import socket
+import socketserver
+import struct
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+from .base import ACache, ADistributedCache
+from .errors import DistributedCacheError
+from .lru_cache import LRUCache
+from .shared_memory_cache import _decode_key, _encode_key
+from ..config.logging_setup import get_logger
+
+logger = get_logger("xwsystem.caching.distributed")
+
+# Ring points per physical node
+DEFAULT_VIRTUAL_NODES = 160
 
-class DistributedCache:
+_NEAR_MISS = object()
+
+# Callback for invalidation messages: (origin client id, key bytes; empty = everything)
+InvalidationCallback = Callable[[bytes, List[bytes]], None]
+
+
+# ----------------------------------------------------------------------
+# Consistent-hash ring
+# ----------------------------------------------------------------------
+
+class HashRing:
     """
-    Distributed cache implementation (Coming in v1.0).
+    Consistent-hash ring with virtual nodes.
     
-    Future features:
-    - Redis backend integration
-    - Consistent hashing for distribution
-    - Replication and failover
-    - Cluster management
+    Adding or removing a node only moves the keys of that node's ring
+    segments (about 1/N of the keys).
+    """
+    
+    def __init__(self, nodes: Iterable[str] = (), virtual_nodes: int = DEFAULT_VIRTUAL_NODES):
+        if virtual_nodes <= 0:
+            raise ValueError(f"virtual_nodes must be positive, got {virtual_nodes}")
+        self.virtual_nodes = virtual_nodes
+        self._points: List[int] = []
+        self._owners: List[str] = []
+        self._nodes: List[str] = []
+        for node in nodes:
+            self.add_node(node)
+    
+    @staticmethod
+    def _hash(data: bytes) -> int:
+        return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'big')
+    
+    @property
+    def nodes(self) -> List[str]:
+        return list(self._nodes)
+    
+    def add_node(self, node: str) -> None:
+        """Add a node and its virtual points."""
+        if node in self._nodes:
+            return
+        self._nodes.append(node)
+        for i in range(self.virtual_nodes):
+            point = self._hash(f"{node}#{i}".encode('utf-8'))
+            index = bisect.bisect(self._points, point)
+            self._points.insert(index, point)
+            self._owners.insert(index, node)
     
-    For now, use local caches or implement Redis manually.
+    def remove_node(self, node: str) -> None:
+        """Remove a node and its virtual points."""
+        if node not in self._nodes:
+            return
+        self._nodes.remove(node)
+        kept = [(p, o) for p, o in zip(self._points, self._owners) if o != node]
+        self._points = [p for p, _ in kept]
+        self._owners = [o for _, o in kept]
+    
+    def get_nodes(self, key: bytes, count: int = 1) -> List[str]:
+        """The first `count` distinct nodes clockwise from the key's hash."""
+        if not self._points:
+            return []
+        count = min(count, len(self._nodes))
+        index = bisect.bisect(self._points, self._hash(key))
+        found: List[str] = []
+        total = len(self._points)
+        for step in range(total):
+            owner = self._owners[(index + step) % total]
+            if owner not in found:
+                found.append(owner)
+                if len(found) == count:
+                    break
+        return found
+    
+    def get_node(self, key: bytes) -> Optional[str]:
+        """The primary node for a key."""
+        nodes = self.get_nodes(key, 1)
+        return nodes[0] if nodes else None
+
+
+# ----------------------------------------------------------------------
+# Cache node (storage side)
+# ----------------------------------------------------------------------
+
+class DistributedCacheNode:
     """
+    One storage node: an LRU of key bytes -> (value bytes, expiry).
     
-    def __init__(self, *args, **kwargs):
-        raise NotImplementedError(
-            "DistributedCache is not yet implemented (coming in v1.0). "
-            "For distributed caching, please use Redis directly: "
-            "https://redis-py.readthedocs.io/ or consider using local caches "
-            "with TTL for now."
+    Writes publish invalidation messages to subscribers, tagged with the
+    writing client's id so it can ignore its own writes.
+    """
+    
+    def __init__(self, capacity: int = 100_000, name: Optional[str] = None):
+        self.name = name or f"node-{id(self)}"
+        self._store = LRUCache(capacity=capacity, name=self.name)
+        self._subscribers: List[InvalidationCallback] = []
+        self._subscribers_lock = threading.Lock()
+    
+    def get_many(self, keys: List[bytes]) -> List[Optional[Tuple[bytes, float]]]:
+        """(value, remaining ttl or 0) per key, None when missing or expired."""
+        found = self._store.get_many(keys)
+        now = time.time()
+        values: List[Optional[Tuple[bytes, float]]] = []
+        for key in keys:
+            entry = found.get(key)
+            if entry is None or (entry[1] and entry[1] < now):
+                values.append(None)
+            else:
+                values.append((entry[0], entry[1] - now if entry[1] else 0.0))
+        return values
+    
+    def put_many(self, items: List[Tuple[bytes, bytes]], ttl: Optional[float] = None,
+                 origin: bytes = b'') -> None:
+        expires = time.time() + ttl if ttl else 0.0
+        self._store.put_many({key: (value, expires) for key, value in items})
+        self._publish(origin, [key for key, _ in items])
+    
+    def delete_many(self, keys: List[bytes], origin: bytes = b'') -> List[bool]:
+        deleted = [self._store.delete(key) for key in keys]
+        self._publish(origin, keys)
+        return deleted
+    
+    def clear(self, origin: bytes = b'') -> None:
+        self._store.clear()
+        self._publish(origin, [])
+    
+    def size(self) -> int:
+        return self._store.size()
+    
+    def dump(self) -> List[Tuple[bytes, bytes, float]]:
+        """(key, value, remaining ttl or 0) for every live entry."""
+        now = time.time()
+        entries = []
+        for key, (value, expires) in self._store.items():
+            if expires and expires < now:
+                continue
+            entries.append((key, value, expires - now if expires else 0.0))
+        return entries
+    
+    def subscribe(self, callback: InvalidationCallback) -> Callable[[], None]:
+        """Register for invalidation messages; returns an unsubscribe function."""
+        with self._subscribers_lock:
+            self._subscribers.append(callback)
+        
+        def unsubscribe() -> None:
+            with self._subscribers_lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+        return unsubscribe
+    
+    def _publish(self, origin: bytes, keys: List[bytes]) -> None:
+        with self._subscribers_lock:
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            try:
+                callback(origin, keys)
+            except Exception as e:
+                logger.warning(f"Invalidation subscriber failed on {self.name}: {e}")
+
+
+# ----------------------------------------------------------------------
+# Wire protocol: u32 frame length, then u32 field count and
+# length-prefixed byte fields; the first request field is the opcode
+# ----------------------------------------------------------------------
+
+_OP_GET = b'G'
+_OP_PUT = b'P'
+_OP_DELETE = b'D'
+_OP_CLEAR = b'C'
+_OP_SIZE = b'S'
+_OP_DUMP = b'U'
+_OP_SUBSCRIBE = b'B'
+_OK = b'+'
+_ERR = b'-'
+_MISSING = b'\x00'
+_PRESENT = b'\x01'
+
+_U32 = struct.Struct('!I')
+_F64 = struct.Struct('!d')
+
+# Upper bound for one frame (protects servers from bogus lengths)
+MAX_FRAME_SIZE = 256 * 1024 * 1024
+
+
+def _pack(fields: Sequence[bytes]) -> bytes:
+    parts = [_U32.pack(len(fields))]
+    for field in fields:
+        parts.append(_U32.pack(len(field)))
+        parts.append(field)
+    body = b''.join(parts)
+    return _U32.pack(len(body)) + body
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 1 << 20))
+        if not chunk:
+            raise ConnectionError("Connection closed by peer")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+def _recv_frame(sock: socket.socket) -> List[bytes]:
+    (length,) = _U32.unpack(_recv_exact(sock, 4))
+    if length > MAX_FRAME_SIZE:
+        raise ConnectionError(f"Frame of {length} bytes exceeds MAX_FRAME_SIZE")
+    body = memoryview(_recv_exact(sock, length))
+    (count,) = _U32.unpack_from(body, 0)
+    offset = 4
+    fields = []
+    for _ in range(count):
+        (size,) = _U32.unpack_from(body, offset)
+        offset += 4
+        fields.append(bytes(body[offset:offset + size]))
+        offset += size
+    return fields
+
+
+def _ttl_field(ttl: Optional[float]) -> bytes:
+    return _F64.pack(ttl or 0.0)
+
+
+class _NodeRequestHandler(socketserver.BaseRequestHandler):
+    """Serves one client connection of a CacheNodeServer."""
+    
+    def handle(self) -> None:
+        node: DistributedCacheNode = self.server.node
+        sock = self.request
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        try:
+            while True:
+                fields = _recv_frame(sock)
+                if fields and fields[0] == _OP_SUBSCRIBE:
+                    self._stream_invalidations(node, sock)
+                    return
+                try:
+                    reply = self._dispatch(node, fields)
+                except Exception as e:
+                    reply = [_ERR, str(e).encode('utf-8', 'replace')]
+                sock.sendall(_pack(reply))
+        except (ConnectionError, OSError, struct.error):
+            return
+    
+    @staticmethod
+    def _dispatch(node: DistributedCacheNode, fields: List[bytes]) -> List[bytes]:
+        op, args = fields[0], fields[1:]
+        if op == _OP_GET:
+            return [_OK] + [
+                _MISSING if entry is None else _PRESENT + _F64.pack(entry[1]) + entry[0]
+                for entry in node.get_many(args)
+            ]
+        if op == _OP_PUT:
+            origin, ttl, pairs = args[0], _F64.unpack(args[1])[0], args[2:]
+            node.put_many(list(zip(pairs[0::2], pairs[1::2])), ttl or None, origin)
+            return [_OK]
+        if op == _OP_DELETE:
+            return [_OK, bytes(node.delete_many(args[1:], args[0]))]
+        if op == _OP_CLEAR:
+            node.clear(args[0])
+            return [_OK]
+        if op == _OP_SIZE:
+            return [_OK, _U32.pack(node.size())]
+        if op == _OP_DUMP:
+            reply = [_OK]
+            for key, value, remaining in node.dump():
+                reply.extend((key, value, _F64.pack(remaining)))
+            return reply
+        raise ValueError(f"Unknown opcode {op!r}")
+    
+    @staticmethod
+    def _stream_invalidations(node: DistributedCacheNode, sock: socket.socket) -> None:
+        send_lock = threading.Lock()
+        closed = threading.Event()
+        
+        def push(origin: bytes, keys: List[bytes]) -> None:
+            if closed.is_set():
+                return
+            try:
+                with send_lock:
+                    sock.sendall(_pack([origin] + keys))
+            except OSError:
+                closed.set()
+        
+        unsubscribe = node.subscribe(push)
+        try:
+            sock.sendall(_pack([_OK]))
+            # The client never sends on this connection; EOF means it went away
+            while not closed.is_set() and sock.recv(1):
+                pass
+        except OSError:
+            pass
+        finally:
+            closed.set()
+            unsubscribe()
+
+
+class CacheNodeServer(socketserver.ThreadingTCPServer):
+    """
+    TCP server exposing a DistributedCacheNode (one thread per connection).
+    
+    Binds to localhost by default; it has no authentication, so only expose
+    it on trusted networks.
+    
+    Example:
+        with CacheNodeServer(DistributedCacheNode(capacity=10_000)) as server:
+            transport = TCPTransport(server.address)
+    """
+    
+    daemon_threads = True
+    allow_reuse_address = True
+    
+    def __init__(self, node: Optional[DistributedCacheNode] = None, host: str = "127.0.0.1", port: int = 0):
+        self.node = node or DistributedCacheNode()
+        super().__init__((host, port), _NodeRequestHandler)
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self.server_address[:2]
+    
+    def start(self) -> "CacheNodeServer":
+        """Serve in a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self.serve_forever, name=f"CacheNodeServer-{self.address[1]}", daemon=True
+            )
+            self._thread.start()
+        return self
+    
+    def stop(self) -> None:
+        """Stop serving and close the listening socket."""
+        if self._thread is not None:
+            self.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.server_close()
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+        return False
+
+
+# ----------------------------------------------------------------------
+# Transports (client side)
+# ----------------------------------------------------------------------
+
+class ACacheTransport(ABC):
+    """Connection from a DistributedCache to one node (keys and values are bytes)."""
+    
+    @abstractmethod
+    def get_many(self, keys: List[bytes]) -> List[Optional[Tuple[bytes, float]]]:
+        """(value, remaining ttl or 0) for keys, in order (None when missing)."""
+        pass
+    
+    @abstractmethod
+    def put_many(self, items: List[Tuple[bytes, bytes]], ttl: Optional[float], origin: bytes) -> None:
+        """Store items with an optional TTL."""
+        pass
+    
+    @abstractmethod
+    def delete_many(self, keys: List[bytes], origin: bytes) -> List[bool]:
+        """Delete keys; returns, per key, whether it existed."""
+        pass
+    
+    @abstractmethod
+    def clear(self, origin: bytes) -> None:
+        """Remove every entry of the node."""
+        pass
+    
+    @abstractmethod
+    def size(self) -> int:
+        """Number of entries on the node."""
+        pass
+    
+    @abstractmethod
+    def dump(self) -> List[Tuple[bytes, bytes, float]]:
+        """(key, value, remaining ttl or 0) for every live entry."""
+        pass
+    
+    @abstractmethod
+    def subscribe(self, callback: InvalidationCallback) -> None:
+        """Deliver the node's invalidation messages to callback until close()."""
+        pass
+    
+    @abstractmethod
+    def close(self) -> None:
+        """Release connections and stop subscriptions."""
+        pass
+
+
+class LocalTransport(ACacheTransport):
+    """Transport to a DistributedCacheNode in this process."""
+    
+    def __init__(self, node: DistributedCacheNode):
+        self.node = node
+        self._unsubscribes: List[Callable[[], None]] = []
+    
+    def get_many(self, keys: List[bytes]) -> List[Optional[Tuple[bytes, float]]]:
+        return self.node.get_many(keys)
+    
+    def put_many(self, items: List[Tuple[bytes, bytes]], ttl: Optional[float], origin: bytes) -> None:
+        self.node.put_many(items, ttl, origin)
+    
+    def delete_many(self, keys: List[bytes], origin: bytes) -> List[bool]:
+        return self.node.delete_many(keys, origin)
+    
+    def clear(self, origin: bytes) -> None:
+        self.node.clear(origin)
+    
+    def size(self) -> int:
+        return self.node.size()
+    
+    def dump(self) -> List[Tuple[bytes, bytes, float]]:
+        return self.node.dump()
+    
+    def subscribe(self, callback: InvalidationCallback) -> None:
+        self._unsubscribes.append(self.node.subscribe(callback))
+    
+    def close(self) -> None:
+        for unsubscribe in self._unsubscribes:
+            unsubscribe()
+        self._unsubscribes = []
+
+
+class TCPTransport(ACacheTransport):
+    """
+    Pooled TCP client for a CacheNodeServer.
+    
+    Up to pool_size connections are kept open and reused; a connection
+    that fails is dropped and the error surfaces as DistributedCacheError.
+    Subscriptions use a dedicated connection that reconnects on failure
+    (and then reports a full invalidation, since messages may be lost).
+    """
+    
+    def __init__(self, address: Union[str, Tuple[str, int]], pool_size: int = 4,
+                 timeout: float = 5.0):
+        if isinstance(address, str):
+            host, _, port = address.rpartition(':')
+            address = (host or "127.0.0.1", int(port))
+        self.address = address
+        self.timeout = timeout
+        self._pool: "queue.LifoQueue[socket.socket]" = queue.LifoQueue(maxsize=pool_size)
+        self._closed = threading.Event()
+        self._subscriber_threads: List[threading.Thread] = []
+        self._subscriber_socks: List[socket.socket] = []
+    
+    def _connect(self, timeout: Optional[float]) -> socket.socket:
+        sock = socket.create_connection(self.address, timeout=self.timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.settimeout(timeout)
+        return sock
+    
+    def _call(self, fields: Sequence[bytes]) -> List[bytes]:
+        if self._closed.is_set():
+            raise DistributedCacheError(f"Transport to {self.address} is closed")
+        try:
+            sock = self._pool.get_nowait()
+        except queue.Empty:
+            sock = None
+        try:
+            if sock is None:
+                sock = self._connect(self.timeout)
+            sock.sendall(_pack(fields))
+            reply = _recv_frame(sock)
+        except (OSError, ConnectionError, struct.error) as e:
+            if sock is not None:
+                sock.close()
+            raise DistributedCacheError(f"Node {self.address[0]}:{self.address[1]} unreachable: {e}") from e
+        try:
+            self._pool.put_nowait(sock)
+        except queue.Full:
+            sock.close()
+        if reply[0] != _OK:
+            raise DistributedCacheError(
+                f"Node {self.address[0]}:{self.address[1]} error: {reply[1].decode('utf-8', 'replace')}"
+            )
+        return reply[1:]
+    
+    def get_many(self, keys: List[bytes]) -> List[Optional[Tuple[bytes, float]]]:
+        reply = self._call([_OP_GET] + list(keys))
+        return [
+            None if field == _MISSING else (field[9:], _F64.unpack_from(field, 1)[0])
+            for field in reply
+        ]
+    
+    def put_many(self, items: List[Tuple[bytes, bytes]], ttl: Optional[float], origin: bytes) -> None:
+        fields = [_OP_PUT, origin, _ttl_field(ttl)]
+        for key, value in items:
+            fields.append(key)
+            fields.append(value)
+        self._call(fields)
+    
+    def delete_many(self, keys: List[bytes], origin: bytes) -> List[bool]:
+        return [bool(flag) for flag in self._call([_OP_DELETE, origin] + list(keys))[0]]
+    
+    def clear(self, origin: bytes) -> None:
+        self._call([_OP_CLEAR, origin])
+    
+    def size(self) -> int:
+        return _U32.unpack(self._call([_OP_SIZE])[0])[0]
+    
+    def dump(self) -> List[Tuple[bytes, bytes, float]]:
+        reply = self._call([_OP_DUMP])
+        return [
+            (reply[i], reply[i + 1], _F64.unpack(reply[i + 2])[0])
+            for i in range(0, len(reply), 3)
+        ]
+    
+    def subscribe(self, callback: InvalidationCallback) -> None:
+        connected = threading.Event()
+        thread = threading.Thread(
+            target=self._subscription_loop, args=(callback, connected),
+            name=f"TCPTransport-subscriber-{self.address[1]}", daemon=True
         )
+        self._subscriber_threads.append(thread)
+        thread.start()
+        # Don't return before the first subscription is live (or failed)
+        connected.wait(self.timeout)
+    
+    def _subscription_loop(self, callback: InvalidationCallback, connected: threading.Event) -> None:
+        delay = 0.05
+        first = True
+        while not self._closed.is_set():
+            sock = None
+            try:
+                sock = self._connect(None)
+                self._subscriber_socks.append(sock)
+                sock.sendall(_pack([_OP_SUBSCRIBE]))
+                _recv_frame(sock)
+                if not first:
+                    callback(b'', [])  # messages may have been lost while disconnected
+                first = False
+                connected.set()
+                delay = 0.05
+                while True:
+                    message = _recv_frame(sock)
+                    callback(message[0], message[1:])
+            except (OSError, ConnectionError, struct.error):
+                connected.set()
+            finally:
+                if sock is not None:
+                    sock.close()
+                    if sock in self._subscriber_socks:
+                        self._subscriber_socks.remove(sock)
+            self._closed.wait(delay)
+            delay = min(delay * 2, 2.0)
+    
+    def close(self) -> None:
+        self._closed.set()
+        for sock in list(self._subscriber_socks):
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        for thread in self._subscriber_threads:
+            thread.join(self.timeout)
+        self._subscriber_threads = []
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+# ----------------------------------------------------------------------
+# Client
+# ----------------------------------------------------------------------
+
+class DistributedCache(ACache, ADistributedCache):
+    """
+    Cache partitioned across nodes by a consistent-hash ring.
+    
+    Features:
+    - Virtual nodes for even key distribution
+    - Replication: each key is written to `replicas` distinct nodes and read
+      from the first reachable one
+    - Multi-key operations send one request per node, to all nodes in parallel
+    - Optional near-cache (local LRU) kept coherent by node invalidation messages
+    - Pluggable transports (in-process nodes or TCP node servers)
+    
+    Example:
+        # In-process nodes (tests, single process)
+        cache = DistributedCache.local(num_nodes=3, replicas=2, near_cache_size=1000)
+        
+        # Node servers on localhost
+        cache = DistributedCache(["127.0.0.1:7001", "127.0.0.1:7002"], near_cache_size=1000)
+        
+        cache.put("user:1", {"name": "Ada"})
+        cache.get_many(["user:1", "user:2"])
+        cache.disconnect()
+    """
+    
+    def __init__(
+        self,
+        nodes: Union[Mapping[str, ACacheTransport], Sequence[str], None] = None,
+        replicas: int = 1,
+        virtual_nodes: int = DEFAULT_VIRTUAL_NODES,
+        near_cache_size: int = 0,
+        near_cache_ttl: Optional[float] = None,
+        ttl: Optional[float] = None,
+        pool_size: int = 4,
+        timeout: float = 5.0,
+        max_workers: int = 8,
+        name: Optional[str] = None
+    ):
+        """
+        Initialize distributed cache.
+        
+        Args:
+            nodes: Node name -> transport mapping, or "host:port" addresses of
+                   CacheNodeServers (connected with TCPTransport)
+            replicas: Nodes each key is written to
+            virtual_nodes: Ring points per node
+            near_cache_size: Local LRU entries (0 disables the near-cache)
+            near_cache_ttl: Optional bound on how long near-cache entries live
+            ttl: Default time-to-live for entries on the nodes
+            pool_size: Connections per node (TCP nodes)
+            timeout: Socket timeout in seconds (TCP nodes)
+            max_workers: Threads used for parallel fan-out
+            name: Optional name for debugging
+        """
+        if replicas <= 0:
+            raise ValueError(f"replicas must be positive, got {replicas}")
+        super().__init__(capacity=0, ttl=None)
+        self.name = name or f"DistributedCache-{id(self)}"
+        self.ttl = ttl
+        self.replicas = replicas
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.client_id = uuid.uuid4().bytes
+        
+        self._ring = HashRing(virtual_nodes=virtual_nodes)
+        self._transports: Dict[str, ACacheTransport] = {}
+        self._lock = threading.RLock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._max_workers = max_workers
+        
+        self._near: Optional[LRUCache] = None
+        if near_cache_size > 0:
+            self._near = LRUCache(capacity=near_cache_size, ttl=near_cache_ttl,
+                                  name=f"{self.name}-near")
+        # Bumped by every invalidation; fetched values are only added to the
+        # near-cache when no invalidation raced with the fetch
+        self._invalidation_epoch = 0
+        
+        # Statistics
+        self._hits = 0
+        self._misses = 0
+        self._near_hits = 0
+        self._invalidations = 0
+        self._failovers = 0
+        
+        if nodes:
+            self.connect(nodes)
+    
+    @classmethod
+    def local(cls, num_nodes: int = 3, node_capacity: int = 100_000, **kwargs) -> "DistributedCache":
+        """Create a cache over fresh in-process CacheNodes."""
+        transports = {
+            f"node-{i}": LocalTransport(DistributedCacheNode(capacity=node_capacity, name=f"node-{i}"))
+            for i in range(num_nodes)
+        }
+        return cls(transports, **kwargs)
+    
+    # ------------------------------------------------------------------
+    # Cluster membership (ADistributedCache)
+    # ------------------------------------------------------------------
+    
+    def connect(self, nodes: Union[Mapping[str, ACacheTransport], Sequence[str]]) -> None:
+        """Add nodes (transports by name, or "host:port" addresses)."""
+        if isinstance(nodes, Mapping):
+            items = list(nodes.items())
+        else:
+            items = [(address, TCPTransport(address, self.pool_size, self.timeout)) for address in nodes]
+        for node_name, transport in items:
+            self.add_node(node_name, transport)
+    
+    def add_node(self, node_name: str, transport: ACacheTransport) -> None:
+        """Add one node to the ring (existing keys are not moved; see sync())."""
+        with self._lock:
+            if node_name in self._transports:
+                raise DistributedCacheError(f"Node {node_name!r} is already connected")
+            if self._near is not None:
+                transport.subscribe(self._on_invalidation)
+            self._transports[node_name] = transport
+            self._ring.add_node(node_name)
+            self._invalidate_near_all()
+    
+    def remove_node(self, node_name: str) -> None:
+        """Remove one node from the ring and close its transport."""
+        with self._lock:
+            transport = self._transports.pop(node_name, None)
+            self._ring.remove_node(node_name)
+            self._invalidate_near_all()
+        if transport is not None:
+            transport.close()
+    
+    def disconnect(self) -> None:
+        """Close every transport and the fan-out pool."""
+        with self._lock:
+            transports = list(self._transports.values())
+            self._transports.clear()
+            for node_name in self._ring.nodes:
+                self._ring.remove_node(node_name)
+            executor, self._executor = self._executor, None
+        for transport in transports:
+            transport.close()
+        if executor is not None:
+            executor.shutdown(wait=True)
+        if self._near is not None:
+            self._near.clear()
+    
+    def is_connected(self) -> bool:
+        """Check if any node is connected."""
+        return bool(self._transports)
+    
+    def get_node_info(self) -> Dict[str, Any]:
+        """Per-node entry counts (None for unreachable nodes)."""
+        info = {}
+        for node_name, transport in list(self._transports.items()):
+            try:
+                info[node_name] = {'size': transport.size(), 'reachable': True}
+            except DistributedCacheError:
+                info[node_name] = {'size': None, 'reachable': False}
+        return {
+            'nodes': info,
+            'replicas': self.replicas,
+            'virtual_nodes': self._ring.virtual_nodes,
+        }
+    
+    def sync(self) -> int:
+        """
+        Copy every entry to all nodes of its current replica set.
+        
+        Run after adding nodes (or after a node came back) so reads find
+        keys at their new owners. Returns the number of entries copied.
+        """
+        missing: Dict[str, Dict[bytes, Tuple[bytes, float]]] = {}
+        dumps = self._fan_out({node_name: None for node_name in self._transports},
+                              lambda transport, _: transport.dump())
+        holders: Dict[bytes, set] = {}
+        entries: Dict[bytes, Tuple[bytes, float]] = {}
+        for node_name, dump in dumps.items():
+            if isinstance(dump, Exception):
+                continue
+            for key, value, remaining in dump:
+                holders.setdefault(key, set()).add(node_name)
+                entries.setdefault(key, (value, remaining))
+        for key, nodes in holders.items():
+            for owner in self._ring.get_nodes(key, self.replicas):
+                if owner not in nodes:
+                    missing.setdefault(owner, {})[key] = entries[key]
+        
+        copied = 0
+        for node_name, batch in missing.items():
+            # Group by TTL so each group is one request
+            by_ttl: Dict[float, List[Tuple[bytes, bytes]]] = {}
+            for key, (value, remaining) in batch.items():
+                by_ttl.setdefault(round(remaining, 3), []).append((key, value))
+            for remaining, items in by_ttl.items():
+                self._transports[node_name].put_many(items, remaining or None, self.client_id)
+                copied += len(items)
+        return copied
+    
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self._max_workers, thread_name_prefix=f"{self.name}-fanout"
+                    )
+        return self._executor
+    
+    def _fan_out(self, batches: Dict[str, Any], call: Callable[[ACacheTransport, Any], Any]) -> Dict[str, Any]:
+        """Run call(transport, batch) per node, in parallel; failures are returned, not raised."""
+        def run(node_name: str) -> Any:
+            transport = self._transports.get(node_name)
+            if transport is None:
+                return DistributedCacheError(f"Node {node_name!r} is not connected")
+            try:
+                return call(transport, batches[node_name])
+            except DistributedCacheError as e:
+                return e
+        
+        if len(batches) <= 1:
+            return {node_name: run(node_name) for node_name in batches}
+        futures = {node_name: self._pool().submit(run, node_name) for node_name in batches}
+        return {node_name: future.result() for node_name, future in futures.items()}
+    
+    def _owners(self, key: bytes) -> List[str]:
+        owners = self._ring.get_nodes(key, self.replicas)
+        if not owners:
+            raise DistributedCacheError(f"{self.name} has no nodes connected")
+        return owners
+    
+    def _fetch(self, keys: List[bytes]) -> Dict[bytes, Tuple[bytes, float]]:
+        """Read keys from their nodes (failing over to replicas) as (value, remaining ttl)."""
+        results: Dict[bytes, Tuple[bytes, float]] = {}
+        pending = list(keys)
+        attempt = 0
+        last_error: Optional[Exception] = None
+        while pending and attempt < self.replicas:
+            batches: Dict[str, List[bytes]] = {}
+            for key in pending:
+                owners = self._owners(key)
+                if attempt < len(owners):
+                    batches.setdefault(owners[attempt], []).append(key)
+            if not batches:
+                break
+            replies = self._fan_out(batches, lambda transport, batch: transport.get_many(batch))
+            pending = []
+            for node_name, reply in replies.items():
+                batch = batches[node_name]
+                if isinstance(reply, Exception):
+                    last_error = reply
+                    self._failovers += 1
+                    pending.extend(batch)
+                    continue
+                for key, value in zip(batch, reply):
+                    if value is not None:
+                        results[key] = value
+            attempt += 1
+        if pending and last_error is not None:
+            raise last_error
+        return results
+    
+    def _write(self, items: List[Tuple[bytes, bytes]], ttl: Optional[float]) -> None:
+        batches: Dict[str, List[Tuple[bytes, bytes]]] = {}
+        for key, value in items:
+            for owner in self._owners(key):
+                batches.setdefault(owner, []).append((key, value))
+        replies = self._fan_out(
+            batches, lambda transport, batch: transport.put_many(batch, ttl, self.client_id)
+        )
+        self._raise_if_all_replicas_failed(replies, [key for key, _ in items])
+    
+    def _remove(self, keys: List[bytes]) -> int:
+        batches: Dict[str, List[bytes]] = {}
+        for key in keys:
+            for owner in self._owners(key):
+                batches.setdefault(owner, []).append(key)
+        replies = self._fan_out(
+            batches, lambda transport, batch: transport.delete_many(batch, self.client_id)
+        )
+        self._raise_if_all_replicas_failed(replies, keys)
+        # Count each key once, however many replicas held it
+        deleted = set()
+        for node_name, reply in replies.items():
+            if not isinstance(reply, Exception):
+                deleted.update(key for key, flag in zip(batches[node_name], reply) if flag)
+        return len(deleted)
+    
+    def _raise_if_all_replicas_failed(self, replies: Dict[str, Any], keys: List[bytes]) -> None:
+        failed = {node_name for node_name, reply in replies.items() if isinstance(reply, Exception)}
+        if not failed:
+            return
+        for node_name in failed:
+            logger.warning(f"{self.name}: write to node {node_name!r} failed: {replies[node_name]}")
+        for key in keys:
+            if all(owner in failed for owner in self._owners(key)):
+                raise replies[next(iter(failed))]
+    
+    def _on_invalidation(self, origin: bytes, keys: List[bytes]) -> None:
+        if origin == self.client_id:
+            return
+        self._invalidations += 1
+        if keys:
+            self._invalidation_epoch += 1
+            self._near.delete_many(keys)
+        else:
+            self._invalidate_near_all()
+    
+    def _invalidate_near_all(self) -> None:
+        if self._near is not None:
+            self._invalidation_epoch += 1
+            self._near.clear()
+    
+    def _encode_value(self, value: Any) -> bytes:
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    
+    def _near_get(self, kb: bytes) -> Any:
+        """Value from the near-cache, or _NEAR_MISS (entries expire with the node entry)."""
+        entry = self._near.get(kb, _NEAR_MISS)
+        if entry is _NEAR_MISS:
+            return entry
+        value, deadline = entry
+        if deadline and deadline < time.time():
+            self._near.delete(kb)
+            return _NEAR_MISS
+        return value
+    
+    @staticmethod
+    def _deadline(ttl: Optional[float]) -> float:
+        return time.time() + ttl if ttl else 0.0
+    
+    # ------------------------------------------------------------------
+    # ACache interface
+    # ------------------------------------------------------------------
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get value by key (near-cache first, then the key's nodes)."""
+        kb = _encode_key(key)
+        near = self._near
+        if near is not None:
+            value = self._near_get(kb)
+            if value is not _NEAR_MISS:
+                self._hits += 1
+                self._near_hits += 1
+                return value
+        epoch = self._invalidation_epoch
+        entry = self._fetch([kb]).get(kb)
+        if entry is None:
+            self._misses += 1
+            return default
+        self._hits += 1
+        value = pickle.loads(entry[0])
+        if near is not None and epoch == self._invalidation_epoch:
+            near.put(kb, (value, self._deadline(entry[1])))
+        return value
+    
+    def get_many(self, keys: List[Hashable]) -> Dict[Hashable, Any]:
+        """Get several values with one request per node (nodes queried in parallel)."""
+        encoded = {_encode_key(key): key for key in keys}
+        results: Dict[Hashable, Any] = {}
+        near = self._near
+        if near is not None:
+            for kb in list(encoded):
+                value = self._near_get(kb)
+                if value is not _NEAR_MISS:
+                    results[encoded.pop(kb)] = value
+            self._near_hits += len(results)
+        epoch = self._invalidation_epoch
+        fetched = self._fetch(list(encoded)) if encoded else {}
+        entries = {kb: (pickle.loads(data), self._deadline(remaining))
+                   for kb, (data, remaining) in fetched.items()}
+        for kb, (value, _) in entries.items():
+            results[encoded[kb]] = value
+        if near is not None and entries and epoch == self._invalidation_epoch:
+            near.put_many(entries)
+        self._hits += len(results)
+        self._misses += len(keys) - len(results)
+        return results
+    
+    def put(self, key: Hashable, value: Any) -> None:
+        """Put key-value pair on the key's replica nodes (default TTL)."""
+        self.set(key, value)
+    
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Put key-value pair with an optional TTL overriding the default."""
+        kb = _encode_key(key)
+        ttl = ttl if ttl is not None else self.ttl
+        self._write([(kb, self._encode_value(value))], ttl)
+        if self._near is not None:
+            self._near.put(kb, (value, self._deadline(ttl)))
+    
+    def put_many(self, items: Dict[Hashable, Any]) -> int:
+        """Put several values with one request per node."""
+        encoded = {_encode_key(key): value for key, value in items.items()}
+        self._write([(kb, self._encode_value(value)) for kb, value in encoded.items()], self.ttl)
+        if self._near is not None:
+            deadline = self._deadline(self.ttl)
+            self._near.put_many({kb: (value, deadline) for kb, value in encoded.items()})
+        return len(encoded)
+    
+    def delete(self, key: Hashable) -> bool:
+        """Delete key from its replica nodes."""
+        return self.delete_many([key]) > 0
+    
+    def delete_many(self, keys: List[Hashable]) -> int:
+        """Delete several keys with one request per node."""
+        encoded = [_encode_key(key) for key in keys]
+        if self._near is not None:
+            self._near.delete_many(encoded)
+        return self._remove(encoded) if encoded else 0
+    
+    def clear(self) -> None:
+        """Clear every node (and the near-cache)."""
+        replies = self._fan_out({node_name: None for node_name in self._transports},
+                                lambda transport, _: transport.clear(self.client_id))
+        self._invalidate_near_all()
+        for reply in replies.values():
+            if isinstance(reply, Exception):
+                raise reply
+    
+    def size(self) -> int:
+        """Number of distinct keys across all nodes (counts replicas once)."""
+        return len(self._all_entries())
+    
+    def is_full(self) -> bool:
+        """Distributed caches are bounded per node, never as a whole."""
+        return False
+    
+    def evict(self) -> None:
+        """Eviction happens on the nodes; nothing to do client-side."""
+        pass
+    
+    def _all_entries(self) -> Dict[bytes, bytes]:
+        dumps = self._fan_out({node_name: None for node_name in self._transports},
+                              lambda transport, _: transport.dump())
+        entries: Dict[bytes, bytes] = {}
+        for dump in dumps.values():
+            if isinstance(dump, Exception):
+                raise dump
+            for key, value, _ in dump:
+                entries.setdefault(key, value)
+        return entries
+    
+    def keys(self) -> List[Hashable]:
+        """Get list of all keys across nodes."""
+        return [_decode_key(kb) for kb in self._all_entries()]
+    
+    def values(self) -> List[Any]:
+        """Get list of all values across nodes."""
+        return [pickle.loads(vb) for vb in self._all_entries().values()]
+    
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """Get list of all key-value pairs across nodes."""
+        return [(_decode_key(kb), pickle.loads(vb)) for kb, vb in self._all_entries().items()]
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get client statistics."""
+        total_requests = self._hits + self._misses
+        return {
+            'name': self.name,
+            'type': 'Distributed',
+            'nodes': self._ring.nodes,
+            'replicas': self.replicas,
+            'hits': self._hits,
+            'misses': self._misses,
+            'near_hits': self._near_hits,
+            'near_size': self._near.size() if self._near is not None else 0,
+            'invalidations': self._invalidations,
+            'failovers': self._failovers,
+            'hit_rate': self._hits / total_requests if total_requests > 0 else 0.0,
+            'ttl': self.ttl,
+        }
+    
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit: disconnect from all nodes."""
+        self.disconnect()
+        return False
 
 
 class RedisCache:
@@ -41,12 +1109,26 @@ class RedisCache:
     - TTL support via Redis EXPIRE
     - Pub/sub for cache invalidation
     
-    For now, use redis-py directly or local caches.
+    For now, use redis-py directly, or DistributedCache with CacheNodeServer nodes.
     """
     
     def __init__(self, *args, **kwargs):
         raise NotImplementedError(
             "RedisCache is not yet implemented (coming in v1.0). "
             "For Redis caching, please use redis-py directly: "
-            "pip install redis && import redis"
+            "pip install redis && import redis. "
+            "For a self-hosted distributed cache, see DistributedCache."
         )
+
+
+__all__ = [
+    "DistributedCache",
+    "RedisCache",
+    "HashRing",
+    "DistributedCacheNode",
+    "CacheNodeServer",
+    "ACacheTransport",
+    "LocalTransport",
+    "TCPTransport",
+    "DEFAULT_VIRTUAL_NODES",
+]
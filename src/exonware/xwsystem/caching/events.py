@@ -11,6 +11,7 @@ Event system for caching module.
 Extensibility Priority #5 - Event-driven architecture for custom behaviors.
 """
 
+from contextlib import nullcontext
 from typing import Callable, Dict, List, Any, Optional
 from enum import Enum
 from ..config.logging_setup import get_logger
@@ -56,6 +57,10 @@ class CacheEventEmitter:
             event: 0 for event in CacheEvent
         }
     
+    def _batch_lock(self):
+        """Batch operations must not run event callbacks under the cache lock."""
+        return nullcontext()
+    
     def on(self, event: CacheEvent, callback: Callable) -> None:
         """
         Register event callback.
@@ -9,10 +9,26 @@ Generation Date: 01-Nov-2025
 
 Pluggable eviction strategies for caching module.
 Extensibility Priority #5 - Strategy pattern for custom eviction policies.
+
+Performance:
+    - OLD: select_victim() received a freshly built list of every
+      (key, value, metadata) tuple and scanned it with min()/max(): O(n)
+      per eviction
+    - NEW: built-in strategies extend AIndexedEvictionStrategy and keep
+      their own index, updated by on_insert/on_access/on_delete:
+        LRU/FIFO  ordered hash list (OrderedDict)      O(1)
+        LFU       frequency buckets                    O(1)
+        TTL/SIZE  heap with lazy deletion              O(log n)
+        RANDOM    array + position map                 O(1)
+      PluggableCache asks them for victim() without building any list.
+      Custom strategies that only implement select_victim() still work.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, List, Tuple, Optional, Hashable
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple, Optional, Hashable
+import heapq
+import itertools
 import random
 import time
 
@@ -75,140 +91,286 @@ class AEvictionStrategy(ABC):
     def get_strategy_name(self) -> str:
         """Get strategy name."""
         pass
+    
+    def reset(self) -> None:
+        """Forget all tracked keys (the cache was cleared or is being rebuilt)."""
+        pass
 
 
-class LRUEvictionStrategy(AEvictionStrategy):
-    """Least Recently Used eviction strategy."""
+class AIndexedEvictionStrategy(AEvictionStrategy):
+    """
+    Eviction strategy that maintains its own victim index.
     
-    def select_victim(self, cache_items: List[Tuple[Hashable, Any, dict]]) -> Optional[Hashable]:
-        """Select least recently used item."""
-        if not cache_items:
-            return None
+    Subclasses keep the index current through on_insert/on_access/on_delete
+    and answer victim() without seeing the cache contents, so the cache
+    never builds the (key, value, metadata) list. The index describes one
+    cache: PluggableCache copies an instance already bound to another cache.
+    """
+    
+    # Weak reference to the cache whose keys the index tracks (set by the cache)
+    _owner = None
+    
+    @abstractmethod
+    def victim(self) -> Optional[Hashable]:
+        """
+        Return the key to evict next, or None if nothing is tracked.
         
-        # Find item with oldest access time
-        lru_item = min(cache_items, key=lambda x: x[2].get('access_time', 0))
-        return lru_item[0]
+        The key stays tracked until the cache calls on_delete() for it.
+        """
+        pass
+    
+    @abstractmethod
+    def reset(self) -> None:
+        """Drop the whole index."""
+        pass
+    
+    def select_victim(self, cache_items: List[Tuple[Hashable, Any, dict]]) -> Optional[Hashable]:
+        """Select victim from the index (cache_items is not scanned)."""
+        return self.victim()
+
+
+class _LazyHeap:
+    """
+    Min-heap of keys by priority with O(1) lazy deletion.
+    
+    Deleted or re-prioritized keys leave stale heap entries that are skipped
+    on peek; the heap is rebuilt once stale entries outnumber live ones.
+    """
+    
+    __slots__ = ('_heap', '_live', '_counter')
+    
+    def __init__(self):
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        self._live: Dict[Hashable, Tuple[float, int]] = {}
+        self._counter = itertools.count()
+    
+    def push(self, key: Hashable, priority: float) -> None:
+        entry = (priority, next(self._counter))
+        self._live[key] = entry
+        heapq.heappush(self._heap, (entry[0], entry[1], key))
+        self._maybe_compact()
+    
+    def discard(self, key: Hashable) -> None:
+        if self._live.pop(key, None) is not None:
+            self._maybe_compact()
+    
+    def peek(self) -> Optional[Hashable]:
+        heap = self._heap
+        live = self._live
+        while heap:
+            priority, seq, key = heap[0]
+            if live.get(key) == (priority, seq):
+                return key
+            heapq.heappop(heap)
+        return None
+    
+    def clear(self) -> None:
+        self._heap.clear()
+        self._live.clear()
+    
+    def _maybe_compact(self) -> None:
+        if len(self._heap) > 64 and len(self._heap) > 2 * len(self._live):
+            self._heap = [(entry[0], entry[1], key) for key, entry in self._live.items()]
+            heapq.heapify(self._heap)
+
+
+class LRUEvictionStrategy(AIndexedEvictionStrategy):
+    """Least Recently Used eviction strategy (recency-ordered hash list)."""
+    
+    def __init__(self):
+        """Initialize LRU strategy."""
+        self._order: "OrderedDict[Hashable, None]" = OrderedDict()
+    
+    def victim(self) -> Optional[Hashable]:
+        """Least recently used key."""
+        return next(iter(self._order), None)
     
     def on_access(self, key: Hashable, metadata: dict) -> None:
-        """Update access time."""
-        metadata['access_time'] = time.time()
+        """Mark key most recently used."""
+        try:
+            self._order.move_to_end(key)
+        except KeyError:
+            self._order[key] = None
     
     def on_insert(self, key: Hashable, value: Any, metadata: dict) -> None:
-        """Set initial access time."""
-        metadata['access_time'] = time.time()
+        """Track key as most recently used."""
+        self._order[key] = None
+        self._order.move_to_end(key)
     
     def on_delete(self, key: Hashable) -> None:
-        """No action needed on delete."""
-        pass
+        """Stop tracking key."""
+        self._order.pop(key, None)
+    
+    def reset(self) -> None:
+        """Drop the recency list."""
+        self._order.clear()
     
     def get_strategy_name(self) -> str:
         """Get strategy name."""
         return "LRU"
 
 
-class LFUEvictionStrategy(AEvictionStrategy):
-    """Least Frequently Used eviction strategy."""
+class LFUEvictionStrategy(AIndexedEvictionStrategy):
+    """
+    Least Frequently Used eviction strategy (frequency buckets).
+    
+    Ties within the lowest frequency are broken by insertion/access order
+    (oldest first).
+    """
     
     def __init__(self):
         """Initialize LFU strategy."""
-        self._access_counts: dict = {}
+        self._access_counts: Dict[Hashable, int] = {}
+        self._buckets: Dict[int, "OrderedDict[Hashable, None]"] = {}
+        self._min_count = 0
     
-    def select_victim(self, cache_items: List[Tuple[Hashable, Any, dict]]) -> Optional[Hashable]:
-        """Select least frequently used item."""
-        if not cache_items:
+    def victim(self) -> Optional[Hashable]:
+        """Least frequently used key."""
+        if not self._access_counts:
             return None
-        
-        # Find item with lowest access count
-        lfu_item = min(cache_items, key=lambda x: self._access_counts.get(x[0], 0))
-        return lfu_item[0]
+        bucket = self._buckets.get(self._min_count)
+        if not bucket:
+            # The minimum bucket emptied by a delete: find the next one
+            self._min_count = min(self._buckets)
+            bucket = self._buckets[self._min_count]
+        return next(iter(bucket))
     
     def on_access(self, key: Hashable, metadata: dict) -> None:
-        """Increment access count."""
-        self._access_counts[key] = self._access_counts.get(key, 0) + 1
-        metadata['access_count'] = self._access_counts[key]
+        """Move key to the next frequency bucket."""
+        count = self._access_counts.get(key)
+        if count is None:
+            self.on_insert(key, None, metadata)
+            return
+        
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+            if self._min_count == count:
+                self._min_count = count + 1
+        
+        count += 1
+        self._access_counts[key] = count
+        self._buckets.setdefault(count, OrderedDict())[key] = None
+        metadata['access_count'] = count
     
     def on_insert(self, key: Hashable, value: Any, metadata: dict) -> None:
-        """Initialize access count."""
+        """Track key with a count of one."""
+        if key in self._access_counts:
+            self.on_delete(key)
         self._access_counts[key] = 1
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._min_count = 1
         metadata['access_count'] = 1
     
     def on_delete(self, key: Hashable) -> None:
         """Remove access count tracking."""
-        self._access_counts.pop(key, None)
+        count = self._access_counts.pop(key, None)
+        if count is None:
+            return
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+    
+    def reset(self) -> None:
+        """Drop all counts and buckets."""
+        self._access_counts.clear()
+        self._buckets.clear()
+        self._min_count = 0
     
     def get_strategy_name(self) -> str:
         """Get strategy name."""
         return "LFU"
 
 
-class FIFOEvictionStrategy(AEvictionStrategy):
-    """First In, First Out eviction strategy."""
+class FIFOEvictionStrategy(AIndexedEvictionStrategy):
+    """First In, First Out eviction strategy (insertion-ordered hash list)."""
     
-    def select_victim(self, cache_items: List[Tuple[Hashable, Any, dict]]) -> Optional[Hashable]:
-        """Select oldest inserted item."""
-        if not cache_items:
-            return None
-        
-        # Find item with oldest creation time
-        fifo_item = min(cache_items, key=lambda x: x[2].get('created_at', 0))
-        return fifo_item[0]
+    def __init__(self):
+        """Initialize FIFO strategy."""
+        self._order: "OrderedDict[Hashable, None]" = OrderedDict()
+    
+    def victim(self) -> Optional[Hashable]:
+        """Oldest inserted key."""
+        return next(iter(self._order), None)
     
     def on_access(self, key: Hashable, metadata: dict) -> None:
         """No action on access for FIFO."""
         pass
     
     def on_insert(self, key: Hashable, value: Any, metadata: dict) -> None:
-        """Set creation time."""
+        """Append key to the insertion order."""
+        self._order[key] = None
         metadata['created_at'] = time.time()
     
     def on_delete(self, key: Hashable) -> None:
-        """No action needed on delete."""
-        pass
+        """Stop tracking key."""
+        self._order.pop(key, None)
+    
+    def reset(self) -> None:
+        """Drop the insertion order."""
+        self._order.clear()
     
     def get_strategy_name(self) -> str:
         """Get strategy name."""
         return "FIFO"
 
 
-class RandomEvictionStrategy(AEvictionStrategy):
-    """Random eviction strategy."""
+class RandomEvictionStrategy(AIndexedEvictionStrategy):
+    """Random eviction strategy (array plus position map for O(1) removal)."""
     
-    def select_victim(self, cache_items: List[Tuple[Hashable, Any, dict]]) -> Optional[Hashable]:
-        """Select random item to evict."""
-        if not cache_items:
+    def __init__(self):
+        """Initialize random strategy."""
+        self._keys: List[Hashable] = []
+        self._positions: Dict[Hashable, int] = {}
+    
+    def victim(self) -> Optional[Hashable]:
+        """Uniformly random tracked key."""
+        if not self._keys:
             return None
-        
-        random_item = random.choice(cache_items)
-        return random_item[0]
+        return random.choice(self._keys)
     
     def on_access(self, key: Hashable, metadata: dict) -> None:
         """No action on access for random."""
         pass
     
     def on_insert(self, key: Hashable, value: Any, metadata: dict) -> None:
-        """No action on insert for random."""
-        pass
+        """Track key."""
+        if key not in self._positions:
+            self._positions[key] = len(self._keys)
+            self._keys.append(key)
     
     def on_delete(self, key: Hashable) -> None:
-        """No action on delete for random."""
-        pass
+        """Swap key with the last one and drop it."""
+        index = self._positions.pop(key, None)
+        if index is None:
+            return
+        last = self._keys.pop()
+        if last != key:
+            self._keys[index] = last
+            self._positions[last] = index
+    
+    def reset(self) -> None:
+        """Drop all tracked keys."""
+        self._keys.clear()
+        self._positions.clear()
     
     def get_strategy_name(self) -> str:
         """Get strategy name."""
         return "RANDOM"
 
 
-class SizeBasedEvictionStrategy(AEvictionStrategy):
-    """Evict largest items first to free maximum memory."""
+class SizeBasedEvictionStrategy(AIndexedEvictionStrategy):
+    """Evict largest items first to free maximum memory (max-heap by size)."""
     
-    def select_victim(self, cache_items: List[Tuple[Hashable, Any, dict]]) -> Optional[Hashable]:
-        """Select largest item to evict."""
-        if not cache_items:
-            return None
-        
-        # Find item with largest size
-        largest_item = max(cache_items, key=lambda x: x[2].get('size_bytes', 0))
-        return largest_item[0]
+    def __init__(self):
+        """Initialize size-based strategy."""
+        self._heap = _LazyHeap()
+    
+    def victim(self) -> Optional[Hashable]:
+        """Largest tracked key."""
+        return self._heap.peek()
     
     def on_access(self, key: Hashable, metadata: dict) -> None:
         """No action on access."""
@@ -217,28 +379,33 @@ class SizeBasedEvictionStrategy(AEvictionStrategy):
     def on_insert(self, key: Hashable, value: Any, metadata: dict) -> None:
         """Track value size."""
         from .utils import estimate_object_size
-        metadata['size_bytes'] = estimate_object_size(value)
+        size = estimate_object_size(value)
+        metadata['size_bytes'] = size
+        self._heap.push(key, -size)
     
     def on_delete(self, key: Hashable) -> None:
-        """No action on delete."""
-        pass
+        """Stop tracking key."""
+        self._heap.discard(key)
+    
+    def reset(self) -> None:
+        """Drop the size heap."""
+        self._heap.clear()
     
     def get_strategy_name(self) -> str:
         """Get strategy name."""
         return "SIZE_BASED"
 
 
-class TTLEvictionStrategy(AEvictionStrategy):
-    """Evict items closest to expiration first."""
+class TTLEvictionStrategy(AIndexedEvictionStrategy):
+    """Evict items closest to expiration first (min-heap by expiry)."""
     
-    def select_victim(self, cache_items: List[Tuple[Hashable, Any, dict]]) -> Optional[Hashable]:
-        """Select item closest to expiration."""
-        if not cache_items:
-            return None
-        
-        # Find item with earliest expiration
-        expired_item = min(cache_items, key=lambda x: x[2].get('expires_at', float('inf')))
-        return expired_item[0]
+    def __init__(self):
+        """Initialize TTL strategy."""
+        self._heap = _LazyHeap()
+    
+    def victim(self) -> Optional[Hashable]:
+        """Key expiring soonest."""
+        return self._heap.peek()
     
     def on_access(self, key: Hashable, metadata: dict) -> None:
         """No action on access for TTL."""
@@ -247,11 +414,17 @@ class TTLEvictionStrategy(AEvictionStrategy):
     def on_insert(self, key: Hashable, value: Any, metadata: dict) -> None:
         """Set expiration time."""
         ttl = metadata.get('ttl', 300)
-        metadata['expires_at'] = time.time() + ttl
+        expires_at = time.time() + ttl
+        metadata['expires_at'] = expires_at
+        self._heap.push(key, expires_at)
     
     def on_delete(self, key: Hashable) -> None:
-        """No action on delete."""
-        pass
+        """Stop tracking key."""
+        self._heap.discard(key)
+    
+    def reset(self) -> None:
+        """Drop the expiry heap."""
+        self._heap.clear()
     
     def get_strategy_name(self) -> str:
         """Get strategy name."""
@@ -260,6 +433,7 @@ class TTLEvictionStrategy(AEvictionStrategy):
 
 __all__ = [
     'AEvictionStrategy',
+    'AIndexedEvictionStrategy',
     'LRUEvictionStrategy',
     'LFUEvictionStrategy',
     'FIFOEvictionStrategy',
@@ -267,4 +441,3 @@ __all__ = [
     'SizeBasedEvictionStrategy',
     'TTLEvictionStrategy',
 ]
-
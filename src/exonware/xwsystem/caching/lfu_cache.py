@@ -11,15 +11,19 @@ LFU (Least Frequently Used) Cache implementation with thread-safety and async su
 import asyncio
 import threading
 import time
-from typing import Any, Dict, Optional, Hashable
+from typing import Any, Dict, List, Optional, Hashable, Tuple, Union
 
 from ..config.logging_setup import get_logger
 from .base import ACache
+from .counters import StatsModeMixin
+from .defs import StatsMode
 
 logger = get_logger("xsystem.caching.lfu_cache")
 
+_MISSING = object()
 
-class LFUCache(ACache):
+
+class LFUCache(StatsModeMixin, ACache):
     """
     Thread-safe LFU (Least Frequently Used) Cache.
     
@@ -31,19 +35,25 @@ class LFUCache(ACache):
     - O(n) eviction (uses min() scan - slow for large caches)
     - Thread-safe operations
     - Frequency-based eviction
-    - Statistics tracking
+    - Statistics tracking (shared, per-thread or disabled)
     
     Recommended Alternative:
         from exonware.xwsystem.caching import OptimizedLFUCache
         cache = OptimizedLFUCache(capacity=1000)  # O(1) eviction
     """
     
-    def __init__(self, capacity: int = 128, name: Optional[str] = None):
+    def __init__(self, capacity: int = 128, name: Optional[str] = None,
+                 stats: Union[StatsMode, str] = StatsMode.SHARED):
         """
         Initialize LFU cache.
         
         ⚠️ PERFORMANCE WARNING: Consider using OptimizedLFUCache for better performance.
         This implementation has O(n) eviction complexity.
+        
+        Args:
+            capacity: Maximum number of items to store
+            name: Optional name for debugging
+            stats: Statistics mode (shared, per_thread or disabled)
         """
         if capacity <= 0:
             raise ValueError(
@@ -64,6 +74,7 @@ class LFUCache(ACache):
         self._hits = 0
         self._misses = 0
         self._evictions = 0
+        self._init_stats_mode(stats)
         
         logger.debug(f"LFU cache {self.name} initialized with capacity {capacity}")
         
@@ -77,31 +88,45 @@ class LFUCache(ACache):
     def get(self, key: Hashable, default: Any = None) -> Any:
         """Get value by key."""
         with self._lock:
-            if key not in self._cache:
-                self._misses += 1
+            value = self._cache.get(key, _MISSING)
+            if value is _MISSING:
+                if self._shared_stats:
+                    self._misses += 1
+                elif self._thread_stats is not None:
+                    self._thread_stats.local.misses += 1
                 return default
             
             # Increment frequency
             self._frequencies[key] += 1
-            self._hits += 1
-            return self._cache[key]
+            if self._shared_stats:
+                self._hits += 1
+            elif self._thread_stats is not None:
+                self._thread_stats.local.hits += 1
+            return value
     
     def put(self, key: Hashable, value: Any) -> None:
         """Put key-value pair in cache."""
         with self._lock:
-            if key in self._cache:
-                self._cache[key] = value
-                self._frequencies[key] += 1
-            else:
-                if len(self._cache) >= self.capacity:
-                    # Find least frequently used key
-                    lfu_key = min(self._frequencies, key=self._frequencies.get)
-                    del self._cache[lfu_key]
-                    del self._frequencies[lfu_key]
+            self._put_locked(key, value)
+    
+    def _put_locked(self, key: Hashable, value: Any) -> None:
+        """Insert or update key, evicting the LFU entry if full (lock held)."""
+        if key in self._cache:
+            self._cache[key] = value
+            self._frequencies[key] += 1
+        else:
+            if len(self._cache) >= self.capacity:
+                # Find least frequently used key
+                lfu_key = min(self._frequencies, key=self._frequencies.get)
+                del self._cache[lfu_key]
+                del self._frequencies[lfu_key]
+                if self._shared_stats:
                     self._evictions += 1
-                
-                self._cache[key] = value
-                self._frequencies[key] = 1
+                elif self._thread_stats is not None:
+                    self._thread_stats.local.evictions += 1
+            
+            self._cache[key] = value
+            self._frequencies[key] = 1
     
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """
@@ -124,6 +149,47 @@ class LFUCache(ACache):
                 return True
             return False
     
+    def get_many(self, keys: List[Hashable]) -> Dict[Hashable, Any]:
+        """Get multiple values with a single lock acquisition."""
+        if type(self).get is not LFUCache.get:
+            return super().get_many(keys)
+        results = {}
+        with self._lock:
+            cache, frequencies = self._cache, self._frequencies
+            for key in keys:
+                if key in cache:
+                    frequencies[key] += 1
+                    results[key] = cache[key]
+            if self._shared_stats:
+                self._hits += len(results)
+                self._misses += len(keys) - len(results)
+            elif self._thread_stats is not None:
+                counters = self._thread_stats.local
+                counters.hits += len(results)
+                counters.misses += len(keys) - len(results)
+        return results
+    
+    def put_many(self, items: Dict[Hashable, Any]) -> int:
+        """Put multiple key-value pairs with a single lock acquisition."""
+        if type(self).put is not LFUCache.put:
+            return super().put_many(items)
+        with self._lock:
+            for key, value in items.items():
+                self._put_locked(key, value)
+        return len(items)
+    
+    def delete_many(self, keys: List[Hashable]) -> int:
+        """Delete multiple keys with a single lock acquisition."""
+        if type(self).delete is not LFUCache.delete:
+            return super().delete_many(keys)
+        count = 0
+        with self._lock:
+            for key in keys:
+                if self._cache.pop(key, _MISSING) is not _MISSING:
+                    del self._frequencies[key]
+                    count += 1
+        return count
+    
     def clear(self) -> None:
         """Clear all items from cache."""
         with self._lock:
@@ -139,6 +205,21 @@ class LFUCache(ACache):
         with self._lock:
             return len(self._cache) >= self.capacity
     
+    def keys(self) -> List[Hashable]:
+        """Get list of all keys."""
+        with self._lock:
+            return list(self._cache.keys())
+    
+    def values(self) -> List[Any]:
+        """Get list of all values."""
+        with self._lock:
+            return list(self._cache.values())
+    
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """Get list of all key-value pairs."""
+        with self._lock:
+            return list(self._cache.items())
+    
     def evict(self) -> None:
         """
         Evict least frequently used entry from cache.
@@ -150,24 +231,29 @@ class LFUCache(ACache):
                 lfu_key = min(self._frequencies, key=self._frequencies.get)
                 del self._cache[lfu_key]
                 del self._frequencies[lfu_key]
-                self._evictions += 1
+                if self._shared_stats:
+                    self._evictions += 1
+                elif self._thread_stats is not None:
+                    self._thread_stats.local.evictions += 1
                 logger.debug(f"Cache {self.name} manually evicted LFU key: {lfu_key}")
     
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
         with self._lock:
-            total_requests = self._hits + self._misses
-            hit_rate = self._hits / total_requests if total_requests > 0 else 0.0
+            counts = self._merged_counts()
+            total_requests = counts.hits + counts.misses
+            hit_rate = counts.hits / total_requests if total_requests > 0 else 0.0
             
             return {
                 'name': self.name,
                 'type': 'LFU',
                 'capacity': self.capacity,
                 'size': len(self._cache),
-                'hits': self._hits,
-                'misses': self._misses,
-                'evictions': self._evictions,
+                'hits': counts.hits,
+                'misses': counts.misses,
+                'evictions': counts.evictions,
                 'hit_rate': hit_rate,
+                'stats_mode': self.stats_mode.value,
             }
     
     def __enter__(self):
@@ -215,18 +301,12 @@ class AsyncLFUCache:
     async def put(self, key: Hashable, value: Any) -> None:
         """Put key-value pair in cache asynchronously."""
         async with self._lock:
-            if key in self._cache:
-                self._cache[key] = value
-                self._frequencies[key] += 1
-            else:
-                if len(self._cache) >= self.capacity:
-                    lfu_key = min(self._frequencies, key=self._frequencies.get)
-                    del self._cache[lfu_key]
-                    del self._frequencies[lfu_key]
-                    self._evictions += 1
-                
-                self._cache[key] = value
-                self._frequencies[key] = 1
+            self._put_locked(key, value)
+    
+    # Same dict layout as LFUCache (counters are always shared here)
+    _shared_stats = True
+    _thread_stats = None
+    _put_locked = LFUCache._put_locked
     
     async def delete(self, key: Hashable) -> bool:
         """Delete key from cache asynchronously."""
@@ -237,6 +317,35 @@ class AsyncLFUCache:
                 return True
             return False
     
+    async def get_many(self, keys: List[Hashable]) -> Dict[Hashable, Any]:
+        """Get multiple values with a single lock acquisition."""
+        results = {}
+        async with self._lock:
+            for key in keys:
+                if key in self._cache:
+                    self._frequencies[key] += 1
+                    results[key] = self._cache[key]
+            self._hits += len(results)
+            self._misses += len(keys) - len(results)
+        return results
+    
+    async def put_many(self, items: Dict[Hashable, Any]) -> int:
+        """Put multiple key-value pairs with a single lock acquisition."""
+        async with self._lock:
+            for key, value in items.items():
+                self._put_locked(key, value)
+        return len(items)
+    
+    async def delete_many(self, keys: List[Hashable]) -> int:
+        """Delete multiple keys with a single lock acquisition."""
+        count = 0
+        async with self._lock:
+            for key in keys:
+                if self._cache.pop(key, _MISSING) is not _MISSING:
+                    del self._frequencies[key]
+                    count += 1
+        return count
+    
     async def clear(self) -> None:
         """Clear all items from cache asynchronously."""
         async with self._lock:
@@ -16,17 +16,23 @@ Performance Improvement:
     - Expected: 100x+ faster eviction for large caches
 """
 
+import logging
 import threading
 import asyncio
 from collections import defaultdict, OrderedDict
-from typing import Any, Dict, List, Optional, Hashable, Tuple
+from typing import Any, Dict, List, Optional, Hashable, Tuple, Union
 from .base import ACache
+from .counters import StatsModeMixin
+from .defs import StatsMode
 from ..config.logging_setup import get_logger
 
 logger = get_logger("xsystem.caching.lfu_optimized")
 
+_DEBUG = logging.DEBUG
+_MISSING = object()
 
-class OptimizedLFUCache(ACache):
+
+class OptimizedLFUCache(StatsModeMixin, ACache):
     """
     O(1) LFU Cache using frequency buckets.
     
@@ -38,7 +44,7 @@ class OptimizedLFUCache(ACache):
     Features:
         - O(1) get, put, and eviction operations
         - Thread-safe with RLock
-        - Statistics tracking
+        - Statistics tracking (shared, per-thread or disabled)
         - Memory-efficient implementation
     
     Performance:
@@ -47,13 +53,15 @@ class OptimizedLFUCache(ACache):
         - Optimized for high-throughput scenarios
     """
     
-    def __init__(self, capacity: int = 128, name: Optional[str] = None):
+    def __init__(self, capacity: int = 128, name: Optional[str] = None,
+                 stats: Union[StatsMode, str] = StatsMode.SHARED):
         """
         Initialize optimized LFU cache.
         
         Args:
             capacity: Maximum number of items to store
             name: Optional name for debugging
+            stats: Statistics mode (shared, per_thread or disabled)
         """
         if capacity <= 0:
             raise ValueError(
@@ -78,6 +86,7 @@ class OptimizedLFUCache(ACache):
         self._hits = 0
         self._misses = 0
         self._evictions = 0
+        self._init_stats_mode(stats)
         
         logger.debug(f"Optimized LFU cache {self.name} initialized with capacity {capacity}")
     
@@ -93,17 +102,26 @@ class OptimizedLFUCache(ACache):
             Value associated with key, or default
         """
         with self._lock:
-            if key not in self._cache:
-                self._misses += 1
-                logger.debug(f"Cache {self.name} miss for key: {key}")
+            value = self._cache.get(key, _MISSING)
+            if value is _MISSING:
+                if self._shared_stats:
+                    self._misses += 1
+                elif self._thread_stats is not None:
+                    self._thread_stats.local.misses += 1
+                if logger.isEnabledFor(_DEBUG):
+                    logger.debug(f"Cache {self.name} miss for key: {key}")
                 return default
             
             # Update frequency (O(1))
             self._update_frequency(key)
             
-            self._hits += 1
-            logger.debug(f"Cache {self.name} hit for key: {key}")
-            return self._cache[key]
+            if self._shared_stats:
+                self._hits += 1
+            elif self._thread_stats is not None:
+                self._thread_stats.local.hits += 1
+            if logger.isEnabledFor(_DEBUG):
+                logger.debug(f"Cache {self.name} hit for key: {key}")
+            return value
     
     def put(self, key: Hashable, value: Any) -> None:
         """
@@ -118,7 +136,8 @@ class OptimizedLFUCache(ACache):
                 # Update existing key
                 self._cache[key] = value
                 self._update_frequency(key)
-                logger.debug(f"Cache {self.name} updated key: {key}")
+                if logger.isEnabledFor(_DEBUG):
+                    logger.debug(f"Cache {self.name} updated key: {key}")
             else:
                 # Add new key
                 if len(self._cache) >= self.capacity:
@@ -131,7 +150,8 @@ class OptimizedLFUCache(ACache):
                 self._freq_to_keys[1][key] = None
                 self._min_freq = 1
                 
-                logger.debug(f"Cache {self.name} added key: {key}")
+                if logger.isEnabledFor(_DEBUG):
+                    logger.debug(f"Cache {self.name} added key: {key}")
     
     def delete(self, key: Hashable) -> bool:
         """
@@ -157,7 +177,8 @@ class OptimizedLFUCache(ACache):
             if not self._freq_to_keys[freq]:
                 del self._freq_to_keys[freq]
             
-            logger.debug(f"Cache {self.name} deleted key: {key}")
+            if logger.isEnabledFor(_DEBUG):
+                logger.debug(f"Cache {self.name} deleted key: {key}")
             return True
     
     def clear(self) -> None:
@@ -207,18 +228,20 @@ class OptimizedLFUCache(ACache):
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
         with self._lock:
-            total_requests = self._hits + self._misses
-            hit_rate = self._hits / total_requests if total_requests > 0 else 0.0
+            counts = self._merged_counts()
+            total_requests = counts.hits + counts.misses
+            hit_rate = counts.hits / total_requests if total_requests > 0 else 0.0
             
             return {
                 'name': self.name,
                 'type': 'OptimizedLFU',
                 'capacity': self.capacity,
                 'size': len(self._cache),
-                'hits': self._hits,
-                'misses': self._misses,
-                'evictions': self._evictions,
+                'hits': counts.hits,
+                'misses': counts.misses,
+                'evictions': counts.evictions,
                 'hit_rate': hit_rate,
+                'stats_mode': self.stats_mode.value,
                 'min_freq': self._min_freq,
                 'num_freq_buckets': len(self._freq_to_keys),
             }
@@ -274,8 +297,12 @@ class OptimizedLFUCache(ACache):
         if not self._freq_to_keys[self._min_freq]:
             del self._freq_to_keys[self._min_freq]
         
-        self._evictions += 1
-        logger.debug(f"Cache {self.name} evicted LFU key: {lfu_key} (freq: {self._min_freq})")
+        if self._shared_stats:
+            self._evictions += 1
+        elif self._thread_stats is not None:
+            self._thread_stats.local.evictions += 1
+        if logger.isEnabledFor(_DEBUG):
+            logger.debug(f"Cache {self.name} evicted LFU key: {lfu_key} (freq: {self._min_freq})")
     
     def get_many(self, keys: List[Hashable]) -> Dict[Hashable, Any]:
         """
@@ -297,10 +324,14 @@ class OptimizedLFUCache(ACache):
             for key in keys:
                 if key in self._cache:
                     self._update_frequency(key)
-                    self._hits += 1
                     results[key] = self._cache[key]
-                else:
-                    self._misses += 1
+            if self._shared_stats:
+                self._hits += len(results)
+                self._misses += len(keys) - len(results)
+            elif self._thread_stats is not None:
+                counters = self._thread_stats.local
+                counters.hits += len(results)
+                counters.misses += len(keys) - len(results)
             return results
     
     def put_many(self, items: Dict[Hashable, Any]) -> int:
@@ -9,29 +9,43 @@ LRU (Least Recently Used) Cache implementation with thread-safety and async supp
 """
 
 import asyncio
+import inspect
+import logging
 import threading
 import time
 from collections import OrderedDict
-from typing import Any, Dict, Optional, Union, Callable, Hashable
+from typing import Any, Dict, List, Optional, Union, Callable, Hashable
 
 from ..config.logging_setup import get_logger
 from .base import ACache
+from .counters import StatsModeMixin
+from .defs import StatsMode
+from .single_flight import AsyncSingleFlight
+from .value_codec import EncodedValue, ValueCodec
 
 logger = get_logger("xsystem.caching.lru_cache")
 
+_DEBUG = logging.DEBUG
+
 
 class CacheNode:
-    """Node for doubly-linked list in LRU cache."""
+    """
+    Node for doubly-linked list in LRU cache.
+    
+    access_time is only maintained by caches with a TTL.
+    """
+    
+    __slots__ = ('key', 'value', 'prev', 'next', 'access_time')
     
-    def __init__(self, key: Hashable, value: Any):
+    def __init__(self, key: Hashable, value: Any, access_time: float = 0.0):
         self.key = key
         self.value = value
         self.prev: Optional['CacheNode'] = None
         self.next: Optional['CacheNode'] = None
-        self.access_time = time.time()
+        self.access_time = access_time
 
 
-class LRUCache(ACache):
+class LRUCache(StatsModeMixin, ACache):
     """
     Thread-safe LRU (Least Recently Used) Cache.
     
@@ -39,8 +53,12 @@ class LRUCache(ACache):
     - O(1) get and put operations
     - Thread-safe operations
     - Optional TTL support
-    - Statistics tracking
+    - Statistics tracking (shared, per-thread or disabled)
     - Memory-efficient implementation
+    - Optional value codec: large values stored compressed, decoded on hit
+    
+    Hot path: without a TTL no timestamps are taken, and debug messages
+    are only formatted when debug logging is enabled.
     
     API Note:
         This class provides both put() and set() methods:
@@ -49,7 +67,9 @@ class LRUCache(ACache):
         Both work identically; use put() for consistency with codebase.
     """
     
-    def __init__(self, capacity: int = 128, ttl: Optional[float] = None, name: Optional[str] = None):
+    def __init__(self, capacity: int = 128, ttl: Optional[float] = None, name: Optional[str] = None,
+                 stats: Union[StatsMode, str] = StatsMode.SHARED,
+                 value_codec: Optional[ValueCodec] = None):
         """
         Initialize LRU cache.
         
@@ -57,6 +77,9 @@ class LRUCache(ACache):
             capacity: Maximum number of items to store
             ttl: Optional time-to-live in seconds
             name: Optional name for debugging
+            stats: Statistics mode (shared, per_thread or disabled)
+            value_codec: Optional ValueCodec storing large values serialized
+                and compressed (encoded on put, decoded on each hit)
         """
         if capacity <= 0:
             raise ValueError(
@@ -72,6 +95,7 @@ class LRUCache(ACache):
         # Cache storage
         self._cache: Dict[Hashable, CacheNode] = {}
         self._lock = threading.RLock()
+        self._value_codec = value_codec
         
         # Doubly-linked list for LRU ordering
         self._head = CacheNode(None, None)  # Dummy head
@@ -83,6 +107,7 @@ class LRUCache(ACache):
         self._hits = 0
         self._misses = 0
         self._evictions = 0
+        self._init_stats_mode(stats)
         
         logger.debug(f"LRU cache {self.name} initialized with capacity {capacity}")
     
@@ -98,28 +123,28 @@ class LRUCache(ACache):
             Value associated with key, or default
         """
         with self._lock:
-            if key not in self._cache:
-                self._misses += 1
-                logger.debug(f"Cache {self.name} miss for key: {key}")
-                return default
-            
-            node = self._cache[key]
-            
-            # Check TTL if enabled
-            if self.ttl and time.time() - node.access_time > self.ttl:
-                self._remove_node(node)
-                del self._cache[key]
-                self._misses += 1
-                logger.debug(f"Cache {self.name} TTL expired for key: {key}")
+            node = self._lookup_locked(key)
+            if node is None:
+                if self._shared_stats:
+                    self._misses += 1
+                elif self._thread_stats is not None:
+                    self._thread_stats.local.misses += 1
+                if logger.isEnabledFor(_DEBUG):
+                    logger.debug(f"Cache {self.name} miss for key: {key}")
                 return default
             
-            # Move to head (most recently used)
-            self._move_to_head(node)
-            node.access_time = time.time()
-            
-            self._hits += 1
-            logger.debug(f"Cache {self.name} hit for key: {key}")
-            return node.value
+            if self._shared_stats:
+                self._hits += 1
+            elif self._thread_stats is not None:
+                self._thread_stats.local.hits += 1
+            if logger.isEnabledFor(_DEBUG):
+                logger.debug(f"Cache {self.name} hit for key: {key}")
+            value = node.value
+        
+        # Decompress outside the lock
+        if self._value_codec is not None:
+            return self._value_codec.decode(value)
+        return value
     
     def put(self, key: Hashable, value: Any) -> None:
         """
@@ -129,29 +154,69 @@ class LRUCache(ACache):
             key: Key to store
             value: Value to store
         """
+        if self._value_codec is not None:
+            value = self._value_codec.encode(value)
         with self._lock:
-            if key in self._cache:
-                # Update existing key
-                node = self._cache[key]
-                node.value = value
-                node.access_time = time.time()
-                self._move_to_head(node)
-                logger.debug(f"Cache {self.name} updated key: {key}")
-            else:
-                # Add new key
-                node = CacheNode(key, value)
-                
-                if len(self._cache) >= self.capacity:
-                    # Remove least recently used item
-                    lru_node = self._tail.prev
-                    self._remove_node(lru_node)
-                    del self._cache[lru_node.key]
-                    self._evictions += 1
-                    logger.debug(f"Cache {self.name} evicted LRU key: {lru_node.key}")
-                
-                self._cache[key] = node
-                self._add_to_head(node)
-                logger.debug(f"Cache {self.name} added key: {key}")
+            evicted = self._store_locked(key, value)
+            if logger.isEnabledFor(_DEBUG):
+                if evicted is not None:
+                    logger.debug(f"Cache {self.name} evicted LRU key: {evicted.key}")
+                logger.debug(f"Cache {self.name} stored key: {key}")
+    
+    def _lookup_locked(self, key: Hashable) -> Optional[CacheNode]:
+        """Return the live node for key and mark it most recently used (lock held)."""
+        node = self._cache.get(key)
+        if node is None:
+            return None
+        
+        # Check TTL if enabled (the only reason to read the clock)
+        if self.ttl:
+            now = time.time()
+            if now - node.access_time > self.ttl:
+                self._remove_node(node)
+                del self._cache[key]
+                return None
+            node.access_time = now
+        
+        # Move to head (most recently used)
+        self._move_to_head(node)
+        return node
+    
+    def _store_locked(self, key: Hashable, value: Any) -> Optional[CacheNode]:
+        """Insert or update key (lock held); returns the evicted node, if any."""
+        now = time.time() if self.ttl else 0.0
+        node = self._cache.get(key)
+        if node is not None:
+            # Update existing key
+            node.value = value
+            node.access_time = now
+            self._move_to_head(node)
+            return None
+        
+        # Add new key
+        evicted = None
+        if len(self._cache) >= self.capacity:
+            # Remove least recently used item
+            evicted = self._tail.prev
+            self._remove_node(evicted)
+            del self._cache[evicted.key]
+            if self._shared_stats:
+                self._evictions += 1
+            elif self._thread_stats is not None:
+                self._thread_stats.local.evictions += 1
+        
+        node = CacheNode(key, value, now)
+        self._cache[key] = node
+        self._add_to_head(node)
+        return evicted
+    
+    def _delete_locked(self, key: Hashable) -> bool:
+        """Remove key (lock held)."""
+        node = self._cache.pop(key, None)
+        if node is None:
+            return False
+        self._remove_node(node)
+        return True
     
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """
@@ -178,15 +243,91 @@ class LRUCache(ACache):
             True if key was deleted, False if not found
         """
         with self._lock:
-            if key not in self._cache:
+            if not self._delete_locked(key):
                 return False
-            
-            node = self._cache[key]
-            self._remove_node(node)
-            del self._cache[key]
-            logger.debug(f"Cache {self.name} deleted key: {key}")
+            if logger.isEnabledFor(_DEBUG):
+                logger.debug(f"Cache {self.name} deleted key: {key}")
             return True
     
+    def get_many(self, keys: List[Hashable]) -> Dict[Hashable, Any]:
+        """
+        Get multiple values with a single lock acquisition.
+        
+        Args:
+            keys: List of keys to retrieve
+            
+        Returns:
+            Dictionary of key-value pairs found in cache
+        """
+        if type(self).get is not LRUCache.get:
+            # Subclass get() adds behavior (loading, validation...): honor it
+            return super().get_many(keys)
+        
+        results = {}
+        with self._lock:
+            lookup = self._lookup_locked
+            for key in keys:
+                node = lookup(key)
+                if node is not None:
+                    results[key] = node.value
+            if self._shared_stats:
+                self._hits += len(results)
+                self._misses += len(keys) - len(results)
+            elif self._thread_stats is not None:
+                counters = self._thread_stats.local
+                counters.hits += len(results)
+                counters.misses += len(keys) - len(results)
+        if self._value_codec is not None:
+            decode = self._value_codec.decode
+            results = {key: decode(value) for key, value in results.items()}
+        if logger.isEnabledFor(_DEBUG):
+            logger.debug(f"Cache {self.name} get_many: {len(results)}/{len(keys)} hits")
+        return results
+    
+    def put_many(self, items: Dict[Hashable, Any]) -> int:
+        """
+        Put multiple key-value pairs with a single lock acquisition.
+        
+        Args:
+            items: Dictionary of key-value pairs to cache
+            
+        Returns:
+            Number of items cached
+        """
+        if type(self).put is not LRUCache.put:
+            return super().put_many(items)
+        
+        if self._value_codec is not None:
+            encode = self._value_codec.encode
+            items = {key: encode(value) for key, value in items.items()}
+        with self._lock:
+            store = self._store_locked
+            for key, value in items.items():
+                store(key, value)
+        if logger.isEnabledFor(_DEBUG):
+            logger.debug(f"Cache {self.name} put_many: {len(items)} keys")
+        return len(items)
+    
+    def delete_many(self, keys: List[Hashable]) -> int:
+        """
+        Delete multiple keys with a single lock acquisition.
+        
+        Args:
+            keys: List of keys to delete
+            
+        Returns:
+            Number of keys deleted
+        """
+        if type(self).delete is not LRUCache.delete:
+            return super().delete_many(keys)
+        
+        with self._lock:
+            delete = self._delete_locked
+            count = sum(1 for key in keys if delete(key))
+        if logger.isEnabledFor(_DEBUG):
+            logger.debug(f"Cache {self.name} delete_many: {count}/{len(keys)} deleted")
+        return count
+    
     def clear(self) -> None:
         """Clear all items from cache."""
         with self._lock:
@@ -216,8 +357,12 @@ class LRUCache(ACache):
                 if lru_node != self._head:  # Ensure it's not the dummy head
                     self._remove_node(lru_node)
                     del self._cache[lru_node.key]
-                    self._evictions += 1
-                    logger.debug(f"Cache {self.name} manually evicted LRU key: {lru_node.key}")
+                    if self._shared_stats:
+                        self._evictions += 1
+                    elif self._thread_stats is not None:
+                        self._thread_stats.local.evictions += 1
+                    if logger.isEnabledFor(_DEBUG):
+                        logger.debug(f"Cache {self.name} manually evicted LRU key: {lru_node.key}")
     
     def keys(self) -> list:
         """Get list of all keys (in LRU order)."""
@@ -237,7 +382,9 @@ class LRUCache(ACache):
             while node != self._tail:
                 values.append(node.value)
                 node = node.next
-            return values
+        if self._value_codec is not None:
+            values = [self._value_codec.decode(value) for value in values]
+        return values
     
     def items(self) -> list:
         """Get list of all key-value pairs (in LRU order)."""
@@ -247,32 +394,51 @@ class LRUCache(ACache):
             while node != self._tail:
                 items.append((node.key, node.value))
                 node = node.next
-            return items
+        if self._value_codec is not None:
+            decode = self._value_codec.decode
+            items = [(key, decode(value)) for key, value in items]
+        return items
+    
+    def get_entry_codec_stats(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """
+        Get size/CPU statistics for one encoded entry (without touching LRU order).
+        
+        Returns:
+            Per-entry statistics, or None if the key is missing or its value
+            is stored unencoded (below the codec threshold or no codec)
+        """
+        with self._lock:
+            node = self._cache.get(key)
+            value = node.value if node is not None else None
+        if isinstance(value, EncodedValue):
+            return value.get_stats()
+        return None
     
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
         with self._lock:
-            total_requests = self._hits + self._misses
-            hit_rate = self._hits / total_requests if total_requests > 0 else 0.0
+            counts = self._merged_counts()
+            total_requests = counts.hits + counts.misses
+            hit_rate = counts.hits / total_requests if total_requests > 0 else 0.0
             
             return {
                 'name': self.name,
                 'type': 'LRU',
                 'capacity': self.capacity,
                 'size': len(self._cache),
-                'hits': self._hits,
-                'misses': self._misses,
-                'evictions': self._evictions,
+                'hits': counts.hits,
+                'misses': counts.misses,
+                'evictions': counts.evictions,
                 'hit_rate': hit_rate,
                 'ttl': self.ttl,
+                'stats_mode': self.stats_mode.value,
+                **({'value_codec': self._value_codec.get_stats()} if self._value_codec else {}),
             }
     
     def reset_stats(self) -> None:
         """Reset cache statistics."""
         with self._lock:
-            self._hits = 0
-            self._misses = 0
-            self._evictions = 0
+            self._reset_counts()
     
     def _add_to_head(self, node: CacheNode) -> None:
         """Add node to head of list."""
@@ -287,9 +453,14 @@ class LRUCache(ACache):
         node.next.prev = node.prev
     
     def _move_to_head(self, node: CacheNode) -> None:
-        """Move node to head of list."""
-        self._remove_node(node)
-        self._add_to_head(node)
+        """Move node to head of list (unlink + relink inlined for the hit path)."""
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        head = self._head
+        node.prev = head
+        node.next = head.next
+        head.next.prev = node
+        head.next = node
     
     def __contains__(self, key: Hashable) -> bool:
         """Check if key exists in cache."""
@@ -371,6 +542,9 @@ class AsyncLRUCache:
         self._misses = 0
         self._evictions = 0
         
+        # In-flight loads for get_or_load()
+        self._flight = AsyncSingleFlight()
+        
         logger.debug(f"Async LRU cache {self.name} initialized with capacity {capacity}")
     
     async def get(self, key: Hashable, default: Any = None) -> Any:
@@ -385,27 +559,16 @@ class AsyncLRUCache:
             Value associated with key, or default
         """
         async with self._lock:
-            if key not in self._cache:
-                self._misses += 1
-                logger.debug(f"Async cache {self.name} miss for key: {key}")
-                return default
-            
-            node = self._cache[key]
-            
-            # Check TTL if enabled
-            if self.ttl and time.time() - node.access_time > self.ttl:
-                self._remove_node(node)
-                del self._cache[key]
+            node = self._lookup_locked(key)
+            if node is None:
                 self._misses += 1
-                logger.debug(f"Async cache {self.name} TTL expired for key: {key}")
+                if logger.isEnabledFor(_DEBUG):
+                    logger.debug(f"Async cache {self.name} miss for key: {key}")
                 return default
             
-            # Move to head (most recently used)
-            self._move_to_head(node)
-            node.access_time = time.time()
-            
             self._hits += 1
-            logger.debug(f"Async cache {self.name} hit for key: {key}")
+            if logger.isEnabledFor(_DEBUG):
+                logger.debug(f"Async cache {self.name} hit for key: {key}")
             return node.value
     
     async def put(self, key: Hashable, value: Any) -> None:
@@ -417,28 +580,104 @@ class AsyncLRUCache:
             value: Value to store
         """
         async with self._lock:
-            if key in self._cache:
-                # Update existing key
-                node = self._cache[key]
-                node.value = value
-                node.access_time = time.time()
-                self._move_to_head(node)
-                logger.debug(f"Async cache {self.name} updated key: {key}")
-            else:
-                # Add new key
-                node = CacheNode(key, value)
-                
-                if len(self._cache) >= self.capacity:
-                    # Remove least recently used item
-                    lru_node = self._tail.prev
-                    self._remove_node(lru_node)
-                    del self._cache[lru_node.key]
-                    self._evictions += 1
-                    logger.debug(f"Async cache {self.name} evicted LRU key: {lru_node.key}")
-                
-                self._cache[key] = node
-                self._add_to_head(node)
-                logger.debug(f"Async cache {self.name} added key: {key}")
+            evicted = self._store_locked(key, value)
+            if logger.isEnabledFor(_DEBUG):
+                if evicted is not None:
+                    logger.debug(f"Async cache {self.name} evicted LRU key: {evicted.key}")
+                logger.debug(f"Async cache {self.name} stored key: {key}")
+    
+    # Lock-held helpers are shared with LRUCache (same node/list layout);
+    # a single event loop needs no per-thread counters
+    _shared_stats = True
+    _thread_stats = None
+    _lookup_locked = LRUCache._lookup_locked
+    _store_locked = LRUCache._store_locked
+    _delete_locked = LRUCache._delete_locked
+    
+    async def get_many(self, keys: List[Hashable]) -> Dict[Hashable, Any]:
+        """
+        Get multiple values with a single lock acquisition.
+        
+        Args:
+            keys: List of keys to retrieve
+            
+        Returns:
+            Dictionary of key-value pairs found in cache
+        """
+        results = {}
+        async with self._lock:
+            for key in keys:
+                node = self._lookup_locked(key)
+                if node is not None:
+                    results[key] = node.value
+            self._hits += len(results)
+            self._misses += len(keys) - len(results)
+        return results
+    
+    async def put_many(self, items: Dict[Hashable, Any]) -> int:
+        """
+        Put multiple key-value pairs with a single lock acquisition.
+        
+        Args:
+            items: Dictionary of key-value pairs to cache
+            
+        Returns:
+            Number of items cached
+        """
+        async with self._lock:
+            for key, value in items.items():
+                self._store_locked(key, value)
+        return len(items)
+    
+    async def delete_many(self, keys: List[Hashable]) -> int:
+        """
+        Delete multiple keys with a single lock acquisition.
+        
+        Args:
+            keys: List of keys to delete
+            
+        Returns:
+            Number of keys deleted
+        """
+        async with self._lock:
+            return sum(1 for key in keys if self._delete_locked(key))
+    
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[Hashable], Any],
+        timeout: Optional[float] = None
+    ) -> Any:
+        """
+        Get value by key, loading and caching it on a miss.
+        
+        Concurrent misses on the same key are coalesced: loader runs once and
+        every waiter receives its result (or its exception).
+        
+        Args:
+            key: Key to lookup
+            loader: Function (key) -> value or awaitable of value
+            timeout: Max seconds to wait for another caller's in-flight load
+            
+        Returns:
+            Cached or loaded value
+            
+        Raises:
+            CacheTimeoutError: If waiting for an in-flight load exceeds timeout
+        """
+        value = await self.get(key)
+        if value is not None:
+            return value
+        
+        async def load() -> Any:
+            loaded = loader(key)
+            if inspect.isawaitable(loaded):
+                loaded = await loaded
+            if loaded is not None:
+                await self.put(key, loaded)
+            return loaded
+        
+        return await self._flight.do(key, load, timeout=timeout)
     
     async def delete(self, key: Hashable) -> bool:
         """
@@ -457,7 +696,8 @@ class AsyncLRUCache:
             node = self._cache[key]
             self._remove_node(node)
             del self._cache[key]
-            logger.debug(f"Async cache {self.name} deleted key: {key}")
+            if logger.isEnabledFor(_DEBUG):
+                logger.debug(f"Async cache {self.name} deleted key: {key}")
             return True
     
     async def clear(self) -> None:
@@ -524,6 +764,7 @@ class AsyncLRUCache:
                 'evictions': self._evictions,
                 'hit_rate': hit_rate,
                 'ttl': self.ttl,
+                'coalesced_loads': self._flight.get_stats()['coalesced'],
             }
     
     async def reset_stats(self) -> None:
@@ -546,9 +787,14 @@ class AsyncLRUCache:
         node.next.prev = node.prev
     
     def _move_to_head(self, node: CacheNode) -> None:
-        """Move node to head of list."""
-        self._remove_node(node)
-        self._add_to_head(node)
+        """Move node to head of list (unlink + relink inlined for the hit path)."""
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        head = self._head
+        node.prev = head
+        node.next = head.next
+        head.next.prev = node
+        head.next = node
     
     async def __aenter__(self):
         """Async context manager entry."""
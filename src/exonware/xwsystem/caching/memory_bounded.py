@@ -9,16 +9,35 @@ Generation Date: 01-Nov-2025
 
 Memory-bounded cache implementations.
 Performance Priority #4 - Memory budget enforcement for controlled memory usage.
+
+Entry sizes come from a weigher(key, value) -> bytes callable. The default
+weigher uses the deep, per-type estimator registry in size_estimators, and
+each entry's weight is computed once on put and cached for eviction.
+
+With a value_codec, large values are stored compressed and weighed in
+their stored form, so the same budget holds several times more entries.
 """
 
-from typing import Any, Optional, Hashable, Dict
+import logging
+from typing import Any, Callable, Optional, Hashable, Dict
 from .lru_cache import LRUCache
 from .lfu_optimized import OptimizedLFUCache
 from .utils import estimate_object_size, format_bytes
+from .value_codec import ValueCodec
 from ..config.logging_setup import get_logger
 
 logger = get_logger("xsystem.caching.memory_bounded")
 
+_DEBUG = logging.DEBUG
+
+
+Weigher = Callable[[Hashable, Any], int]
+
+
+def default_weigher(key: Hashable, value: Any) -> int:
+    """Default entry weight: deep estimated size of the value in bytes."""
+    return estimate_object_size(value)
+
 
 class MemoryBoundedLRUCache(LRUCache):
     """
@@ -39,7 +58,9 @@ class MemoryBoundedLRUCache(LRUCache):
         capacity: int = 128,
         memory_budget_mb: float = 100.0,
         ttl: Optional[float] = None,
-        name: Optional[str] = None
+        name: Optional[str] = None,
+        weigher: Optional[Weigher] = None,
+        value_codec: Optional[ValueCodec] = None
     ):
         """
         Initialize memory-bounded LRU cache.
@@ -49,9 +70,14 @@ class MemoryBoundedLRUCache(LRUCache):
             memory_budget_mb: Memory budget in megabytes
             ttl: Optional TTL in seconds
             name: Cache name for debugging
+            weigher: Callable (key, value) -> size in bytes
+                (default: deep estimated size of the value). With a
+                value_codec it receives the stored (encoded) value.
+            value_codec: Optional ValueCodec storing large values compressed
         """
-        super().__init__(capacity, ttl, name)
+        super().__init__(capacity, ttl, name, value_codec=value_codec)
         
+        self.weigher = weigher or default_weigher
         self.memory_budget_mb = memory_budget_mb
         self.memory_budget_bytes = int(memory_budget_mb * 1024 * 1024)
         self._current_memory_bytes = 0
@@ -70,8 +96,12 @@ class MemoryBoundedLRUCache(LRUCache):
             key: Cache key
             value: Value to cache
         """
+        # Encode (compress) outside the lock; the stored form is what is weighed
+        if self._value_codec is not None:
+            value = self._value_codec.encode(value)
+        
         with self._lock:
-            value_size = estimate_object_size(value)
+            value_size = self.weigher(key, value)
             
             # If single value exceeds budget, reject it
             if value_size > self.memory_budget_bytes:
@@ -81,28 +111,34 @@ class MemoryBoundedLRUCache(LRUCache):
                 )
                 return
             
-            # If key exists, update memory accounting
+            # If key exists, release its old weight (popped so that evicting
+            # the same key below cannot release it twice)
             if key in self._cache:
-                old_size = self._value_sizes.get(key, 0)
-                self._current_memory_bytes -= old_size
+                self._current_memory_bytes -= self._value_sizes.pop(key, 0)
             
             # Evict LRU entries until we have enough memory
             while (self._current_memory_bytes + value_size > self.memory_budget_bytes
                    and len(self._cache) > 0):
                 self._evict_lru_with_memory()
             
-            # Store value using parent method
-            super().put(key, value)
+            # Enforce the entry-count limit here too, so the parent never
+            # evicts an entry behind the memory accounting's back
+            if key not in self._cache and len(self._cache) >= self.capacity:
+                self._evict_lru_with_memory()
+            
+            # Store the (already encoded) value
+            self._store_locked(key, value)
             
             # Update memory tracking
             self._value_sizes[key] = value_size
             self._current_memory_bytes += value_size
             
-            logger.debug(
-                f"Cache {self.name} stored key {key}: "
-                f"{format_bytes(value_size)} "
-                f"(total: {format_bytes(self._current_memory_bytes)})"
-            )
+            if logger.isEnabledFor(_DEBUG):
+                logger.debug(
+                    f"Cache {self.name} stored key {key}: "
+                    f"{format_bytes(value_size)} "
+                    f"(total: {format_bytes(self._current_memory_bytes)})"
+                )
     
     def delete(self, key: Hashable) -> bool:
         """Delete key and update memory tracking."""
@@ -147,10 +183,11 @@ class MemoryBoundedLRUCache(LRUCache):
         del self._cache[lru_key]
         self._evictions += 1
         
-        logger.debug(
-            f"Cache {self.name} evicted LRU key {lru_key}: "
-            f"freed {format_bytes(value_size)}"
-        )
+        if logger.isEnabledFor(_DEBUG):
+            logger.debug(
+                f"Cache {self.name} evicted LRU key {lru_key}: "
+                f"freed {format_bytes(value_size)}"
+            )
     
     def get_memory_stats(self) -> Dict[str, Any]:
         """Get memory-specific statistics."""
@@ -187,11 +224,22 @@ class MemoryBoundedLFUCache(OptimizedLFUCache):
         self,
         capacity: int = 128,
         memory_budget_mb: float = 100.0,
-        name: Optional[str] = None
+        name: Optional[str] = None,
+        weigher: Optional[Weigher] = None
     ):
-        """Initialize memory-bounded LFU cache."""
+        """
+        Initialize memory-bounded LFU cache.
+        
+        Args:
+            capacity: Maximum number of entries (fallback limit)
+            memory_budget_mb: Memory budget in megabytes
+            name: Cache name for debugging
+            weigher: Callable (key, value) -> size in bytes
+                (default: deep estimated size of the value)
+        """
         super().__init__(capacity, name)
         
+        self.weigher = weigher or default_weigher
         self.memory_budget_mb = memory_budget_mb
         self.memory_budget_bytes = int(memory_budget_mb * 1024 * 1024)
         self._current_memory_bytes = 0
@@ -200,7 +248,7 @@ class MemoryBoundedLFUCache(OptimizedLFUCache):
     def put(self, key: Hashable, value: Any) -> None:
         """Put value with memory budget enforcement."""
         with self._lock:
-            value_size = estimate_object_size(value)
+            value_size = self.weigher(key, value)
             
             if value_size > self.memory_budget_bytes:
                 logger.warning(
@@ -209,16 +257,19 @@ class MemoryBoundedLFUCache(OptimizedLFUCache):
                 )
                 return
             
-            # Update memory for existing key
+            # Release old weight for existing key
             if key in self._cache:
-                old_size = self._value_sizes.get(key, 0)
-                self._current_memory_bytes -= old_size
+                self._current_memory_bytes -= self._value_sizes.pop(key, 0)
             
             # Evict until we have space
             while (self._current_memory_bytes + value_size > self.memory_budget_bytes
                    and len(self._cache) > 0):
                 self._evict_lfu_with_memory()
             
+            # Enforce the entry-count limit with memory accounting
+            if key not in self._cache and len(self._cache) >= self.capacity:
+                self._evict_lfu_with_memory()
+            
             # Store using parent
             super().put(key, value)
             
@@ -285,5 +336,6 @@ class MemoryBoundedLFUCache(OptimizedLFUCache):
 __all__ = [
     'MemoryBoundedLRUCache',
     'MemoryBoundedLFUCache',
+    'default_weigher',
 ]
 
@@ -0,0 +1,602 @@
+#!/usr/bin/env python3
+"""
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+
+Streaming cache snapshots for warm restarts.
+
+File layout:
+    header   b"XWCSNAP", version, compression id, metadata length + JSON
+    chunk*   b"CHNK", record count, raw length, stored length, CRC32 of the
+             stored bytes, then the (optionally compressed) records
+    trailer  b"END!", total records, chunk count
+
+Each record is length-prefixed: key length, value length, frequency and
+remaining TTL (NaN = none), followed by the pickled key and value. Records
+are written coldest first, so restoring them in order rebuilds LRU order,
+LFU frequencies and remaining TTLs.
+
+Performance:
+    - The cache lock is held only while entry references are copied;
+      pickling, compression and file I/O run outside it
+    - Chunks are compressed and decoded on a thread pool (zlib/lz4/zstd
+      release the GIL) with a bounded number of chunks in flight
+    - Restore applies one chunk per lock acquisition, with the cyclic GC
+      paused (millions of new objects otherwise trigger repeated full
+      collections, roughly tripling restore time)
+
+Snapshots contain pickles: only load files you wrote.
+"""
+
+import gc
+import json
+import math
+import os
+import pickle
+import struct
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Hashable, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from .base import ACache
+from .errors import CacheDeserializationError, CacheIntegrityError
+from .lfu_cache import LFUCache
+from .lfu_optimized import OptimizedLFUCache
+from .lru_cache import LRUCache
+from .sharded_cache import _ShardedCache
+from .ttl_cache import TTLCache, TTLEntry
+from .value_codec import decode_value, get_decompressor, resolve_compression
+from ..config.logging_setup import get_logger
+
+logger = get_logger("xwsystem.caching.persistence")
+
+
+SNAPSHOT_MAGIC = b"XWCSNAP"
+SNAPSHOT_VERSION = 1
+
+# Uncompressed bytes per chunk
+DEFAULT_CHUNK_BYTES = 4 * 1024 * 1024
+
+# Threads compressing (save) or decoding (load) chunks
+DEFAULT_SNAPSHOT_WORKERS = 4
+
+_HEADER = struct.Struct("<7sBBI")      # magic, version, compression id, metadata length
+_CHUNK = struct.Struct("<4sIIII")      # tag, records, raw length, stored length, crc32
+_RECORD = struct.Struct("<IIId")       # key length, value length, frequency, ttl remaining
+_TRAILER = struct.Struct("<4sQI")      # tag, total records, chunks
+_CHUNK_TAG = b"CHNK"
+_TRAILER_TAG = b"END!"
+
+_PICKLE_PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+
+class SnapshotRecord(NamedTuple):
+    """One cache entry in a snapshot."""
+    key: Hashable
+    value: Any
+    ttl_remaining: Optional[float] = None
+    frequency: int = 0
+
+
+class ASnapshotAdapter(ABC):
+    """
+    Reads entries out of, and writes them back into, one kind of cache.
+
+    Register adapters for custom caches with register_snapshot_adapter().
+    """
+
+    @abstractmethod
+    def capture(self, cache: Any) -> Iterable[SnapshotRecord]:
+        """
+        Return the cache's entries, coldest first.
+
+        Hold the cache lock only to copy references; the result is
+        serialized after the lock is released.
+        """
+
+    @abstractmethod
+    def restore(self, cache: Any, records: List[SnapshotRecord]) -> int:
+        """
+        Store records (coldest first) into the cache.
+
+        Returns:
+            Number of records stored
+        """
+
+
+class GenericSnapshotAdapter(ASnapshotAdapter):
+    """Any ACache: entries from items(), restored with put_many() (no metadata)."""
+
+    def capture(self, cache: Any) -> Iterable[SnapshotRecord]:
+        return [SnapshotRecord(key, value) for key, value in cache.items()]
+
+    def restore(self, cache: Any, records: List[SnapshotRecord]) -> int:
+        return cache.put_many({record.key: record.value for record in records})
+
+
+class LRUSnapshotAdapter(ASnapshotAdapter):
+    """LRUCache and subclasses: recency order and per-entry remaining TTL."""
+
+    def capture(self, cache: LRUCache) -> Iterable[SnapshotRecord]:
+        with cache._lock:
+            entries = []
+            node = cache._tail.prev
+            while node is not cache._head:
+                entries.append((node.key, node.value, node.access_time))
+                node = node.prev
+        ttl = cache.ttl
+        now = time.time()
+        for key, value, access_time in entries:
+            remaining = ttl - (now - access_time) if ttl else None
+            if remaining is not None and remaining <= 0:
+                continue
+            # Compressed values are stored decoded so any cache can load them
+            yield SnapshotRecord(key, decode_value(value), remaining)
+
+    def restore(self, cache: LRUCache, records: List[SnapshotRecord]) -> int:
+        if type(cache).put is LRUCache.put:
+            codec = cache._value_codec
+            entries = [(record.key, codec.encode(record.value) if codec else record.value)
+                       for record in records]
+            with cache._lock:
+                store = cache._store_locked
+                for key, value in entries:
+                    store(key, value)
+                self._restore_ages(cache, records)
+        else:
+            # put() adds accounting (memory budget, validation...): honor it
+            for record in records:
+                cache.put(record.key, record.value)
+            with cache._lock:
+                self._restore_ages(cache, records)
+        return len(records)
+
+    @staticmethod
+    def _restore_ages(cache: LRUCache, records: List[SnapshotRecord]) -> None:
+        """Backdate access times so entries expire when they would have (lock held)."""
+        ttl = cache.ttl
+        if not ttl:
+            return
+        now = time.time()
+        for record in records:
+            if record.ttl_remaining is None:
+                continue
+            node = cache._cache.get(record.key)
+            if node is not None:
+                node.access_time = now - (ttl - min(record.ttl_remaining, ttl))
+
+
+class LFUSnapshotAdapter(ASnapshotAdapter):
+    """LFUCache: access frequencies."""
+
+    def capture(self, cache: LFUCache) -> Iterable[SnapshotRecord]:
+        with cache._lock:
+            entries = [(key, value, cache._frequencies[key]) for key, value in cache._cache.items()]
+        entries.sort(key=lambda entry: entry[2])
+        return [SnapshotRecord(key, value, None, frequency) for key, value, frequency in entries]
+
+    def restore(self, cache: LFUCache, records: List[SnapshotRecord]) -> int:
+        with cache._lock:
+            for record in records:
+                cache._put_locked(record.key, record.value)
+                cache._frequencies[record.key] = max(1, record.frequency)
+        return len(records)
+
+
+class OptimizedLFUSnapshotAdapter(ASnapshotAdapter):
+    """OptimizedLFUCache: frequencies and per-bucket insertion order."""
+
+    def capture(self, cache: OptimizedLFUCache) -> Iterable[SnapshotRecord]:
+        with cache._lock:
+            values = cache._cache
+            entries = [
+                (key, values[key], frequency)
+                for frequency in sorted(cache._freq_to_keys)
+                for key in cache._freq_to_keys[frequency]
+            ]
+        return [SnapshotRecord(key, value, None, frequency) for key, value, frequency in entries]
+
+    def restore(self, cache: OptimizedLFUCache, records: List[SnapshotRecord]) -> int:
+        with cache._lock:
+            buckets = cache._freq_to_keys
+            for key, value, _, frequency in records:
+                frequency = max(1, frequency)
+                if key in cache._cache:
+                    old = cache._key_to_freq[key]
+                    del buckets[old][key]
+                    if not buckets[old]:
+                        del buckets[old]
+                elif len(cache._cache) >= cache.capacity:
+                    cache._evict_lfu()
+                cache._cache[key] = value
+                cache._key_to_freq[key] = frequency
+                buckets[frequency][key] = None
+                if cache._min_freq not in buckets or frequency < cache._min_freq:
+                    cache._min_freq = min(buckets)
+        return len(records)
+
+
+class TTLSnapshotAdapter(ASnapshotAdapter):
+    """TTLCache: recency order, per-entry expiry and access counts."""
+
+    def capture(self, cache: TTLCache) -> Iterable[SnapshotRecord]:
+        with cache._lock:
+            entries = cache._live_items()
+        now = time.time()
+        return [
+            SnapshotRecord(key, entry.value, entry.expires_at - now, entry.access_count)
+            for key, entry in entries
+            if entry.expires_at > now
+        ]
+
+    def restore(self, cache: TTLCache, records: List[SnapshotRecord]) -> int:
+        now = time.time()
+        with cache._lock:
+            for key, value, remaining, frequency in records:
+                expires_at = now + (remaining if remaining is not None else cache.ttl)
+                cache._store(key, TTLEntry(value=value, expires_at=expires_at, access_count=frequency))
+        return len(records)
+
+
+class ShardedSnapshotAdapter(ASnapshotAdapter):
+    """Sharded caches: each shard is captured under its own lock."""
+
+    def capture(self, cache: _ShardedCache) -> Iterable[SnapshotRecord]:
+        for shard in cache.shards:
+            yield from get_snapshot_adapter(shard).capture(shard)
+
+    def restore(self, cache: _ShardedCache, records: List[SnapshotRecord]) -> int:
+        groups: Dict[int, Tuple[ACache, List[SnapshotRecord]]] = {}
+        for record in records:
+            shard = cache._shard_for(record.key)
+            groups.setdefault(id(shard), (shard, []))[1].append(record)
+        return sum(
+            get_snapshot_adapter(shard).restore(shard, shard_records)
+            for shard, shard_records in groups.values()
+        )
+
+
+_adapters: Dict[type, ASnapshotAdapter] = {
+    LRUCache: LRUSnapshotAdapter(),
+    LFUCache: LFUSnapshotAdapter(),
+    OptimizedLFUCache: OptimizedLFUSnapshotAdapter(),
+    TTLCache: TTLSnapshotAdapter(),
+    _ShardedCache: ShardedSnapshotAdapter(),
+}
+_generic_adapter = GenericSnapshotAdapter()
+_adapters_lock = threading.Lock()
+
+
+def register_snapshot_adapter(cache_type: type, adapter: ASnapshotAdapter) -> None:
+    """
+    Register the snapshot adapter for a cache type (and its subclasses).
+
+    Args:
+        cache_type: Cache class handled by the adapter
+        adapter: ASnapshotAdapter instance
+    """
+    with _adapters_lock:
+        _adapters[cache_type] = adapter
+
+
+def get_snapshot_adapter(cache: Any) -> ASnapshotAdapter:
+    """Resolve the adapter for a cache via its MRO (generic items()/put_many() fallback)."""
+    for klass in type(cache).__mro__:
+        adapter = _adapters.get(klass)
+        if adapter is not None:
+            return adapter
+    return _generic_adapter
+
+
+# ----------------------------------------------------------------------
+# Writing
+# ----------------------------------------------------------------------
+
+def _seal_chunk(compress: Optional[Callable[[bytes], bytes]], count: int, raw: bytes) -> bytes:
+    """Compress a chunk and prefix its header (runs on a worker thread)."""
+    stored = compress(raw) if compress is not None else raw
+    return _CHUNK.pack(_CHUNK_TAG, count, len(raw), len(stored), zlib.crc32(stored)) + stored
+
+
+def _write_snapshot(cache: Any, path: Path, compression: str, level: Optional[int],
+                    chunk_bytes: int, workers: int) -> Dict[str, Any]:
+    adapter = get_snapshot_adapter(cache)
+    compression_id, compress = resolve_compression(compression, level)
+    if not compression_id:
+        compress = None
+
+    started = time.perf_counter()
+    meta = json.dumps({
+        'cache_type': type(cache).__name__,
+        'name': getattr(cache, 'name', None),
+        'created': time.time(),
+    }).encode('utf-8')
+
+    records = skipped = chunks = raw_bytes = stored_bytes = 0
+    tmp_path = path.with_name(path.name + ".tmp")
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(tmp_path, 'wb') as f, \
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix="xwsystem-cache-snapshot") as pool:
+        f.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, compression_id, len(meta)))
+        f.write(meta)
+        pending: deque = deque()
+
+        def write_oldest() -> None:
+            nonlocal stored_bytes
+            data = pending.popleft().result()
+            stored_bytes += len(data) - _CHUNK.size
+            f.write(data)
+
+        def submit(raw: bytes, count: int) -> None:
+            nonlocal chunks, raw_bytes
+            pending.append(pool.submit(_seal_chunk, compress, count, raw))
+            chunks += 1
+            raw_bytes += len(raw)
+            while len(pending) > workers * 2:
+                write_oldest()
+
+        buffer = bytearray()
+        count = 0
+        pack = _RECORD.pack
+        dumps = pickle.dumps
+        for key, value, ttl_remaining, frequency in adapter.capture(cache):
+            try:
+                key_bytes = dumps(key, _PICKLE_PROTOCOL)
+                value_bytes = dumps(value, _PICKLE_PROTOCOL)
+            except Exception as e:
+                skipped += 1
+                logger.warning(f"Skipping unpicklable cache entry {key!r} in snapshot: {e}")
+                continue
+            buffer += pack(len(key_bytes), len(value_bytes), frequency,
+                           math.nan if ttl_remaining is None else ttl_remaining)
+            buffer += key_bytes
+            buffer += value_bytes
+            count += 1
+            if len(buffer) >= chunk_bytes:
+                submit(bytes(buffer), count)
+                records += count
+                buffer = bytearray()
+                count = 0
+        if count:
+            submit(bytes(buffer), count)
+            records += count
+        while pending:
+            write_oldest()
+
+        f.write(_TRAILER.pack(_TRAILER_TAG, records, chunks))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+    elapsed = time.perf_counter() - started
+    logger.info(f"Cache snapshot written to {path}: {records} entries, {chunks} chunks in {elapsed:.2f}s")
+    return {
+        'path': str(path),
+        'records': records,
+        'skipped': skipped,
+        'chunks': chunks,
+        'raw_bytes': raw_bytes,
+        'stored_bytes': stored_bytes,
+        'seconds': elapsed,
+    }
+
+
+def save_snapshot(cache: Any, path: Union[str, Path], *, compression: str = 'zlib',
+                  level: Optional[int] = None, chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+                  workers: int = DEFAULT_SNAPSHOT_WORKERS,
+                  background: bool = False) -> Union[Dict[str, Any], Future]:
+    """
+    Write a streaming snapshot of any cache.
+
+    The file is written next to path and renamed into place, so a reader
+    never sees a partial snapshot.
+
+    Args:
+        cache: Cache to snapshot (any ACache; see register_snapshot_adapter)
+        path: Snapshot file path
+        compression: 'zlib', 'lz4', 'zstd' or 'none'
+        level: Compression level (default: per-compressor default)
+        chunk_bytes: Uncompressed bytes per chunk
+        workers: Threads compressing chunks
+        background: Return a Future immediately and write on a background thread
+
+    Returns:
+        Statistics (records, skipped, chunks, raw/stored bytes, seconds),
+        or a Future of them when background is True
+
+    Example:
+        save_snapshot(cache, "/var/cache/app.snap", compression="zstd")
+        ...
+        load_snapshot(new_cache, "/var/cache/app.snap")
+    """
+    path = Path(path)
+    workers = max(1, workers)
+    if background:
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="xwsystem-cache-snapshot-bg")
+        future = executor.submit(_write_snapshot, cache, path, compression, level, chunk_bytes, workers)
+        executor.shutdown(wait=False)
+        return future
+    return _write_snapshot(cache, path, compression, level, chunk_bytes, workers)
+
+
+# ----------------------------------------------------------------------
+# Reading
+# ----------------------------------------------------------------------
+
+def _read_exact(f: BinaryIO, size: int) -> bytes:
+    data = f.read(size)
+    if len(data) != size:
+        raise CacheIntegrityError("Cache snapshot is truncated")
+    return data
+
+
+def _read_header(f: BinaryIO) -> Tuple[int, Dict[str, Any]]:
+    magic, version, compression_id, meta_length = _HEADER.unpack(_read_exact(f, _HEADER.size))
+    if magic != SNAPSHOT_MAGIC:
+        raise CacheDeserializationError("Not a cache snapshot file")
+    if version != SNAPSHOT_VERSION:
+        raise CacheDeserializationError(f"Unsupported cache snapshot version {version}")
+    return compression_id, json.loads(_read_exact(f, meta_length))
+
+
+def _read_chunks(f: BinaryIO) -> Iterator[Tuple[int, int, int, bytes]]:
+    """Yield (count, raw length, crc, stored bytes) until the trailer."""
+    records = chunks = 0
+    while True:
+        tag = _read_exact(f, 4)
+        if tag == _TRAILER_TAG:
+            total, total_chunks = struct.unpack("<QI", _read_exact(f, _TRAILER.size - 4))
+            if (total, total_chunks) != (records, chunks):
+                raise CacheIntegrityError("Cache snapshot trailer does not match its chunks")
+            return
+        if tag != _CHUNK_TAG:
+            raise CacheIntegrityError("Corrupt cache snapshot chunk header")
+        _, count, raw_length, stored_length, crc = _CHUNK.unpack(tag + _read_exact(f, _CHUNK.size - 4))
+        yield count, raw_length, crc, _read_exact(f, stored_length)
+        records += count
+        chunks += 1
+
+
+def _decode_chunk(decompress: Optional[Callable[[bytes], bytes]], count: int,
+                  raw_length: int, crc: int, stored: bytes) -> List[SnapshotRecord]:
+    """Verify, decompress and unpickle one chunk (runs on a worker thread)."""
+    if zlib.crc32(stored) != crc:
+        raise CacheIntegrityError("Cache snapshot chunk checksum mismatch")
+    raw = decompress(stored) if decompress is not None else stored
+    if len(raw) != raw_length:
+        raise CacheIntegrityError("Cache snapshot chunk has the wrong size")
+
+    view = memoryview(raw)
+    unpack = _RECORD.unpack_from
+    loads = pickle.loads
+    header_size = _RECORD.size
+    records = []
+    offset = 0
+    for _ in range(count):
+        key_length, value_length, frequency, ttl_remaining = unpack(raw, offset)
+        offset += header_size
+        key = loads(view[offset:offset + key_length])
+        offset += key_length
+        value = loads(view[offset:offset + value_length])
+        offset += value_length
+        records.append(SnapshotRecord(
+            key, value, None if math.isnan(ttl_remaining) else ttl_remaining, frequency
+        ))
+    return records
+
+
+def _iter_chunks(path: Union[str, Path], workers: int) -> Iterator[List[SnapshotRecord]]:
+    """Decoded chunks in file order, remaining TTLs reduced by the snapshot's age."""
+    with open(path, 'rb') as f:
+        compression_id, meta = _read_header(f)
+        decompress = get_decompressor(compression_id) if compression_id else None
+        age = max(0.0, time.time() - meta.get('created', time.time()))
+
+        def adjust(records: List[SnapshotRecord]) -> List[SnapshotRecord]:
+            if not age:
+                return records
+            live = []
+            for record in records:
+                if record.ttl_remaining is not None:
+                    remaining = record.ttl_remaining - age
+                    if remaining <= 0:
+                        continue
+                    record = record._replace(ttl_remaining=remaining)
+                live.append(record)
+            return live
+
+        if workers <= 1:
+            for chunk in _read_chunks(f):
+                yield adjust(_decode_chunk(decompress, *chunk))
+            return
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="xwsystem-cache-restore") as pool:
+            pending: deque = deque()
+            for chunk in _read_chunks(f):
+                pending.append(pool.submit(_decode_chunk, decompress, *chunk))
+                if len(pending) >= workers * 2:
+                    yield adjust(pending.popleft().result())
+            while pending:
+                yield adjust(pending.popleft().result())
+
+
+def iter_snapshot(path: Union[str, Path], *, workers: int = DEFAULT_SNAPSHOT_WORKERS) -> Iterator[SnapshotRecord]:
+    """
+    Iterate the entries of a snapshot file (coldest first).
+
+    Remaining TTLs are as of now; entries that expired since the snapshot
+    was written are skipped.
+    """
+    for records in _iter_chunks(path, workers):
+        yield from records
+
+
+@contextmanager
+def _gc_paused(enabled: bool):
+    """Pause the cyclic garbage collector while bulk-creating objects."""
+    if not enabled or not gc.isenabled():
+        yield
+        return
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+def load_snapshot(cache: Any, path: Union[str, Path], *,
+                  workers: int = DEFAULT_SNAPSHOT_WORKERS, pause_gc: bool = True) -> int:
+    """
+    Restore a snapshot into a cache.
+
+    Chunks are verified and decoded in parallel and applied in file order,
+    one chunk per lock acquisition.
+
+    Args:
+        cache: Cache to fill (need not be the type that was saved)
+        path: Snapshot file path
+        workers: Threads decoding chunks
+        pause_gc: Disable the cyclic GC (process-wide) during the restore
+
+    Returns:
+        Number of entries restored
+
+    Raises:
+        CacheIntegrityError: On checksum mismatch or truncation
+        CacheDeserializationError: If the file is not a snapshot
+    """
+    started = time.perf_counter()
+    adapter = get_snapshot_adapter(cache)
+    restored = 0
+    with _gc_paused(pause_gc):
+        for records in _iter_chunks(path, max(1, workers)):
+            if records:
+                restored += adapter.restore(cache, records)
+    logger.info(
+        f"Cache snapshot {path} restored: {restored} entries in {time.perf_counter() - started:.2f}s"
+    )
+    return restored
+
+
+__all__ = [
+    "SnapshotRecord",
+    "ASnapshotAdapter",
+    "GenericSnapshotAdapter",
+    "register_snapshot_adapter",
+    "get_snapshot_adapter",
+    "save_snapshot",
+    "load_snapshot",
+    "iter_snapshot",
+    "DEFAULT_CHUNK_BYTES",
+    "DEFAULT_SNAPSHOT_WORKERS",
+]
@@ -11,10 +11,13 @@ Pluggable cache with runtime-switchable eviction strategies.
 Extensibility Priority #5 - Maximum flexibility for custom behaviors.
 """
 
+import copy
+import logging
 import threading
+import weakref
 from typing import Any, Optional, Hashable, Dict, Tuple, List
 from .base import ACache
-from .eviction_strategies import AEvictionStrategy, LRUEvictionStrategy
+from .eviction_strategies import AEvictionStrategy, AIndexedEvictionStrategy, LRUEvictionStrategy
 from ..config.logging_setup import get_logger
 
 logger = get_logger("xsystem.caching.pluggable")
@@ -25,6 +28,8 @@ class PluggableCache(ACache):
     Cache with pluggable eviction strategy.
     
     Allows runtime switching of eviction policies for maximum flexibility.
+    Indexed strategies (all built-ins) pick victims in O(1)/O(log n);
+    strategies implementing only select_victim() get the full item list.
     
     Example:
         from .eviction_strategies import LRUEvictionStrategy, LFUEvictionStrategy
@@ -58,7 +63,7 @@ class PluggableCache(ACache):
         super().__init__(capacity=capacity, ttl=None)
         
         self.name = name or f"PluggableCache-{id(self)}"
-        self.strategy = strategy or LRUEvictionStrategy()
+        self.strategy = self._bind_strategy(strategy or LRUEvictionStrategy())
         
         # Storage
         self._cache: Dict[Hashable, Any] = {}
@@ -122,6 +127,7 @@ class PluggableCache(ACache):
         with self._lock:
             self._cache.clear()
             self._metadata.clear()
+            self.strategy.reset()
     
     def size(self) -> int:
         """Get current cache size."""
@@ -179,14 +185,20 @@ class PluggableCache(ACache):
             strategy: New eviction strategy
             
         Note:
-            Metadata may need to be rebuilt for the new strategy.
+            Metadata and the new strategy's index are rebuilt once, in
+            insertion order. An indexed strategy already bound to another
+            cache is copied, so get_strategy() returns the copy.
         """
         with self._lock:
             old_strategy = self.strategy.get_strategy_name()
+            if getattr(self.strategy, '_owner', None) is not None and self.strategy._owner() is self:
+                self.strategy._owner = None
+            strategy = self._bind_strategy(strategy)
             self.strategy = strategy
             self._strategy_switches += 1
             
-            # Rebuild metadata for new strategy
+            # Rebuild metadata and index for new strategy
+            strategy.reset()
             for key, value in self._cache.items():
                 self._metadata[key] = {}
                 self.strategy.on_insert(key, value, self._metadata[key])
@@ -199,24 +211,49 @@ class PluggableCache(ACache):
         """Get current eviction strategy."""
         return self.strategy
     
+    def _bind_strategy(self, strategy: AEvictionStrategy) -> AEvictionStrategy:
+        """
+        Bind an indexed strategy to this cache.
+        
+        An instance whose index already tracks another live cache is
+        deep-copied with an empty index, so caches never share one index.
+        """
+        if isinstance(strategy, AIndexedEvictionStrategy):
+            owner = strategy._owner() if strategy._owner is not None else None
+            if owner is not None and owner is not self:
+                strategy = copy.deepcopy(strategy)
+                strategy.reset()
+            strategy._owner = weakref.ref(self)
+        return strategy
+    
     def _evict_using_strategy(self) -> None:
         """Evict one item using current strategy."""
-        # Build cache items list with metadata
-        cache_items = [
-            (key, value, self._metadata.get(key, {}))
-            for key, value in self._cache.items()
-        ]
+        if isinstance(self.strategy, AIndexedEvictionStrategy):
+            # Discard index entries for keys this cache does not hold
+            victim_key = self.strategy.victim()
+            while victim_key is not None and victim_key not in self._cache:
+                self.strategy.on_delete(victim_key)
+                victim_key = self.strategy.victim()
+        else:
+            # Legacy strategy: build cache items list with metadata
+            cache_items = [
+                (key, value, self._metadata.get(key, {}))
+                for key, value in self._cache.items()
+            ]
+            victim_key = self.strategy.select_victim(cache_items)
         
-        # Select victim using strategy
-        victim_key = self.strategy.select_victim(cache_items)
+        if (victim_key is None or victim_key not in self._cache) and self._cache:
+            # Never skip an eviction: fall back to the oldest inserted key
+            victim_key = next(iter(self._cache))
         
-        if victim_key is not None:
+        if victim_key is not None and victim_key in self._cache:
             del self._cache[victim_key]
             del self._metadata[victim_key]
             self.strategy.on_delete(victim_key)
             self._evictions += 1
             
-            logger.debug(f"Cache {self.name} evicted key {victim_key} using {self.strategy.get_strategy_name()}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Cache {self.name} evicted key {victim_key} using {self.strategy.get_strategy_name()}")
     
     def __enter__(self):
         """Context manager entry."""
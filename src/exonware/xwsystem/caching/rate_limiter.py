@@ -117,6 +117,65 @@ class RateLimiter:
         except CacheRateLimitError:
             return False
     
+    def reserve(self, tokens: int = 1) -> float:
+        """
+        Take tokens if available, otherwise report how long to wait.
+        
+        Unlike try_acquire(), a short wait is not counted as a rejection,
+        so pacing callers (cache warming) do not skew the statistics.
+        
+        Args:
+            tokens: Number of tokens to acquire
+        
+        Returns:
+            0.0 if tokens were acquired, else seconds until they will be
+        
+        Raises:
+            ValueError: If tokens exceeds burst capacity (never satisfiable)
+        """
+        if tokens > self.burst_capacity:
+            raise ValueError(
+                f"Cannot reserve {tokens} tokens, burst capacity is {self.burst_capacity}"
+            )
+        with self._lock:
+            now = time.time()
+            elapsed = now - self._last_update
+            self._tokens = min(
+                self.burst_capacity,
+                self._tokens + (elapsed * self.max_ops_per_second)
+            )
+            self._last_update = now
+            
+            if self._tokens >= tokens:
+                self._total_requests += 1
+                self._tokens -= tokens
+                self._timestamps.append(now)
+                return 0.0
+            return (tokens - self._tokens) / self.max_ops_per_second
+    
+    def wait(self, tokens: int = 1, timeout: Optional[float] = None) -> bool:
+        """
+        Block until tokens are acquired.
+        
+        Args:
+            tokens: Number of tokens to acquire
+            timeout: Maximum seconds to wait (None = no limit)
+        
+        Returns:
+            True if tokens acquired, False on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            delay = self.reserve(tokens)
+            if delay <= 0.0:
+                return True
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                delay = min(delay, remaining)
+            time.sleep(delay)
+    
     def get_current_rate(self) -> float:
         """
         Get current operations per second rate.
@@ -10,14 +10,77 @@ Read-through and Write-through cache implementations.
 Extensibility Priority #5 - Auto-loading and auto-writing patterns.
 """
 
+import logging
+from contextlib import nullcontext
 from typing import Any, Callable, Dict, Optional, Hashable
 from .lru_cache import LRUCache
+from .single_flight import SingleFlight
 from ..config.logging_setup import get_logger
 
 logger = get_logger("xsystem.caching.read_through")
 
 
-class ReadThroughCache(LRUCache):
+class _LoaderMixin:
+    """
+    Shared miss handling for loader-backed caches.
+
+    With coalescing enabled, concurrent misses on the same key share a single
+    loader call (single-flight); every waiter receives the loaded value or
+    the loader's failure.
+    """
+
+    def _init_loader(self, loader: Optional[Callable[[Any], Any]], coalesce: bool,
+                     load_timeout: Optional[float], raise_on_load_error: bool) -> None:
+        self.loader = loader
+        self.load_timeout = load_timeout
+        self.raise_on_load_error = raise_on_load_error
+        self._flight = SingleFlight() if coalesce else None
+        self._loader_calls = 0
+
+    def _batch_lock(self):
+        # Loads may wait on another thread's single-flight call that needs
+        # the cache lock to store its result: never load under the lock
+        return nullcontext()
+
+    def _load_missing(self, key: Hashable, default: Any, store: Callable[[Hashable, Any], Any]) -> Any:
+        """Load a missed key, cache it with store(), and return it (or default)."""
+        if not self.loader:
+            return default
+
+        def load() -> Any:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Cache miss for {key}, calling loader")
+            return self._run_loader(key, store)
+
+        try:
+            if self._flight is not None:
+                loaded_value = self._flight.do(key, load, timeout=self.load_timeout)
+            else:
+                loaded_value = load()
+        except Exception as e:
+            if self.raise_on_load_error:
+                raise
+            logger.error(f"Loader failed for key {key}: {e}")
+            return default
+
+        return default if loaded_value is None else loaded_value
+
+    def _run_loader(self, key: Hashable, store: Callable[[Hashable, Any], Any]) -> Any:
+        """Call the loader once and cache a non-None result."""
+        self._loader_calls += 1
+        loaded_value = self.loader(key)
+        if loaded_value is not None:
+            store(key, loaded_value)
+        return loaded_value
+
+    def _loader_stats(self, stats: Dict[str, Any]) -> Dict[str, Any]:
+        stats['loader_calls'] = self._loader_calls
+        if self._flight is not None:
+            stats['coalesced_loads'] = self._flight.get_stats()['coalesced']
+        return stats
+
+
+class ReadThroughCache(_LoaderMixin, LRUCache):
     """
     Read-through cache that automatically loads missing values.
     
@@ -35,6 +98,9 @@ class ReadThroughCache(LRUCache):
         
         # Automatically loads from DB on cache miss
         user = cache.get('user:123')
+    
+    Concurrent misses on the same key are coalesced: the loader runs once
+    and all callers receive its result.
     """
     
     def __init__(
@@ -42,7 +108,10 @@ class ReadThroughCache(LRUCache):
         capacity: int = 128,
         loader: Optional[Callable[[Any], Any]] = None,
         ttl: Optional[float] = None,
-        name: Optional[str] = None
+        name: Optional[str] = None,
+        coalesce: bool = True,
+        load_timeout: Optional[float] = None,
+        raise_on_load_error: bool = False
     ):
         """
         Initialize read-through cache.
@@ -52,10 +121,14 @@ class ReadThroughCache(LRUCache):
             loader: Function to load missing values (key) -> value
             ttl: Optional TTL in seconds
             name: Cache name
+            coalesce: Share one loader call among concurrent misses on a key
+            load_timeout: Max seconds to wait for another caller's load
+                (None = wait indefinitely)
+            raise_on_load_error: Re-raise loader failures (and wait timeouts)
+                in every waiting caller instead of returning default
         """
         super().__init__(capacity, ttl, name)
-        self.loader = loader
-        self._loader_calls = 0
+        self._init_loader(loader, coalesce, load_timeout, raise_on_load_error)
     
     def get(self, key: Hashable, default: Any = None) -> Any:
         """
@@ -75,28 +148,11 @@ class ReadThroughCache(LRUCache):
             return value
         
         # Cache miss - try loader
-        if self.loader:
-            try:
-                logger.debug(f"Cache miss for {key}, calling loader")
-                loaded_value = self.loader(key)
-                self._loader_calls += 1
-                
-                # Cache the loaded value
-                if loaded_value is not None:
-                    self.put(key, loaded_value)
-                    return loaded_value
-                
-            except Exception as e:
-                logger.error(f"Loader failed for key {key}: {e}")
-                # Fall through to default
-        
-        return default
+        return self._load_missing(key, default, self.put)
     
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics including loader calls."""
-        stats = super().get_stats()
-        stats['loader_calls'] = self._loader_calls
-        return stats
+        return self._loader_stats(super().get_stats())
 
 
 class WriteThroughCache(LRUCache):
@@ -151,7 +207,8 @@ class WriteThroughCache(LRUCache):
         # Persist first (write-through)
         if self.writer:
             try:
-                logger.debug(f"Writing through to storage for key: {key}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Writing through to storage for key: {key}")
                 self.writer(key, value)
                 self._writer_calls += 1
             except Exception as e:
@@ -162,6 +219,10 @@ class WriteThroughCache(LRUCache):
         # Then cache
         super().put(key, value)
     
+    def _batch_lock(self):
+        # Keep the writer's I/O outside the cache lock
+        return nullcontext()
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics including writer calls."""
         stats = super().get_stats()
@@ -170,7 +231,7 @@ class WriteThroughCache(LRUCache):
         return stats
 
 
-class ReadWriteThroughCache(LRUCache):
+class ReadWriteThroughCache(_LoaderMixin, LRUCache):
     """
     Combined read-through and write-through cache.
     
@@ -196,13 +257,15 @@ class ReadWriteThroughCache(LRUCache):
         loader: Optional[Callable[[Any], Any]] = None,
         writer: Optional[Callable[[Any, Any], None]] = None,
         ttl: Optional[float] = None,
-        name: Optional[str] = None
+        name: Optional[str] = None,
+        coalesce: bool = True,
+        load_timeout: Optional[float] = None,
+        raise_on_load_error: bool = False
     ):
-        """Initialize read-write-through cache."""
+        """Initialize read-write-through cache (see ReadThroughCache for loader options)."""
         super().__init__(capacity, ttl, name)
-        self.loader = loader
+        self._init_loader(loader, coalesce, load_timeout, raise_on_load_error)
         self.writer = writer
-        self._loader_calls = 0
         self._writer_calls = 0
     
     def get(self, key: Hashable, default: Any = None) -> Any:
@@ -212,17 +275,8 @@ class ReadWriteThroughCache(LRUCache):
         if value is not None:
             return value
         
-        if self.loader:
-            try:
-                loaded_value = self.loader(key)
-                self._loader_calls += 1
-                if loaded_value is not None:
-                    super().put(key, loaded_value)
-                    return loaded_value
-            except Exception as e:
-                logger.error(f"Loader failed for key {key}: {e}")
-        
-        return default
+        # Loaded values are cached without being written back
+        return self._load_missing(key, default, super().put)
     
     def put(self, key: Hashable, value: Any) -> None:
         """Put with auto-persistence."""
@@ -237,8 +291,7 @@ class ReadWriteThroughCache(LRUCache):
     
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics."""
-        stats = super().get_stats()
-        stats['loader_calls'] = self._loader_calls
+        stats = self._loader_stats(super().get_stats())
         stats['writer_calls'] = self._writer_calls
         return stats
 
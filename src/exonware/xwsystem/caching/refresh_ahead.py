@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+#exonware/xwsystem/caching/refresh_ahead.py
+"""
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+
+Refresh-ahead TTL caches: stale-while-revalidate plus probabilistic early
+expiration (XFetch).
+Performance Priority #4 - Keeps loader latency off the request path.
+
+Performance Improvement:
+    - OLD: An entry disappears at expiry and the next caller blocks on the
+      loader; entries warmed together expire (and reload) together
+    - NEW: Within a grace window after expiry the stale value is served while
+      a background worker reloads it. Before expiry, each read triggers an
+      early refresh with probability rising towards the expiry time, scaled
+      by how long the loader took (XFetch: refresh when
+      now - load_time * beta * ln(rand) >= fresh_until), which spreads
+      refreshes of hot keys out instead of letting them stampede at expiry.
+"""
+
+import asyncio
+import inspect
+import math
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Set
+from .read_through import _LoaderMixin
+from .single_flight import AsyncSingleFlight
+from .ttl_cache import AsyncTTLCache, TTLCache, TTLEntry
+from ..config.logging_setup import get_logger
+
+logger = get_logger("xsystem.caching.refresh_ahead")
+
+
+# Entry refresh states returned by _RefreshPolicy._refresh_state()
+_FRESH = 0
+_REFRESH = 1
+_EXPIRED = 2
+
+
+@dataclass
+class RefreshEntry(TTLEntry):
+    """
+    TTL entry that outlives its freshness by a grace window.
+
+    expires_at (used by TTL storage for removal) is fresh_until + stale_ttl.
+    """
+    fresh_until: float = 0.0
+    load_time: float = 0.0
+
+
+class _RefreshPolicy:
+    """Freshness and refresh decisions shared by the sync and async caches."""
+
+    def _init_refresh(self, stale_ttl: float, beta: float) -> None:
+        if stale_ttl < 0:
+            raise ValueError(f"stale_ttl must be >= 0, got {stale_ttl}")
+        if beta < 0:
+            raise ValueError(f"beta must be >= 0, got {beta}")
+        self.stale_ttl = stale_ttl
+        self.beta = beta
+        self._refresh_stats = {
+            'stale_hits': 0,
+            'early_refreshes': 0,
+            'refreshes': 0,
+            'refresh_errors': 0,
+        }
+
+    def _make_entry(self, key: Hashable, value: Any, ttl: Optional[float],
+                    load_time: Optional[float]) -> RefreshEntry:
+        """Build an entry; without a measured load_time the previous one is kept."""
+        entry_ttl = ttl if ttl is not None else self.ttl
+        if load_time is None:
+            previous = self._cache.get(key)
+            load_time = previous.load_time if isinstance(previous, RefreshEntry) else 0.0
+        now = time.time()
+        return RefreshEntry(
+            value=value,
+            expires_at=now + entry_ttl + self.stale_ttl,
+            created_at=now,
+            fresh_until=now + entry_ttl,
+            load_time=load_time,
+        )
+
+    def _refresh_state(self, entry: RefreshEntry, now: float) -> int:
+        """Classify an entry as fresh, due for a background refresh, or expired."""
+        if now >= entry.fresh_until:
+            if self.loader is None:
+                # Nothing can revalidate it: stale values are never served
+                return _EXPIRED
+            self._refresh_stats['stale_hits'] += 1
+            return _REFRESH
+
+        if self.beta and entry.load_time and self.loader is not None:
+            # XFetch: -ln(u) for u in (0, 1] is an Exp(1) sample
+            gap = -entry.load_time * self.beta * math.log(1.0 - random.random())
+            if now + gap >= entry.fresh_until:
+                self._refresh_stats['early_refreshes'] += 1
+                return _REFRESH
+
+        return _FRESH
+
+    def _fresh_remaining(self, key: Hashable) -> Optional[float]:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        remaining = entry.fresh_until - time.time()
+        return remaining if remaining > 0 else None
+
+    def _add_refresh_stats(self, stats: Dict[str, Any]) -> Dict[str, Any]:
+        stats.update(self._refresh_stats)
+        stats['stale_ttl'] = self.stale_ttl
+        stats['beta'] = self.beta
+        return stats
+
+
+class RefreshAheadCache(_RefreshPolicy, _LoaderMixin, TTLCache):
+    """
+    Thread-safe TTL cache with stale-while-revalidate and early refresh.
+
+    Uses the same loader contract as ReadThroughCache: misses load
+    synchronously (coalesced per key), while stale and early refreshes run on
+    a thread pool and never block the caller. A failed background refresh
+    keeps serving the stale value until the grace window ends.
+
+    Example:
+        cache = RefreshAheadCache(
+            capacity=10_000,
+            ttl=60.0,
+            stale_ttl=30.0,
+            loader=lambda key: db.load(key),
+        )
+        value = cache.get('config:flags')
+    """
+
+    def __init__(self,
+                 capacity: int = 128,
+                 ttl: float = 300.0,
+                 loader: Optional[Callable[[Any], Any]] = None,
+                 stale_ttl: float = 60.0,
+                 beta: float = 1.0,
+                 refresh_workers: int = 2,
+                 executor: Optional[ThreadPoolExecutor] = None,
+                 load_timeout: Optional[float] = None,
+                 raise_on_load_error: bool = False,
+                 cleanup_interval: float = 60.0,
+                 name: str = "refresh_ahead_cache"):
+        """
+        Initialize refresh-ahead cache.
+
+        Args:
+            capacity: Maximum number of entries
+            ttl: Seconds an entry is fresh
+            loader: Function to load values (key) -> value
+            stale_ttl: Grace window (seconds after ttl) during which the stale
+                value is served while it is reloaded in the background
+            beta: XFetch aggressiveness (0 disables early refresh; >1 refreshes earlier)
+            refresh_workers: Threads for background refreshes (ignored with executor)
+            executor: Optional shared executor for background refreshes
+            load_timeout: Max seconds to wait for another caller's load on a miss
+            raise_on_load_error: Re-raise loader failures on a miss instead of
+                returning default
+            cleanup_interval: Cleanup interval in seconds
+            name: Cache name for debugging
+        """
+        super().__init__(capacity=capacity, ttl=ttl, cleanup_interval=cleanup_interval, name=name)
+        self._init_loader(loader, True, load_timeout, raise_on_load_error)
+        self._init_refresh(stale_ttl, beta)
+        self.refresh_workers = max(1, refresh_workers)
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._executor_lock = threading.Lock()
+        self._refreshing: Set[Hashable] = set()
+
+    def put(self, key: Hashable, value: Any, ttl: Optional[float] = None,
+            load_time: Optional[float] = None) -> bool:
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Custom freshness TTL for this entry (overrides default)
+            load_time: Seconds it took to produce value (drives early refresh)
+
+        Returns:
+            True if stored successfully
+        """
+        with self._lock:
+            self._store(key, self._make_entry(key, value, ttl, load_time))
+            return True
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a value, loading on miss and refreshing stale or near-expiry entries.
+
+        Args:
+            key: Cache key
+            default: Returned if the key is absent and cannot be loaded
+
+        Returns:
+            Cached (possibly stale, within the grace window) or loaded value
+        """
+        with self._lock:
+            entry = self._lookup(key)
+            state = _EXPIRED if entry is None else self._refresh_state(entry, time.time())
+            if state == _EXPIRED:
+                if entry is not None:
+                    self._discard(key)
+                self._stats['misses'] += 1
+            else:
+                entry.touch()
+                self._stats['hits'] += 1
+
+        if state == _EXPIRED:
+            return self._load_missing(key, default, self.put)
+        if state == _REFRESH:
+            self._schedule_refresh(key)
+        return entry.value
+
+    def refresh(self, key: Hashable) -> Any:
+        """
+        Reload a key synchronously (coalesced with any in-flight load).
+
+        Returns:
+            Loaded value
+
+        Raises:
+            Exception: Whatever the loader raised
+        """
+        return self._flight.do(key, lambda: self._run_loader(key, self.put), timeout=self.load_timeout)
+
+    def get_remaining_ttl(self, key: Hashable) -> Optional[float]:
+        """Get remaining freshness TTL for a key (None if stale or absent)."""
+        with self._lock:
+            return self._fresh_remaining(key)
+
+    def _run_loader(self, key: Hashable, store: Callable[..., Any]) -> Any:
+        """Call the loader, recording how long it took on the stored entry."""
+        started = time.perf_counter()
+        return super()._run_loader(
+            key, lambda k, v: store(k, v, load_time=time.perf_counter() - started)
+        )
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.refresh_workers,
+                    thread_name_prefix=f"RefreshAhead-{self.name}",
+                )
+            return self._executor
+
+    def _schedule_refresh(self, key: Hashable) -> None:
+        """Queue one background reload per key."""
+        with self._lock:
+            if key in self._refreshing or self._shutdown.is_set():
+                return
+            self._refreshing.add(key)
+        try:
+            self._get_executor().submit(self._background_refresh, key)
+        except RuntimeError:
+            # Executor already shut down
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _background_refresh(self, key: Hashable) -> None:
+        try:
+            self.refresh(key)
+            with self._lock:
+                self._refresh_stats['refreshes'] += 1
+        except Exception as e:
+            with self._lock:
+                self._refresh_stats['refresh_errors'] += 1
+            logger.warning(f"Background refresh failed for key {key}: {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics including refresh counters."""
+        with self._lock:
+            stats = self._add_refresh_stats(self._build_stats())
+            stats['refreshing'] = len(self._refreshing)
+        return self._loader_stats(stats)
+
+    def shutdown(self):
+        """Shutdown cleanup thread and the owned refresh executor."""
+        super().shutdown()
+        executor = getattr(self, '_executor', None)
+        if executor is not None and self._owns_executor:
+            executor.shutdown(wait=False)
+
+
+class AsyncRefreshAheadCache(_RefreshPolicy, AsyncTTLCache):
+    """
+    Asyncio TTL cache with stale-while-revalidate and early refresh.
+
+    Background refreshes run as asyncio tasks on the running loop. The loader
+    may be a coroutine function or a plain function.
+
+    Example:
+        cache = AsyncRefreshAheadCache(ttl=60.0, stale_ttl=30.0, loader=fetch_user)
+        user = await cache.get(user_id)
+    """
+
+    def __init__(self,
+                 capacity: int = 128,
+                 ttl: float = 300.0,
+                 loader: Optional[Callable[[Any], Any]] = None,
+                 stale_ttl: float = 60.0,
+                 beta: float = 1.0,
+                 load_timeout: Optional[float] = None,
+                 raise_on_load_error: bool = False,
+                 cleanup_interval: float = 60.0,
+                 name: str = "async_refresh_ahead_cache"):
+        """Initialize async refresh-ahead cache (see RefreshAheadCache for arguments)."""
+        super().__init__(capacity=capacity, ttl=ttl, cleanup_interval=cleanup_interval, name=name)
+        self._init_refresh(stale_ttl, beta)
+        self.loader = loader
+        self.load_timeout = load_timeout
+        self.raise_on_load_error = raise_on_load_error
+        self._flight = AsyncSingleFlight()
+        self._loader_calls = 0
+        self._refresh_tasks: Dict[Hashable, asyncio.Task] = {}
+
+    async def put(self, key: Hashable, value: Any, ttl: Optional[float] = None,
+                  load_time: Optional[float] = None) -> bool:
+        """Store a value (load_time drives early refresh)."""
+        async with self._lock:
+            self._store(key, self._make_entry(key, value, ttl, load_time))
+            return True
+
+    async def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a value, loading on miss and refreshing stale or near-expiry entries."""
+        async with self._lock:
+            entry = self._lookup(key)
+            state = _EXPIRED if entry is None else self._refresh_state(entry, time.time())
+            if state == _EXPIRED:
+                if entry is not None:
+                    self._discard(key)
+                self._stats['misses'] += 1
+            else:
+                entry.touch()
+                self._stats['hits'] += 1
+
+        if state == _EXPIRED:
+            if self.loader is None:
+                return default
+            try:
+                value = await self.refresh(key)
+            except Exception as e:
+                if self.raise_on_load_error:
+                    raise
+                logger.error(f"Loader failed for key {key}: {e}")
+                return default
+            return default if value is None else value
+
+        if state == _REFRESH:
+            self._schedule_refresh(key)
+        return entry.value
+
+    async def refresh(self, key: Hashable) -> Any:
+        """Reload a key now (coalesced with any in-flight load)."""
+        return await self._flight.do(key, lambda: self._run_loader(key), timeout=self.load_timeout)
+
+    async def get_remaining_ttl(self, key: Hashable) -> Optional[float]:
+        """Get remaining freshness TTL for a key (None if stale or absent)."""
+        async with self._lock:
+            return self._fresh_remaining(key)
+
+    async def _run_loader(self, key: Hashable) -> Any:
+        started = time.perf_counter()
+        self._loader_calls += 1
+        value = self.loader(key)
+        if inspect.isawaitable(value):
+            value = await value
+        if value is not None:
+            await self.put(key, value, load_time=time.perf_counter() - started)
+        return value
+
+    def _schedule_refresh(self, key: Hashable) -> None:
+        """Start one background refresh task per key."""
+        if key in self._refresh_tasks or self._shutdown:
+            return
+        task = asyncio.get_running_loop().create_task(self._background_refresh(key))
+        self._refresh_tasks[key] = task
+        task.add_done_callback(lambda _: self._refresh_tasks.pop(key, None))
+
+    async def _background_refresh(self, key: Hashable) -> None:
+        try:
+            await self.refresh(key)
+            self._refresh_stats['refreshes'] += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._refresh_stats['refresh_errors'] += 1
+            logger.warning(f"Background refresh failed for key {key}: {e}")
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics including refresh counters."""
+        async with self._lock:
+            stats = self._add_refresh_stats(self._build_stats())
+        stats['refreshing'] = len(self._refresh_tasks)
+        stats['loader_calls'] = self._loader_calls
+        stats['coalesced_loads'] = self._flight.get_stats()['coalesced']
+        return stats
+
+    async def shutdown(self):
+        """Cancel pending refreshes and stop the cleanup task."""
+        tasks = list(self._refresh_tasks.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        await super().shutdown()
+
+
+__all__ = [
+    'RefreshEntry',
+    'RefreshAheadCache',
+    'AsyncRefreshAheadCache',
+]
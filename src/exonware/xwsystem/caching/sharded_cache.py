@@ -0,0 +1,495 @@
+#!/usr/bin/env python3
+#exonware/xwsystem/caching/sharded_cache.py
+"""
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+
+Lock-striped sharded caches.
+Performance Priority #4 - Spreads keys across independently-locked shards.
+
+Performance Improvement:
+    - OLD: Every get/put serialized behind one cache-wide RLock
+    - NEW: Keys hashed across N shards, each with its own lock
+    - Expected: Read-heavy multi-threaded workloads no longer contend
+      on a single lock; threads touching different shards never block
+      each other
+"""
+
+import threading
+from typing import Any, Callable, Dict, List, Optional, Hashable, Tuple, Union
+from .base import ACache
+from .defs import StatsMode
+from .lru_cache import LRUCache
+from .ttl_cache import TTLCache
+from ..config.logging_setup import get_logger
+
+logger = get_logger("xsystem.caching.sharded_cache")
+
+
+# Default number of shards (power of two so shard selection is a bit mask)
+DEFAULT_SHARD_COUNT = 16
+
+
+class _ShardedCache(ACache):
+    """
+    Base class for caches that stripe keys across independent shards.
+
+    Each shard is a complete, thread-safe cache with its own lock. A key
+    always maps to the same shard, so per-key semantics (LRU order, TTL)
+    are those of the underlying shard implementation, while aggregate
+    operations fan out across all shards.
+    """
+
+    _shard_type_name = "Sharded"
+
+    # Additional shard counters summed into get_stats()
+    _extra_stat_keys: Tuple[str, ...] = ()
+
+    def __init__(self,
+                 capacity: int,
+                 shard_count: int,
+                 shard_factory: Callable[[int, int], ACache],
+                 ttl: Optional[float] = None,
+                 name: Optional[str] = None):
+        """
+        Initialize sharded cache.
+
+        Args:
+            capacity: Total maximum number of items across all shards
+            shard_count: Number of independently-locked shards
+            shard_factory: Callable (index, shard_capacity) -> shard cache
+            ttl: Optional time-to-live in seconds (informational)
+            name: Optional name for debugging
+        """
+        if capacity <= 0:
+            raise ValueError(
+                f"Cache capacity must be positive, got {capacity}. "
+                f"Example: {type(self).__name__}(capacity=1024)"
+            )
+        if shard_count <= 0:
+            raise ValueError(
+                f"Shard count must be positive, got {shard_count}. "
+                f"Example: {type(self).__name__}(capacity=1024, shard_count=16)"
+            )
+
+        # Never create more shards than slots
+        shard_count = min(shard_count, capacity)
+
+        super().__init__(capacity=capacity, ttl=int(ttl) if ttl else None)
+
+        self.name = name or f"{type(self).__name__}-{id(self)}"
+        self.shard_count = shard_count
+
+        # Distribute capacity evenly; the first `remainder` shards get one extra slot
+        base, remainder = divmod(capacity, shard_count)
+        self._shards: List[ACache] = [
+            shard_factory(i, base + (1 if i < remainder else 0))
+            for i in range(shard_count)
+        ]
+
+        # Bit mask shard selection when shard_count is a power of two
+        self._mask = shard_count - 1 if (shard_count & (shard_count - 1)) == 0 else None
+
+        logger.debug(
+            f"{self._shard_type_name} cache {self.name} initialized with "
+            f"capacity {capacity} across {shard_count} shards"
+        )
+
+    def _shard_for(self, key: Hashable) -> ACache:
+        """Return the shard responsible for key."""
+        if self._mask is not None:
+            return self._shards[hash(key) & self._mask]
+        return self._shards[hash(key) % self.shard_count]
+
+    def _group_by_shard(self, keys) -> Dict[int, List[Hashable]]:
+        """Group keys by shard index, preserving input order within each shard."""
+        groups: Dict[int, List[Hashable]] = {}
+        for key in keys:
+            h = hash(key)
+            index = h & self._mask if self._mask is not None else h % self.shard_count
+            groups.setdefault(index, []).append(key)
+        return groups
+
+    @property
+    def shards(self) -> List[ACache]:
+        """Underlying shard caches (read-only view)."""
+        return list(self._shards)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get value by key.
+
+        Args:
+            key: Key to lookup
+            default: Default value if key not found
+
+        Returns:
+            Value associated with key, or default
+        """
+        return self._shard_for(key).get(key, default)
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Put key-value pair in the owning shard.
+
+        Args:
+            key: Key to store
+            value: Value to store
+        """
+        self._shard_for(key).put(key, value)
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[int] = None) -> None:
+        """
+        Set value in cache (Protocol interface method).
+
+        Args:
+            key: Key to store
+            value: Value to store
+            ttl: Optional time-to-live, honoured by shards that support it
+        """
+        self._shard_for(key).set(key, value, ttl)
+
+    def delete(self, key: Hashable) -> bool:
+        """
+        Delete key from cache.
+
+        Args:
+            key: Key to delete
+
+        Returns:
+            True if key was deleted, False if not found
+        """
+        return self._shard_for(key).delete(key)
+
+    def clear(self) -> None:
+        """Clear all shards."""
+        for shard in self._shards:
+            shard.clear()
+        logger.debug(f"{self._shard_type_name} cache {self.name} cleared")
+
+    def size(self) -> int:
+        """Get current cache size (sum of shard sizes)."""
+        return sum(shard.size() for shard in self._shards)
+
+    def is_full(self) -> bool:
+        """Check if cache is at capacity."""
+        return self.size() >= self.capacity
+
+    def evict(self) -> None:
+        """Evict one entry from the largest shard."""
+        largest = max(self._shards, key=lambda shard: shard.size())
+        if largest.size() > 0:
+            largest.evict()
+
+    def keys(self) -> list:
+        """Get list of all keys (grouped by shard)."""
+        result = []
+        for shard in self._shards:
+            result.extend(shard.keys())
+        return result
+
+    def values(self) -> list:
+        """Get list of all values (grouped by shard)."""
+        result = []
+        for shard in self._shards:
+            result.extend(shard.values())
+        return result
+
+    def items(self) -> list:
+        """Get list of all key-value pairs (grouped by shard)."""
+        result = []
+        for shard in self._shards:
+            result.extend(shard.items())
+        return result
+
+    def get_many(self, keys: List[Hashable]) -> Dict[Hashable, Any]:
+        """
+        Get multiple values, taking each shard lock once.
+
+        Args:
+            keys: List of keys to retrieve
+
+        Returns:
+            Dictionary of key-value pairs found in cache
+        """
+        results = {}
+        for index, shard_keys in self._group_by_shard(keys).items():
+            shard = self._shards[index]
+            with shard._lock:
+                for key in shard_keys:
+                    value = shard.get(key)
+                    if value is not None:
+                        results[key] = value
+        return results
+
+    def put_many(self, items: Dict[Hashable, Any]) -> int:
+        """
+        Put multiple key-value pairs, taking each shard lock once.
+
+        Args:
+            items: Dictionary of key-value pairs to cache
+
+        Returns:
+            Number of items successfully cached
+        """
+        count = 0
+        for index, shard_keys in self._group_by_shard(items.keys()).items():
+            shard = self._shards[index]
+            with shard._lock:
+                for key in shard_keys:
+                    shard.put(key, items[key])
+                    count += 1
+        return count
+
+    def delete_many(self, keys: List[Hashable]) -> int:
+        """
+        Delete multiple keys, taking each shard lock once.
+
+        Args:
+            keys: List of keys to delete
+
+        Returns:
+            Number of keys successfully deleted
+        """
+        count = 0
+        for index, shard_keys in self._group_by_shard(keys).items():
+            shard = self._shards[index]
+            with shard._lock:
+                for key in shard_keys:
+                    if shard.delete(key):
+                        count += 1
+        return count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get aggregated statistics across all shards.
+
+        Returns:
+            Dictionary with summed hits/misses/evictions, overall hit rate
+            and per-shard sizes (useful to spot hash skew)
+        """
+        shard_stats = [shard.get_stats() for shard in self._shards]
+
+        hits = sum(s.get('hits', 0) for s in shard_stats)
+        misses = sum(s.get('misses', 0) for s in shard_stats)
+        total_requests = hits + misses
+
+        stats = {
+            'name': self.name,
+            'type': self._shard_type_name,
+            'capacity': self.capacity,
+            'size': sum(s.get('size', 0) for s in shard_stats),
+            'hits': hits,
+            'misses': misses,
+            'evictions': sum(s.get('evictions', 0) for s in shard_stats),
+            'hit_rate': hits / total_requests if total_requests > 0 else 0.0,
+            'ttl': self.ttl,
+            'shard_count': self.shard_count,
+            'shard_sizes': [s.get('size', 0) for s in shard_stats],
+        }
+        for stat_key in self._extra_stat_keys:
+            stats[stat_key] = sum(s.get(stat_key, 0) for s in shard_stats)
+        return stats
+
+    def reset_stats(self) -> None:
+        """Reset statistics on every shard that supports it."""
+        for shard in self._shards:
+            reset = getattr(shard, 'reset_stats', None)
+            if reset is not None:
+                reset()
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check if key exists in cache."""
+        return key in self._shard_for(key)
+
+    def __len__(self) -> int:
+        """Get cache size."""
+        return self.size()
+
+    def __getitem__(self, key: Hashable) -> Any:
+        """Get item by key (raises KeyError if not found)."""
+        shard = self._shard_for(key)
+        result = shard.get(key, None)
+        if result is None and key not in shard:
+            raise KeyError(key)
+        return result
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        """Set item by key."""
+        self.put(key, value)
+
+    def __delitem__(self, key: Hashable) -> None:
+        """Delete item by key."""
+        if not self.delete(key):
+            raise KeyError(key)
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        return False
+
+
+class ShardedLRUCache(_ShardedCache):
+    """
+    Thread-safe LRU cache striped across independently-locked LRUCache shards.
+
+    Features:
+    - O(1) get and put operations
+    - One RLock per shard instead of one per cache
+    - Optional TTL support (per shard)
+    - Aggregated statistics via get_stats()
+
+    Note:
+        LRU order is maintained per shard, so eviction is approximately
+        (not strictly) least-recently-used across the whole cache.
+
+    Example:
+        cache = ShardedLRUCache(capacity=100_000, shard_count=32)
+        cache.put("user:42", user)
+        user = cache.get("user:42")
+    """
+
+    _shard_type_name = "ShardedLRU"
+
+    def __init__(self,
+                 capacity: int = 1024,
+                 shard_count: int = DEFAULT_SHARD_COUNT,
+                 ttl: Optional[float] = None,
+                 name: Optional[str] = None,
+                 stats: Union[StatsMode, str] = StatsMode.SHARED):
+        """
+        Initialize sharded LRU cache.
+
+        Args:
+            capacity: Total maximum number of items across all shards
+            shard_count: Number of shards (powers of two are fastest)
+            ttl: Optional time-to-live in seconds
+            name: Optional name for debugging
+            stats: Statistics mode of every shard
+        """
+        cache_name = name or f"ShardedLRUCache-{id(self)}"
+        super().__init__(
+            capacity=capacity,
+            shard_count=shard_count,
+            shard_factory=lambda i, cap: LRUCache(
+                capacity=cap, ttl=ttl, name=f"{cache_name}[{i}]", stats=stats
+            ),
+            ttl=ttl,
+            name=cache_name,
+        )
+
+
+class ShardedTTLCache(_ShardedCache):
+    """
+    Thread-safe TTL cache striped across independently-locked TTLCache shards.
+
+    Features:
+    - Per-entry TTL with LRU eviction inside each shard
+    - One RLock per shard instead of one per cache
+    - Aggregated statistics (including expirations) via get_stats()
+
+    Note:
+        One background thread sweeps every shard (the shards run no cleanup
+        threads of their own); pass cleanup_interval=0 to rely solely on
+        lazy expiration on access.
+    """
+
+    _shard_type_name = "ShardedTTL"
+    _extra_stat_keys = ('expirations', 'cleanups')
+
+    def __init__(self,
+                 capacity: int = 1024,
+                 ttl: float = 300.0,
+                 shard_count: int = DEFAULT_SHARD_COUNT,
+                 cleanup_interval: float = 60.0,
+                 name: Optional[str] = None,
+                 stats: Union[StatsMode, str] = StatsMode.SHARED):
+        """
+        Initialize sharded TTL cache.
+
+        Args:
+            capacity: Total maximum number of items across all shards
+            ttl: Default time-to-live in seconds
+            shard_count: Number of shards (powers of two are fastest)
+            cleanup_interval: Interval of the shared cleanup sweep in seconds (0 disables)
+            name: Optional name for debugging
+            stats: Statistics mode of every shard
+        """
+        cache_name = name or f"ShardedTTLCache-{id(self)}"
+        super().__init__(
+            capacity=capacity,
+            shard_count=shard_count,
+            shard_factory=lambda i, cap: TTLCache(
+                capacity=cap,
+                ttl=ttl,
+                cleanup_interval=0,
+                name=f"{cache_name}[{i}]",
+                stats=stats,
+            ),
+            ttl=ttl,
+            name=cache_name,
+        )
+
+        # One cleanup thread for all shards
+        self.cleanup_interval = cleanup_interval
+        self._shutdown = threading.Event()
+        self._cleanup_thread = None
+        if cleanup_interval > 0:
+            self._cleanup_thread = threading.Thread(
+                target=self._cleanup_loop,
+                name=f"ShardedTTLCache-{self.name}-cleanup",
+                daemon=True
+            )
+            self._cleanup_thread.start()
+
+    def _cleanup_loop(self):
+        """Background cleanup loop sweeping the shards one after another."""
+        while not self._shutdown.wait(self.cleanup_interval):
+            for shard in self._shards:
+                if self._shutdown.is_set():
+                    return
+                try:
+                    shard._cleanup_expired()
+                except Exception as e:
+                    logger.error(f"Sharded TTL cache cleanup error: {e}")
+
+    def put(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> bool:
+        """
+        Store a value in the owning shard.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Custom TTL for this entry (overrides default)
+
+        Returns:
+            True if stored successfully
+        """
+        return self._shard_for(key).put(key, value, ttl)
+
+    def get_remaining_ttl(self, key: Hashable) -> Optional[float]:
+        """Get remaining TTL for a key."""
+        return self._shard_for(key).get_remaining_ttl(key)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check if key exists and is not expired."""
+        return self._shard_for(key).contains(key)
+
+    def shutdown(self) -> None:
+        """Stop the cleanup thread and shut every shard down."""
+        self._shutdown.set()
+        if self._cleanup_thread and self._cleanup_thread.is_alive():
+            self._cleanup_thread.join(timeout=1.0)
+        for shard in self._shards:
+            shard.shutdown()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.shutdown()
+        return False
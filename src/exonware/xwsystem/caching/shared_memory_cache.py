@@ -0,0 +1,752 @@
+#!/usr/bin/env python3
+"""
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+
+Cross-process shared-memory cache for multi-worker deployments.
+
+Segment layout (one multiprocessing.shared_memory block):
+    header   magic, seqlock counter, geometry, allocator state, evictions, ttl
+    index    open-addressing hash table: key hash (u64) + slot number (i32)
+    slots    per-slot key hash, expiry, key/value lengths and CLOCK bit
+    free     stack of freed slot numbers
+    arena    capacity fixed-size slots, each holding encoded key + pickled value
+
+Concurrency:
+    - Writers serialize on an inter-process lock (a thread lock plus an
+      flock'ed lock file, reopened after fork) and move the seqlock counter
+      to odd before and back to even after every mutation
+    - Readers take no lock: a read is retried when the counter was odd or
+      changed while it ran, and falls back to the lock if writers keep it busy
+    - Eviction is CLOCK (approximate LRU): readers set a slot's reference
+      bit, the allocator's hand clears set bits and evicts the first clear
+      (or expired) slot
+    - Hit/miss counters are per process; evictions are counted in the segment
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+import time
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple, Hashable
+from .base import ACache
+from .errors import CacheError, CacheValueSizeError
+from ..config.logging_setup import get_logger
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = get_logger("xwsystem.caching.shared_memory_cache")
+
+# Default bytes per slot (encoded key + pickled value must fit)
+DEFAULT_SLOT_SIZE = 1024
+
+_MAGIC = b"XWSHMC01"
+_HEADER_SIZE = 64
+
+# Header u32 fields (offset 16)
+_NUM_SLOTS, _SLOT_SIZE, _NUM_BUCKETS, _NEXT_FREE, _FREE_TOP, _CLOCK_HAND, _COUNT, _TOMBSTONES = range(8)
+
+# Index bucket states (slot numbers are >= 0)
+_EMPTY = -1
+_TOMBSTONE = -2
+
+# Lock-free read attempts before falling back to the writer lock
+_READ_RETRIES = 64
+
+_TORN = object()
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def _layout(num_slots: int, slot_size: int, num_buckets: int) -> Dict[str, Tuple[int, int]]:
+    """Section name -> (offset, byte length) for the given geometry."""
+    sections = [
+        ('bucket_hash', 8 * num_buckets),
+        ('bucket_slot', 4 * num_buckets),
+        ('slot_hash', 8 * num_slots),
+        ('slot_expires', 8 * num_slots),
+        ('slot_klen', 4 * num_slots),
+        ('slot_vlen', 4 * num_slots),
+        ('slot_ref', num_slots),
+        ('free', 4 * num_slots),
+        ('arena', slot_size * num_slots),
+    ]
+    layout = {}
+    offset = _HEADER_SIZE
+    for name, length in sections:
+        layout[name] = (offset, length)
+        offset = _align(offset + length)
+    layout['total'] = (0, offset)
+    return layout
+
+
+def _fill(typed: memoryview, byte: int) -> None:
+    """Set every byte of a typed view."""
+    with typed.cast('B') as raw:
+        raw[:] = bytes([byte]) * raw.nbytes
+
+
+def _encode_key(key: Hashable) -> bytes:
+    """Deterministic key bytes (identical in every process)."""
+    kind = type(key)
+    if kind is str:
+        return b's' + key.encode('utf-8')
+    if kind is bytes:
+        return b'b' + key
+    if kind is int:
+        return b'i' + str(key).encode('ascii')
+    return b'p' + pickle.dumps(key, protocol=4)
+
+
+def _decode_key(data: bytes) -> Hashable:
+    tag, body = data[:1], data[1:]
+    if tag == b's':
+        return body.decode('utf-8')
+    if tag == b'b':
+        return body
+    if tag == b'i':
+        return int(body)
+    return pickle.loads(body)
+
+
+def _hash_key(data: bytes) -> int:
+    """Stable 64-bit hash (hash() is salted per process)."""
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'little')
+
+
+def _attach_segment(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing segment without taking ownership of its lifetime."""
+    try:
+        return shared_memory.SharedMemory(name=name, create=False, track=False)
+    except TypeError:
+        pass
+    # Before Python 3.13 attaching registers the segment with this process's
+    # resource tracker, which would unlink it when this process exits
+    from multiprocessing import resource_tracker
+    with _ATTACH_LOCK:
+        register = resource_tracker.register
+        resource_tracker.register = lambda name, rtype: None
+        try:
+            return shared_memory.SharedMemory(name=name, create=False)
+        finally:
+            resource_tracker.register = register
+
+
+_ATTACH_LOCK = threading.Lock()
+
+
+class _InterProcessLock:
+    """Thread lock plus an exclusive lock on a file, so it also excludes other processes."""
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._thread_lock = threading.Lock()
+        self._fd: Optional[int] = None
+        self._pid: Optional[int] = None
+    
+    def _file(self) -> int:
+        if self._pid != os.getpid():
+            # A descriptor inherited across fork shares its lock with the parent
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            self._pid = os.getpid()
+        return self._fd
+    
+    def __enter__(self):
+        self._thread_lock.acquire()
+        try:
+            fd = self._file()
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            else:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+        except BaseException:
+            self._thread_lock.release()
+            raise
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            self._thread_lock.release()
+    
+    def close(self) -> None:
+        if self._fd is not None and self._pid == os.getpid():
+            os.close(self._fd)
+        self._fd = None
+        self._pid = None
+
+
+def _attach_cache(name: str, lock_path: str) -> "SharedMemoryCache":
+    return SharedMemoryCache(name=name, create=False, lock_path=lock_path)
+
+
+class SharedMemoryCache(ACache):
+    """
+    Cache shared by every process that attaches to the same segment.
+    
+    Values are pickled into a fixed-size slab arena, so N worker processes
+    hold one copy of the data and warm each other's misses.
+    
+    Example:
+        # In the parent (e.g. a gunicorn master with preload_app)
+        cache = SharedMemoryCache(capacity=100_000, slot_size=512, name="app-cache")
+        
+        # In forked workers the same object keeps working; unrelated
+        # processes attach by name
+        cache = SharedMemoryCache.attach("app-cache")
+        
+        cache.put("user:1", {"name": "Ada"})
+        cache.get("user:1")
+        
+        # When every user is done (owner only)
+        cache.close()
+        cache.unlink()
+    """
+    
+    def __init__(
+        self,
+        capacity: int = 1024,
+        slot_size: int = DEFAULT_SLOT_SIZE,
+        ttl: Optional[float] = None,
+        name: Optional[str] = None,
+        create: bool = True,
+        lock_path: Optional[str] = None
+    ):
+        """
+        Create or attach to a shared-memory cache.
+        
+        Args:
+            capacity: Number of slots (maximum entries); ignored when attaching
+            slot_size: Bytes per slot for encoded key + pickled value; ignored when attaching
+            ttl: Optional time-to-live in seconds; ignored when attaching
+            name: Segment name (generated when creating without one)
+            create: Create a new segment (True) or attach to an existing one
+            lock_path: Lock file shared by all users (default: derived from name)
+        
+        Raises:
+            ValueError: On invalid geometry, or attaching without a name
+            CacheError: If the segment is not a SharedMemoryCache segment
+        """
+        if create:
+            if capacity <= 0:
+                raise ValueError(
+                    f"Cache capacity must be positive, got {capacity}. "
+                    f"Example: SharedMemoryCache(capacity=1024)"
+                )
+            if slot_size < 16:
+                raise ValueError(f"slot_size must be at least 16 bytes, got {slot_size}")
+            num_buckets = 1 << max(3, (2 * capacity - 1).bit_length())
+            size = _layout(capacity, slot_size, num_buckets)['total'][1]
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            self._owner_pid = os.getpid()
+        else:
+            if not name:
+                raise ValueError("name is required to attach to a SharedMemoryCache")
+            self._shm = _attach_segment(name)
+            self._owner_pid = None
+        
+        self._map(create, capacity, slot_size, ttl)
+        super().__init__(capacity=self._geometry[_NUM_SLOTS], ttl=None)
+        self.ttl = self._ttl_field[0] or None
+        self.slot_size = self._geometry[_SLOT_SIZE]
+        self.name = self._shm.name
+        
+        self._ipc_lock = _InterProcessLock(
+            lock_path or os.path.join(tempfile.gettempdir(), f"xwsystem-shm-{self.name.lstrip('/')}.lock")
+        )
+        
+        # Per-process statistics
+        self._hits = 0
+        self._misses = 0
+        
+        logger.debug(
+            f"Shared memory cache {self.name} {'created' if create else 'attached'}: "
+            f"{self.capacity} slots x {self.slot_size} bytes"
+        )
+    
+    @classmethod
+    def attach(cls, name: str, lock_path: Optional[str] = None) -> "SharedMemoryCache":
+        """Attach to an existing cache segment by name."""
+        return cls(name=name, create=False, lock_path=lock_path)
+    
+    def _map(self, create: bool, capacity: int, slot_size: int, ttl: Optional[float]) -> None:
+        """Create typed views over the segment (and initialize it when creating)."""
+        buf = self._shm.buf
+        header = buf[:_HEADER_SIZE]
+        self._views = [header]
+        
+        def view(section: memoryview, fmt: str) -> memoryview:
+            typed = section.cast(fmt)
+            self._views.append(section)
+            self._views.append(typed)
+            return typed
+        
+        self._seq = view(header[8:16], 'Q')
+        self._geometry = view(header[16:48], 'I')
+        self._evictions = view(header[48:56], 'Q')
+        self._ttl_field = view(header[56:64], 'd')
+        
+        if create:
+            header[:8] = _MAGIC
+            geometry = self._geometry
+            geometry[_NUM_SLOTS] = capacity
+            geometry[_SLOT_SIZE] = slot_size
+            geometry[_NUM_BUCKETS] = 1 << max(3, (2 * capacity - 1).bit_length())
+            self._ttl_field[0] = float(ttl or 0.0)
+        elif bytes(header[:8]) != _MAGIC:
+            raise CacheError(f"Shared memory segment {self._shm.name} is not a SharedMemoryCache")
+        
+        num_slots = self._geometry[_NUM_SLOTS]
+        layout = _layout(num_slots, self._geometry[_SLOT_SIZE], self._geometry[_NUM_BUCKETS])
+        
+        def section(name: str) -> memoryview:
+            offset, length = layout[name]
+            return buf[offset:offset + length]
+        
+        self._bucket_hash = view(section('bucket_hash'), 'Q')
+        self._bucket_slot = view(section('bucket_slot'), 'i')
+        self._slot_hash = view(section('slot_hash'), 'Q')
+        self._slot_expires = view(section('slot_expires'), 'd')
+        self._slot_klen = view(section('slot_klen'), 'I')
+        self._slot_vlen = view(section('slot_vlen'), 'I')
+        self._slot_ref = view(section('slot_ref'), 'B')
+        self._free = view(section('free'), 'i')
+        self._arena = section('arena')
+        self._views.append(self._arena)
+        
+        if create:
+            self._reset_locked()
+    
+    # ------------------------------------------------------------------
+    # Segment internals (callers hold the writer lock unless noted)
+    # ------------------------------------------------------------------
+    
+    def _begin_write(self) -> None:
+        self._seq[0] += 1
+    
+    def _end_write(self) -> None:
+        self._seq[0] += 1
+    
+    def _reset_locked(self) -> None:
+        _fill(self._bucket_slot, 0xFF)  # every bucket _EMPTY
+        _fill(self._slot_klen, 0)
+        _fill(self._slot_ref, 0)
+        geometry = self._geometry
+        for field in (_NEXT_FREE, _FREE_TOP, _CLOCK_HAND, _COUNT, _TOMBSTONES):
+            geometry[field] = 0
+    
+    def _find(self, kb: bytes, h: int) -> Tuple[int, int]:
+        """
+        Probe the index for kb (safe without the lock; callers validate).
+        
+        Returns:
+            (slot, bucket) when found, else (-1, first reusable bucket)
+        """
+        bucket_slot = self._bucket_slot
+        bucket_hash = self._bucket_hash
+        klen = self._slot_klen
+        arena = self._arena
+        slot_size = self.slot_size
+        n = len(kb)
+        num_buckets = len(bucket_slot)
+        mask = num_buckets - 1
+        i = h & mask
+        reusable = -1
+        for _ in range(num_buckets):
+            slot = bucket_slot[i]
+            if slot == _EMPTY:
+                return -1, (reusable if reusable >= 0 else i)
+            if slot == _TOMBSTONE:
+                if reusable < 0:
+                    reusable = i
+            elif bucket_hash[i] == h and klen[slot] == n:
+                offset = slot * slot_size
+                if arena[offset:offset + n] == kb:
+                    return slot, i
+            i = (i + 1) & mask
+        return -1, reusable
+    
+    def _read_value(self, kb: bytes, h: int) -> Any:
+        """Raw value bytes for kb, or None (no lock; may return _TORN)."""
+        try:
+            slot, _ = self._find(kb, h)
+            if slot < 0:
+                return None
+            expires = self._slot_expires[slot]
+            if expires and expires < time.time():
+                return None
+            offset = slot * self.slot_size + len(kb)
+            data = bytes(self._arena[offset:offset + self._slot_vlen[slot]])
+            self._slot_ref[slot] = 1
+            return data
+        except (IndexError, ValueError):
+            # Indices read mid-write: the seqlock check retries
+            return _TORN
+    
+    def _read(self, kb: bytes, h: int) -> Optional[bytes]:
+        """Seqlock read of the value bytes for kb."""
+        seq = self._seq
+        for _ in range(_READ_RETRIES):
+            start = seq[0]
+            if start & 1:
+                time.sleep(0)
+                continue
+            data = self._read_value(kb, h)
+            if data is not _TORN and seq[0] == start:
+                return data
+        # Writers kept the segment busy: read under their lock
+        with self._ipc_lock:
+            return self._read_value(kb, h)
+    
+    def _remove_slot_locked(self, slot: int, push_free: bool = True) -> None:
+        """Unlink slot from the index and free it."""
+        n = self._slot_klen[slot]
+        offset = slot * self.slot_size
+        kb = bytes(self._arena[offset:offset + n])
+        found, bucket = self._find(kb, self._slot_hash[slot])
+        if found == slot:
+            self._bucket_slot[bucket] = _TOMBSTONE
+            self._geometry[_TOMBSTONES] += 1
+        self._slot_klen[slot] = 0
+        self._slot_ref[slot] = 0
+        self._geometry[_COUNT] -= 1
+        if push_free:
+            top = self._geometry[_FREE_TOP]
+            self._free[top] = slot
+            self._geometry[_FREE_TOP] = top + 1
+    
+    def _clock_victim_locked(self) -> int:
+        """Advance the CLOCK hand to a slot to evict (unreferenced or expired)."""
+        num_slots = self._geometry[_NUM_SLOTS]
+        klen = self._slot_klen
+        ref = self._slot_ref
+        expires = self._slot_expires
+        now = time.time()
+        hand = self._geometry[_CLOCK_HAND]
+        for _ in range(2 * num_slots + 1):
+            slot = hand
+            hand = (hand + 1) % num_slots
+            if klen[slot] == 0:
+                continue
+            expiry = expires[slot]
+            if ref[slot] and not (expiry and expiry < now):
+                ref[slot] = 0
+                continue
+            self._geometry[_CLOCK_HAND] = hand
+            return slot
+        raise CacheError(f"Shared memory cache {self.name}: no evictable slot")
+    
+    def _allocate_slot_locked(self) -> int:
+        geometry = self._geometry
+        top = geometry[_FREE_TOP]
+        if top > 0:
+            geometry[_FREE_TOP] = top - 1
+            return self._free[top - 1]
+        if geometry[_NEXT_FREE] < geometry[_NUM_SLOTS]:
+            slot = geometry[_NEXT_FREE]
+            geometry[_NEXT_FREE] = slot + 1
+            return slot
+        slot = self._clock_victim_locked()
+        self._remove_slot_locked(slot, push_free=False)
+        self._evictions[0] += 1
+        return slot
+    
+    def _store_locked(self, kb: bytes, h: int, vb: bytes, expires: float) -> None:
+        slot, _ = self._find(kb, h)
+        if slot < 0:
+            slot = self._allocate_slot_locked()
+            # Find the insert position after any eviction changed the index
+            _, bucket = self._find(kb, h)
+            if self._bucket_slot[bucket] == _TOMBSTONE:
+                self._geometry[_TOMBSTONES] -= 1
+            self._bucket_hash[bucket] = h
+            self._bucket_slot[bucket] = slot
+            self._slot_hash[slot] = h
+            offset = slot * self.slot_size
+            self._arena[offset:offset + len(kb)] = kb
+            self._slot_klen[slot] = len(kb)
+            self._geometry[_COUNT] += 1
+        
+        offset = slot * self.slot_size + len(kb)
+        self._arena[offset:offset + len(vb)] = vb
+        self._slot_vlen[slot] = len(vb)
+        self._slot_expires[slot] = expires
+        self._slot_ref[slot] = 1
+    
+    def _delete_locked(self, kb: bytes, h: int) -> bool:
+        slot, _ = self._find(kb, h)
+        if slot < 0:
+            return False
+        self._remove_slot_locked(slot)
+        return True
+    
+    def _maybe_rebuild_index_locked(self) -> None:
+        """Rehash live slots once tombstones fill a quarter of the index."""
+        bucket_slot = self._bucket_slot
+        if self._geometry[_TOMBSTONES] * 4 < len(bucket_slot):
+            return
+        _fill(bucket_slot, 0xFF)
+        self._geometry[_TOMBSTONES] = 0
+        mask = len(bucket_slot) - 1
+        for slot in range(self._geometry[_NEXT_FREE]):
+            if self._slot_klen[slot] == 0:
+                continue
+            h = self._slot_hash[slot]
+            i = h & mask
+            while bucket_slot[i] != _EMPTY:
+                i = (i + 1) & mask
+            self._bucket_hash[i] = h
+            bucket_slot[i] = slot
+    
+    def _encode(self, key: Hashable, value: Any) -> Tuple[bytes, int, bytes]:
+        kb = _encode_key(key)
+        vb = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(kb) + len(vb) > self.slot_size:
+            raise CacheValueSizeError(
+                f"Entry for key {key!r} needs {len(kb) + len(vb)} bytes, "
+                f"slot_size is {self.slot_size}"
+            )
+        return kb, _hash_key(kb), vb
+    
+    def _expiry(self) -> float:
+        return time.time() + self.ttl if self.ttl else 0.0
+    
+    def _live_entries(self) -> List[Tuple[bytes, bytes]]:
+        """(key bytes, value bytes) of every live slot (writer lock held)."""
+        now = time.time()
+        entries = []
+        slot_size = self.slot_size
+        for slot in range(self._geometry[_NEXT_FREE]):
+            n = self._slot_klen[slot]
+            if n == 0:
+                continue
+            expiry = self._slot_expires[slot]
+            if expiry and expiry < now:
+                continue
+            offset = slot * slot_size
+            entries.append((
+                bytes(self._arena[offset:offset + n]),
+                bytes(self._arena[offset + n:offset + n + self._slot_vlen[slot]]),
+            ))
+        return entries
+    
+    # ------------------------------------------------------------------
+    # ACache interface
+    # ------------------------------------------------------------------
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get value by key (lock-free read).
+        
+        Args:
+            key: Key to lookup
+            default: Default value if key not found
+        
+        Returns:
+            Value associated with key, or default
+        """
+        kb = _encode_key(key)
+        data = self._read(kb, _hash_key(kb))
+        if data is None:
+            self._misses += 1
+            return default
+        self._hits += 1
+        return pickle.loads(data)
+    
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Put key-value pair in the shared segment.
+        
+        Raises:
+            CacheValueSizeError: If encoded key + pickled value exceed slot_size
+        """
+        kb, h, vb = self._encode(key, value)
+        expires = self._expiry()
+        with self._ipc_lock:
+            self._begin_write()
+            try:
+                self._store_locked(kb, h, vb, expires)
+                self._maybe_rebuild_index_locked()
+            finally:
+                self._end_write()
+    
+    def delete(self, key: Hashable) -> bool:
+        """Delete key; returns True if it was present."""
+        kb = _encode_key(key)
+        h = _hash_key(kb)
+        with self._ipc_lock:
+            self._begin_write()
+            try:
+                deleted = self._delete_locked(kb, h)
+                self._maybe_rebuild_index_locked()
+            finally:
+                self._end_write()
+        return deleted
+    
+    def get_many(self, keys: List[Hashable]) -> Dict[Hashable, Any]:
+        """Get several values (lock-free reads)."""
+        results = {}
+        for key in keys:
+            kb = _encode_key(key)
+            data = self._read(kb, _hash_key(kb))
+            if data is not None:
+                results[key] = pickle.loads(data)
+        self._hits += len(results)
+        self._misses += len(keys) - len(results)
+        return results
+    
+    def put_many(self, items: Dict[Hashable, Any]) -> int:
+        """Put several values with a single lock acquisition (pickling happens outside it)."""
+        encoded = [self._encode(key, value) for key, value in items.items()]
+        expires = self._expiry()
+        with self._ipc_lock:
+            self._begin_write()
+            try:
+                for kb, h, vb in encoded:
+                    self._store_locked(kb, h, vb, expires)
+                self._maybe_rebuild_index_locked()
+            finally:
+                self._end_write()
+        return len(encoded)
+    
+    def delete_many(self, keys: List[Hashable]) -> int:
+        """Delete several keys with a single lock acquisition."""
+        encoded = [_encode_key(key) for key in keys]
+        with self._ipc_lock:
+            self._begin_write()
+            try:
+                count = sum(1 for kb in encoded if self._delete_locked(kb, _hash_key(kb)))
+                self._maybe_rebuild_index_locked()
+            finally:
+                self._end_write()
+        return count
+    
+    def clear(self) -> None:
+        """Clear all entries (for every attached process)."""
+        with self._ipc_lock:
+            self._begin_write()
+            try:
+                self._reset_locked()
+            finally:
+                self._end_write()
+    
+    def size(self) -> int:
+        """Get current number of entries (expired entries count until reclaimed)."""
+        return self._geometry[_COUNT]
+    
+    def is_full(self) -> bool:
+        """Check if every slot is used."""
+        return self._geometry[_COUNT] >= self.capacity
+    
+    def evict(self) -> None:
+        """Evict one entry chosen by the CLOCK hand."""
+        with self._ipc_lock:
+            if self._geometry[_COUNT] == 0:
+                return
+            self._begin_write()
+            try:
+                self._remove_slot_locked(self._clock_victim_locked())
+                self._evictions[0] += 1
+            finally:
+                self._end_write()
+    
+    def keys(self) -> List[Hashable]:
+        """Get list of all live keys."""
+        with self._ipc_lock:
+            entries = self._live_entries()
+        return [_decode_key(kb) for kb, _ in entries]
+    
+    def values(self) -> List[Any]:
+        """Get list of all live values."""
+        with self._ipc_lock:
+            entries = self._live_entries()
+        return [pickle.loads(vb) for _, vb in entries]
+    
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """Get list of all live key-value pairs."""
+        with self._ipc_lock:
+            entries = self._live_entries()
+        return [(_decode_key(kb), pickle.loads(vb)) for kb, vb in entries]
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics (hits/misses are this process's)."""
+        total_requests = self._hits + self._misses
+        return {
+            'name': self.name,
+            'type': 'SharedMemory',
+            'capacity': self.capacity,
+            'size': self._geometry[_COUNT],
+            'slot_size': self.slot_size,
+            'segment_bytes': self._shm.size,
+            'hits': self._hits,
+            'misses': self._misses,
+            'evictions': self._evictions[0],
+            'hit_rate': self._hits / total_requests if total_requests > 0 else 0.0,
+            'ttl': self.ttl,
+        }
+    
+    def close(self) -> None:
+        """Detach this process from the segment (the data stays for other users)."""
+        if self._shm is None:
+            return
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._shm.close()
+        self._shm = None
+        self._ipc_lock.close()
+    
+    def unlink(self) -> None:
+        """Destroy the segment and its lock file (call once, when every user is done)."""
+        name = self.name
+        try:
+            segment = self._shm or _attach_segment(name)
+            segment.unlink()
+            if segment is not self._shm:
+                segment.close()
+        except FileNotFoundError:
+            pass
+        try:
+            os.unlink(self._ipc_lock.path)
+        except OSError:
+            pass
+    
+    def __reduce__(self):
+        # Pickled (e.g. sent to a spawned worker) as "attach by name"
+        return _attach_cache, (self.name, self._ipc_lock.path)
+    
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit: detach, and destroy the segment in the creating process."""
+        owner = self._owner_pid == os.getpid()
+        self.close()
+        if owner:
+            self.unlink()
+        return False
+
+
+__all__ = [
+    "SharedMemoryCache",
+    "DEFAULT_SLOT_SIZE",
+]
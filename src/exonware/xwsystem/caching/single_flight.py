@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+#exonware/xwsystem/caching/single_flight.py
+"""
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+
+Single-flight request coalescing for cache loaders.
+Performance Priority #4 - Prevents cache stampedes on hot-key misses.
+
+Performance Improvement:
+    - OLD: N concurrent misses on the same key run the loader N times
+    - NEW: The first caller (leader) runs the loader; the other N-1 callers
+      wait on its future and receive the same result or the same exception
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+from .errors import CacheTimeoutError
+
+
+class SingleFlight:
+    """
+    Thread-safe per-key call deduplication.
+
+    Example:
+        flight = SingleFlight()
+        user = flight.do(user_id, lambda: db.load_user(user_id), timeout=5.0)
+    """
+
+    def __init__(self):
+        """Initialize single-flight group."""
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, Future] = {}
+        self._calls = 0
+        self._coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any], timeout: Optional[float] = None) -> Any:
+        """
+        Run fn once per key among concurrent callers.
+
+        Args:
+            key: Deduplication key
+            fn: Zero-argument callable producing the value
+            timeout: Maximum seconds a waiting caller blocks (None = forever).
+                The leader always runs fn to completion.
+
+        Returns:
+            Result of fn (shared by all concurrent callers)
+
+        Raises:
+            CacheTimeoutError: If a waiting caller exceeds timeout
+            Exception: Whatever fn raised, re-raised in every caller
+        """
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._in_flight[key] = future
+                self._calls += 1
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            try:
+                return future.result(timeout=timeout)
+            except FutureTimeoutError:
+                raise CacheTimeoutError(
+                    f"Timed out after {timeout}s waiting for in-flight load of key: {key}"
+                ) from None
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                if self._in_flight.get(key) is future:
+                    del self._in_flight[key]
+
+    def in_flight(self) -> int:
+        """Number of keys currently being loaded."""
+        with self._lock:
+            return len(self._in_flight)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get coalescing statistics."""
+        with self._lock:
+            return {
+                'calls': self._calls,
+                'coalesced': self._coalesced,
+                'in_flight': len(self._in_flight),
+            }
+
+
+class AsyncSingleFlight:
+    """
+    Per-key coroutine deduplication for a single event loop.
+
+    If the leader is cancelled, waiting callers are not failed: one of them
+    is promoted to leader and runs the loader again.
+
+    Example:
+        flight = AsyncSingleFlight()
+        user = await flight.do(user_id, lambda: db.load_user(user_id))
+    """
+
+    def __init__(self):
+        """Initialize async single-flight group."""
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        self._calls = 0
+        self._coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]],
+                 timeout: Optional[float] = None) -> Any:
+        """
+        Await fn() once per key among concurrent callers.
+
+        Args:
+            key: Deduplication key
+            fn: Zero-argument callable returning an awaitable
+            timeout: Maximum seconds a waiting caller waits (None = forever)
+
+        Returns:
+            Result of fn() (shared by all concurrent callers)
+
+        Raises:
+            CacheTimeoutError: If a waiting caller exceeds timeout
+            Exception: Whatever fn() raised, re-raised in every caller
+        """
+        while True:
+            future = self._in_flight.get(key)
+            if future is None:
+                break
+
+            self._coalesced += 1
+            try:
+                return await asyncio.wait_for(asyncio.shield(future), timeout)
+            except asyncio.TimeoutError:
+                raise CacheTimeoutError(
+                    f"Timed out after {timeout}s waiting for in-flight load of key: {key}"
+                ) from None
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # Leader was cancelled: retry, possibly as the new leader
+                self._coalesced -= 1
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        self._calls += 1
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an un-awaited failure is not reported by asyncio
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+
+    def in_flight(self) -> int:
+        """Number of keys currently being loaded."""
+        return len(self._in_flight)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get coalescing statistics."""
+        return {
+            'calls': self._calls,
+            'coalesced': self._coalesced,
+            'in_flight': len(self._in_flight),
+        }
+
+
+__all__ = [
+    'SingleFlight',
+    'AsyncSingleFlight',
+]
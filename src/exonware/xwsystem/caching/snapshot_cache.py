@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+
+Lock-free-read cache for read-mostly data (configuration, registries).
+
+Performance:
+    - Reads take no lock: they do one dict lookup on the current snapshot
+    - Writes copy the snapshot, modify the copy and swap it in with a single
+      attribute assignment (atomic in CPython), serialized by a writer lock
+    - Batch writes copy once per batch; get_many() reads one consistent snapshot
+    - Writes cost O(size), so use it for data that changes rarely
+"""
+
+import threading
+from types import MappingProxyType
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Tuple, Union
+from .base import ACache
+from .counters import StatsModeMixin
+from .defs import StatsMode
+from ..config.logging_setup import get_logger
+
+logger = get_logger("xwsystem.caching.snapshot_cache")
+
+_MISSING = object()
+
+
+class SnapshotCache(StatsModeMixin, ACache):
+    """
+    Copy-on-write cache with lock-free reads.
+    
+    When bounded, the oldest inserted entries are evicted first (readers
+    never write, so there is no recency to track).
+    
+    Statistics default to per-thread counters so readers never write shared
+    state; in SHARED mode the unlocked counters are approximate.
+    
+    Example:
+        settings = SnapshotCache()
+        settings.replace(load_settings())       # atomic reload
+        settings.get("feature.enabled", False)  # no lock taken
+    """
+    
+    def __init__(self, capacity: Optional[int] = None, name: Optional[str] = None,
+                 stats: Union[StatsMode, str] = StatsMode.PER_THREAD):
+        """
+        Initialize snapshot cache.
+        
+        Args:
+            capacity: Optional maximum number of entries (None = unbounded)
+            name: Optional name for debugging
+            stats: Statistics mode (per_thread by default)
+        """
+        if capacity is not None and capacity <= 0:
+            raise ValueError(
+                f"Cache capacity must be positive, got {capacity}. "
+                f"Example: SnapshotCache(capacity=1024)"
+            )
+        super().__init__(capacity=capacity or 0, ttl=None)
+        self.max_size = capacity
+        self.name = name or f"SnapshotCache-{id(self)}"
+        
+        self._snapshot: Dict[Hashable, Any] = {}
+        # Writers only; readers never take it
+        self._write_lock = threading.Lock()
+        self._version = 0
+        
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._init_stats_mode(stats)
+    
+    # ------------------------------------------------------------------
+    # Reads (lock-free)
+    # ------------------------------------------------------------------
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get value by key without locking.
+        
+        Args:
+            key: Key to lookup
+            default: Default value if key not found
+        
+        Returns:
+            Value associated with key, or default
+        """
+        value = self._snapshot.get(key, _MISSING)
+        if value is _MISSING:
+            if self._shared_stats:
+                self._misses += 1
+            elif self._thread_stats is not None:
+                self._thread_stats.local.misses += 1
+            return default
+        if self._shared_stats:
+            self._hits += 1
+        elif self._thread_stats is not None:
+            self._thread_stats.local.hits += 1
+        return value
+    
+    def get_many(self, keys: List[Hashable]) -> Dict[Hashable, Any]:
+        """Get several values from one consistent snapshot."""
+        snapshot = self._snapshot
+        results = {}
+        for key in keys:
+            value = snapshot.get(key, _MISSING)
+            if value is not _MISSING:
+                results[key] = value
+        if self._shared_stats:
+            self._hits += len(results)
+            self._misses += len(keys) - len(results)
+        elif self._thread_stats is not None:
+            counters = self._thread_stats.local
+            counters.hits += len(results)
+            counters.misses += len(keys) - len(results)
+        return results
+    
+    def snapshot(self) -> Mapping[Hashable, Any]:
+        """Read-only view of the current contents (unaffected by later writes)."""
+        return MappingProxyType(self._snapshot)
+    
+    @property
+    def version(self) -> int:
+        """Number of snapshots published so far (changes on every write)."""
+        return self._version
+    
+    def __contains__(self, key: Hashable) -> bool:
+        """Check if key exists in cache."""
+        return key in self._snapshot
+    
+    def __len__(self) -> int:
+        """Get cache size."""
+        return len(self._snapshot)
+    
+    # ------------------------------------------------------------------
+    # Writes (copy-on-write)
+    # ------------------------------------------------------------------
+    
+    def _publish_locked(self, snapshot: Dict[Hashable, Any]) -> None:
+        """Trim to capacity and swap in a new snapshot (writer lock held)."""
+        if self.max_size is not None and len(snapshot) > self.max_size:
+            excess = len(snapshot) - self.max_size
+            for key in list(snapshot)[:excess]:
+                del snapshot[key]
+            self._evictions += excess
+        self._snapshot = snapshot
+        self._version += 1
+    
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Put key-value pair (publishes a new snapshot).
+        
+        Args:
+            key: Key to store
+            value: Value to store
+        """
+        with self._write_lock:
+            current = self._snapshot
+            if current.get(key, _MISSING) is value:
+                return
+            snapshot = dict(current)
+            snapshot[key] = value
+            self._publish_locked(snapshot)
+    
+    def set(self, key: Hashable, value: Any, ttl: Optional[int] = None) -> None:
+        """Set value (Protocol interface; snapshot entries do not expire)."""
+        self.put(key, value)
+    
+    def put_many(self, items: Dict[Hashable, Any]) -> int:
+        """Put several values with a single copy."""
+        if not items:
+            return 0
+        with self._write_lock:
+            snapshot = dict(self._snapshot)
+            snapshot.update(items)
+            self._publish_locked(snapshot)
+        return len(items)
+    
+    def get_or_put(self, key: Hashable, factory) -> Any:
+        """
+        Return the cached value, computing and storing it on a miss.
+        
+        The factory runs under the writer lock, so concurrent misses for a
+        key compute it once; hits stay lock-free.
+        """
+        value = self._snapshot.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        with self._write_lock:
+            value = self._snapshot.get(key, _MISSING)
+            if value is _MISSING:
+                value = factory()
+                snapshot = dict(self._snapshot)
+                snapshot[key] = value
+                self._publish_locked(snapshot)
+        return value
+    
+    def replace(self, items: Mapping[Hashable, Any]) -> None:
+        """Atomically replace the whole contents (e.g. a configuration reload)."""
+        with self._write_lock:
+            self._publish_locked(dict(items))
+    
+    def delete(self, key: Hashable) -> bool:
+        """
+        Delete key from cache.
+        
+        Returns:
+            True if key was deleted, False if not found
+        """
+        with self._write_lock:
+            if key not in self._snapshot:
+                return False
+            snapshot = dict(self._snapshot)
+            del snapshot[key]
+            self._publish_locked(snapshot)
+            return True
+    
+    def delete_many(self, keys: List[Hashable]) -> int:
+        """Delete several keys with a single copy."""
+        with self._write_lock:
+            present = [key for key in keys if key in self._snapshot]
+            if not present:
+                return 0
+            snapshot = dict(self._snapshot)
+            for key in present:
+                snapshot.pop(key, None)
+            self._publish_locked(snapshot)
+        return len(set(present))
+    
+    def clear(self) -> None:
+        """Clear all items from cache."""
+        with self._write_lock:
+            self._publish_locked({})
+    
+    # ------------------------------------------------------------------
+    # ACache interface
+    # ------------------------------------------------------------------
+    
+    def size(self) -> int:
+        """Get current cache size."""
+        return len(self._snapshot)
+    
+    def is_full(self) -> bool:
+        """Check if cache is at capacity (never, when unbounded)."""
+        return self.max_size is not None and len(self._snapshot) >= self.max_size
+    
+    def evict(self) -> None:
+        """Evict the oldest inserted entry."""
+        with self._write_lock:
+            if not self._snapshot:
+                return
+            snapshot = dict(self._snapshot)
+            del snapshot[next(iter(snapshot))]
+            self._evictions += 1
+            self._publish_locked(snapshot)
+    
+    def keys(self) -> List[Hashable]:
+        """Get list of all keys (in insertion order)."""
+        return list(self._snapshot)
+    
+    def values(self) -> List[Any]:
+        """Get list of all values (in insertion order)."""
+        return list(self._snapshot.values())
+    
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """Get list of all key-value pairs (in insertion order)."""
+        return list(self._snapshot.items())
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        counts = self._merged_counts()
+        total_requests = counts.hits + counts.misses
+        return {
+            'name': self.name,
+            'type': 'Snapshot',
+            'capacity': self.max_size,
+            'size': len(self._snapshot),
+            'hits': counts.hits,
+            'misses': counts.misses,
+            'evictions': counts.evictions,
+            'hit_rate': counts.hits / total_requests if total_requests > 0 else 0.0,
+            'version': self._version,
+            'stats_mode': self.stats_mode.value,
+        }
+    
+    def reset_stats(self) -> None:
+        """Reset cache statistics."""
+        self._reset_counts()
+
+
+# Read-mostly name used by the decorator mode (xwcached(read_mostly=True))
+ReadMostlyCache = SnapshotCache
+
+
+__all__ = [
+    "SnapshotCache",
+    "ReadMostlyCache",
+]
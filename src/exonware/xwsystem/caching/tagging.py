@@ -8,15 +8,55 @@ Generation Date: 01-Nov-2025
 
 Tag-based cache invalidation.
 Extensibility Priority #5 - Flexible invalidation patterns.
+
+Invalidation is O(1) in the number of tagged entries:
+    - Every tagged entry is stamped with the cache's invalidation sequence
+      number at write time
+    - Invalidating a tag records the new sequence number for that tag; an
+      entry whose stamp is older than a record for one of its tags is stale
+    - Stale entries are dropped lazily: on read, and a few at a time on
+      writes (or all at once with purge_stale())
+
+Tags are hierarchical on ':' - invalidating 'user:42:*' makes every entry
+tagged 'user:42:<anything>' stale, without touching the entries. Any
+hashable can be a tag; non-string tags are flat (no hierarchy).
 """
 
-from typing import Any, Dict, List, Optional, Hashable, Set
-from collections import defaultdict
-from .lru_cache import LRUCache
+import logging
+import sys
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Hashable, Set, Tuple
+from .lru_cache import LRUCache, CacheNode
 from ..config.logging_setup import get_logger
 
 logger = get_logger("xsystem.caching.tagging")
 
+# Separator of hierarchical tags and the suffix of subtree patterns
+TAG_SEPARATOR = ":"
+TAG_WILDCARD = TAG_SEPARATOR + "*"
+
+# Stale entries dropped per write while invalidated tags are pending cleanup
+DEFAULT_SWEEP_BATCH = 64
+
+
+def _validate_tags(tags: Optional[List[str]]) -> None:
+    for tag in tags or ():
+        if _is_pattern(tag):
+            raise ValueError(f"Invalid tag {tag!r}: tags ending in '{TAG_WILDCARD}' are invalidation patterns")
+
+
+def _is_pattern(tag: Hashable) -> bool:
+    """Whether tag is a 'prefix:*' subtree pattern."""
+    return isinstance(tag, str) and tag.endswith(TAG_WILDCARD)
+
+
+def _ancestors(tag: Hashable) -> List[str]:
+    """Strict ancestors of a hierarchical tag ('a:b:c' -> ['a', 'a:b']; none for non-strings)."""
+    if not isinstance(tag, str):
+        return []
+    parts = tag.split(TAG_SEPARATOR)
+    return [TAG_SEPARATOR.join(parts[:i]) for i in range(1, len(parts))]
+
 
 class TaggedCache(LRUCache):
     """
@@ -31,15 +71,20 @@ class TaggedCache(LRUCache):
         cache.put('user:1', user1_data, tags=['user', 'active'])
         cache.put('user:2', user2_data, tags=['user', 'inactive'])
         cache.put('product:1', product_data, tags=['product'])
+        cache.put('orders:42', orders, tags=['user:42:orders'])
         
         # Invalidate all user entries
         cache.invalidate_by_tag('user')
         
         # Invalidate multiple tags
         cache.invalidate_by_tags(['user', 'product'])
+        
+        # Invalidate every tag under user:42 (user:42:orders, user:42:cart, ...)
+        cache.invalidate_by_tag('user:42:*')
     """
     
-    def __init__(self, capacity: int = 128, ttl: Optional[float] = None, name: Optional[str] = None):
+    def __init__(self, capacity: int = 128, ttl: Optional[float] = None, name: Optional[str] = None,
+                 sweep_batch: int = DEFAULT_SWEEP_BATCH):
         """
         Initialize tagged cache.
         
@@ -47,79 +92,231 @@ class TaggedCache(LRUCache):
             capacity: Maximum cache size
             ttl: Optional TTL in seconds
             name: Cache name
+            sweep_batch: Stale entries removed per write after invalidations
         """
         super().__init__(capacity, ttl, name)
+        self.sweep_batch = sweep_batch
+        
+        # Tag index: tag -> keys, key -> (stamp, tags, tags/patterns to check)
+        self._tag_to_keys: Dict[str, Set[Hashable]] = {}
+        self._entries: Dict[Hashable, Tuple[int, frozenset, Tuple[str, ...]]] = {}
+        # Prefix -> tags below it (for 'prefix:*' invalidation)
+        self._descendants: Dict[str, Set[str]] = {}
+        self._tag_links = 0
+        
+        # Invalidation records: tag or pattern -> sequence number when invalidated
+        self._sequence = 0
+        self._invalidated: Dict[str, int] = {}
+        # Detached key sets awaiting cleanup, and how many reference each record
+        self._stale: Deque[Tuple[str, Set[Hashable]]] = deque()
+        self._pending_records: Dict[str, int] = {}
         
-        # Tag tracking
-        self._key_to_tags: Dict[Hashable, Set[str]] = {}
-        self._tag_to_keys: Dict[str, Set[Hashable]] = defaultdict(set)
         self._invalidations = 0
+        self._stale_removed = 0
+    
+    # ------------------------------------------------------------------
+    # Tag index (lock held)
+    # ------------------------------------------------------------------
+    
+    def _is_current(self, key: Hashable) -> bool:
+        """False if an invalidation recorded after the entry was written covers one of its tags."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return True
+        stamp = entry[0]
+        invalidated = self._invalidated
+        for check in entry[2]:
+            if invalidated.get(check, 0) > stamp:
+                return False
+        return True
+    
+    @staticmethod
+    def _plan(tags: Optional[List[str]]) -> Optional[Tuple[frozenset, Tuple[str, ...]]]:
+        """Tag set and the tags/patterns whose invalidation makes an entry stale."""
+        if not tags:
+            return None
+        tagset = frozenset(tags)
+        checks = []
+        for tag in tagset:
+            checks.append(tag)
+            checks.extend(prefix + TAG_WILDCARD for prefix in _ancestors(tag))
+        return tagset, tuple(checks)
+    
+    def _link_locked(self, key: Hashable, plan: Optional[Tuple[frozenset, Tuple[str, ...]]]) -> None:
+        """Replace the tags of key and stamp it with the current sequence number."""
+        self._unlink_locked(key)
+        if plan is None:
+            return
+        tagset, checks = plan
+        tag_to_keys = self._tag_to_keys
+        for tag in tagset:
+            keys = tag_to_keys.get(tag)
+            if keys is None:
+                keys = tag_to_keys[tag] = set()
+                for prefix in _ancestors(tag):
+                    self._descendants.setdefault(prefix, set()).add(tag)
+            keys.add(key)
+        self._entries[key] = (self._sequence, tagset, checks)
+        self._tag_links += len(tagset)
+    
+    def _unlink_locked(self, key: Hashable) -> None:
+        """Remove key from the tag index."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._tag_links -= len(entry[1])
+        for tag in entry[1]:
+            keys = self._tag_to_keys.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    self._drop_tag_locked(tag)
+    
+    def _drop_tag_locked(self, tag: str) -> Set[Hashable]:
+        """Detach a tag's key set from the index."""
+        keys = self._tag_to_keys.pop(tag, set())
+        for prefix in _ancestors(tag):
+            below = self._descendants.get(prefix)
+            if below is not None:
+                below.discard(tag)
+                if not below:
+                    del self._descendants[prefix]
+        return keys
+    
+    def _invalidate_locked(self, tag: str) -> int:
+        """Record an invalidation of a tag or 'prefix:*' pattern; returns entries affected."""
+        if _is_pattern(tag):
+            tags = list(self._descendants.get(tag[:-len(TAG_WILDCARD)], ()))
+        else:
+            tags = [tag] if tag in self._tag_to_keys else []
+        if not tags:
+            return 0
+        
+        self._sequence += 1
+        self._invalidated[tag] = self._sequence
+        count = 0
+        for matched in tags:
+            keys = self._drop_tag_locked(matched)
+            if keys:
+                count += len(keys)
+                self._stale.append((tag, keys))
+                self._pending_records[tag] = self._pending_records.get(tag, 0) + 1
+        return count
+    
+    def _sweep_locked(self, budget: Optional[int]) -> int:
+        """Remove up to budget stale entries (all when budget is None)."""
+        removed = 0
+        stale = self._stale
+        while stale and (budget is None or removed < budget):
+            record, keys = stale[0]
+            while keys and (budget is None or removed < budget):
+                key = keys.pop()
+                if key in self._entries and not self._is_current(key):
+                    self._delete_locked(key)
+                    removed += 1
+            if keys:
+                break
+            stale.popleft()
+            # Every entry stamped before the record is gone: drop the record
+            remaining = self._pending_records[record] - 1
+            if remaining:
+                self._pending_records[record] = remaining
+            else:
+                del self._pending_records[record]
+                del self._invalidated[record]
+        self._stale_removed += removed
+        return removed
+    
+    # ------------------------------------------------------------------
+    # LRU hooks: keep the index in step with lookups, evictions and deletes
+    # ------------------------------------------------------------------
+    
+    def _lookup_locked(self, key: Hashable) -> Optional[CacheNode]:
+        if self._invalidated and not self._is_current(key):
+            self._delete_locked(key)
+            self._stale_removed += 1
+            return None
+        node = super()._lookup_locked(key)
+        if node is None and key in self._entries:
+            # Expired by TTL
+            self._unlink_locked(key)
+        return node
+    
+    def _store_locked(self, key: Hashable, value: Any) -> Optional[CacheNode]:
+        evicted = super()._store_locked(key, value)
+        if evicted is not None:
+            self._unlink_locked(evicted.key)
+        return evicted
+    
+    def _delete_locked(self, key: Hashable) -> bool:
+        self._unlink_locked(key)
+        return super()._delete_locked(key)
+    
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
     
     def put(self, key: Hashable, value: Any, tags: Optional[List[str]] = None) -> None:
         """
-        Put value with optional tags.
+        Put value with optional tags (replacing any tags the key had).
         
         Args:
             key: Cache key
             value: Value to cache
             tags: List of tags to associate with entry
+        
+        Raises:
+            ValueError: If a tag is a 'prefix:*' pattern
         """
-        # Store in cache
-        super().put(key, value)
+        _validate_tags(tags)
+        plan = self._plan(tags)
+        with self._lock:
+            self._store_locked(key, value)
+            self._link_locked(key, plan)
+            if self._stale:
+                self._sweep_locked(self.sweep_batch)
         
-        # Update tags
-        if tags:
-            self._key_to_tags[key] = set(tags)
-            for tag in tags:
-                self._tag_to_keys[tag].add(key)
-            
+        if tags and logger.isEnabledFor(logging.DEBUG):
             logger.debug(f"Cached {key} with tags: {tags}")
     
-    def delete(self, key: Hashable) -> bool:
+    def put_many(self, items: Dict[Hashable, Any], tags: Optional[List[str]] = None) -> int:
         """
-        Delete key and remove from tag mappings.
+        Put multiple values sharing the same tags with a single lock acquisition.
         
         Args:
-            key: Key to delete
-            
+            items: Dictionary of key-value pairs to cache
+            tags: List of tags to associate with every entry
+        
         Returns:
-            True if deleted
+            Number of items cached
         """
-        # Remove from tag mappings
-        if key in self._key_to_tags:
-            tags = self._key_to_tags[key]
-            for tag in tags:
-                self._tag_to_keys[tag].discard(key)
-                # Clean up empty tag sets
-                if not self._tag_to_keys[tag]:
-                    del self._tag_to_keys[tag]
-            del self._key_to_tags[key]
-        
-        # Delete from cache
-        return super().delete(key)
+        _validate_tags(tags)
+        plan = self._plan(tags)
+        with self._lock:
+            for key, value in items.items():
+                self._store_locked(key, value)
+                self._link_locked(key, plan)
+            if self._stale:
+                self._sweep_locked(self.sweep_batch)
+        return len(items)
     
     def invalidate_by_tag(self, tag: str) -> int:
         """
         Invalidate all entries with a specific tag.
         
+        Runs in constant time per matching tag; the entries become misses
+        immediately and are removed lazily.
+        
         Args:
-            tag: Tag to invalidate
-            
+            tag: Tag to invalidate, or 'prefix:*' for every tag below prefix
+        
         Returns:
-            Number of entries invalidated
+            Number of entries invalidated (an entry matched by several tags
+            of a pattern counts once per tag)
         """
-        if tag not in self._tag_to_keys:
-            return 0
-        
-        # Get all keys with this tag
-        keys_to_delete = list(self._tag_to_keys[tag])
-        count = 0
-        
-        for key in keys_to_delete:
-            if self.delete(key):
-                count += 1
-        
-        self._invalidations += count
+        with self._lock:
+            count = self._invalidate_locked(tag)
+            self._invalidations += count
         logger.info(f"Invalidated {count} entries with tag '{tag}'")
         return count
     
@@ -128,37 +325,48 @@ class TaggedCache(LRUCache):
         Invalidate all entries with any of the specified tags.
         
         Args:
-            tags: List of tags to invalidate
-            
+            tags: List of tags (or 'prefix:*' patterns) to invalidate
+        
         Returns:
-            Number of entries invalidated
+            Number of entries invalidated (an entry with several of the tags
+            counts once per tag)
         """
-        keys_to_delete = set()
-        
-        for tag in tags:
-            if tag in self._tag_to_keys:
-                keys_to_delete.update(self._tag_to_keys[tag])
-        
-        count = 0
-        for key in keys_to_delete:
-            if self.delete(key):
-                count += 1
-        
-        self._invalidations += count
+        with self._lock:
+            count = sum(self._invalidate_locked(tag) for tag in tags)
+            self._invalidations += count
         logger.info(f"Invalidated {count} entries with tags: {tags}")
         return count
     
+    def purge_stale(self) -> int:
+        """
+        Remove every entry made stale by earlier invalidations now.
+        
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            return self._sweep_locked(None)
+    
     def get_keys_by_tag(self, tag: str) -> Set[Hashable]:
         """
         Get all keys associated with a tag.
         
         Args:
-            tag: Tag to query
-            
+            tag: Tag to query, or 'prefix:*' for every tag below prefix
+        
         Returns:
             Set of keys with this tag
         """
-        return self._tag_to_keys.get(tag, set()).copy()
+        with self._lock:
+            if _is_pattern(tag):
+                keys = set()
+                for matched in self._descendants.get(tag[:-len(TAG_WILDCARD)], ()):
+                    keys.update(self._tag_to_keys[matched])
+            else:
+                keys = set(self._tag_to_keys.get(tag, ()))
+            if self._invalidated:
+                keys = {key for key in keys if self._is_current(key)}
+            return keys
     
     def get_tags(self, key: Hashable) -> Set[str]:
         """
@@ -166,11 +374,15 @@ class TaggedCache(LRUCache):
         
         Args:
             key: Key to query
-            
+        
         Returns:
             Set of tags for this key
         """
-        return self._key_to_tags.get(key, set()).copy()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not self._is_current(key):
+                return set()
+            return set(entry[1])
     
     def get_all_tags(self) -> Set[str]:
         """
@@ -179,24 +391,98 @@ class TaggedCache(LRUCache):
         Returns:
             Set of all tags
         """
-        return set(self._tag_to_keys.keys())
+        with self._lock:
+            return set(self._tag_to_keys.keys())
+    
+    def get_index_memory(self) -> Dict[str, int]:
+        """
+        Approximate memory used by the tag index (walks the index: O(entries)).
+        
+        Returns:
+            Bytes per index structure and in total (tag strings and keys
+            themselves are shared with the cache and not counted)
+        """
+        getsizeof = sys.getsizeof
+        with self._lock:
+            tag_sets = getsizeof(self._tag_to_keys) + sum(
+                getsizeof(keys) for keys in self._tag_to_keys.values()
+            )
+            entries = getsizeof(self._entries) + sum(
+                getsizeof(entry) + getsizeof(entry[1]) + getsizeof(entry[2])
+                for entry in self._entries.values()
+            )
+            hierarchy = getsizeof(self._descendants) + sum(
+                getsizeof(tags) for tags in self._descendants.values()
+            )
+            pending = getsizeof(self._stale) + getsizeof(self._invalidated) + sum(
+                getsizeof(keys) for _, keys in self._stale
+            )
+        return {
+            'tag_sets': tag_sets,
+            'entries': entries,
+            'hierarchy': hierarchy,
+            'pending_invalidations': pending,
+            'total': tag_sets + entries + hierarchy + pending,
+        }
+    
+    def __contains__(self, key: Hashable) -> bool:
+        """Check if key exists in cache and is not stale."""
+        with self._lock:
+            return key in self._cache and self._is_current(key)
+    
+    def keys(self) -> list:
+        """Get list of all live keys (in LRU order)."""
+        with self._lock:
+            keys = super().keys()
+            if self._invalidated:
+                keys = [key for key in keys if self._is_current(key)]
+            return keys
+    
+    def values(self) -> list:
+        """Get list of all live values (in LRU order)."""
+        return [value for _, value in self.items()]
+    
+    def items(self) -> list:
+        """Get list of all live key-value pairs (in LRU order)."""
+        with self._lock:
+            items = super().items()
+            if self._invalidated:
+                items = [item for item in items if self._is_current(item[0])]
+            return items
+    
+    def evict(self) -> None:
+        """Evict least recently used entry (and its tag links)."""
+        with self._lock:
+            node = self._tail.prev
+            if node is not self._head:
+                self._delete_locked(node.key)
+                self._evictions += 1
     
     def clear(self) -> None:
         """Clear cache and all tag mappings."""
-        super().clear()
-        self._key_to_tags.clear()
-        self._tag_to_keys.clear()
+        with self._lock:
+            super().clear()
+            self._tag_to_keys.clear()
+            self._entries.clear()
+            self._descendants.clear()
+            self._tag_links = 0
+            self._invalidated.clear()
+            self._stale.clear()
+            self._pending_records.clear()
     
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics including tag information."""
-        stats = super().get_stats()
-        stats['total_tags'] = len(self._tag_to_keys)
-        stats['invalidations'] = self._invalidations
-        stats['tagged_entries'] = len(self._key_to_tags)
-        return stats
+        with self._lock:
+            stats = super().get_stats()
+            stats['total_tags'] = len(self._tag_to_keys)
+            stats['invalidations'] = self._invalidations
+            stats['tagged_entries'] = len(self._entries)
+            stats['tag_links'] = self._tag_links
+            stats['pending_stale'] = sum(len(keys) for _, keys in self._stale)
+            stats['stale_removed'] = self._stale_removed
+            return stats
 
 
 __all__ = [
     'TaggedCache',
 ]
-
@@ -9,18 +9,42 @@ Author: Eng. Muhammad AlShehri
 Email: connect@exonware.com
 Version: 0.0.1.409
 Generated: 2025-01-27
+
+Performance:
+    - LRU order kept in an OrderedDict: O(1) hit, insert and LRU eviction
+    - Expirations tracked in a min-heap keyed by expiry time: O(log n) insert,
+      O(1) peek at the next entry to expire
+    - Cleanup pops only entries that are actually expired, in bounded
+      batches, releasing the lock between batches (no full scans)
 """
 
 import asyncio
+import heapq
+import itertools
 import time
 import threading
-from typing import Any, Dict, Optional, Tuple, Union
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 import logging
 from .base import ACache
+from .counters import StatsModeMixin
+from .defs import StatsMode
 
 logger = logging.getLogger(__name__)
 
+_DEBUG = logging.DEBUG
+
+
+# Maximum expired entries removed per lock acquisition during cleanup
+DEFAULT_CLEANUP_BATCH_SIZE = 1000
+
+# Expired entries opportunistically removed on each put
+_EXPIRE_ON_WRITE = 2
+
+# Rebuild the expiry heap once stale records outnumber live entries by this factor
+_HEAP_COMPACT_FACTOR = 2
+
 
 @dataclass
 class TTLEntry:
@@ -29,80 +53,246 @@ class TTLEntry:
     expires_at: float
     access_count: int = 0
     created_at: float = None
-    
+
     def __post_init__(self):
         if self.created_at is None:
             self.created_at = time.time()
-    
+
     def is_expired(self) -> bool:
         """Check if entry has expired."""
         return time.time() > self.expires_at
-    
+
     def touch(self):
         """Update access count."""
         self.access_count += 1
 
 
-class TTLCache(ACache):
+class _TTLStorage:
+    """
+    Lock-free storage core shared by TTLCache and AsyncTTLCache.
+
+    Entries live in an OrderedDict (oldest access first). Every stored entry
+    also gets a record (expires_at, seq, key, entry) in a min-heap; records
+    whose entry has since been replaced or removed are skipped lazily when
+    they reach the top of the heap, and the heap is compacted once stale
+    records dominate. Callers are responsible for holding their lock.
+
+    Hit/miss counts go to self._stats unless a subclass selects per-thread
+    or disabled statistics (see counters.StatsModeMixin).
+    """
+
+    stats_mode = StatsMode.SHARED
+    _shared_stats = True
+    _thread_stats = None
+
+    def _init_storage(self) -> None:
+        """Initialize storage structures."""
+        self._cache: 'OrderedDict[Any, TTLEntry]' = OrderedDict()
+        self._expiry_heap: List[Tuple[float, int, Any, TTLEntry]] = []
+        self._heap_seq = itertools.count()
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'expirations': 0,
+            'cleanups': 0
+        }
+
+    def _store(self, key: Any, entry: TTLEntry) -> None:
+        """Insert or replace an entry and mark it most recently used."""
+        now = time.time()
+        if key in self._cache:
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+        else:
+            self._expire_batch(now, _EXPIRE_ON_WRITE)
+            if len(self._cache) >= self.capacity:
+                self._evict_one()
+            self._cache[key] = entry
+
+        heapq.heappush(self._expiry_heap, (entry.expires_at, next(self._heap_seq), key, entry))
+        self._maybe_compact_heap()
+
+    def _lookup(self, key: Any) -> Optional[TTLEntry]:
+        """Return the live entry for key (marking it used), dropping it if expired."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if entry.is_expired():
+            del self._cache[key]
+            self._stats['expirations'] += 1
+            return None
+        self._cache.move_to_end(key)
+        return entry
+
+    def _discard(self, key: Any) -> bool:
+        """Remove key; its heap record becomes stale and is skipped later."""
+        return self._cache.pop(key, None) is not None
+
+    def _evict_one(self) -> None:
+        """Make room for one entry: drop an expired entry if any, else the LRU entry."""
+        if self._expire_batch(time.time(), 1):
+            return
+        if self._cache:
+            self._cache.popitem(last=False)
+            self._stats['evictions'] += 1
+
+    def _expire_batch(self, now: float, limit: int) -> int:
+        """
+        Remove up to limit expired entries, earliest expiry first.
+
+        Returns:
+            Number of live entries removed
+        """
+        heap = self._expiry_heap
+        cache = self._cache
+        removed = 0
+        while heap and heap[0][0] <= now and removed < limit:
+            _, _, key, entry = heapq.heappop(heap)
+            if cache.get(key) is entry:
+                del cache[key]
+                removed += 1
+        self._stats['expirations'] += removed
+        return removed
+
+    def _has_expired(self, now: float) -> bool:
+        """Check whether the earliest heap record is due."""
+        return bool(self._expiry_heap) and self._expiry_heap[0][0] <= now
+
+    def _maybe_compact_heap(self) -> None:
+        """Rebuild the heap from live entries when stale records dominate."""
+        if len(self._expiry_heap) > _HEAP_COMPACT_FACTOR * len(self._cache) + 64:
+            seq = self._heap_seq
+            self._expiry_heap = [
+                (entry.expires_at, next(seq), key, entry)
+                for key, entry in self._cache.items()
+            ]
+            heapq.heapify(self._expiry_heap)
+
+    def _get_many(self, keys: List[Any]) -> Dict[Any, Any]:
+        """Look up several keys at once, counting hits and misses."""
+        results = {}
+        lookup = self._lookup
+        for key in keys:
+            entry = lookup(key)
+            if entry is not None:
+                entry.access_count += 1
+                results[key] = entry.value
+        if self._shared_stats:
+            self._stats['hits'] += len(results)
+            self._stats['misses'] += len(keys) - len(results)
+        elif self._thread_stats is not None:
+            counters = self._thread_stats.local
+            counters.hits += len(results)
+            counters.misses += len(keys) - len(results)
+        return results
+
+    def _put_many(self, items: Dict[Any, Any], ttl: Optional[float]) -> int:
+        """Store several values sharing one expiry time."""
+        expires_at = time.time() + (ttl if ttl is not None else self.ttl)
+        for key, value in items.items():
+            self._store(key, TTLEntry(value=value, expires_at=expires_at))
+        return len(items)
+
+    def _delete_many(self, keys: List[Any]) -> int:
+        """Remove several keys; returns how many were present."""
+        discard = self._discard
+        return sum(1 for key in keys if discard(key))
+
+    def _clear_storage(self) -> None:
+        """Drop all entries and heap records."""
+        self._cache.clear()
+        self._expiry_heap.clear()
+
+    def _live_items(self) -> List[Tuple[Any, TTLEntry]]:
+        """Non-expired (key, entry) pairs in LRU order (least recent first)."""
+        now = time.time()
+        return [(key, entry) for key, entry in self._cache.items() if entry.expires_at > now]
+
+    def _build_stats(self) -> Dict[str, Any]:
+        """Build statistics dictionary."""
+        hits = self._stats['hits']
+        misses = self._stats['misses']
+        if self._thread_stats is not None:
+            totals = self._thread_stats.totals()
+            hits += totals.hits
+            misses += totals.misses
+        total_requests = hits + misses
+        hit_rate = hits / total_requests if total_requests > 0 else 0.0
+
+        return {
+            'name': self.name,
+            'capacity': self.capacity,
+            'size': len(self._cache),
+            'ttl': self.ttl,
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hit_rate,
+            'evictions': self._stats['evictions'],
+            'expirations': self._stats['expirations'],
+            'cleanups': self._stats['cleanups'],
+            'stats_mode': self.stats_mode.value,
+        }
+
+
+class TTLCache(_TTLStorage, ACache):
     """
     Production-grade Time-To-Live cache with automatic expiration.
-    
+
     Features:
     - Automatic expiration based on TTL
-    - LRU eviction when capacity is reached
+    - LRU eviction when capacity is reached (expired entries are reclaimed first)
     - Thread-safe operations
-    - Statistics tracking
-    - Background cleanup
+    - Statistics tracking (shared, per-thread or disabled)
+    - Background cleanup in bounded incremental batches
     - Configurable cleanup intervals
     """
-    
-    def __init__(self, 
-                 capacity: int = 128, 
+
+    def __init__(self,
+                 capacity: int = 128,
                  ttl: float = 300.0,
                  cleanup_interval: float = 60.0,
-                 name: str = "ttl_cache"):
+                 name: str = "ttl_cache",
+                 cleanup_batch_size: int = DEFAULT_CLEANUP_BATCH_SIZE,
+                 stats: Union[StatsMode, str] = StatsMode.SHARED):
         """
         Initialize TTL cache.
-        
+
         Args:
             capacity: Maximum number of entries
             ttl: Time to live in seconds
             cleanup_interval: Cleanup interval in seconds
             name: Cache name for debugging
+            cleanup_batch_size: Maximum expired entries removed per lock hold
+            stats: Hit/miss statistics mode (shared, per_thread or disabled)
         """
         if capacity <= 0:
             raise ValueError(
                 f"Cache capacity must be positive, got {capacity}. "
                 f"Example: TTLCache(capacity=128, ttl=300.0)"
             )
-        
+
         # Call parent constructor
         super().__init__(capacity=capacity, ttl=int(ttl))
-        
+
+        # Keep sub-second precision for the default TTL
+        self.ttl = ttl
         self.cleanup_interval = cleanup_interval
+        self.cleanup_batch_size = max(1, cleanup_batch_size)
         self.name = name
-        
-        # Storage
-        self._cache: Dict[str, TTLEntry] = {}
-        self._access_order = []  # For LRU tracking
-        
+
+        # Storage (OrderedDict LRU + expiry heap)
+        self._init_storage()
+        StatsModeMixin._init_stats_mode(self, stats)
+
         # Thread safety
         self._lock = threading.RLock()
-        
-        # Statistics
-        self._stats = {
-            'hits': 0,
-            'misses': 0,
-            'evictions': 0,
-            'expirations': 0,
-            'cleanups': 0
-        }
-        
+
         # Background cleanup
         self._cleanup_thread = None
         self._shutdown = threading.Event()
         self._start_cleanup_thread()
-    
+
     def _start_cleanup_thread(self):
         """Start background cleanup thread."""
         if self.cleanup_interval > 0:
@@ -112,7 +302,7 @@ class TTLCache(ACache):
                 daemon=True
             )
             self._cleanup_thread.start()
-    
+
     def _cleanup_loop(self):
         """Background cleanup loop."""
         while not self._shutdown.wait(self.cleanup_interval):
@@ -120,52 +310,51 @@ class TTLCache(ACache):
                 self._cleanup_expired()
             except Exception as e:
                 logger.error(f"TTL cache cleanup error: {e}")
-    
-    def _cleanup_expired(self):
-        """Remove expired entries."""
-        with self._lock:
-            current_time = time.time()
-            expired_keys = []
-            
-            for key, entry in self._cache.items():
-                if entry.expires_at <= current_time:
-                    expired_keys.append(key)
-            
-            for key in expired_keys:
-                del self._cache[key]
-                if key in self._access_order:
-                    self._access_order.remove(key)
-                self._stats['expirations'] += 1
-            
-            if expired_keys:
+
+    def _cleanup_expired(self) -> int:
+        """
+        Remove expired entries in bounded batches.
+
+        Only entries at the head of the expiry heap are visited, and the lock
+        is released after every cleanup_batch_size removals so readers and
+        writers are never stalled for a full pass.
+
+        Returns:
+            Number of entries removed
+        """
+        total = 0
+        while not self._shutdown.is_set():
+            with self._lock:
+                now = time.time()
+                removed = self._expire_batch(now, self.cleanup_batch_size)
+                total += removed
+                more = self._has_expired(now)
+                if not more:
+                    self._maybe_compact_heap()
+            if not more:
+                break
+
+        if total:
+            with self._lock:
                 self._stats['cleanups'] += 1
-                logger.debug(f"TTL cache '{self.name}' cleaned up {len(expired_keys)} expired entries")
-    
+            logger.debug(f"TTL cache '{self.name}' cleaned up {total} expired entries")
+        return total
+
     def _evict_lru(self):
         """Evict least recently used entry."""
-        if not self._access_order:
-            return
-        
-        lru_key = self._access_order.pop(0)
-        if lru_key in self._cache:
-            del self._cache[lru_key]
+        if self._cache:
+            self._cache.popitem(last=False)
             self._stats['evictions'] += 1
-    
-    def _update_access_order(self, key: str):
-        """Update LRU access order."""
-        if key in self._access_order:
-            self._access_order.remove(key)
-        self._access_order.append(key)
-    
+
     def put(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
         """
         Store a value in the cache.
-        
+
         Args:
             key: Cache key
             value: Value to store
             ttl: Custom TTL for this entry (overrides default)
-            
+
         Returns:
             True if stored successfully
         """
@@ -173,107 +362,139 @@ class TTLCache(ACache):
             try:
                 # Use custom TTL or default
                 entry_ttl = ttl if ttl is not None else self.ttl
-                expires_at = time.time() + entry_ttl
-                
-                # Create entry
-                entry = TTLEntry(value=value, expires_at=expires_at)
-                
-                # Check if we need to make space
-                if key not in self._cache and len(self._cache) >= self.capacity:
-                    self._evict_lru()
-                
-                # Store entry
-                self._cache[key] = entry
-                self._update_access_order(key)
-                
-                logger.debug(f"TTL cache '{self.name}' stored key '{key}' (expires in {entry_ttl}s)")
+                entry = TTLEntry(value=value, expires_at=time.time() + entry_ttl)
+
+                self._store(key, entry)
+
+                if logger.isEnabledFor(_DEBUG):
+                    logger.debug(f"TTL cache '{self.name}' stored key '{key}' (expires in {entry_ttl}s)")
                 return True
-                
+
             except Exception as e:
                 logger.error(f"TTL cache put error: {e}")
                 return False
-    
+
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """
         Set value in cache (abstract method implementation).
         Delegates to put() for backward compatibility.
-        
+
         Args:
             key: Key to store
             value: Value to store
             ttl: Optional time-to-live in seconds
         """
         self.put(key, value, float(ttl) if ttl is not None else None)
-    
+
     def get(self, key: str, default: Any = None) -> Any:
         """
         Retrieve a value from the cache.
-        
+
         Args:
             key: Cache key
             default: Default value if key not found
-            
+
         Returns:
             Cached value or default
         """
         with self._lock:
-            if key not in self._cache:
-                self._stats['misses'] += 1
+            entry = self._lookup(key)
+            if entry is None:
+                if self._shared_stats:
+                    self._stats['misses'] += 1
+                elif self._thread_stats is not None:
+                    self._thread_stats.local.misses += 1
                 return default
-            
-            entry = self._cache[key]
-            
-            # Check if expired
-            if entry.is_expired():
-                del self._cache[key]
-                if key in self._access_order:
-                    self._access_order.remove(key)
-                self._stats['misses'] += 1
-                self._stats['expirations'] += 1
-                return default
-            
-            # Update access tracking
-            entry.touch()
-            self._update_access_order(key)
-            self._stats['hits'] += 1
-            
+
+            entry.access_count += 1
+            if self._shared_stats:
+                self._stats['hits'] += 1
+            elif self._thread_stats is not None:
+                self._thread_stats.local.hits += 1
             return entry.value
-    
+
     def delete(self, key: str) -> bool:
         """
         Delete a key from the cache.
-        
+
         Args:
             key: Cache key to delete
-            
+
         Returns:
             True if key was deleted
         """
         with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                if key in self._access_order:
-                    self._access_order.remove(key)
-                return True
-            return False
-    
+            return self._discard(key)
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Retrieve several values with a single lock acquisition.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Dictionary of keys found (and not expired) to their values
+        """
+        if type(self).get is not TTLCache.get:
+            # Subclass get() adds behavior (refresh, validation...): honor it
+            return super().get_many(keys)
+        with self._lock:
+            return self._get_many(keys)
+
+    def put_many(self, items: Dict[str, Any], ttl: Optional[float] = None) -> int:
+        """
+        Store several values with a single lock acquisition.
+
+        Args:
+            items: Key-value pairs to store
+            ttl: Custom TTL for these entries (overrides default)
+
+        Returns:
+            Number of entries stored
+        """
+        if type(self).put is not TTLCache.put:
+            if ttl is None:
+                return super().put_many(items)
+            with self._lock:
+                return sum(1 for key, value in items.items() if self.put(key, value, ttl) is not False)
+        with self._lock:
+            count = self._put_many(items, ttl)
+        if logger.isEnabledFor(_DEBUG):
+            logger.debug(f"TTL cache '{self.name}' stored {count} keys")
+        return count
+
+    def delete_many(self, keys: List[str]) -> int:
+        """
+        Delete several keys with a single lock acquisition.
+
+        Args:
+            keys: Cache keys to delete
+
+        Returns:
+            Number of keys deleted
+        """
+        if type(self).delete is not TTLCache.delete:
+            return super().delete_many(keys)
+        with self._lock:
+            return self._delete_many(keys)
+
     def clear(self):
         """Clear all entries from the cache."""
         with self._lock:
-            self._cache.clear()
-            self._access_order.clear()
+            self._clear_storage()
             logger.debug(f"TTL cache '{self.name}' cleared")
-    
+
     def size(self) -> int:
         """Get current cache size."""
         with self._lock:
             return len(self._cache)
-    
+
     def is_full(self) -> bool:
         """Check if cache is at capacity."""
         with self._lock:
             return len(self._cache) >= self.capacity
-    
+
     def evict(self) -> None:
         """
         Evict entry from cache (uses LRU strategy).
@@ -281,119 +502,108 @@ class TTLCache(ACache):
         """
         with self._lock:
             self._evict_lru()
-    
+
     def contains(self, key: str) -> bool:
         """Check if key exists and is not expired."""
         with self._lock:
-            if key not in self._cache:
+            entry = self._cache.get(key)
+            if entry is None:
                 return False
-            
-            entry = self._cache[key]
             if entry.is_expired():
                 del self._cache[key]
-                if key in self._access_order:
-                    self._access_order.remove(key)
                 self._stats['expirations'] += 1
                 return False
-            
             return True
-    
+
+    def keys(self) -> list:
+        """Get list of all non-expired keys (in LRU order)."""
+        with self._lock:
+            return [key for key, _ in self._live_items()]
+
+    def values(self) -> list:
+        """Get list of all non-expired values (in LRU order)."""
+        with self._lock:
+            return [entry.value for _, entry in self._live_items()]
+
+    def items(self) -> list:
+        """Get list of all non-expired key-value pairs (in LRU order)."""
+        with self._lock:
+            return [(key, entry.value) for key, entry in self._live_items()]
+
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
         with self._lock:
-            total_requests = self._stats['hits'] + self._stats['misses']
-            hit_rate = self._stats['hits'] / total_requests if total_requests > 0 else 0.0
-            
-            return {
-                'name': self.name,
-                'capacity': self.capacity,
-                'size': len(self._cache),
-                'ttl': self.ttl,
-                'hits': self._stats['hits'],
-                'misses': self._stats['misses'],
-                'hit_rate': hit_rate,
-                'evictions': self._stats['evictions'],
-                'expirations': self._stats['expirations'],
-                'cleanups': self._stats['cleanups']
-            }
-    
+            return self._build_stats()
+
     def get_remaining_ttl(self, key: str) -> Optional[float]:
         """Get remaining TTL for a key."""
         with self._lock:
             if key not in self._cache:
                 return None
-            
+
             entry = self._cache[key]
             remaining = entry.expires_at - time.time()
             return max(0, remaining) if remaining > 0 else None
-    
+
     def shutdown(self):
         """Shutdown the cache and cleanup thread."""
         self._shutdown.set()
         if self._cleanup_thread and self._cleanup_thread.is_alive():
             self._cleanup_thread.join(timeout=1.0)
-    
+
     def __del__(self):
         """Cleanup on deletion."""
         self.shutdown()
-    
+
     def __enter__(self):
         """Context manager entry."""
         return self
-    
+
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.shutdown()
 
 
-class AsyncTTLCache:
+class AsyncTTLCache(_TTLStorage):
     """
     Async-compatible TTL cache.
-    
+
     Features:
     - Full asyncio integration
     - Automatic expiration
-    - Async cleanup tasks
+    - Async cleanup tasks in bounded incremental batches
     - Thread-safe operations
     """
-    
-    def __init__(self, 
-                 capacity: int = 128, 
+
+    def __init__(self,
+                 capacity: int = 128,
                  ttl: float = 300.0,
                  cleanup_interval: float = 60.0,
-                 name: str = "async_ttl_cache"):
+                 name: str = "async_ttl_cache",
+                 cleanup_batch_size: int = DEFAULT_CLEANUP_BATCH_SIZE):
         """Initialize async TTL cache."""
         self.capacity = capacity
         self.ttl = ttl
         self.cleanup_interval = cleanup_interval
+        self.cleanup_batch_size = max(1, cleanup_batch_size)
         self.name = name
-        
-        # Storage
-        self._cache: Dict[str, TTLEntry] = {}
-        self._access_order = []
-        
+
+        # Storage (OrderedDict LRU + expiry heap)
+        self._init_storage()
+
         # Async synchronization
         self._lock = asyncio.Lock()
-        
-        # Statistics
-        self._stats = {
-            'hits': 0,
-            'misses': 0,
-            'evictions': 0,
-            'expirations': 0,
-            'cleanups': 0
-        }
-        
+
         # Background cleanup task
         self._cleanup_task = None
         self._shutdown = False
         self._start_cleanup_task()
-    
+
     def _start_cleanup_task(self):
         """Start background cleanup task."""
         if self.cleanup_interval > 0:
             self._cleanup_task = asyncio.create_task(self._cleanup_loop())
-    
+
     async def _cleanup_loop(self):
         """Background cleanup loop."""
         while not self._shutdown:
@@ -405,133 +615,115 @@ class AsyncTTLCache:
                 break
             except Exception as e:
                 logger.error(f"Async TTL cache cleanup error: {e}")
-    
-    async def _cleanup_expired(self):
-        """Remove expired entries."""
-        async with self._lock:
-            current_time = time.time()
-            expired_keys = []
-            
-            for key, entry in self._cache.items():
-                if entry.expires_at <= current_time:
-                    expired_keys.append(key)
-            
-            for key in expired_keys:
-                del self._cache[key]
-                if key in self._access_order:
-                    self._access_order.remove(key)
-                self._stats['expirations'] += 1
-            
-            if expired_keys:
-                self._stats['cleanups'] += 1
-                logger.debug(f"Async TTL cache '{self.name}' cleaned up {len(expired_keys)} expired entries")
-    
+
+    async def _cleanup_expired(self) -> int:
+        """
+        Remove expired entries in bounded batches.
+
+        Yields to the event loop between batches so other coroutines are not
+        starved while a large number of entries expire at once.
+
+        Returns:
+            Number of entries removed
+        """
+        total = 0
+        while not self._shutdown:
+            async with self._lock:
+                now = time.time()
+                removed = self._expire_batch(now, self.cleanup_batch_size)
+                total += removed
+                more = self._has_expired(now)
+                if not more:
+                    self._maybe_compact_heap()
+            if not more:
+                break
+            await asyncio.sleep(0)
+
+        if total:
+            self._stats['cleanups'] += 1
+            logger.debug(f"Async TTL cache '{self.name}' cleaned up {total} expired entries")
+        return total
+
     async def put(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
         """Store a value in the async cache."""
         async with self._lock:
             try:
                 # Use custom TTL or default
                 entry_ttl = ttl if ttl is not None else self.ttl
-                expires_at = time.time() + entry_ttl
-                
-                # Create entry
-                entry = TTLEntry(value=value, expires_at=expires_at)
-                
-                # Check if we need to make space
-                if key not in self._cache and len(self._cache) >= self.capacity:
-                    await self._evict_lru()
-                
-                # Store entry
-                self._cache[key] = entry
-                self._update_access_order(key)
-                
+                entry = TTLEntry(value=value, expires_at=time.time() + entry_ttl)
+
+                self._store(key, entry)
                 return True
-                
+
             except Exception as e:
                 logger.error(f"Async TTL cache put error: {e}")
                 return False
-    
+
     async def get(self, key: str, default: Any = None) -> Any:
         """Retrieve a value from the async cache."""
         async with self._lock:
-            if key not in self._cache:
+            entry = self._lookup(key)
+            if entry is None:
                 self._stats['misses'] += 1
                 return default
-            
-            entry = self._cache[key]
-            
-            # Check if expired
-            if entry.is_expired():
-                del self._cache[key]
-                if key in self._access_order:
-                    self._access_order.remove(key)
-                self._stats['misses'] += 1
-                self._stats['expirations'] += 1
-                return default
-            
-            # Update access tracking
+
             entry.touch()
-            self._update_access_order(key)
             self._stats['hits'] += 1
-            
             return entry.value
-    
+
     async def delete(self, key: str) -> bool:
         """Delete a key from the async cache."""
         async with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                if key in self._access_order:
-                    self._access_order.remove(key)
-                return True
-            return False
-    
+            return self._discard(key)
+
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Retrieve several values with a single lock acquisition."""
+        if type(self).get is not AsyncTTLCache.get:
+            # asyncio.Lock is not reentrant: go through the subclass get()
+            results = {}
+            for key in keys:
+                value = await self.get(key)
+                if value is not None:
+                    results[key] = value
+            return results
+        async with self._lock:
+            return self._get_many(keys)
+
+    async def put_many(self, items: Dict[str, Any], ttl: Optional[float] = None) -> int:
+        """Store several values with a single lock acquisition."""
+        if type(self).put is not AsyncTTLCache.put:
+            for key, value in items.items():
+                await self.put(key, value, ttl)
+            return len(items)
+        async with self._lock:
+            return self._put_many(items, ttl)
+
+    async def delete_many(self, keys: List[str]) -> int:
+        """Delete several keys with a single lock acquisition."""
+        async with self._lock:
+            return self._delete_many(keys)
+
     async def clear(self):
         """Clear all entries from the async cache."""
         async with self._lock:
-            self._cache.clear()
-            self._access_order.clear()
-    
+            self._clear_storage()
+
     async def size(self) -> int:
         """Get current cache size."""
         async with self._lock:
             return len(self._cache)
-    
+
     async def get_stats(self) -> Dict[str, Any]:
         """Get async cache statistics."""
         async with self._lock:
-            total_requests = self._stats['hits'] + self._stats['misses']
-            hit_rate = self._stats['hits'] / total_requests if total_requests > 0 else 0.0
-            
-            return {
-                'name': self.name,
-                'capacity': self.capacity,
-                'size': len(self._cache),
-                'ttl': self.ttl,
-                'hits': self._stats['hits'],
-                'misses': self._stats['misses'],
-                'hit_rate': hit_rate,
-                'evictions': self._stats['evictions'],
-                'expirations': self._stats['expirations'],
-                'cleanups': self._stats['cleanups']
-            }
-    
+            return self._build_stats()
+
     async def _evict_lru(self):
         """Evict least recently used entry."""
-        if not self._access_order:
-            return
-        
-        lru_key = self._access_order.pop(0)
-        if lru_key in self._cache:
-            del self._cache[lru_key]
+        if self._cache:
+            self._cache.popitem(last=False)
             self._stats['evictions'] += 1
-    
-    def _update_access_order(self, key: str):
-        """Update LRU access order."""
-        if key in self._access_order:
-            self._access_order.remove(key)
-        self._access_order.append(key)
-    
+
     async def shutdown(self):
         """Shutdown the async cache."""
         self._shutdown = True
@@ -541,11 +733,11 @@ class AsyncTTLCache:
                 await self._cleanup_task
             except asyncio.CancelledError:
                 pass
-    
+
     async def __aenter__(self):
         """Async context manager entry."""
         return self
-    
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
         await self.shutdown()
@@ -7,18 +7,76 @@ Version: 0.0.1.409
 Generation Date: October 26, 2025
 
 Two-tier cache implementation combining memory and disk caching.
+
+Concurrency:
+    - Memory-tier hits take no TwoTierCache lock (only the LRU's own lock)
+    - Disk-tier reads and writes hold a lock striped by key, so a slow disk
+      operation only stalls other disk-path operations on the same stripe
+    - With write_behind=True, disk writes are queued and written in batches
+      by a background thread (queued values stay readable)
+    - A TierAdmissionPolicy decides which writes enter memory and when disk
+      hits are promoted (e.g. PromoteAfterHits(2))
 """
 
+import asyncio
+import functools
 import threading
-from typing import Any, Optional, Dict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from .lru_cache import LRUCache
-from .disk_cache import DiskCache
+from .disk_cache import DEFAULT_IO_WORKERS, DiskCache
 from .contracts import ICache
 from .errors import CacheError
 from ..config.logging_setup import get_logger
 
 logger = get_logger("xwsystem.caching.two_tier_cache")
 
+# Number of per-key lock stripes guarding disk-tier operations
+DEFAULT_LOCK_STRIPES = 64
+
+
+class TierAdmissionPolicy:
+    """
+    Decides how entries move between the memory and disk tiers.
+    
+    The base policy admits every write into memory and promotes a disk
+    entry on its first hit (the historical TwoTierCache behavior).
+    """
+    
+    def admit_write(self, key: str, value: Any) -> bool:
+        """Whether set() stores the value in the memory tier (else memory drops the key)."""
+        return True
+    
+    def should_promote(self, key: str, disk_hits: int) -> bool:
+        """Whether a key's disk_hits-th disk hit promotes it into memory."""
+        return True
+
+
+class PromoteAfterHits(TierAdmissionPolicy):
+    """
+    Promote a key into memory only after N disk hits.
+    
+    Keeps one-off reads of cold keys from evicting the hot memory working set.
+    """
+    
+    def __init__(self, hits: int = 2, admit_writes: bool = True):
+        """
+        Args:
+            hits: Disk hits before a key is promoted
+            admit_writes: Whether set() also writes to the memory tier
+        """
+        if hits <= 0:
+            raise ValueError(f"hits must be positive, got {hits}")
+        self.hits = hits
+        self.admit_writes = admit_writes
+    
+    def admit_write(self, key: str, value: Any) -> bool:
+        return self.admit_writes
+    
+    def should_promote(self, key: str, disk_hits: int) -> bool:
+        return disk_hits >= self.hits
+
 
 class TwoTierCache(ICache):
     """
@@ -27,8 +85,9 @@ class TwoTierCache(ICache):
     Features:
     - Memory tier: Fast LRU cache for hot data
     - Disk tier: Persistent storage for cold data
-    - Automatic promotion from disk to memory on hit
-    - Write-through to both tiers
+    - Promotion from disk to memory on hit, per the admission policy
+    - Write-through to both tiers, or deferred disk writes (write_behind)
+    - Memory hits never wait on disk I/O (per-key locks for the disk path)
     - Namespace support for multiple cache instances
     - Comprehensive statistics for both tiers
     """
@@ -40,6 +99,11 @@ class TwoTierCache(ICache):
         disk_size: int = 10000,
         disk_cache_dir: Optional[str] = None,
         max_file_size: int = 10 * 1024 * 1024,  # 10MB
+        admission: Optional[TierAdmissionPolicy] = None,
+        write_behind: bool = False,
+        flush_interval: float = 1.0,
+        write_batch_size: int = 1000,
+        lock_stripes: int = DEFAULT_LOCK_STRIPES,
     ):
         """
         Initialize two-tier cache.
@@ -50,8 +114,20 @@ class TwoTierCache(ICache):
             disk_size: Maximum entries in disk tier
             disk_cache_dir: Custom disk cache directory
             max_file_size: Maximum size per disk cache file
+            admission: Tier admission policy (default: admit and promote all)
+            write_behind: Queue disk writes for a background writer thread
+            flush_interval: Max seconds a queued disk write waits
+            write_batch_size: Queued writes that wake the writer early
+            lock_stripes: Number of per-key lock stripes for the disk path
         """
+        if lock_stripes <= 0:
+            raise ValueError(f"lock_stripes must be positive, got {lock_stripes}")
+        
         self.namespace = namespace
+        self.admission = admission or TierAdmissionPolicy()
+        self.write_behind = write_behind
+        self.flush_interval = flush_interval
+        self.write_batch_size = write_batch_size
         
         # Initialize tiers
         # Root cause fixed: LRUCache uses 'capacity' parameter, not 'maxsize'
@@ -63,8 +139,21 @@ class TwoTierCache(ICache):
             max_file_size=max_file_size,
         )
         
-        # Thread safety
-        self._lock = threading.RLock()
+        # Thread safety: disk-path locks striped by key, plus a stats lock
+        self._key_locks = [threading.RLock() for _ in range(lock_stripes)]
+        self._stats_lock = threading.Lock()
+        
+        # Disk hits per key, for policies that promote after N hits
+        self._disk_hit_counts = LRUCache(capacity=max(memory_size, 1))
+        
+        # Deferred disk writes: key -> (value, ttl)
+        self._pending: Dict[str, Tuple[Any, Optional[int]]] = {}
+        self._flushing: Dict[str, Tuple[Any, Optional[int]]] = {}
+        self._pending_cond = threading.Condition(threading.Lock())
+        # Orders deferred writes against deletes and clears
+        self._flush_lock = threading.Lock()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._stop_writer = False
         
         # Statistics
         self._stats = {
@@ -74,128 +163,416 @@ class TwoTierCache(ICache):
             'sets': 0,
             'deletes': 0,
             'promotions': 0,  # Disk to memory promotions
+            'deferred_writes': 0,
+            'disk_write_errors': 0,
         }
+        
+        if write_behind:
+            self._writer_thread = threading.Thread(
+                target=self._background_writer,
+                daemon=True,
+                name=f"xwsystem-two-tier-{namespace}-writer",
+            )
+            self._writer_thread.start()
+    
+    # ------------------------------------------------------------------
+    # Locking and bookkeeping helpers
+    # ------------------------------------------------------------------
+    
+    def _key_lock(self, key: str) -> threading.RLock:
+        return self._key_locks[hash(key) % len(self._key_locks)]
+    
+    def _lock_keys(self, keys) -> ExitStack:
+        """Hold the stripes of several keys (acquired in index order: no deadlock)."""
+        stack = ExitStack()
+        stripes = len(self._key_locks)
+        for index in sorted({hash(key) % stripes for key in keys}):
+            stack.enter_context(self._key_locks[index])
+        return stack
+    
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[name] += amount
+    
+    def _should_promote(self, key: str) -> bool:
+        """Record a disk hit for key and ask the admission policy."""
+        hits = (self._disk_hit_counts.get(key) or 0) + 1
+        if self.admission.should_promote(key, hits):
+            self._disk_hit_counts.delete(key)
+            return True
+        self._disk_hit_counts.put(key, hits)
+        return False
+    
+    def _pending_values(self, keys: List[str]) -> Dict[str, Any]:
+        """Queued (not yet written) disk values for keys."""
+        if not self.write_behind:
+            return {}
+        found = {}
+        with self._pending_cond:
+            for key in keys:
+                entry = self._pending.get(key) or self._flushing.get(key)
+                if entry is not None:
+                    found[key] = entry[0]
+        return found
+    
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
     
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache (memory first, then disk)."""
-        with self._lock:
-            try:
-                # Try memory tier first
+        value = self._get_from_memory(key)
+        if value is not None:
+            return value
+        return self._get_from_disk(key)
+    
+    def _get_from_memory(self, key: str) -> Optional[Any]:
+        value = self.memory_cache.get(key)
+        if value is not None:
+            self._count('memory_hits')
+        return value
+    
+    def _get_from_disk(self, key: str) -> Optional[Any]:
+        """Disk-tier read under the key's stripe lock (memory already missed)."""
+        try:
+            with self._key_lock(key):
+                # Another thread may have promoted it while we waited
                 value = self.memory_cache.get(key)
                 if value is not None:
-                    self._stats['memory_hits'] += 1
+                    self._count('memory_hits')
                     return value
                 
-                # Try disk tier
-                value = self.disk_cache.get(key)
-                if value is not None:
-                    # Promote to memory tier
-                    self.memory_cache.set(key, value)
-                    self._stats['disk_hits'] += 1
+                value = self._pending_values([key]).get(key)
+                if value is None:
+                    value = self.disk_cache.get(key)
+                if value is None:
+                    # Miss in both tiers
+                    self._count('misses')
+                    return None
+                
+                promoted = self._should_promote(key)
+                if promoted:
+                    self.memory_cache.put(key, value)
+            
+            with self._stats_lock:
+                self._stats['disk_hits'] += 1
+                if promoted:
                     self._stats['promotions'] += 1
-                    return value
+            return value
+        
+        except Exception as e:
+            logger.error(f"Two-tier cache get failed for key {key}: {e}")
+            self._count('misses')
+            return None
+    
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Get several values: one memory batch, one disk batch for the misses,
+        then one bulk promotion of the admitted disk hits into memory.
+        """
+        results = self._get_many_from_memory(keys)
+        misses = [key for key in keys if key not in results]
+        if misses:
+            results.update(self._get_many_from_disk(misses))
+        return results
+    
+    def _get_many_from_memory(self, keys: List[str]) -> Dict[str, Any]:
+        results = self.memory_cache.get_many(keys)
+        if results:
+            self._count('memory_hits', len(results))
+        return results
+    
+    def _get_many_from_disk(self, keys: List[str]) -> Dict[str, Any]:
+        """Disk-tier batch read under the stripes of keys (memory already missed)."""
+        try:
+            with self._lock_keys(keys):
+                results = self.memory_cache.get_many(keys)
+                memory_hits = len(results)
                 
-                # Miss in both tiers
-                self._stats['misses'] += 1
-                return None
+                rest = [key for key in keys if key not in results]
+                disk_results = self._pending_values(rest)
+                unqueued = [key for key in rest if key not in disk_results]
+                if unqueued:
+                    disk_results.update(self.disk_cache.get_many(unqueued))
                 
-            except Exception as e:
-                logger.error(f"Two-tier cache get failed for key {key}: {e}")
-                self._stats['misses'] += 1
-                return None
+                promote = {key: value for key, value in disk_results.items() if self._should_promote(key)}
+                if promote:
+                    self.memory_cache.put_many(promote)
+                results.update(disk_results)
+            
+            with self._stats_lock:
+                self._stats['memory_hits'] += memory_hits
+                self._stats['disk_hits'] += len(disk_results)
+                self._stats['promotions'] += len(promote)
+                self._stats['misses'] += len(keys) - len(results)
+            return results
+        
+        except Exception as e:
+            logger.error(f"Two-tier cache get_many failed: {e}")
+            self._count('misses', len(keys))
+            return {}
+    
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
     
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
-        """Set value in both memory and disk tiers."""
-        with self._lock:
-            try:
-                # Set in memory tier
-                memory_success = self.memory_cache.set(key, value)
+        """Set value in the memory tier (if admitted) and the disk tier."""
+        try:
+            with self._key_lock(key):
+                if self.admission.admit_write(key, value):
+                    self.memory_cache.put(key, value)
+                else:
+                    # Demote: a stale memory copy must not outlive the write
+                    self.memory_cache.delete(key)
                 
-                # Set in disk tier
-                disk_success = self.disk_cache.set(key, value, ttl)
-                
-                if memory_success or disk_success:
-                    self._stats['sets'] += 1
-                    return True
-                
-                return False
+                if self.write_behind:
+                    self._enqueue({key: value}, ttl)
+                    disk_success = True
+                else:
+                    disk_success = self.disk_cache.set(key, value, ttl)
+            
+            if disk_success:
+                self._count('sets')
+                return True
+            
+            return False
+        
+        except Exception as e:
+            logger.error(f"Two-tier cache set failed for key {key}: {e}")
+            return False
+    
+    def put_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> int:
+        """Set several values in both tiers (one batch per tier)."""
+        try:
+            with self._lock_keys(items):
+                admitted = {key: value for key, value in items.items()
+                            if self.admission.admit_write(key, value)}
+                if admitted:
+                    self.memory_cache.put_many(admitted)
+                if len(admitted) < len(items):
+                    self.memory_cache.delete_many([key for key in items if key not in admitted])
                 
-            except Exception as e:
-                logger.error(f"Two-tier cache set failed for key {key}: {e}")
-                return False
+                if self.write_behind:
+                    self._enqueue(items, ttl)
+                else:
+                    self.disk_cache.put_many(items, ttl)
+            
+            self._count('sets', len(items))
+            return len(items)
+        
+        except Exception as e:
+            logger.error(f"Two-tier cache put_many failed: {e}")
+            return 0
     
     def delete(self, key: str) -> bool:
         """Delete value from both tiers."""
-        with self._lock:
-            try:
+        try:
+            with self._key_lock(key):
                 memory_deleted = self.memory_cache.delete(key)
-                disk_deleted = self.disk_cache.delete(key)
-                
-                if memory_deleted or disk_deleted:
-                    self._stats['deletes'] += 1
-                    return True
-                
-                return False
-                
-            except Exception as e:
-                logger.error(f"Two-tier cache delete failed for key {key}: {e}")
-                return False
+                disk_deleted = self._delete_from_disk([key]) > 0
+            
+            if memory_deleted or disk_deleted:
+                self._count('deletes')
+                return True
+            
+            return False
+        
+        except Exception as e:
+            logger.error(f"Two-tier cache delete failed for key {key}: {e}")
+            return False
+    
+    def delete_many(self, keys: List[str]) -> int:
+        """Delete several keys from both tiers."""
+        try:
+            with self._lock_keys(keys):
+                # Writes go to both tiers, so the larger count covers the union
+                memory_deleted = self.memory_cache.delete_many(keys)
+                disk_deleted = self._delete_from_disk(keys)
+            count = max(memory_deleted, disk_deleted)
+            self._count('deletes', count)
+            return count
+        
+        except Exception as e:
+            logger.error(f"Two-tier cache delete_many failed: {e}")
+            return 0
+    
+    def _delete_from_disk(self, keys: List[str]) -> int:
+        """Drop queued writes for keys and delete them from disk (stripes held)."""
+        if not self.write_behind:
+            return self.disk_cache.delete_many(keys)
+        
+        with self._pending_cond:
+            queued = {key for key in keys if self._pending.pop(key, None) is not None}
+        # Wait out an in-flight batch so it cannot resurrect the keys
+        with self._flush_lock:
+            deleted = self.disk_cache.delete_many(keys)
+        return max(deleted, len(queued))
     
     def clear(self) -> bool:
         """Clear both tiers."""
-        with self._lock:
-            try:
+        try:
+            with self._lock_keys_all(), self._flush_lock:
+                with self._pending_cond:
+                    self._pending.clear()
+                self._disk_hit_counts.clear()
                 memory_cleared = self.memory_cache.clear()
                 disk_cleared = self.disk_cache.clear()
                 
-                return memory_cleared and disk_cleared
-                
+                # LRUCache.clear() returns None
+                return memory_cleared is not False and disk_cleared
+        
+        except Exception as e:
+            logger.error(f"Two-tier cache clear failed: {e}")
+            return False
+    
+    def _lock_keys_all(self) -> ExitStack:
+        stack = ExitStack()
+        for lock in self._key_locks:
+            stack.enter_context(lock)
+        return stack
+    
+    # ------------------------------------------------------------------
+    # Deferred disk writes
+    # ------------------------------------------------------------------
+    
+    def _enqueue(self, items: Dict[str, Any], ttl: Optional[int]) -> None:
+        with self._pending_cond:
+            for key, value in items.items():
+                self._pending[key] = (value, ttl)
+            if len(self._pending) >= self.write_batch_size:
+                self._pending_cond.notify()
+        self._count('deferred_writes', len(items))
+    
+    def flush(self) -> int:
+        """
+        Write queued disk writes now (a no-op without write_behind).
+        
+        Returns:
+            Number of entries written
+        """
+        with self._flush_lock:
+            with self._pending_cond:
+                if not self._pending:
+                    return 0
+                batch, self._pending = self._pending, {}
+                self._flushing = batch
+            
+            # One put_many per distinct TTL
+            by_ttl: Dict[Optional[int], Dict[str, Any]] = {}
+            for key, (value, ttl) in batch.items():
+                by_ttl.setdefault(ttl, {})[key] = value
+            
+            written = 0
+            try:
+                for ttl, items in by_ttl.items():
+                    try:
+                        self.disk_cache.put_many(items, ttl)
+                        written += len(items)
+                    except Exception as e:
+                        logger.error(f"Two-tier cache deferred write of {len(items)} entries failed: {e}")
+                        self._count('disk_write_errors')
+                        with self._pending_cond:
+                            # A newer set() since the swap supersedes the failed value
+                            for key, value in items.items():
+                                self._pending.setdefault(key, (value, ttl))
+            finally:
+                with self._pending_cond:
+                    self._flushing = {}
+            return written
+    
+    def _background_writer(self) -> None:
+        """Background thread draining deferred disk writes."""
+        while True:
+            with self._pending_cond:
+                self._pending_cond.wait_for(
+                    lambda: self._stop_writer or len(self._pending) >= self.write_batch_size,
+                    self.flush_interval,
+                )
+                stop = self._stop_writer
+            try:
+                self.flush()
             except Exception as e:
-                logger.error(f"Two-tier cache clear failed: {e}")
-                return False
+                logger.error(f"Two-tier cache background write error: {e}")
+            if stop:
+                return
+    
+    def close(self) -> None:
+        """Stop the background writer, write queued entries and close the disk tier."""
+        thread = self._writer_thread
+        if thread is not None:
+            with self._pending_cond:
+                self._stop_writer = True
+                self._pending_cond.notify()
+            thread.join(timeout=10.0)
+            self._writer_thread = None
+        self.flush()
+        self.disk_cache.close()
+    
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+    
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
     
     def exists(self, key: str) -> bool:
         """Check if key exists in either tier."""
-        with self._lock:
-            try:
-                return self.memory_cache.exists(key) or self.disk_cache.exists(key)
-                
-            except Exception as e:
-                logger.error(f"Two-tier cache exists check failed for key {key}: {e}")
-                return False
+        try:
+            return (
+                key in self.memory_cache
+                or bool(self._pending_values([key]))
+                or self.disk_cache.exists(key)
+            )
+        
+        except Exception as e:
+            logger.error(f"Two-tier cache exists check failed for key {key}: {e}")
+            return False
     
     def size(self) -> int:
         """Get total size across both tiers."""
-        with self._lock:
-            return self.memory_cache.size() + self.disk_cache.size()
+        return self.memory_cache.size() + self.disk_cache.size()
     
     def get_stats(self) -> Dict[str, Any]:
         """Get comprehensive statistics for both tiers."""
-        with self._lock:
-            memory_stats = self.memory_cache.get_stats()
-            disk_stats = self.disk_cache.get_stats()
-            
-            total_hits = self._stats['memory_hits'] + self._stats['disk_hits']
-            total_requests = total_hits + self._stats['misses']
-            overall_hit_rate = total_hits / total_requests if total_requests > 0 else 0
-            
-            return {
-                'namespace': self.namespace,
-                'total_size': self.size(),
-                'memory_size': memory_stats['size'],
-                'disk_size': disk_stats['size'],
-                'memory_hits': self._stats['memory_hits'],
-                'disk_hits': self._stats['disk_hits'],
-                'misses': self._stats['misses'],
-                'overall_hit_rate': overall_hit_rate,
-                'memory_hit_rate': memory_stats['hit_rate'],
-                'disk_hit_rate': disk_stats['hit_rate'],
-                'promotions': self._stats['promotions'],
-                'sets': self._stats['sets'],
-                'deletes': self._stats['deletes'],
-                'memory_stats': memory_stats,
-                'disk_stats': disk_stats,
-            }
+        memory_stats = self.memory_cache.get_stats()
+        disk_stats = self.disk_cache.get_stats()
+        with self._stats_lock:
+            stats = dict(self._stats)
+        with self._pending_cond:
+            pending_writes = len(self._pending) + len(self._flushing)
+        
+        total_hits = stats['memory_hits'] + stats['disk_hits']
+        total_requests = total_hits + stats['misses']
+        overall_hit_rate = total_hits / total_requests if total_requests > 0 else 0
+        
+        return {
+            'namespace': self.namespace,
+            'total_size': memory_stats['size'] + disk_stats['size'],
+            'memory_size': memory_stats['size'],
+            'disk_size': disk_stats['size'],
+            'memory_hits': stats['memory_hits'],
+            'disk_hits': stats['disk_hits'],
+            'misses': stats['misses'],
+            'overall_hit_rate': overall_hit_rate,
+            'memory_hit_rate': memory_stats['hit_rate'],
+            'disk_hit_rate': disk_stats['hit_rate'],
+            'promotions': stats['promotions'],
+            'sets': stats['sets'],
+            'deletes': stats['deletes'],
+            'write_behind': self.write_behind,
+            'deferred_writes': stats['deferred_writes'],
+            'pending_writes': pending_writes,
+            'disk_write_errors': stats['disk_write_errors'],
+            'admission_policy': type(self.admission).__name__,
+            'memory_stats': memory_stats,
+            'disk_stats': disk_stats,
+        }
     
     def get_memory_stats(self) -> Dict[str, Any]:
         """Get memory tier statistics."""
@@ -207,27 +584,23 @@ class TwoTierCache(ICache):
     
     def preload_from_disk(self, keys: list) -> int:
         """
-        Preload specified keys from disk to memory.
+        Preload specified keys from disk to memory (bypasses the admission policy).
         
         Args:
             keys: List of keys to preload
-            
+        
         Returns:
             Number of keys successfully preloaded
         """
-        with self._lock:
-            preloaded = 0
-            
-            for key in keys:
-                try:
-                    value = self.disk_cache.get(key)
-                    if value is not None:
-                        self.memory_cache.set(key, value)
-                        preloaded += 1
-                except Exception as e:
-                    logger.warning(f"Failed to preload key {key}: {e}")
-            
-            return preloaded
+        try:
+            with self._lock_keys(keys):
+                values = self.disk_cache.get_many(keys)
+                values.update(self._pending_values(keys))
+                self.memory_cache.put_many(values)
+            return len(values)
+        except Exception as e:
+            logger.warning(f"Failed to preload keys from disk: {e}")
+            return 0
     
     def evict_from_memory(self, keys: list) -> int:
         """
@@ -235,23 +608,163 @@ class TwoTierCache(ICache):
         
         Args:
             keys: List of keys to evict from memory
-            
+        
         Returns:
             Number of keys successfully evicted
         """
-        with self._lock:
-            evicted = 0
-            
-            for key in keys:
-                try:
-                    if self.memory_cache.delete(key):
-                        evicted += 1
-                except Exception as e:
-                    logger.warning(f"Failed to evict key {key} from memory: {e}")
-            
-            return evicted
+        try:
+            return self.memory_cache.delete_many(keys)
+        except Exception as e:
+            logger.warning(f"Failed to evict keys from memory: {e}")
+            return 0
+
+
+class AsyncTwoTierCache:
+    """
+    Async two-tier cache.
+    
+    Memory-tier hits are answered on the event loop without a thread hop;
+    disk-tier work (reads, writes, promotion) runs on a small thread pool,
+    so the loop never blocks on file or SQLite I/O. Plain threads are used
+    instead of aiofiles: the disk tier is SQLite plus pread-style reads,
+    which have no native async API anyway.
+    """
+    
+    def __init__(
+        self,
+        namespace: str = "default",
+        memory_size: int = 1000,
+        disk_size: int = 10000,
+        disk_cache_dir: Optional[str] = None,
+        max_file_size: int = 10 * 1024 * 1024,  # 10MB
+        admission: Optional[TierAdmissionPolicy] = None,
+        write_behind: bool = False,
+        flush_interval: float = 1.0,
+        write_batch_size: int = 1000,
+        max_io_workers: int = DEFAULT_IO_WORKERS,
+    ):
+        """
+        Initialize async two-tier cache.
+        
+        Args:
+            namespace: Cache namespace for organization
+            memory_size: Maximum entries in memory tier
+            disk_size: Maximum entries in disk tier
+            disk_cache_dir: Custom disk cache directory
+            max_file_size: Maximum size per disk cache file
+            admission: Tier admission policy (default: admit and promote all)
+            write_behind: Queue disk writes for a background writer thread
+            flush_interval: Max seconds a queued disk write waits
+            write_batch_size: Queued writes that wake the writer early
+            max_io_workers: Threads running disk-tier operations
+        """
+        self.max_io_workers = max_io_workers
+        self.cache = TwoTierCache(
+            namespace=namespace,
+            memory_size=memory_size,
+            disk_size=disk_size,
+            disk_cache_dir=disk_cache_dir,
+            max_file_size=max_file_size,
+            admission=admission,
+            write_behind=write_behind,
+            flush_interval=flush_interval,
+            write_batch_size=write_batch_size,
+        )
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+    
+    @property
+    def memory_cache(self) -> LRUCache:
+        return self.cache.memory_cache
+    
+    @property
+    def disk_cache(self) -> DiskCache:
+        return self.cache.disk_cache
+    
+    def _get_io_pool(self) -> ThreadPoolExecutor:
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(
+                max_workers=self.max_io_workers,
+                thread_name_prefix=f"xwsystem-two-tier-{self.cache.namespace}",
+            )
+        return self._io_pool
+    
+    async def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_io_pool(), functools.partial(fn, *args))
+    
+    async def get(self, key: str) -> Optional[Any]:
+        """Get value (memory hit inline, disk read in the I/O pool)."""
+        value = self.cache._get_from_memory(key)
+        if value is not None:
+            return value
+        return await self._run(self.cache._get_from_disk, key)
+    
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Get several values (memory batch inline, one disk batch in the I/O pool)."""
+        results = self.cache._get_many_from_memory(keys)
+        misses = [key for key in keys if key not in results]
+        if misses:
+            results.update(await self._run(self.cache._get_many_from_disk, misses))
+        return results
+    
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """Set value in both tiers."""
+        return await self._run(self.cache.set, key, value, ttl)
+    
+    async def put_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> int:
+        """Set several values in both tiers."""
+        return await self._run(self.cache.put_many, items, ttl)
+    
+    async def delete(self, key: str) -> bool:
+        """Delete value from both tiers."""
+        return await self._run(self.cache.delete, key)
+    
+    async def delete_many(self, keys: List[str]) -> int:
+        """Delete several keys from both tiers."""
+        return await self._run(self.cache.delete_many, keys)
+    
+    async def clear(self) -> bool:
+        """Clear both tiers."""
+        return await self._run(self.cache.clear)
+    
+    async def exists(self, key: str) -> bool:
+        """Check if key exists in either tier."""
+        if key in self.cache.memory_cache:
+            return True
+        return await self._run(self.cache.exists, key)
+    
+    async def size(self) -> int:
+        """Get total size across both tiers."""
+        return await self._run(self.cache.size)
+    
+    async def flush(self) -> int:
+        """Write queued disk writes now."""
+        return await self._run(self.cache.flush)
+    
+    async def get_stats(self) -> Dict[str, Any]:
+        """Get comprehensive statistics for both tiers."""
+        return await self._run(self.cache.get_stats)
+    
+    async def close(self) -> None:
+        """Write queued entries, close the disk tier and stop the I/O pool."""
+        await self._run(self.cache.close)
+        if self._io_pool is not None:
+            self._io_pool.shutdown(wait=True)
+            self._io_pool = None
+    
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+        return False
 
 
 __all__ = [
     "TwoTierCache",
+    "AsyncTwoTierCache",
+    "TierAdmissionPolicy",
+    "PromoteAfterHits",
 ]
@@ -10,36 +10,32 @@ Generation Date: 01-Nov-2025
 Common utility functions for caching module.
 """
 
-import sys
 import hashlib
 import pickle
 from typing import Any, Callable, Tuple
+from .size_estimators import deep_sizeof, shallow_sizeof
 
 
-def estimate_object_size(obj: Any) -> int:
+def estimate_object_size(obj: Any, deep: bool = True) -> int:
     """
     Estimate memory size of object in bytes.
     
     Args:
         obj: Object to estimate size of
+        deep: Include referenced objects (container elements, attributes).
+            Set False for the old shallow sys.getsizeof behaviour.
         
     Returns:
         Estimated size in bytes
         
     Note:
-        This is a rough estimate using sys.getsizeof.
-        For more accurate memory profiling, use memory_profiler.
+        Deep estimates use the per-type registry in size_estimators
+        (bounded recursion, sampling for large containers). Register
+        estimators for custom types with register_size_estimator().
     """
-    try:
-        return sys.getsizeof(obj)
-    except (TypeError, AttributeError):
-        # For objects that don't support getsizeof
-        try:
-            # Try pickling as fallback
-            return len(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
-        except Exception:
-            # Last resort: return a conservative estimate
-            return 1024  # 1KB default
+    if deep:
+        return deep_sizeof(obj)
+    return shallow_sizeof(obj)
 
 
 def compute_checksum(value: Any, algorithm: str = 'sha256') -> str:
@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+
+Transparent value codec for caches holding large payloads.
+
+A ValueCodec serializes values with one of the project serializers
+(pickle or msgpack from io/serialization/formats/binary) and compresses
+the result with zlib, lz4 or zstd once it reaches a size threshold.
+
+Performance:
+    - Values below the threshold are stored as-is (no decode cost on hit).
+      None, bools, floats, 64-bit ints, str and bytes are sized without
+      serializing; any other value is serialized once on put to measure
+      it (still cheaper than a deep size estimate), and below the
+      threshold those bytes are discarded
+    - Large values are stored as compressed bytes and only decompressed
+      when they are read (a hit), never on put or eviction
+    - Encoding runs outside the cache lock; compression that does not
+      shrink a value is dropped and the serialized bytes are kept
+"""
+
+import importlib
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .errors import CacheConfigurationError, CacheDeserializationError, CacheSerializationError
+from ..config.logging_setup import get_logger
+
+logger = get_logger("xwsystem.caching.value_codec")
+
+
+# Serialized size (bytes) from which values are compressed
+DEFAULT_COMPRESSION_THRESHOLD = 4 * 1024
+
+# Frame header for self-describing byte form (see ValueCodec.dumps)
+FRAME_MAGIC = b"XC"
+
+# Serializer overhead allowed for by _size_bound() (pickle/msgpack need < 24)
+_FRAMING_BYTES = 32
+
+# name -> (frame id, module under io/serialization/formats/binary, class)
+_SERIALIZERS: Dict[str, Tuple[int, str, str]] = {
+    'pickle': (0, 'pickle', 'PickleSerializer'),
+    'msgpack': (1, 'msgpack', 'MsgPackSerializer'),
+}
+
+# name -> (frame id, default level)
+_COMPRESSORS: Dict[str, Tuple[int, Optional[int]]] = {
+    'none': (0, None),
+    'zlib': (1, 6),
+    'lz4': (2, 0),
+    'zstd': (3, 3),
+}
+
+_serializer_instances: Dict[int, Any] = {}
+_decompressors: Dict[int, Callable[[bytes], bytes]] = {}
+_resolve_lock = threading.Lock()
+
+
+def _size_bound(value: Any) -> Optional[int]:
+    """Upper bound of a value's serialized size, if known without serializing it."""
+    value_type = type(value)
+    if value is None or value_type is bool or value_type is float:
+        return _FRAMING_BYTES
+    if value_type is int:
+        return _FRAMING_BYTES if -2 ** 63 <= value < 2 ** 64 else None
+    if value_type is str:
+        # UTF-8 takes at most 4 bytes per character
+        return 4 * len(value) + _FRAMING_BYTES
+    if value_type is bytes or value_type is bytearray:
+        return len(value) + _FRAMING_BYTES
+    return None
+
+
+def _load_serializer(serializer_id: int) -> Any:
+    """Instantiate the project serializer for a frame id (cached)."""
+    serializer = _serializer_instances.get(serializer_id)
+    if serializer is not None:
+        return serializer
+    with _resolve_lock:
+        serializer = _serializer_instances.get(serializer_id)
+        if serializer is None:
+            for name, (sid, module, class_name) in _SERIALIZERS.items():
+                if sid == serializer_id:
+                    break
+            else:
+                raise CacheDeserializationError(f"Unknown value serializer id: {serializer_id}")
+            try:
+                formats = importlib.import_module(
+                    f"..io.serialization.formats.binary.{module}", __package__
+                )
+                serializer = getattr(formats, class_name)()
+            except ImportError as e:
+                raise CacheConfigurationError(
+                    f"Value serializer '{name}' is not available: {e}"
+                ) from e
+            _serializer_instances[serializer_id] = serializer
+        return serializer
+
+
+def _load_compressor(name: str, level: Optional[int]) -> Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    """Return (compress, decompress) callables for a compression name."""
+    if name == 'zlib':
+        import zlib
+        return (lambda data: zlib.compress(data, level)), zlib.decompress
+    try:
+        if name == 'lz4':
+            import lz4.frame
+            return (lambda data: lz4.frame.compress(data, compression_level=level)), lz4.frame.decompress
+        if name == 'zstd':
+            import zstandard
+            # Module-level one-shot functions are safe to share across threads
+            return (lambda data: zstandard.compress(data, level)), zstandard.decompress
+    except ImportError as e:
+        package = 'lz4' if name == 'lz4' else 'zstandard'
+        raise CacheConfigurationError(
+            f"Compression '{name}' requires {package}. Install with: pip install {package}"
+        ) from e
+    return (lambda data: data), (lambda data: data)
+
+
+def resolve_compression(name: str, level: Optional[int] = None) -> Tuple[int, Callable[[bytes], bytes]]:
+    """
+    Frame id and compress callable for a compression name.
+
+    Raises:
+        CacheConfigurationError: If the name is unknown or its library is missing
+    """
+    if name not in _COMPRESSORS:
+        raise CacheConfigurationError(
+            f"Unknown compression '{name}'. Supported: {', '.join(_COMPRESSORS)}"
+        )
+    compression_id, default_level = _COMPRESSORS[name]
+    return compression_id, _load_compressor(name, level if level is not None else default_level)[0]
+
+
+def get_decompressor(compression_id: int) -> Callable[[bytes], bytes]:
+    """Decompress callable for a frame id (cached)."""
+    decompress = _decompressors.get(compression_id)
+    if decompress is None:
+        for name, (cid, level) in _COMPRESSORS.items():
+            if cid == compression_id:
+                break
+        else:
+            raise CacheDeserializationError(f"Unknown value compression id: {compression_id}")
+        decompress = _load_compressor(name, level)[1]
+        _decompressors[compression_id] = decompress
+    return decompress
+
+
+class EncodedValue:
+    """
+    A cache value held in serialized (and possibly compressed) form.
+
+    Carries the per-entry statistics reported by get_entry_codec_stats().
+    """
+
+    __slots__ = ('data', 'flags', 'raw_size', 'encode_seconds', 'decodes', 'decode_seconds')
+
+    def __init__(self, data: bytes, flags: int, raw_size: int, encode_seconds: float):
+        self.data = data
+        self.flags = flags
+        self.raw_size = raw_size
+        self.encode_seconds = encode_seconds
+        self.decodes = 0
+        self.decode_seconds = 0.0
+
+    @property
+    def stored_size(self) -> int:
+        """Bytes held in memory."""
+        return len(self.data)
+
+    @property
+    def compressed(self) -> bool:
+        """Whether the payload is compressed."""
+        return bool(self.flags & 0x0F)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-entry size and CPU statistics."""
+        return {
+            'raw_size': self.raw_size,
+            'stored_size': len(self.data),
+            'ratio': self.raw_size / len(self.data) if self.data else 1.0,
+            'compressed': self.compressed,
+            'encode_ms': self.encode_seconds * 1000,
+            'decodes': self.decodes,
+            'avg_decode_ms': self.decode_seconds / self.decodes * 1000 if self.decodes else 0.0,
+        }
+
+
+class ValueCodec:
+    """
+    Serialize-and-compress codec for cache values.
+
+    Example:
+        cache = MemoryBoundedLRUCache(
+            capacity=10_000, memory_budget_mb=256,
+            value_codec=ValueCodec(serializer="msgpack", compression="zstd"),
+        )
+        cache.put("report", large_payload)   # stored compressed
+        cache.get("report")                  # decompressed on this hit
+    """
+
+    def __init__(self, serializer: str = 'pickle', compression: str = 'zlib',
+                 level: Optional[int] = None, threshold: int = DEFAULT_COMPRESSION_THRESHOLD):
+        """
+        Initialize value codec.
+
+        Args:
+            serializer: 'pickle' (any Python object) or 'msgpack' (JSON-like data)
+            compression: 'zlib', 'lz4', 'zstd' or 'none'
+            level: Compression level (default: per-compressor default)
+            threshold: Serialized size in bytes from which values are compressed;
+                smaller values are kept in memory unencoded
+
+        Raises:
+            CacheConfigurationError: If the serializer/compressor is unknown or
+                its library is not installed
+        """
+        if serializer not in _SERIALIZERS:
+            raise CacheConfigurationError(
+                f"Unknown value serializer '{serializer}'. Supported: {', '.join(_SERIALIZERS)}"
+            )
+        if compression not in _COMPRESSORS:
+            raise CacheConfigurationError(
+                f"Unknown value compression '{compression}'. Supported: {', '.join(_COMPRESSORS)}"
+            )
+        if threshold < 0:
+            raise CacheConfigurationError(f"Compression threshold must be >= 0, got {threshold}")
+
+        self.serializer = serializer
+        self.compression = compression
+        self.level = level if level is not None else _COMPRESSORS[compression][1]
+        self.threshold = threshold
+
+        self._serializer_id = _SERIALIZERS[serializer][0]
+        self._compression_id = _COMPRESSORS[compression][0]
+        self._codec = _load_serializer(self._serializer_id)
+        self._compress = _load_compressor(compression, self.level)[0]
+
+        self._stats_lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._encoded = 0
+        self._compressed = 0
+        self._passthrough = 0
+        self._raw_bytes = 0
+        self._stored_bytes = 0
+        self._encode_seconds = 0.0
+        self._decoded = 0
+        self._decode_seconds = 0.0
+
+    def _serialize(self, value: Any) -> bytes:
+        try:
+            data = self._codec.encode(value)
+        except Exception as e:
+            raise CacheSerializationError(
+                f"Failed to serialize cache value with {self.serializer}: {e}"
+            ) from e
+        return data.encode('utf-8') if isinstance(data, str) else data
+
+    def _pack(self, value: Any) -> Tuple[bytes, int, int]:
+        """Serialize and, above the threshold, compress (returns data, flags, raw size)."""
+        data = self._serialize(value)
+        raw_size = len(data)
+        flags = self._serializer_id << 4
+        if self._compression_id and raw_size >= self.threshold:
+            packed = self._compress(data)
+            if len(packed) < raw_size:
+                return packed, flags | self._compression_id, raw_size
+        return data, flags, raw_size
+
+    def encode(self, value: Any) -> Any:
+        """
+        Convert a value to its in-memory stored form.
+
+        Returns an EncodedValue for values at or above the threshold and
+        the value itself otherwise. EncodedValue inputs pass through.
+        """
+        if type(value) is EncodedValue:
+            return value
+        bound = _size_bound(value)
+        if bound is not None and bound < self.threshold:
+            with self._stats_lock:
+                self._passthrough += 1
+            return value
+        start = time.perf_counter()
+        data, flags, raw_size = self._pack(value)
+        elapsed = time.perf_counter() - start
+        if raw_size < self.threshold:
+            with self._stats_lock:
+                self._passthrough += 1
+            return value
+
+        with self._stats_lock:
+            self._encoded += 1
+            if flags & 0x0F:
+                self._compressed += 1
+            self._raw_bytes += raw_size
+            self._stored_bytes += len(data)
+            self._encode_seconds += elapsed
+        return EncodedValue(data, flags, raw_size, elapsed)
+
+    def decode(self, stored: Any) -> Any:
+        """Convert a stored form back to the value (decompressing if needed)."""
+        if type(stored) is not EncodedValue:
+            return stored
+        start = time.perf_counter()
+        value = self._unpack(stored.data, stored.flags)
+        elapsed = time.perf_counter() - start
+        # Per-entry counters are updated without the cache lock (approximate)
+        stored.decodes += 1
+        stored.decode_seconds += elapsed
+        with self._stats_lock:
+            self._decoded += 1
+            self._decode_seconds += elapsed
+        return value
+
+    @staticmethod
+    def _unpack(data: bytes, flags: int) -> Any:
+        compression_id = flags & 0x0F
+        try:
+            if compression_id:
+                data = get_decompressor(compression_id)(data)
+            return _load_serializer(flags >> 4).decode(data)
+        except CacheConfigurationError:
+            raise
+        except Exception as e:
+            raise CacheDeserializationError(f"Failed to decode cache value: {e}") from e
+
+    def dumps(self, value: Any) -> bytes:
+        """
+        Encode a value to self-describing bytes (for persistent caches).
+
+        Frames record the serializer and compression used, so loads() can
+        read entries written with different codec settings.
+        """
+        start = time.perf_counter()
+        data, flags, raw_size = self._pack(value)
+        elapsed = time.perf_counter() - start
+        with self._stats_lock:
+            self._encoded += 1
+            if flags & 0x0F:
+                self._compressed += 1
+            self._raw_bytes += raw_size
+            self._stored_bytes += len(data)
+            self._encode_seconds += elapsed
+        return FRAME_MAGIC + bytes((flags,)) + data
+
+    def loads(self, frame: bytes) -> Any:
+        """Decode bytes produced by dumps()."""
+        start = time.perf_counter()
+        value = loads_frame(frame)
+        with self._stats_lock:
+            self._decoded += 1
+            self._decode_seconds += time.perf_counter() - start
+        return value
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Aggregate compression ratio and CPU cost."""
+        with self._stats_lock:
+            return {
+                'serializer': self.serializer,
+                'compression': self.compression,
+                'threshold': self.threshold,
+                'encoded': self._encoded,
+                'compressed': self._compressed,
+                'passthrough': self._passthrough,
+                'raw_bytes': self._raw_bytes,
+                'stored_bytes': self._stored_bytes,
+                'ratio': self._raw_bytes / self._stored_bytes if self._stored_bytes else 1.0,
+                'avg_encode_ms': self._encode_seconds / self._encoded * 1000 if self._encoded else 0.0,
+                'decoded': self._decoded,
+                'avg_decode_ms': self._decode_seconds / self._decoded * 1000 if self._decoded else 0.0,
+            }
+
+    def reset_stats(self) -> None:
+        """Reset aggregate statistics."""
+        with self._stats_lock:
+            self._reset()
+
+
+def decode_value(stored: Any) -> Any:
+    """Decode a stored cache value without a codec instance (no statistics)."""
+    if type(stored) is EncodedValue:
+        return ValueCodec._unpack(stored.data, stored.flags)
+    return stored
+
+
+def is_frame(data: bytes) -> bool:
+    """Whether bytes were produced by ValueCodec.dumps()."""
+    return data[:2] == FRAME_MAGIC
+
+
+def loads_frame(frame: bytes) -> Any:
+    """Decode ValueCodec.dumps() output, whatever codec settings wrote it."""
+    if frame[:2] != FRAME_MAGIC or len(frame) < 3:
+        raise CacheDeserializationError("Not a value codec frame")
+    return ValueCodec._unpack(frame[3:], frame[2])
+
+
+__all__ = [
+    "ValueCodec",
+    "EncodedValue",
+    "DEFAULT_COMPRESSION_THRESHOLD",
+    "decode_value",
+    "is_frame",
+    "loads_frame",
+    "resolve_compression",
+    "get_decompressor",
+]
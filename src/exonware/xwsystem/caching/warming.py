@@ -11,14 +11,38 @@ Cache warming utilities for preloading data.
 Performance Priority #4 - Reduce cold start penalties.
 """
 
-from typing import Any, Callable, List, Optional, Hashable, Dict
+from typing import Any, Callable, List, Optional, Hashable, Dict, Union
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import asyncio
+import inspect
+import threading
 import time
+from .errors import CacheError
+from .persistence import DEFAULT_SNAPSHOT_WORKERS, load_snapshot, save_snapshot
+from .rate_limiter import RateLimiter
+from .refresh_ahead import AsyncRefreshAheadCache, RefreshAheadCache
 from ..config.logging_setup import get_logger
 
 logger = get_logger("xsystem.caching.warming")
 
 
+def _warm_key(cache: Any, key: Hashable, loader: Callable[[Hashable], Any]) -> None:
+    """
+    Load one key and store it.
+
+    Refresh-ahead caches also get the measured load time, so warmed entries
+    take part in early (XFetch) refresh instead of all expiring together.
+    """
+    if isinstance(cache, RefreshAheadCache):
+        started = time.perf_counter()
+        value = loader(key)
+        cache.put(key, value, load_time=time.perf_counter() - started)
+    else:
+        cache.put(key, loader(key))
+
+
 class AWarmingStrategy(ABC):
     """Abstract base class for cache warming strategies."""
     
@@ -55,8 +79,7 @@ class PreloadWarmingStrategy(AWarmingStrategy):
         
         for key in keys:
             try:
-                value = loader(key)
-                cache.put(key, value)
+                _warm_key(cache, key, loader)
                 success_count += 1
             except Exception as e:
                 failures.append((key, str(e)))
@@ -103,8 +126,7 @@ class LazyWarmingStrategy(AWarmingStrategy):
         success_count = 0
         for key in preload_keys:
             try:
-                value = loader(key)
-                cache.put(key, value)
+                _warm_key(cache, key, loader)
                 success_count += 1
             except Exception as e:
                 logger.warning(f"Failed to warm key {key}: {e}")
@@ -139,8 +161,7 @@ class PriorityWarmingStrategy(AWarmingStrategy):
         success_count = 0
         for key in sorted_keys:
             try:
-                value = loader(key)
-                cache.put(key, value)
+                _warm_key(cache, key, loader)
                 success_count += 1
             except Exception as e:
                 logger.warning(f"Failed to warm key {key}: {e}")
@@ -148,6 +169,371 @@ class PriorityWarmingStrategy(AWarmingStrategy):
         return success_count
 
 
+class SnapshotWarmingStrategy(AWarmingStrategy):
+    """
+    Snapshot warming - restore a snapshot from the previous run, then load
+    only the requested keys it did not contain.
+    
+    Suitable for large caches that must survive restarts and deploys.
+    
+    Example:
+        strategy = SnapshotWarmingStrategy("/var/cache/users.snap")
+        warm_cache(cache, load_user, user_ids, strategy=strategy)
+        ...
+        strategy.save(cache)  # on shutdown (or periodically, background=True)
+    """
+    
+    def __init__(
+        self,
+        path: Union[str, Path],
+        workers: int = DEFAULT_SNAPSHOT_WORKERS,
+        fallback: Optional[AWarmingStrategy] = None
+    ):
+        """
+        Initialize snapshot warming strategy.
+        
+        Args:
+            path: Snapshot file (written by save() / save_snapshot())
+            workers: Threads decoding snapshot chunks
+            fallback: Strategy loading keys missing from the snapshot
+                     (default: PreloadWarmingStrategy)
+        """
+        self.path = Path(path)
+        self.workers = workers
+        self.fallback = fallback or PreloadWarmingStrategy()
+    
+    def warm(self, cache: Any, keys: List[Hashable], loader: Callable[[Hashable], Any]) -> int:
+        """Restore the snapshot, then load requested keys it lacked."""
+        restored = 0
+        if self.path.exists():
+            try:
+                restored = load_snapshot(cache, self.path, workers=self.workers)
+            except (CacheError, OSError) as e:
+                # A bad snapshot only costs the warm start
+                logger.warning(f"Ignoring unreadable cache snapshot {self.path}: {e}")
+        else:
+            logger.info(f"No cache snapshot at {self.path}, warming from loader")
+        
+        missing = [key for key in keys if key not in cache]
+        if missing and loader is not None:
+            restored += self.fallback.warm(cache, missing, loader)
+        return restored
+    
+    def save(self, cache: Any, **options: Any) -> Any:
+        """Write the snapshot for the next warm start (options as for save_snapshot)."""
+        return save_snapshot(cache, self.path, **options)
+
+
+DEFAULT_WARMING_WORKERS = 16
+DEFAULT_WARMING_BATCH_SIZE = 100
+
+
+def _budget_reached(cache: Any, budget_fraction: float) -> Any:
+    """
+    Check whether further warming would only evict already-warmed keys.
+    
+    Memory-bounded caches compare their usage to the memory budget; other
+    caches stop once full. Async caches return an awaitable.
+    """
+    budget = getattr(cache, 'memory_budget_bytes', None)
+    get_memory_stats = getattr(cache, 'get_memory_stats', None)
+    if budget and get_memory_stats is not None:
+        if get_memory_stats()['current_memory_bytes'] >= budget * budget_fraction:
+            return True
+    is_full = getattr(cache, 'is_full', None)
+    return is_full() if is_full is not None else False
+
+
+class _WarmingRun:
+    """Counters shared by the workers of one concurrent warming pass."""
+    
+    def __init__(self, total: int, progress: Any, on_progress: Optional[Callable[[int, int], None]]):
+        self.total = total
+        self.progress = progress
+        self.on_progress = on_progress
+        self.loaded = 0
+        self.failed = 0
+        self.batches = 0
+        self.failures: List[tuple] = []
+        self.stopped_early = False
+        self.started = time.perf_counter()
+        self._lock = threading.Lock()
+    
+    def record(self, loaded: int, failures: List[tuple]) -> None:
+        """Account for one finished batch and report progress."""
+        with self._lock:
+            self.loaded += loaded
+            self.failed += len(failures)
+            self.batches += 1
+            if len(self.failures) < 5:
+                self.failures.extend(failures[:5 - len(self.failures)])
+            loaded_so_far = self.loaded
+        if self.progress is not None:
+            self.progress.update(loaded + len(failures))
+        if self.on_progress is not None:
+            self.on_progress(loaded_so_far, self.total)
+
+
+class ConcurrentWarmingStrategy(AWarmingStrategy):
+    """
+    Concurrent warming - load keys through a bounded pool of workers.
+    
+    Suitable for large caches whose loaders wait on I/O (databases, HTTP):
+    loads overlap instead of running one after another, batch loaders fetch
+    many keys per round trip and store them with one put_many(), and warming
+    stops as soon as the cache is full or at its memory budget, since any
+    further load would only evict a key warmed earlier.
+    
+    warm() uses a thread pool; warm_async() runs the same pass on the event
+    loop with max_workers concurrent loads.
+    
+    Example:
+        strategy = ConcurrentWarmingStrategy(
+            max_workers=32,
+            loader_many=database.get_users,   # ids -> {id: user}
+            rate_limiter=RateLimiter(max_ops_per_second=5000),
+            progress=True,
+        )
+        warm_cache(cache, None, user_ids, strategy=strategy)
+        print(strategy.last_stats['keys_per_second'])
+    """
+    
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_WARMING_WORKERS,
+        loader_many: Optional[Callable[[List[Hashable]], Dict[Hashable, Any]]] = None,
+        batch_size: int = DEFAULT_WARMING_BATCH_SIZE,
+        rate_limiter: Optional[RateLimiter] = None,
+        progress: Any = None,
+        stop_when_full: bool = True,
+        budget_fraction: float = 0.95,
+        priority_func: Optional[Callable[[Hashable], float]] = None
+    ):
+        """
+        Initialize concurrent warming strategy.
+        
+        Args:
+            max_workers: Maximum concurrent loads (threads, or tasks in async mode)
+            loader_many: Optional batch loader returning {key: value};
+                        keys missing from the result count as failed
+            batch_size: Keys per loader_many() call
+            rate_limiter: Optional RateLimiter pacing loads (one token per key)
+            progress: True for a ProgressBar on stderr, or any object with
+                     update(n) (e.g. an existing ProgressBar)
+            stop_when_full: Stop once the cache is full / at its memory budget
+            budget_fraction: Fraction of the memory budget that counts as full
+            priority_func: Optional key priority (higher loads first)
+        """
+        if max_workers <= 0:
+            raise ValueError(f"max_workers must be positive, got {max_workers}")
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        if not 0 < budget_fraction <= 1:
+            raise ValueError(f"budget_fraction must be in (0, 1], got {budget_fraction}")
+        
+        self.max_workers = max_workers
+        self.loader_many = loader_many
+        self.batch_size = batch_size
+        self.rate_limiter = rate_limiter
+        self.progress = progress
+        self.stop_when_full = stop_when_full
+        self.budget_fraction = budget_fraction
+        self.priority_func = priority_func
+        self.last_stats: Dict[str, Any] = {}
+    
+    def _prepare(
+        self,
+        cache: Any,
+        keys: List[Hashable],
+        loader: Optional[Callable],
+        on_progress: Optional[Callable[[int, int], None]]
+    ) -> tuple:
+        """Order keys, split them into batches and start the run counters."""
+        if loader is None and self.loader_many is None:
+            raise ValueError("Concurrent warming needs a loader or loader_many")
+        if self.priority_func is not None:
+            keys = sorted(keys, key=self.priority_func, reverse=True)
+        step = self.batch_size if self.loader_many is not None else 1
+        batches = [keys[i:i + step] for i in range(0, len(keys), step)]
+        
+        progress = self.progress
+        if progress is True:
+            from ..cli.progress import ProgressBar
+            progress = ProgressBar(total=len(keys), description="Warming cache")
+        elif progress is False:
+            progress = None
+        
+        logger.info(
+            f"Concurrent warming: {len(keys)} keys in {len(batches)} batches into cache "
+            f"{cache.name if hasattr(cache, 'name') else 'unknown'}"
+        )
+        return batches, _WarmingRun(len(keys), progress, on_progress)
+    
+    def _finish(self, run: _WarmingRun, workers: int) -> int:
+        """Close owned progress output, publish last_stats and log the summary."""
+        elapsed = time.perf_counter() - run.started
+        if self.progress is True:
+            run.progress.close()
+        
+        self.last_stats = {
+            'total': run.total,
+            'loaded': run.loaded,
+            'failed': run.failed,
+            'skipped': run.total - run.loaded - run.failed,
+            'batches': run.batches,
+            'workers': workers,
+            'elapsed_seconds': elapsed,
+            'keys_per_second': run.loaded / elapsed if elapsed > 0 else 0.0,
+            'stopped_early': run.stopped_early,
+        }
+        logger.info(
+            f"Cache warming complete: {run.loaded}/{run.total} loaded "
+            f"in {elapsed:.2f}s ({self.last_stats['keys_per_second']:.0f} keys/sec)"
+            + (", stopped at cache budget" if run.stopped_early else "")
+        )
+        if run.failures:
+            logger.warning(f"Failed to load {run.failed} keys: {run.failures}...")
+        return run.loaded
+    
+    def _rate_chunks(self, count: int) -> List[int]:
+        """Split a batch's tokens so no request exceeds the burst capacity."""
+        burst = max(1, int(self.rate_limiter.burst_capacity))
+        return [min(burst, count - i) for i in range(0, count, burst)]
+    
+    def _load_batch(self, cache: Any, batch: List[Hashable], loader: Optional[Callable]) -> tuple:
+        """Load and store one batch; returns (loaded, failures)."""
+        if self.loader_many is None:
+            key = batch[0]
+            try:
+                _warm_key(cache, key, loader)
+                return 1, []
+            except Exception as e:
+                return 0, [(key, str(e))]
+        
+        try:
+            started = time.perf_counter()
+            values = self.loader_many(batch)
+            load_time = time.perf_counter() - started
+            values = {key: values[key] for key in batch if key in values}
+            if isinstance(cache, RefreshAheadCache):
+                for key, value in values.items():
+                    cache.put(key, value, load_time=load_time)
+            elif hasattr(cache, 'put_many'):
+                cache.put_many(values)
+            else:
+                for key, value in values.items():
+                    cache.put(key, value)
+        except Exception as e:
+            return 0, [(key, str(e)) for key in batch]
+        return len(values), [(key, "missing from loader_many result")
+                             for key in batch if key not in values]
+    
+    def warm(
+        self,
+        cache: Any,
+        keys: List[Hashable],
+        loader: Optional[Callable[[Hashable], Any]],
+        on_progress: Optional[Callable[[int, int], None]] = None
+    ) -> int:
+        """Load keys with a bounded thread pool."""
+        batches, run = self._prepare(cache, keys, loader, on_progress)
+        pending = iter(batches)
+        take_lock = threading.Lock()
+        
+        def worker() -> None:
+            while True:
+                with take_lock:
+                    if run.stopped_early:
+                        return
+                    if self.stop_when_full and _budget_reached(cache, self.budget_fraction):
+                        run.stopped_early = True
+                        return
+                    batch = next(pending, None)
+                if batch is None:
+                    return
+                if self.rate_limiter is not None:
+                    for tokens in self._rate_chunks(len(batch)):
+                        self.rate_limiter.wait(tokens)
+                run.record(*self._load_batch(cache, batch, loader))
+        
+        workers = min(self.max_workers, len(batches))
+        if workers:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="xwcache-warm") as pool:
+                for future in [pool.submit(worker) for _ in range(workers)]:
+                    future.result()
+        return self._finish(run, workers)
+    
+    async def warm_async(
+        self,
+        cache: Any,
+        keys: List[Hashable],
+        loader: Optional[Callable[[Hashable], Any]],
+        on_progress: Optional[Callable[[int, int], None]] = None
+    ) -> int:
+        """
+        Load keys on the running event loop, max_workers at a time.
+        
+        Loaders and cache methods may be sync or async; sync loaders run in
+        worker threads so they do not block the loop.
+        """
+        batches, run = self._prepare(cache, keys, loader, on_progress)
+        pending = iter(batches)
+        
+        async def call(func: Callable, *args: Any) -> Any:
+            if inspect.iscoroutinefunction(func):
+                return await func(*args)
+            result = await asyncio.to_thread(func, *args)
+            return await result if inspect.isawaitable(result) else result
+        
+        async def store(key: Hashable, value: Any, load_time: float) -> None:
+            if isinstance(cache, (RefreshAheadCache, AsyncRefreshAheadCache)):
+                result = cache.put(key, value, load_time=load_time)
+            else:
+                result = cache.put(key, value)
+            if inspect.isawaitable(result):
+                await result
+        
+        async def load(batch: List[Hashable]) -> tuple:
+            started = time.perf_counter()
+            try:
+                if self.loader_many is None:
+                    values = {batch[0]: await call(loader, batch[0])}
+                else:
+                    values = await call(self.loader_many, batch)
+                load_time = time.perf_counter() - started
+                values = {key: values[key] for key in batch if key in values}
+                for key, value in values.items():
+                    await store(key, value, load_time)
+            except Exception as e:
+                return 0, [(key, str(e)) for key in batch]
+            return len(values), [(key, "missing from loader_many result")
+                                 for key in batch if key not in values]
+        
+        async def worker() -> None:
+            while not run.stopped_early:
+                if self.stop_when_full:
+                    full = _budget_reached(cache, self.budget_fraction)
+                    if inspect.isawaitable(full):
+                        full = await full
+                    if full:
+                        run.stopped_early = True
+                        return
+                batch = next(pending, None)
+                if batch is None:
+                    return
+                if self.rate_limiter is not None:
+                    for tokens in self._rate_chunks(len(batch)):
+                        delay = self.rate_limiter.reserve(tokens)
+                        while delay > 0:
+                            await asyncio.sleep(delay)
+                            delay = self.rate_limiter.reserve(tokens)
+                run.record(*(await load(batch)))
+        
+        workers = min(self.max_workers, len(batches))
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        return self._finish(run, workers)
+
+
 def warm_cache(
     cache: Any,
     loader: Callable[[Hashable], Any],
@@ -179,6 +565,10 @@ def warm_cache(
     if strategy is None:
         strategy = PreloadWarmingStrategy()
     
+    if isinstance(strategy, ConcurrentWarmingStrategy):
+        # Counts loads itself (thread-safe, and covers loader_many batches)
+        return strategy.warm(cache, keys, loader, on_progress=on_progress)
+    
     if on_progress:
         # Wrap loader with progress callback
         original_loader = loader
@@ -197,38 +587,32 @@ def warm_cache(
 
 def warm_cache_async(
     cache: Any,
-    loader: Callable,
-    keys: List[Hashable]
+    loader: Optional[Callable],
+    keys: List[Hashable],
+    max_concurrency: int = DEFAULT_WARMING_WORKERS,
+    loader_many: Optional[Callable] = None,
+    on_progress: Optional[Callable[[int, int], None]] = None
 ) -> int:
     """
     Warm async cache with data.
     
     Args:
-        cache: Async cache instance
-        loader: Async function to load data
+        cache: Async (or sync) cache instance
+        loader: Async or sync function to load data for a key
         keys: List of keys to preload
+        max_concurrency: Maximum loads in flight at once
+        loader_many: Optional batch loader returning {key: value}
+        on_progress: Optional callback for progress updates (loaded, total)
         
     Returns:
         Number of keys successfully loaded
         
     Note:
-        This is a synchronous wrapper. For true async warming,
-        use the loader directly with async for.
+        This is a synchronous wrapper. Inside a running event loop, await
+        ConcurrentWarmingStrategy(...).warm_async() instead.
     """
-    import asyncio
-    
-    async def async_warm():
-        success_count = 0
-        for key in keys:
-            try:
-                value = await loader(key)
-                await cache.put(key, value)
-                success_count += 1
-            except Exception as e:
-                logger.warning(f"Failed to warm key {key}: {e}")
-        return success_count
-    
-    return asyncio.run(async_warm())
+    strategy = ConcurrentWarmingStrategy(max_workers=max_concurrency, loader_many=loader_many)
+    return asyncio.run(strategy.warm_async(cache, keys, loader, on_progress=on_progress))
 
 
 __all__ = [
@@ -236,6 +620,8 @@ __all__ = [
     'PreloadWarmingStrategy',
     'LazyWarmingStrategy',
     'PriorityWarmingStrategy',
+    'SnapshotWarmingStrategy',
+    'ConcurrentWarmingStrategy',
     'warm_cache',
     'warm_cache_async',
 ]
@@ -8,16 +8,39 @@ Generation Date: 01-Nov-2025
 
 Write-behind (lazy write) cache implementation.
 Performance Priority #4 - Delayed persistence for better write performance.
+
+Pipeline:
+    - put() caches the value and queues (key, value) as dirty; repeated
+      puts to a dirty key coalesce into one pending write
+    - flush() swaps the queue out under the lock and writes it outside the
+      lock, in writer_many() batches of batch_size (or per key via writer())
+    - Evicted dirty entries stay queued (and readable) until written, so
+      LRU eviction never drops unflushed data
+    - Keys deleted while their write is in flight are hidden from reads and
+      not re-queued if that write fails
+    - max_dirty bounds the queue: put() waits for the flusher (or flushes
+      itself when no flusher runs) instead of growing without limit
 """
 
+import asyncio
+import inspect
+import logging
 import threading
-import time
-from typing import Any, Callable, Dict, Optional, Set, Hashable
-from .lru_cache import LRUCache
+from typing import Any, Callable, Dict, List, Optional, Hashable, Set, Union
+from .defs import StatsMode
+from .errors import CacheError, CacheTimeoutError
+from .lru_cache import AsyncLRUCache, LRUCache
 from ..config.logging_setup import get_logger
 
 logger = get_logger("xsystem.caching.write_behind")
 
+_DEBUG = logging.DEBUG
+
+# Default dirty entries handed to writer_many() per call
+DEFAULT_WRITE_BATCH_SIZE = 5000
+
+_MISSING = object()
+
 
 class WriteBehindCache(LRUCache):
     """
@@ -33,15 +56,20 @@ class WriteBehindCache(LRUCache):
         - Automatic background flushing
         - Manual flush support
         - Dirty entry tracking
+        - Batch writer mode (writer_many) and write coalescing
+        - Evicted dirty entries are kept until flushed
+        - Bounded dirty queue with backpressure (max_dirty)
     
     Example:
-        def save_to_db(key, value):
-            db.update(key, value)
+        def save_rows_to_db(items):
+            db.upsert_many(items.items())  # one round-trip per batch
         
         cache = WriteBehindCache(
             capacity=1000,
-            writer=save_to_db,
-            flush_interval=5.0  # Flush every 5 seconds
+            writer_many=save_rows_to_db,
+            flush_interval=5.0,  # Flush every 5 seconds
+            batch_size=5000,
+            max_dirty=50000,
         )
         
         # Writes cached immediately, flushed to DB later
@@ -58,7 +86,12 @@ class WriteBehindCache(LRUCache):
         flush_interval: float = 5.0,
         ttl: Optional[float] = None,
         name: Optional[str] = None,
-        auto_start: bool = True
+        auto_start: bool = True,
+        writer_many: Optional[Callable[[Dict[Hashable, Any]], None]] = None,
+        batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+        max_dirty: Optional[int] = None,
+        put_timeout: Optional[float] = None,
+        stats: Union[StatsMode, str] = StatsMode.SHARED
     ):
         """
         Initialize write-behind cache.
@@ -70,28 +103,77 @@ class WriteBehindCache(LRUCache):
             ttl: Optional TTL in seconds
             name: Cache name
             auto_start: Automatically start background flusher
+            writer_many: Function to persist a batch {key: value} -> None
+                (preferred over writer when both are given)
+            batch_size: Maximum entries per writer_many() call; a full batch
+                of dirty entries also wakes the background flusher early
+            max_dirty: Maximum pending writes (None = unbounded)
+            put_timeout: Max seconds put() waits for room in a full queue
+                (None = wait indefinitely)
+            stats: Statistics mode (shared, per_thread or disabled)
+        
+        Raises:
+            ValueError: If batch_size or max_dirty is not positive
         """
-        super().__init__(capacity, ttl, name)
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        if max_dirty is not None and max_dirty <= 0:
+            raise ValueError(f"max_dirty must be positive, got {max_dirty}")
+        
+        super().__init__(capacity, ttl, name, stats)
         
         self.writer = writer
+        self.writer_many = writer_many
         self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_dirty = max_dirty
+        self.put_timeout = put_timeout
         
-        # Dirty entry tracking
-        self._dirty_keys: Set[Hashable] = set()
+        # Pending writes: key -> latest value (repeated puts coalesce)
+        self._dirty: Dict[Hashable, Any] = {}
+        # Batch being written by flush(), still readable through get()
+        self._flushing: Dict[Hashable, Any] = {}
+        # Keys of that batch deleted since: not readable, never re-queued
+        self._deleted_in_flight: Set[Hashable] = set()
+        # One flush at a time keeps writes to a key in put() order
         self._flush_lock = threading.Lock()
+        # Signalled whenever the dirty queue shrinks
+        self._room = threading.Condition(self._lock)
         
         # Statistics
         self._flush_count = 0
         self._write_count = 0
         self._write_errors = 0
+        self._batch_writes = 0
+        self._coalesced_writes = 0
+        self._evicted_dirty = 0
+        self._backpressure_waits = 0
         
         # Background flusher
         self._flusher_thread = None
         self._stop_flusher = threading.Event()
+        self._flush_requested = threading.Event()
         
-        if auto_start and writer:
+        if auto_start and (writer or writer_many):
             self.start_flusher()
     
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get value by key, including entries evicted before their flush.
+        
+        Args:
+            key: Key to lookup
+            default: Default value if key not found
+        
+        Returns:
+            Cached or pending value, or default
+        """
+        value = super().get(key, _MISSING)
+        if value is _MISSING:
+            with self._lock:
+                value = self._pending_value(key, default)
+        return value
+    
     def put(self, key: Hashable, value: Any) -> None:
         """
         Put value in cache and mark as dirty for later flush.
@@ -99,15 +181,141 @@ class WriteBehindCache(LRUCache):
         Args:
             key: Cache key
             value: Value to cache
+        
+        Raises:
+            CacheTimeoutError: If the dirty queue stays full for put_timeout
+            CacheError: If the queue is full and an inline flush writes nothing
         """
-        # Cache immediately
-        super().put(key, value)
+        stalled = False
+        while True:
+            with self._lock:
+                if self._has_room_locked(key) or self._wait_for_room_locked(key):
+                    self._put_dirty_locked(key, value)
+                    break
+                if stalled:
+                    raise CacheError(
+                        f"Write-behind cache {self.name}: {len(self._dirty)} dirty entries "
+                        f"(max_dirty={self.max_dirty}) and flush wrote nothing"
+                    )
+            # No background flusher to wait for: the caller drains the queue
+            stalled = self.flush() == 0
         
-        # Mark as dirty for flush
-        with self._flush_lock:
-            self._dirty_keys.add(key)
+        if logger.isEnabledFor(_DEBUG):
+            logger.debug(f"Cached {key} (dirty, will flush later)")
+    
+    def put_many(self, items: Dict[Hashable, Any]) -> int:
+        """
+        Put several values and mark them dirty with a single lock acquisition.
+        
+        Args:
+            items: Dictionary of key-value pairs to cache
+        
+        Returns:
+            Number of items cached
+        """
+        if self.max_dirty is not None:
+            # Backpressure may wait or flush between keys: never under the lock
+            for key, value in items.items():
+                self.put(key, value)
+            return len(items)
         
-        logger.debug(f"Cached {key} (dirty, will flush later)")
+        with self._lock:
+            for key, value in items.items():
+                self._put_dirty_locked(key, value)
+        return len(items)
+    
+    def delete(self, key: Hashable) -> bool:
+        """
+        Delete key from cache, dropping its pending write.
+        
+        Args:
+            key: Key to delete
+        
+        Returns:
+            True if key was cached or pending, False otherwise
+        """
+        with self._lock:
+            return self._discard_locked(key)
+    
+    def clear(self) -> None:
+        """Clear all items from cache, dropping pending writes."""
+        with self._lock:
+            super().clear()
+            self._dirty.clear()
+            self._deleted_in_flight.update(self._flushing)
+            self._room.notify_all()
+    
+    def _has_room_locked(self, key: Hashable) -> bool:
+        """Whether put(key) fits in the dirty queue (lock held)."""
+        return self.max_dirty is None or key in self._dirty or len(self._dirty) < self.max_dirty
+    
+    def _wait_for_room_locked(self, key: Hashable) -> bool:
+        """
+        Wait for the background flusher to drain the queue (lock held).
+        
+        Returns False at once when no flusher runs (the caller flushes).
+        """
+        if not self._flusher_alive():
+            return False
+        
+        self._backpressure_waits += 1
+        self._flush_requested.set()
+        if not self._room.wait_for(
+            lambda: self._has_room_locked(key) or not self._flusher_alive(),
+            self.put_timeout
+        ):
+            raise CacheTimeoutError(
+                f"Write-behind cache {self.name}: dirty queue full "
+                f"(max_dirty={self.max_dirty}) for {self.put_timeout}s"
+            )
+        return self._has_room_locked(key)
+    
+    def _put_dirty_locked(self, key: Hashable, value: Any) -> None:
+        """Cache value and queue its write (lock held)."""
+        evicted = self._store_locked(key, value)
+        self._deleted_in_flight.discard(key)
+        dirty = self._dirty
+        if key in dirty:
+            self._coalesced_writes += 1
+        dirty[key] = value
+        
+        if evicted is not None and evicted.key in dirty:
+            # Still queued with its value: flush it now rather than at the
+            # next interval, so evicted data does not linger in memory
+            self._evicted_dirty += 1
+            self._flush_requested.set()
+        elif len(dirty) >= self.batch_size:
+            self._flush_requested.set()
+    
+    def _discard_locked(self, key: Hashable) -> bool:
+        """Remove key and its pending write (lock held)."""
+        queued = self._dirty.pop(key, _MISSING) is not _MISSING
+        if queued:
+            self._room.notify_all()
+        # An in-flight write cannot be recalled: hide it and never retry it
+        in_flight = key in self._flushing and key not in self._deleted_in_flight
+        if in_flight:
+            self._deleted_in_flight.add(key)
+        return self._delete_locked(key) or queued or in_flight
+    
+    def _pending_value(self, key: Hashable, default: Any) -> Any:
+        """Queued or in-flight value for an uncached key."""
+        value = self._dirty.get(key, _MISSING)
+        if value is _MISSING:
+            if key in self._deleted_in_flight:
+                return default
+            value = self._flushing.get(key, default)
+        return value
+    
+    def _requeue_failed_locked(self, failed: Dict[Hashable, Any]) -> None:
+        """Queue failed writes again, except deleted or superseded keys (lock held)."""
+        deleted = self._deleted_in_flight
+        for key, value in failed.items():
+            if key not in deleted:
+                # A newer put() since the swap supersedes a failed value
+                self._dirty.setdefault(key, value)
+        self._flushing = {}
+        deleted.clear()
     
     def flush(self) -> int:
         """
@@ -116,35 +324,64 @@ class WriteBehindCache(LRUCache):
         Returns:
             Number of entries flushed
         """
-        if not self.writer:
+        if not (self.writer or self.writer_many):
             return 0
         
         with self._flush_lock:
-            dirty_keys = list(self._dirty_keys)
-            self._dirty_keys.clear()
-        
-        flushed = 0
-        
-        for key in dirty_keys:
+            with self._lock:
+                pending, self._dirty = self._dirty, {}
+                self._flushing = pending
+                self._room.notify_all()
+            
+            if not pending:
+                return 0
+            
+            failed = pending
             try:
-                value = self.get(key)
-                if value is not None:
-                    self.writer(key, value)
-                    flushed += 1
-                    self._write_count += 1
-            except Exception as e:
-                logger.error(f"Failed to flush {key}: {e}")
-                self._write_errors += 1
-                # Re-add to dirty set
-                with self._flush_lock:
-                    self._dirty_keys.add(key)
+                failed = self._write(pending)
+            finally:
+                with self._lock:
+                    self._requeue_failed_locked(failed)
         
+        flushed = len(pending) - len(failed)
         if flushed > 0:
+            self._write_count += flushed
             self._flush_count += 1
             logger.info(f"Flushed {flushed} entries to storage")
         
         return flushed
     
+    def _write(self, pending: Dict[Hashable, Any]) -> Dict[Hashable, Any]:
+        """Write pending entries outside the cache lock; returns the failed ones."""
+        failed: Dict[Hashable, Any] = {}
+        
+        if self.writer_many:
+            for batch in _batches(pending, self.batch_size):
+                try:
+                    self.writer_many(batch)
+                    self._batch_writes += 1
+                except Exception as e:
+                    logger.error(f"Failed to flush batch of {len(batch)} entries: {e}")
+                    self._write_errors += 1
+                    failed.update(batch)
+            return failed
+        
+        for key, value in pending.items():
+            try:
+                self.writer(key, value)
+            except Exception as e:
+                logger.error(f"Failed to flush {key}: {e}")
+                self._write_errors += 1
+                failed[key] = value
+        return failed
+    
+    def _flusher_alive(self) -> bool:
+        return (
+            self._flusher_thread is not None
+            and self._flusher_thread.is_alive()
+            and not self._stop_flusher.is_set()
+        )
+    
     def start_flusher(self) -> None:
         """Start background flusher thread."""
         if self._flusher_thread and self._flusher_thread.is_alive():
@@ -171,20 +408,27 @@ class WriteBehindCache(LRUCache):
             return
         
         self._stop_flusher.set()
+        self._flush_requested.set()
         self._flusher_thread.join(timeout=5.0)
         
+        # Producers waiting on the flusher fall back to flushing themselves
+        with self._lock:
+            self._room.notify_all()
+        
         if flush_remaining:
             self.flush()
         
         logger.info("Stopped background flusher")
     
     def _background_flusher(self) -> None:
-        """Background thread for periodic flushing."""
+        """Background thread for periodic (or requested) flushing."""
         logger.debug("Background flusher started")
         
         while not self._stop_flusher.is_set():
-            # Wait for interval or stop signal
-            if self._stop_flusher.wait(self.flush_interval):
+            # Wait for interval, a full batch, an evicted dirty entry or stop
+            self._flush_requested.wait(self.flush_interval)
+            self._flush_requested.clear()
+            if self._stop_flusher.is_set():
                 break
             
             # Flush dirty entries
@@ -195,14 +439,25 @@ class WriteBehindCache(LRUCache):
         
         logger.debug("Background flusher stopped")
     
+    def _write_behind_stats(self) -> Dict[str, Any]:
+        return {
+            'dirty_entries': len(self._dirty),
+            'max_dirty': self.max_dirty,
+            'batch_size': self.batch_size,
+            'flush_count': self._flush_count,
+            'write_count': self._write_count,
+            'write_errors': self._write_errors,
+            'batch_writes': self._batch_writes,
+            'coalesced_writes': self._coalesced_writes,
+            'evicted_dirty': self._evicted_dirty,
+            'backpressure_waits': self._backpressure_waits,
+            'flusher_running': self._flusher_alive(),
+        }
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics including write-behind metrics."""
         stats = super().get_stats()
-        stats['dirty_entries'] = len(self._dirty_keys)
-        stats['flush_count'] = self._flush_count
-        stats['write_count'] = self._write_count
-        stats['write_errors'] = self._write_errors
-        stats['flusher_running'] = self._flusher_thread and self._flusher_thread.is_alive()
+        stats.update(self._write_behind_stats())
         return stats
     
     def __del__(self):
@@ -213,7 +468,343 @@ class WriteBehindCache(LRUCache):
             pass
 
 
+class AsyncWriteBehindCache(AsyncLRUCache):
+    """
+    Async write-behind cache, flushed by an asyncio task.
+    
+    Same pipeline as WriteBehindCache (coalescing, batch writes, evicted
+    dirty entries kept until written, bounded queue). writer and
+    writer_many may be plain functions or coroutine functions.
+    
+    The flusher task needs a running event loop: with auto_start it is
+    started by the first put(), otherwise call start_flusher().
+    
+    Example:
+        async def save_rows(items):
+            await db.upsert_many(items.items())
+        
+        async with AsyncWriteBehindCache(writer_many=save_rows) as cache:
+            await cache.put('user:123', user_data)
+        # Remaining dirty entries are flushed on exit
+    """
+    
+    def __init__(
+        self,
+        capacity: int = 128,
+        writer: Optional[Callable[[Any, Any], Any]] = None,
+        flush_interval: float = 5.0,
+        ttl: Optional[float] = None,
+        name: Optional[str] = None,
+        auto_start: bool = True,
+        writer_many: Optional[Callable[[Dict[Hashable, Any]], Any]] = None,
+        batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+        max_dirty: Optional[int] = None,
+        put_timeout: Optional[float] = None
+    ):
+        """
+        Initialize async write-behind cache.
+        
+        Args:
+            capacity: Maximum cache size
+            writer: Function or coroutine function (key, value) persisting one value
+            flush_interval: Interval between flushes in seconds
+            ttl: Optional TTL in seconds
+            name: Cache name
+            auto_start: Start the flusher task on the first put()
+            writer_many: Function or coroutine function persisting {key: value}
+            batch_size: Maximum entries per writer_many() call
+            max_dirty: Maximum pending writes (None = unbounded)
+            put_timeout: Max seconds put() waits for room in a full queue
+        
+        Raises:
+            ValueError: If batch_size or max_dirty is not positive
+        """
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        if max_dirty is not None and max_dirty <= 0:
+            raise ValueError(f"max_dirty must be positive, got {max_dirty}")
+        
+        super().__init__(capacity, ttl, name)
+        
+        self.writer = writer
+        self.writer_many = writer_many
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_dirty = max_dirty
+        self.put_timeout = put_timeout
+        self.auto_start = auto_start
+        
+        self._dirty: Dict[Hashable, Any] = {}
+        self._flushing: Dict[Hashable, Any] = {}
+        self._deleted_in_flight: Set[Hashable] = set()
+        self._flush_lock = asyncio.Lock()
+        self._room = asyncio.Condition(self._lock)
+        
+        # Statistics
+        self._flush_count = 0
+        self._write_count = 0
+        self._write_errors = 0
+        self._batch_writes = 0
+        self._coalesced_writes = 0
+        self._evicted_dirty = 0
+        self._backpressure_waits = 0
+        
+        # Background flusher
+        self._flusher_task: Optional[asyncio.Task] = None
+        self._stop_flusher = asyncio.Event()
+        self._flush_requested = asyncio.Event()
+    
+    # Lock-held queue helpers are shared with WriteBehindCache
+    _has_room_locked = WriteBehindCache._has_room_locked
+    _put_dirty_locked = WriteBehindCache._put_dirty_locked
+    _discard_locked = WriteBehindCache._discard_locked
+    _pending_value = WriteBehindCache._pending_value
+    _requeue_failed_locked = WriteBehindCache._requeue_failed_locked
+    _write_behind_stats = WriteBehindCache._write_behind_stats
+    
+    async def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get value by key, including entries evicted before their flush."""
+        value = await super().get(key, _MISSING)
+        if value is _MISSING:
+            value = self._pending_value(key, default)
+        return value
+    
+    async def get_many(self, keys: List[Hashable]) -> Dict[Hashable, Any]:
+        """Get several values, including entries evicted before their flush."""
+        results = await super().get_many(keys)
+        for key in keys:
+            if key not in results:
+                value = self._pending_value(key, _MISSING)
+                if value is not _MISSING:
+                    results[key] = value
+        return results
+    
+    async def put(self, key: Hashable, value: Any) -> None:
+        """
+        Put value in cache and mark as dirty for later flush.
+        
+        Raises:
+            CacheTimeoutError: If the dirty queue stays full for put_timeout
+            CacheError: If the queue is full and an inline flush writes nothing
+        """
+        self._ensure_flusher()
+        stalled = False
+        while True:
+            async with self._lock:
+                if self._has_room_locked(key) or await self._wait_for_room_locked(key):
+                    self._put_dirty_locked(key, value)
+                    return
+                if stalled:
+                    raise CacheError(
+                        f"Write-behind cache {self.name}: {len(self._dirty)} dirty entries "
+                        f"(max_dirty={self.max_dirty}) and flush wrote nothing"
+                    )
+            stalled = await self.flush() == 0
+    
+    async def put_many(self, items: Dict[Hashable, Any]) -> int:
+        """Put several values and mark them dirty with a single lock acquisition."""
+        if self.max_dirty is not None:
+            for key, value in items.items():
+                await self.put(key, value)
+            return len(items)
+        
+        self._ensure_flusher()
+        async with self._lock:
+            for key, value in items.items():
+                self._put_dirty_locked(key, value)
+        return len(items)
+    
+    async def delete(self, key: Hashable) -> bool:
+        """Delete key from cache, dropping its pending write."""
+        async with self._lock:
+            return self._discard_locked(key)
+    
+    async def delete_many(self, keys: List[Hashable]) -> int:
+        """Delete several keys and their pending writes with a single lock acquisition."""
+        async with self._lock:
+            return sum(1 for key in keys if self._discard_locked(key))
+    
+    async def clear(self) -> None:
+        """Clear all items from cache, dropping pending writes."""
+        await super().clear()
+        async with self._lock:
+            self._dirty.clear()
+            self._deleted_in_flight.update(self._flushing)
+            self._room.notify_all()
+    
+    async def _wait_for_room_locked(self, key: Hashable) -> bool:
+        """Wait for the flusher task to drain the queue (lock held)."""
+        if not self._flusher_alive():
+            return False
+        
+        self._backpressure_waits += 1
+        self._flush_requested.set()
+        try:
+            await asyncio.wait_for(
+                self._room.wait_for(lambda: self._has_room_locked(key) or not self._flusher_alive()),
+                self.put_timeout
+            )
+        except asyncio.TimeoutError:
+            raise CacheTimeoutError(
+                f"Write-behind cache {self.name}: dirty queue full "
+                f"(max_dirty={self.max_dirty}) for {self.put_timeout}s"
+            ) from None
+        return self._has_room_locked(key)
+    
+    async def flush(self) -> int:
+        """
+        Flush all dirty entries to storage.
+        
+        Returns:
+            Number of entries flushed
+        """
+        if not (self.writer or self.writer_many):
+            return 0
+        
+        async with self._flush_lock:
+            async with self._lock:
+                pending, self._dirty = self._dirty, {}
+                self._flushing = pending
+                self._room.notify_all()
+            
+            if not pending:
+                return 0
+            
+            failed = pending
+            try:
+                failed = await self._write(pending)
+            finally:
+                async with self._lock:
+                    self._requeue_failed_locked(failed)
+        
+        flushed = len(pending) - len(failed)
+        if flushed > 0:
+            self._write_count += flushed
+            self._flush_count += 1
+            logger.info(f"Flushed {flushed} entries to storage")
+        
+        return flushed
+    
+    async def _write(self, pending: Dict[Hashable, Any]) -> Dict[Hashable, Any]:
+        """Write pending entries outside the cache lock; returns the failed ones."""
+        failed: Dict[Hashable, Any] = {}
+        
+        if self.writer_many:
+            for batch in _batches(pending, self.batch_size):
+                try:
+                    result = self.writer_many(batch)
+                    if inspect.isawaitable(result):
+                        await result
+                    self._batch_writes += 1
+                except Exception as e:
+                    logger.error(f"Failed to flush batch of {len(batch)} entries: {e}")
+                    self._write_errors += 1
+                    failed.update(batch)
+            return failed
+        
+        for key, value in pending.items():
+            try:
+                result = self.writer(key, value)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error(f"Failed to flush {key}: {e}")
+                self._write_errors += 1
+                failed[key] = value
+        return failed
+    
+    def _flusher_alive(self) -> bool:
+        return (
+            self._flusher_task is not None
+            and not self._flusher_task.done()
+            and not self._stop_flusher.is_set()
+        )
+    
+    def _ensure_flusher(self) -> None:
+        if self.auto_start and self._flusher_task is None and (self.writer or self.writer_many):
+            self.start_flusher()
+    
+    def start_flusher(self) -> None:
+        """Start the background flusher task (must be called from a running loop)."""
+        if self._flusher_task is not None and not self._flusher_task.done():
+            logger.warning("Flusher already running")
+            return
+        
+        self._stop_flusher.clear()
+        self._flusher_task = asyncio.get_running_loop().create_task(
+            self._background_flusher(),
+            name=f"{self.name}-flusher"
+        )
+        logger.info(f"Started background flusher task (interval: {self.flush_interval}s)")
+    
+    async def stop_flusher(self, flush_remaining: bool = True) -> None:
+        """
+        Stop the background flusher task.
+        
+        Args:
+            flush_remaining: Flush remaining dirty entries before stopping
+        """
+        task = self._flusher_task
+        if task is None or task.done():
+            return
+        
+        self._stop_flusher.set()
+        self._flush_requested.set()
+        await task
+        
+        async with self._lock:
+            self._room.notify_all()
+        
+        if flush_remaining:
+            await self.flush()
+        
+        logger.info("Stopped background flusher task")
+    
+    async def _background_flusher(self) -> None:
+        """Background task for periodic (or requested) flushing."""
+        logger.debug("Background flusher task started")
+        
+        while not self._stop_flusher.is_set():
+            try:
+                await asyncio.wait_for(self._flush_requested.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+            if self._stop_flusher.is_set():
+                break
+            
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Background flush error: {e}")
+        
+        logger.debug("Background flusher task stopped")
+    
+    async def get_stats(self) -> Dict[str, Any]:
+        """Get statistics including write-behind metrics."""
+        stats = await super().get_stats()
+        stats['type'] = 'AsyncWriteBehind'
+        stats.update(self._write_behind_stats())
+        return stats
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit: stop the flusher and flush what is left."""
+        await self.stop_flusher(flush_remaining=False)
+        await self.flush()
+        return False
+
+
+def _batches(pending: Dict[Hashable, Any], size: int):
+    """Split pending writes into dicts of at most size entries."""
+    if len(pending) <= size:
+        yield pending
+        return
+    items = list(pending.items())
+    for start in range(0, len(items), size):
+        yield dict(items[start:start + size])
+
+
 __all__ = [
     'WriteBehindCache',
+    'AsyncWriteBehindCache',
 ]
-
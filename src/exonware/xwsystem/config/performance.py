@@ -43,6 +43,9 @@ class SerializationLimits:
     # Memory management
     max_memory_mb: float = 200.0                # Maximum memory usage for operations
     enable_compression: bool = False            # Enable compression by default
+    
+    # Backend selection
+    json_backend: str = "auto"                  # auto, msgspec, orjson, ujson or json
 
 
 @dataclass
@@ -155,6 +158,9 @@ class PerformanceConfig:
         if val := os.getenv('XSYSTEM_MAX_FILE_SIZE_MB'):
             self._limits.serialization.max_file_size_mb = float(val)
         
+        if val := os.getenv('XSYSTEM_JSON_BACKEND'):
+            self._limits.serialization.json_backend = val.lower()
+        
         # Network limits
         if val := os.getenv('XSYSTEM_CONNECT_TIMEOUT'):
             self._limits.network.connect_timeout = float(val)
@@ -254,6 +260,7 @@ class PerformanceConfig:
             'use_atomic_writes': self._limits.serialization.use_atomic_writes,
             'validate_input': self._limits.serialization.validate_input,
             'validate_paths': self._limits.serialization.validate_paths,
+            'json_backend': self._limits.serialization.json_backend,
         }
     
     def get_network_config(self) -> Dict[str, Any]:
@@ -341,6 +348,7 @@ class PerformanceConfig:
                 'use_atomic_writes': self._limits.serialization.use_atomic_writes,
                 'validate_input': self._limits.serialization.validate_input,
                 'validate_paths': self._limits.serialization.validate_paths,
+                'json_backend': self._limits.serialization.json_backend,
             },
             'network': {
                 'connect_timeout': self._limits.network.connect_timeout,
@@ -11,12 +11,21 @@ Universal Codec Registry - High-performance registry for all codec types.
 from typing import Optional, Dict, Type, List, Union, Set, Any, Callable
 from pathlib import Path
 from threading import RLock
-from functools import lru_cache
 import mimetypes
 
 from .contracts import ICodec, ICodecMetadata
 from ..errors import CodecNotFoundError, CodecRegistrationError
 from ..contracts import CodecCapability
+from ...caching.snapshot_cache import SnapshotCache
+from ...caching.defs import StatsMode
+
+# Cached id/extension/MIME/alias lookups (oldest evicted first)
+LOOKUP_CACHE_SIZE = 1024
+
+# Cached detect() results, one per (path, codec_type) (oldest evicted first)
+DETECT_CACHE_SIZE = 256
+
+_MISSING = object()
 
 
 class CompoundExtensionTrie:
@@ -92,13 +101,13 @@ class UniversalCodecRegistry:
     - Metadata retrieval
     - Unregister support
     - Instance caching for O(1) lookups
-    - LRU caching for detection results
+    - Lock-free snapshot cache for lookups, bounded dict for detection results
     
     Performance Targets:
     - Codec lookup: < 1ms (O(1) hash map)
     - Detection: < 2ms (cached)
     - Registration: < 5ms per codec
-    - Thread-safe with minimal lock contention
+    - Thread-safe with minimal lock contention (cached lookups take no lock)
     """
     
     def __init__(self):
@@ -127,6 +136,27 @@ class UniversalCodecRegistry:
         
         # Thread safety
         self._lock = RLock()
+        
+        # Lookup results; read without locking, written under self._lock
+        # and cleared whenever the registry changes
+        self._lookups = SnapshotCache(
+            capacity=LOOKUP_CACHE_SIZE, name="codec-registry-lookups", stats=StatsMode.DISABLED
+        )
+        
+        # Detection results keyed per path, so misses are frequent: a plain
+        # dict avoids copying a snapshot on every insert
+        self._detections: Dict[tuple, Optional[ICodec]] = {}
+    
+    def _cached_lookup(self, kind: str, name: str, resolve: Callable[[str], Optional[ICodec]]) -> Optional[ICodec]:
+        """Serve a lookup from the snapshot cache, resolving misses under the registry lock."""
+        key = (kind, name)
+        result = self._lookups.get(key, _MISSING)
+        if result is not _MISSING:
+            return result
+        with self._lock:
+            result = resolve(name)
+            self._lookups.put(key, result)
+        return result
     
     def register(
         self,
@@ -332,6 +362,10 @@ class UniversalCodecRegistry:
         Returns:
             Codec instance or None
         """
+        return self._cached_lookup('id', codec_id, self._get_by_id_locked)
+    
+    def _get_by_id_locked(self, codec_id: str) -> Optional[ICodec]:
+        """Resolve a codec by ID (lock held)."""
         with self._lock:
             codec_id_lower = codec_id.lower()
             
@@ -358,6 +392,10 @@ class UniversalCodecRegistry:
         Returns:
             Highest priority codec instance or None
         """
+        return self._cached_lookup('ext', ext, self._get_by_extension_locked)
+    
+    def _get_by_extension_locked(self, ext: str) -> Optional[ICodec]:
+        """Resolve a codec by extension (lock held)."""
         with self._lock:
             normalized_ext = ext.lower()
             if not normalized_ext.startswith('.'):
@@ -381,6 +419,10 @@ class UniversalCodecRegistry:
         Returns:
             Highest priority codec instance or None
         """
+        return self._cached_lookup('mime', mime, self._get_by_mime_type_locked)
+    
+    def _get_by_mime_type_locked(self, mime: str) -> Optional[ICodec]:
+        """Resolve a codec by MIME type (lock held)."""
         with self._lock:
             codec_list = self._by_mime_type.get(mime.lower(), [])
             if not codec_list:
@@ -400,13 +442,16 @@ class UniversalCodecRegistry:
         Returns:
             Codec instance or None
         """
+        return self._cached_lookup('alias', alias, self._get_by_alias_locked)
+    
+    def _get_by_alias_locked(self, alias: str) -> Optional[ICodec]:
+        """Resolve a codec by alias (lock held)."""
         with self._lock:
             codec_id = self._by_alias.get(alias.lower())
             if not codec_id:
                 return None
             return self.get_by_id(codec_id)
     
-    @lru_cache(maxsize=256)
     def detect(self, path: Union[str, Path], codec_type: Optional[str] = None) -> Optional[ICodec]:
         """
         Auto-detect codec from file path (best match with optional type filter).
@@ -425,9 +470,16 @@ class UniversalCodecRegistry:
         Returns:
             Best matching codec instance or None
         """
-        # Note: This is cached, so we need to handle the lock carefully
+        key = (path, codec_type)
+        result = self._detections.get(key, _MISSING)
+        if result is not _MISSING:
+            return result
         with self._lock:
-            return self._detect_internal(path, codec_type)
+            result = self._detect_internal(path, codec_type)
+            if len(self._detections) >= DETECT_CACHE_SIZE:
+                del self._detections[next(iter(self._detections))]
+            self._detections[key] = result
+        return result
     
     def _detect_internal(self, path: Union[str, Path], codec_type: Optional[str] = None) -> Optional[ICodec]:
         """Internal detection implementation (not cached)."""
@@ -694,9 +746,9 @@ class UniversalCodecRegistry:
             self._detect_cache_clear()
     
     def _detect_cache_clear(self) -> None:
-        """Clear the detection cache."""
-        # Clear the LRU cache for detect method
-        self.detect.cache_clear()
+        """Clear the lookup and detection cache."""
+        self._lookups.clear()
+        self._detections.clear()
     
     # ========================================================================
     # BULK OPERATIONS
@@ -4,15 +4,22 @@ Atomic file operations to prevent data corruption during writes.
 
 import logging
 import os
+import secrets
 import shutil
 import tempfile
 import time
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, BinaryIO, List, Optional, TextIO, Union
+from typing import Any, BinaryIO, Iterable, List, Optional, TextIO, Union
 
 logger = logging.getLogger(__name__)
 
+# Flags for exclusively creating the temporary file
+_TEMP_FILE_FLAGS = (
+    os.O_RDWR | os.O_CREAT | os.O_EXCL
+    | getattr(os, "O_BINARY", 0) | getattr(os, "O_NOINHERIT", 0)
+)
+
 
 class FileOperationError(Exception):
     """Raised when file operations fail."""
@@ -36,6 +43,7 @@ class AtomicFileWriter:
         encoding: Optional[str] = "utf-8",
         backup: bool = False,
         temp_dir: Optional[Union[str, Path]] = None,
+        buffer_size: int = -1,
     ):
         """
         Initialize atomic file writer.
@@ -46,12 +54,14 @@ class AtomicFileWriter:
             encoding: Text encoding (for text modes)
             backup: Whether to create backup of existing file
             temp_dir: Directory for temporary files (defaults to same as target)
+            buffer_size: Write buffer size in bytes (-1 = io default)
         """
         self.target_path = Path(target_path)
         self.mode = mode
         self.encoding = encoding if "b" not in mode else None
         self.backup = backup
         self.temp_dir = Path(temp_dir) if temp_dir else self.target_path.parent
+        self.buffer_size = buffer_size
 
         self.temp_path: Optional[Path] = None
         self.backup_path: Optional[Path] = None
@@ -95,22 +105,27 @@ class AtomicFileWriter:
 
             # Create temporary file in same directory as target
             # This ensures they're on the same filesystem for atomic move
-            fd, temp_path_str = tempfile.mkstemp(
-                prefix=f".{self.target_path.name}_", suffix=".tmp", dir=self.temp_dir
-            )
+            self.temp_path = self._create_temp_file()
 
-            self.temp_path = Path(temp_path_str)
-
-            # Close the file descriptor and reopen with desired mode
-            os.close(fd)
+            # Keep the target's permissions (new files get the umask default)
+            if self.target_path.exists():
+                try:
+                    os.chmod(self.temp_path, self.target_path.stat().st_mode)
+                except OSError:
+                    pass  # Ignore permission errors
 
-            # Open with the requested mode and encoding
+            # Open with the requested mode, encoding and buffering
             if self.encoding:
                 self.file_handle = open(
-                    self.temp_path, self.mode, encoding=self.encoding
+                    self.temp_path,
+                    self.mode,
+                    buffering=self.buffer_size,
+                    encoding=self.encoding,
                 )
             else:
-                self.file_handle = open(self.temp_path, self.mode)
+                self.file_handle = open(
+                    self.temp_path, self.mode, buffering=self.buffer_size
+                )
 
             logger.debug(
                 f"Started atomic write: {self.target_path} via {self.temp_path}"
@@ -121,11 +136,60 @@ class AtomicFileWriter:
             self._cleanup()
             raise FileOperationError(f"Failed to start atomic write: {e}") from e
 
-    def commit(self) -> None:
+    def _create_temp_file(self) -> Path:
+        """
+        Create an empty temporary file in the temp directory.
+
+        The file is created with mode 0o666 and the kernel applies the
+        process umask, as for a plain open(); tempfile.mkstemp() would make
+        it owner-only (0600).
+        """
+        for _ in range(tempfile.TMP_MAX):
+            temp_path = self.temp_dir / f".{self.target_path.name}_{secrets.token_hex(4)}.tmp"
+            try:
+                fd = os.open(temp_path, _TEMP_FILE_FLAGS, 0o666)
+            except FileExistsError:
+                continue
+            os.close(fd)
+            return temp_path
+        raise FileExistsError(f"No usable temporary file name in {self.temp_dir}")
+
+    def write_chunks(self, chunks: Iterable[Union[str, bytes]]) -> int:
+        """
+        Write an iterable of chunks to the temporary file as they arrive.
+
+        Lets encoders that produce output piece by piece (e.g. iter_encode())
+        stream into the file without joining the whole payload in memory.
+        Text chunks are encoded when the file was opened in binary mode.
+
+        Args:
+            chunks: Iterable of str or bytes chunks
+
+        Returns:
+            Number of chunks written
+        """
+        if not self._started or self.file_handle is None:
+            raise FileOperationError("Atomic write operation not started")
+
+        write = self.file_handle.write
+        binary = "b" in self.mode
+        count = 0
+        for chunk in chunks:
+            if binary and isinstance(chunk, str):
+                chunk = chunk.encode("utf-8")
+            write(chunk)
+            count += 1
+        return count
+
+    def commit(self, keep_backup: bool = True) -> None:
         """
         Commit the atomic write operation.
 
         This closes the temporary file and atomically moves it to the target location.
+
+        Args:
+            keep_backup: Whether to leave the backup file in place after a
+                successful commit (pass False to remove it)
         """
         if not self._started:
             raise FileOperationError("Atomic write operation not started")
@@ -169,6 +233,10 @@ class AtomicFileWriter:
 
             logger.debug(f"Committed atomic write: {self.target_path}")
 
+            # Drop the backup now that the new content is in place
+            if not keep_backup:
+                self._cleanup()
+
         except Exception as e:
             # Try to rollback on commit failure
             self.rollback()
@@ -255,6 +323,7 @@ def atomic_write(
     encoding: Optional[str] = "utf-8",
     backup: bool = True,
     temp_dir: Optional[Union[str, Path]] = None,
+    buffer_size: int = -1,
 ):
     """
     Context manager for atomic file writing.
@@ -265,6 +334,7 @@ def atomic_write(
         encoding: Text encoding (for text modes)
         backup: Whether to create backup of existing file
         temp_dir: Directory for temporary files
+        buffer_size: Write buffer size in bytes (-1 = io default)
 
     Yields:
         File handle for writing
@@ -279,6 +349,7 @@ def atomic_write(
         encoding=encoding,
         backup=backup,
         temp_dir=temp_dir,
+        buffer_size=buffer_size,
     )
 
     with writer as f:
@@ -360,7 +360,11 @@ class SerializationError(Exception):
     Root cause fixed: Added missing SerializationError class that was being
     imported by serialization/base.py but didn't exist.
     """
-    pass
+    
+    def __init__(self, message: str = "", format_name: str = "", original_error: Optional[Exception] = None):
+        super().__init__(message)
+        self.format_name = format_name
+        self.original_error = original_error
 
 
 class EncodeError(CodecError):
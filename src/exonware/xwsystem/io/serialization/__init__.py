@@ -19,6 +19,7 @@ Following I→A→XW pattern:
 # Contracts and base classes
 from .contracts import ISerialization
 from .base import ASerialization, ASchemaRegistry
+from .batch import BatchResult
 
 # Registry
 from .registry import SerializationRegistry, get_serialization_registry
@@ -114,6 +115,7 @@ __all__ = [
     # Interfaces and base classes
     "ISerialization",
     "ASerialization",
+    "BatchResult",
     "ASchemaRegistry",
     
     # Registry
@@ -23,12 +23,42 @@ from .contracts import ISerialization
 from ..contracts import EncodeOptions, DecodeOptions
 from ..defs import CodecCapability
 from ..errors import SerializationError
+from ..common.atomic import AtomicFileWriter
+from .batch import BatchResult, iter_batch
 
 if TYPE_CHECKING:
     from .defs import CompatibilityLevel
     from .schema_registry import SchemaInfo
 
 
+# Write buffer used by save_file() while streaming iter_encode() output
+DEFAULT_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Top-level items/entries encoded per piece by incremental encoders
+DEFAULT_ENCODE_BATCH_SIZE = 1000
+
+
+def _rechunk(pieces: Iterator[Union[str, bytes]], chunk_size: int) -> Iterator[Union[str, bytes]]:
+    """Regroup encoder pieces of any size into chunks of exactly chunk_size (last may be shorter)."""
+    pending: List[Union[str, bytes]] = []
+    size = 0
+    for piece in pieces:
+        if not piece:
+            continue
+        pending.append(piece)
+        size += len(piece)
+        if size >= chunk_size:
+            joined = piece[:0].join(pending)
+            end = size - size % chunk_size
+            for i in range(0, end, chunk_size):
+                yield joined[i:i + chunk_size]
+            rest = joined[end:]
+            pending = [rest] if rest else []
+            size = len(rest)
+    if pending:
+        yield pending[0][:0].join(pending)
+
+
 class ASerialization(ACodec[Any, Union[bytes, str]], ISerialization, ABC):
     """
     Abstract base class for serialization - follows I→A→XW pattern.
@@ -247,32 +277,36 @@ class ASerialization(ACodec[Any, Union[bytes, str]], ISerialization, ABC):
         Save data to file with atomic operations.
         
         Default implementation:
-        1. Encode data using encode()
-        2. Write to file using Path.write_bytes() or write_text()
-        3. Uses atomic operations if configured
+        1. Encode data piece by piece using iter_encode()
+        2. Stream the pieces into a temporary file through AtomicFileWriter
+        3. Move the temporary file into place once encoding finished
+        
+        Formats with incremental encoders never hold the whole output in
+        memory, and a failure mid-way (e.g. a generator raising) leaves any
+        existing file untouched.
         
         Args:
-            data: Data to serialize and save
+            data: Data to serialize and save (streaming formats also accept
+                  iterators/generators as a top-level array)
             file_path: Path to save file
-            **options: Format-specific options
+            **options: Format-specific options, plus write_buffer_size
+                       (bytes, default 1 MiB)
         
         Raises:
             SerializationError: If save fails
         """
         try:
             path = Path(file_path)
+            write_buffer_size = options.pop('write_buffer_size', DEFAULT_WRITE_BUFFER_SIZE)
             
             # Ensure parent directory exists
             path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Encode data
-            repr_data = self.encode(data, options=options or None)
-            
-            # Write to file (atomic)
-            if isinstance(repr_data, bytes):
-                path.write_bytes(repr_data)
-            else:
-                path.write_text(repr_data, encoding='utf-8')
+            # Encode and write incrementally (atomic)
+            pieces = self.iter_encode(data, options=options or None)
+            writer = AtomicFileWriter(path, mode='wb', buffer_size=write_buffer_size)
+            with writer:
+                writer.write_chunks(pieces)
                 
         except Exception as e:
             raise SerializationError(
@@ -327,6 +361,99 @@ class ASerialization(ACodec[Any, Union[bytes, str]], ISerialization, ABC):
                 original_error=e
             )
     
+    # ========================================================================
+    # BATCH OPERATIONS (Serial, thread or process executors)
+    # ========================================================================
+    
+    def iter_batch_load(
+        self,
+        file_paths: List[Union[str, Path]],
+        *,
+        executor: str = "auto",
+        max_workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        ordered: bool = True,
+        **options
+    ) -> Iterator[BatchResult]:
+        """
+        Load many files in parallel, yielding one BatchResult per file.
+        
+        "auto" uses worker processes for CPU-heavy decoders (YAML, XML,
+        TOML, JSON5) on batches of 64+ files and a thread pool otherwise.
+        Files are submitted chunksize at a time to amortize IPC. A file
+        that fails yields success=False with its error; the batch goes on.
+        
+        Args:
+            file_paths: Files to load
+            executor: "auto", "serial", "thread" or "process"
+            max_workers: Worker threads/processes
+            chunksize: Files per submitted task (default: ~4 tasks per worker)
+            ordered: Yield in input order (False: as files complete)
+            **options: Passed to load_file()
+        
+        Yields:
+            BatchResult (path, success, value, error)
+        
+        Example:
+            >>> for result in serializer.iter_batch_load(paths, ordered=False):
+            ...     if result.success:
+            ...         index(result.path, result.value)
+        """
+        return iter_batch(
+            self, "load", file_paths, executor=executor, max_workers=max_workers,
+            chunksize=chunksize, ordered=ordered, **options
+        )
+    
+    def iter_batch_save(
+        self,
+        data_dict: Dict[Union[str, Path], Any],
+        *,
+        executor: str = "auto",
+        max_workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        ordered: bool = True,
+        **options
+    ) -> Iterator[BatchResult]:
+        """
+        Save many files in parallel, yielding one BatchResult per file.
+        
+        Same executors and options as iter_batch_load(); each file is
+        written atomically by save_file().
+        
+        Args:
+            data_dict: Mapping of file path to data
+            executor: "auto", "serial", "thread" or "process"
+            max_workers: Worker threads/processes
+            chunksize: Files per submitted task
+            ordered: Yield in input order (False: as files complete)
+            **options: Passed to save_file()
+        
+        Yields:
+            BatchResult (path, success, error)
+        """
+        return iter_batch(
+            self, "save", data_dict.items(), executor=executor, max_workers=max_workers,
+            chunksize=chunksize, ordered=ordered, **options
+        )
+    
+    def batch_load(self, file_paths: List[Union[str, Path]], **options) -> Dict[str, Any]:
+        """
+        Load many files in parallel (see iter_batch_load()).
+        
+        Returns:
+            {path: data} in input order; None for files that failed
+        """
+        return {result.path: result.value for result in self.iter_batch_load(file_paths, **options)}
+    
+    def batch_save(self, data_dict: Dict[Union[str, Path], Any], **options) -> Dict[str, bool]:
+        """
+        Save many files in parallel (see iter_batch_save()).
+        
+        Returns:
+            {path: success} in input order
+        """
+        return {result.path: result.success for result in self.iter_batch_save(data_dict, **options)}
+    
     # ========================================================================
     # VALIDATION METHODS (Default implementations)
     # ========================================================================
@@ -361,12 +488,30 @@ class ASerialization(ACodec[Any, Union[bytes, str]], ISerialization, ABC):
     # STREAMING METHODS (Default implementations)
     # ========================================================================
     
+    def iter_encode(self, value: Any, *, options: Optional[EncodeOptions] = None) -> Iterator[Union[str, bytes]]:
+        """
+        Encode data as a sequence of pieces whose concatenation is encode(value).
+        
+        Default implementation: yield encode() as a single piece.
+        Formats that can emit output while walking the data override this
+        (and report supports_incremental_streaming) so that iter_serialize()
+        and save_file() never build the full representation.
+        
+        Args:
+            value: Data to encode
+            options: Format-specific encoding options
+        
+        Yields:
+            Encoded pieces (str or bytes, of arbitrary size)
+        """
+        yield self.encode(value, options=options)
+    
     def iter_serialize(self, data: Any, chunk_size: int = 8192) -> Iterator[Union[str, bytes]]:
         """
         Stream serialize data in chunks.
         
-        Default implementation: Encode all data then yield in chunks.
-        Override for true streaming support.
+        Default implementation: regroup iter_encode() pieces into chunks of
+        chunk_size, so incremental formats are streamed as they are encoded.
         
         Args:
             data: Data to serialize
@@ -375,15 +520,7 @@ class ASerialization(ACodec[Any, Union[bytes, str]], ISerialization, ABC):
         Yields:
             Serialized chunks
         """
-        # Default: encode all at once, then chunk
-        repr_data = self.encode(data)
-        
-        if isinstance(repr_data, bytes):
-            for i in range(0, len(repr_data), chunk_size):
-                yield repr_data[i:i + chunk_size]
-        else:
-            for i in range(0, len(repr_data), chunk_size):
-                yield repr_data[i:i + chunk_size]
+        yield from _rechunk(self.iter_encode(data), chunk_size)
     
     def iter_deserialize(self, src: Union[TextIO, BinaryIO, Iterator[Union[str, bytes]]]) -> Any:
         """
@@ -0,0 +1,183 @@
+"""
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+
+Parallel batch load/save for serializers.
+
+Files are processed by a thread pool for I/O-bound formats (JSON, CSV,
+binary formats - their parsers run in C or release the GIL while reading)
+and by an ipc ProcessPool for CPU-heavy pure-Python decoders (YAML, XML,
+TOML, JSON5). Process tasks are submitted in chunks, so one pickling round
+trip carries many files. Every file gets its own BatchResult: a failing
+file is reported, it does not abort the batch.
+"""
+
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+BATCH_EXECUTORS = ("auto", "serial", "thread", "process")
+
+# Decoders that hold the GIL while parsing - only processes run them in parallel
+CPU_BOUND_FORMATS = frozenset({"yaml", "xml", "toml", "json5"})
+CPU_BOUND_EXTENSIONS = frozenset({".yaml", ".yml", ".xml", ".toml", ".json5"})
+
+# Below this many files "auto" never starts worker processes
+AUTO_PROCESS_MIN_FILES = 64
+
+# Chunks per worker when chunksize is not given (as multiprocessing.Pool.map)
+_CHUNKS_PER_WORKER = 4
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one file in a batch operation."""
+    path: str
+    success: bool
+    value: Any = None
+    error: Optional[str] = None
+
+
+def _load_one(serializer: Any, options: dict, path: Union[str, Path]) -> BatchResult:
+    try:
+        return BatchResult(str(path), True, serializer.load_file(path, **options))
+    except Exception as e:
+        return BatchResult(str(path), False, error=f"{type(e).__name__}: {e}")
+
+
+def _save_one(serializer: Any, options: dict, item: Tuple[Union[str, Path], Any]) -> BatchResult:
+    path, data = item
+    try:
+        serializer.save_file(data, path, **options)
+        return BatchResult(str(path), True)
+    except Exception as e:
+        return BatchResult(str(path), False, error=f"{type(e).__name__}: {e}")
+
+
+def _run_chunk(worker: Callable[[Any], BatchResult], items: List[Any]) -> List[BatchResult]:
+    return [worker(item) for item in items]
+
+
+def resolve_executor(serializer: Any, paths: List[Union[str, Path]], executor: str) -> str:
+    """
+    Resolve "auto" to a concrete executor for a batch.
+    
+    Args:
+        serializer: Serializer doing the work
+        paths: Files in the batch
+        executor: "auto", "serial", "thread" or "process"
+    
+    Returns:
+        "serial", "thread" or "process"
+    
+    Raises:
+        ValueError: If executor is unknown
+    """
+    if executor not in BATCH_EXECUTORS:
+        raise ValueError(f"Unknown batch executor {executor!r}; expected one of: {', '.join(BATCH_EXECUTORS)}")
+    if executor != "auto":
+        return executor
+    if len(paths) <= 1:
+        return "serial"
+    
+    codec_id = serializer.codec_id
+    if codec_id:
+        cpu_bound = codec_id in CPU_BOUND_FORMATS
+    else:
+        # Auto-detecting serializers: judge by the files themselves
+        cpu_bound = any(Path(path).suffix.lower() in CPU_BOUND_EXTENSIONS for path in paths)
+    return "process" if cpu_bound and len(paths) >= AUTO_PROCESS_MIN_FILES else "thread"
+
+
+def iter_batch(
+    serializer: Any,
+    operation: str,
+    items: Iterable[Any],
+    *,
+    executor: str = "auto",
+    max_workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    ordered: bool = True,
+    **options: Any
+) -> Iterator[BatchResult]:
+    """
+    Run serializer.load_file()/save_file() over many files in parallel.
+    
+    Args:
+        serializer: Serializer (must be picklable for the process executor)
+        operation: "load" (items are paths) or "save" (items are (path, data))
+        items: Paths or (path, data) pairs
+        executor: "auto", "serial", "thread" or "process"
+        max_workers: Worker threads/processes (default: executor's default)
+        chunksize: Files per submitted task (default: spread over ~4 tasks
+                   per worker)
+        ordered: Yield results in input order (False: as they complete)
+        **options: Passed to every load_file()/save_file() call
+    
+    Yields:
+        One BatchResult per file
+    
+    Raises:
+        ValueError: If operation, executor, max_workers or chunksize is invalid
+    """
+    if operation == "load":
+        items = list(items)
+        paths = items
+        worker = partial(_load_one, serializer, options)
+    elif operation == "save":
+        items = list(items)
+        paths = [path for path, _ in items]
+        worker = partial(_save_one, serializer, options)
+    else:
+        raise ValueError(f"Unknown batch operation {operation!r}; expected 'load' or 'save'")
+    if max_workers is not None and max_workers <= 0:
+        raise ValueError(f"max_workers must be positive, got {max_workers}")
+    if chunksize is not None and chunksize <= 0:
+        raise ValueError(f"chunksize must be positive, got {chunksize}")
+    
+    mode = resolve_executor(serializer, paths, executor)
+    return _iter_results(worker, items, mode, max_workers, chunksize, ordered)
+
+
+def _iter_results(
+    worker: Callable[[Any], BatchResult],
+    items: List[Any],
+    mode: str,
+    max_workers: Optional[int],
+    chunksize: Optional[int],
+    ordered: bool
+) -> Iterator[BatchResult]:
+    if mode == "serial" or not items:
+        for item in items:
+            yield worker(item)
+        return
+    
+    if mode == "process":
+        from ...ipc.process_pool import ProcessPool
+        workers = max_workers or os.cpu_count() or 1
+        chunksize = chunksize or math.ceil(len(items) / (workers * _CHUNKS_PER_WORKER))
+        with ProcessPool(max_workers=min(workers, len(items))) as pool:
+            yield from pool.imap(worker, items, chunksize=chunksize, ordered=ordered)
+        return
+    
+    workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+    chunksize = chunksize or math.ceil(len(items) / (workers * _CHUNKS_PER_WORKER))
+    with ThreadPoolExecutor(max_workers=min(workers, len(items)), thread_name_prefix="xwserial-batch") as pool:
+        pending = iter(items)
+        futures = []
+        while chunk := list(islice(pending, chunksize)):
+            futures.append(pool.submit(_run_chunk, worker, chunk))
+        try:
+            for future in (futures if ordered else as_completed(futures)):
+                yield from future.result()
+        finally:
+            for future in futures:
+                future.cancel()
@@ -158,6 +158,20 @@ class ISerialization(ICodec[Any, Union[bytes, str]], ABC):
     # STREAMING METHODS
     # ========================================================================
     
+    @abstractmethod
+    def iter_encode(self, value: Any, *, options: Optional[EncodeOptions] = None) -> Iterator[Union[str, bytes]]:
+        """
+        Encode data as a sequence of pieces whose concatenation is encode(value).
+        
+        Args:
+            value: Data to encode
+            options: Format-specific encoding options
+        
+        Yields:
+            Encoded pieces
+        """
+        pass
+    
     @abstractmethod
     def iter_serialize(self, data: Any, chunk_size: int = 8192) -> Iterator[Union[str, bytes]]:
         """
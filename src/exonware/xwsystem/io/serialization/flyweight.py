@@ -15,8 +15,11 @@ configuration, which is especially important for high-throughput applications.
 
 import threading
 from typing import Any, Dict, Hashable, Optional, Type, TypeVar, Union
-from weakref import WeakValueDictionary
+from weakref import WeakValueDictionary, ref
 
+from ...caching.counters import ThreadLocalCounters
+from ...caching.defs import StatsMode
+from ...caching.snapshot_cache import SnapshotCache
 from ...config.logging_setup import get_logger
 from .contracts import ISerialization
 
@@ -24,6 +27,9 @@ logger = get_logger("xsystem.serialization.flyweight")
 
 T = TypeVar('T', bound=ISerialization)
 
+# Lock-free fast-path entries (weak references to shared instances)
+FAST_PATH_SIZE = 1024
+
 
 class SerializerFlyweight:
     """
@@ -31,6 +37,9 @@ class SerializerFlyweight:
     
     Manages shared serializer instances to reduce memory footprint and
     improve performance by avoiding redundant object creation.
+    
+    Repeat lookups with hashable configurations are served lock-free from
+    a snapshot of weak references; only misses take the lock.
     """
     
     def __init__(self):
@@ -43,6 +52,11 @@ class SerializerFlyweight:
             'cache_hits': 0,
             'cache_misses': 0
         }
+        self._fast_path = SnapshotCache(
+            capacity=FAST_PATH_SIZE, name="serializer-flyweight", stats=StatsMode.DISABLED
+        )
+        # Lock-free hits are counted per thread and merged in get_stats()
+        self._fast_hits = ThreadLocalCounters()
     
     def get_serializer(
         self, 
@@ -59,16 +73,27 @@ class SerializerFlyweight:
         Returns:
             Shared serializer instance
         """
+        fast_key = self._create_fast_key(serializer_class, config)
+        if fast_key is not None:
+            instance_ref = self._fast_path.get(fast_key)
+            if instance_ref is not None:
+                instance = instance_ref()
+                if instance is not None:
+                    self._fast_hits.local.hits += 1
+                    return instance
+        
         # Create a hashable key from the class and configuration
         cache_key = self._create_cache_key(serializer_class, config)
         
         with self._lock:
             # Check if we already have this instance
-            if cache_key in self._instances:
+            instance = self._instances.get(cache_key)
+            if instance is not None:
                 self._stats['cache_hits'] += 1
                 self._stats['reused'] += 1
-                # Removed expensive debug logging from hot path for performance
-                return self._instances[cache_key]
+                if fast_key is not None:
+                    self._fast_path.put(fast_key, ref(instance))
+                return instance
             
             # Create new instance
             self._stats['cache_misses'] += 1
@@ -77,6 +102,8 @@ class SerializerFlyweight:
             try:
                 instance = serializer_class(**config)
                 self._instances[cache_key] = instance
+                if fast_key is not None:
+                    self._fast_path.put(fast_key, ref(instance))
                 # Removed expensive debug logging from hot path for performance
                 return instance
                 
@@ -110,6 +137,25 @@ class SerializerFlyweight:
         
         return "|".join(key_parts)
     
+    @staticmethod
+    def _create_fast_key(serializer_class: Type[T], config: Dict[str, Any]) -> Optional[Hashable]:
+        """
+        Create the lock-free lookup key, or None if the configuration is unhashable.
+        
+        Value types are part of the key so that e.g. 1 and True stay distinct,
+        as they are in the string key.
+        """
+        if not config:
+            return serializer_class
+        key = (serializer_class,) + tuple(
+            (name, type(value), value) for name, value in sorted(config.items())
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+    
     def _is_hashable(self, obj: Any) -> bool:
         """Check if an object is hashable."""
         try:
@@ -125,20 +171,24 @@ class SerializerFlyweight:
         Returns:
             Dictionary with usage statistics
         """
+        fast_hits = self._fast_hits.totals().hits
         with self._lock:
+            stats = dict(self._stats)
+            stats['cache_hits'] += fast_hits
+            stats['reused'] += fast_hits
             return {
-                **self._stats,
+                **stats,
                 'active_instances': len(self._instances),
                 'hit_rate': (
-                    self._stats['cache_hits'] / 
-                    (self._stats['cache_hits'] + self._stats['cache_misses'])
-                    if (self._stats['cache_hits'] + self._stats['cache_misses']) > 0 
+                    stats['cache_hits'] / 
+                    (stats['cache_hits'] + stats['cache_misses'])
+                    if (stats['cache_hits'] + stats['cache_misses']) > 0 
                     else 0.0
                 ),
                 'reuse_rate': (
-                    self._stats['reused'] / 
-                    (self._stats['created'] + self._stats['reused'])
-                    if (self._stats['created'] + self._stats['reused']) > 0
+                    stats['reused'] / 
+                    (stats['created'] + stats['reused'])
+                    if (stats['created'] + stats['reused']) > 0
                     else 0.0
                 )
             }
@@ -148,6 +198,7 @@ class SerializerFlyweight:
         with self._lock:
             cleared_count = len(self._instances)
             self._instances.clear()
+            self._fast_path.clear()
             logger.info(f"Cleared {cleared_count} serializer instances from cache")
     
     def get_cache_info(self) -> Dict[str, Any]:
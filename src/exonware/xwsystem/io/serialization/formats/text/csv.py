@@ -15,10 +15,11 @@ Following I→A pattern:
 
 import csv
 import io
-from typing import Any, Optional, Union, List, Dict
+from itertools import chain, islice
+from typing import Any, Iterator, Optional, Union, List, Dict
 from pathlib import Path
 
-from ...base import ASerialization
+from ...base import ASerialization, DEFAULT_ENCODE_BATCH_SIZE
 from ....contracts import EncodeOptions, DecodeOptions
 from ....defs import CodecCapability
 from ....errors import SerializationError
@@ -85,6 +86,10 @@ class CsvSerializer(ASerialization):
     def supports_streaming(self) -> bool:
         return True  # CSV naturally supports streaming (row by row)
     
+    @property
+    def supports_incremental_streaming(self) -> bool:
+        return True  # Rows are encoded a batch at a time (iter_encode)
+    
     @property
     def capabilities(self) -> CodecCapability:
         return CodecCapability.BIDIRECTIONAL
@@ -163,6 +168,70 @@ class CsvSerializer(ASerialization):
                 original_error=e
             )
     
+    def iter_encode(self, value: Any, *, options: Optional[EncodeOptions] = None) -> Iterator[str]:
+        """
+        Encode data to CSV piece by piece.
+        
+        Accepts lists and iterators/generators of rows; the first row picks
+        DictWriter or csv.writer (and the default fieldnames) exactly like
+        encode(), then rows are written a batch at a time through one
+        reused buffer.
+        
+        Args:
+            value: List or iterator of dicts or lists
+            options: Same options as encode()
+        
+        Yields:
+            CSV text pieces
+        
+        Raises:
+            SerializationError: If encoding fails
+        """
+        if not isinstance(value, (list, Iterator)):
+            yield self.encode(value, options=options)
+            return
+        
+        try:
+            opts = options or {}
+            rows = iter(value)
+            first = next(rows, None)
+            if first is None:
+                return
+            rows = chain([first], rows)
+            
+            # Get CSV options
+            delimiter = opts.get('delimiter', ',')
+            quoting = opts.get('quoting', csv.QUOTE_MINIMAL)
+            
+            output = io.StringIO()
+            if isinstance(first, dict):
+                fieldnames = opts.get('fieldnames', list(first.keys()))
+                writer = csv.DictWriter(
+                    output,
+                    fieldnames=fieldnames,
+                    delimiter=delimiter,
+                    quoting=quoting
+                )
+                if opts.get('header', True):
+                    writer.writeheader()
+            else:
+                writer = csv.writer(output, delimiter=delimiter, quoting=quoting)
+            
+            batch = list(islice(rows, DEFAULT_ENCODE_BATCH_SIZE))
+            while batch:
+                writer.writerows(batch)
+                yield output.getvalue()
+                output.seek(0)
+                output.truncate()
+                batch = list(islice(rows, DEFAULT_ENCODE_BATCH_SIZE))
+            
+        except Exception as e:
+            raise SerializationError(
+                f"Failed to encode CSV: {e}",
+                format_name=self.format_name,
+                original_error=e
+            )
+    
     def decode(self, repr: Union[bytes, str], *, options: Optional[DecodeOptions] = None) -> Any:
         """
         Decode CSV string to data.
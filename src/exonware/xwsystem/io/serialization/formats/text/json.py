@@ -14,14 +14,22 @@ Following I→A pattern:
 """
 
 import json
-from typing import Any, Optional, Union
+from functools import partial
+from itertools import islice
+from typing import Any, AsyncIterator, BinaryIO, Dict, Iterator, Optional, TextIO, Union
 from pathlib import Path
 
-from ...base import ASerialization
+from ...base import ASerialization, DEFAULT_ENCODE_BATCH_SIZE
+from ...utils.json_backend import get_json_backend
+from ...utils.json_offsets import JsonOffsetIndex, patch_json_pointer, read_json_pointer, split_json_pointer
+from ...utils.json_stream import aiter_json_items, iter_json_items
 from ....contracts import EncodeOptions, DecodeOptions
 from ....defs import CodecCapability
 from ....errors import SerializationError
 
+# json.loads() options only the stdlib backend understands
+_DECODE_HOOKS = ('object_hook', 'parse_float', 'parse_int', 'parse_constant', 'cls')
+
 
 class JsonSerializer(ASerialization):
     """
@@ -31,14 +39,18 @@ class JsonSerializer(ASerialization):
     A: ASerialization (abstract base)
     Concrete: JsonSerializer
     
-    Uses Python's built-in `json` library for reliable JSON handling.
+    Encodes/decodes through the fastest installed JSON backend (msgspec,
+    orjson, ujson, else the stdlib `json` library); pin one with the
+    `backend` option or PerformanceConfig serialization.json_backend.
+    Backends lay text out identically, but msgspec/orjson write exponent
+    floats as 1e16/1e-7 where the stdlib writes 1e+16/1e-07.
     
     Examples:
         >>> serializer = JsonSerializer()
         >>> 
         >>> # Encode data
         >>> json_str = serializer.encode({"key": "value"})
-        >>> # b'{"key": "value"}'
+        >>> # '{"key": "value"}'
         >>> 
         >>> # Decode data
         >>> data = serializer.decode(b'{"key": "value"}')
@@ -81,11 +93,11 @@ class JsonSerializer(ASerialization):
     
     @property
     def supports_streaming(self) -> bool:
-        return False  # Standard JSON doesn't support streaming
+        return True  # Incremental parser yields items as they complete
     
     @property
     def capabilities(self) -> CodecCapability:
-        return CodecCapability.BIDIRECTIONAL
+        return CodecCapability.BIDIRECTIONAL | CodecCapability.STREAMING
     
     @property
     def aliases(self) -> list[str]:
@@ -110,19 +122,41 @@ class JsonSerializer(ASerialization):
         """JSON supports queries via JSONPath."""
         return True
     
+    @property
+    def supports_incremental_streaming(self) -> bool:
+        """JSON encodes top-level arrays/objects incrementally (iter_encode)."""
+        return True
+    
     # ========================================================================
-    # CORE ENCODE/DECODE (Using official json library)
+    # CORE ENCODE/DECODE (Pluggable JSON backend)
     # ========================================================================
     
+    @staticmethod
+    def _dumps_options(opts: Dict[str, Any]) -> Dict[str, Any]:
+        """Map EncodeOptions to json.dumps() keyword arguments."""
+        indent = opts.get('indent', opts.get('pretty', None))
+        if indent is True:
+            indent = 2
+        
+        return {
+            'indent': indent,
+            'sort_keys': opts.get('sort_keys', False),
+            'ensure_ascii': opts.get('ensure_ascii', False),
+            'default': opts.get('default', None),
+            'cls': opts.get('cls', None),
+        }
+    
     def encode(self, value: Any, *, options: Optional[EncodeOptions] = None) -> Union[bytes, str]:
         """
         Encode data to JSON string.
         
-        Uses Python's built-in json.dumps().
+        Uses the configured JSON backend; a custom encoder `cls` always
+        goes through the stdlib json.dumps().
         
         Args:
             value: Data to serialize
-            options: JSON options (indent, sort_keys, ensure_ascii, etc.)
+            options: JSON options (indent, sort_keys, ensure_ascii, default,
+                     cls, backend)
         
         Returns:
             JSON string (as text, not bytes for compatibility)
@@ -132,26 +166,84 @@ class JsonSerializer(ASerialization):
         """
         try:
             opts = options or {}
+            kwargs = self._dumps_options(opts)
+            cls = kwargs.pop('cls')
+            if cls is not None:
+                return json.dumps(value, cls=cls, **kwargs)
             
-            # Common JSON options
-            indent = opts.get('indent', opts.get('pretty', None))
-            if indent is True:
-                indent = 2
-            
-            sort_keys = opts.get('sort_keys', False)
-            ensure_ascii = opts.get('ensure_ascii', False)
+            return get_json_backend(opts.get('backend')).dumps(value, **kwargs)
             
-            # Encode to JSON string
-            json_str = json.dumps(
-                value,
-                indent=indent,
-                sort_keys=sort_keys,
-                ensure_ascii=ensure_ascii,
-                default=opts.get('default', None),
-                cls=opts.get('cls', None)
+        except (TypeError, ValueError, OverflowError) as e:
+            raise SerializationError(
+                f"Failed to encode JSON: {e}",
+                format_name=self.format_name,
+                original_error=e
             )
+    
+    def iter_encode(self, value: Any, *, options: Optional[EncodeOptions] = None) -> Iterator[str]:
+        """
+        Encode data to JSON piece by piece.
+        
+        Top-level objects and arrays are written a batch of entries at a
+        time with the JSON backend, so only one batch is ever materialized.
+        Iterators and generators are encoded as top-level arrays. The
+        concatenated pieces equal encode(value) (for generators:
+        encode(list(value))).
+        
+        Args:
+            value: Data to serialize
+            options: Same options as encode()
+        
+        Yields:
+            JSON text pieces
+        
+        Raises:
+            SerializationError: If encoding fails
+        
+        Example:
+            >>> rows = (row_to_dict(r) for r in cursor)
+            >>> for piece in serializer.iter_encode(rows):
+            ...     sock.sendall(piece.encode("utf-8"))
+        """
+        if isinstance(value, dict):
+            open_, close, entries = '{', '}', iter(value.items())
+        elif isinstance(value, (list, tuple, Iterator)):
+            open_, close, entries = '[', ']', iter(value)
+        else:
+            yield self.encode(value, options=options)
+            return
+        
+        opts = options or {}
+        kwargs = self._dumps_options(opts)
+        if open_ == '{' and kwargs['sort_keys']:
+            entries = iter(sorted(value.items()))
+        indent = kwargs['indent']
+        
+        # Strip the brackets (and newlines around them when indenting)
+        strip = 1 if indent is None else 2
+        
+        try:
+            cls = kwargs.pop('cls')
+            if cls is not None:
+                encode, item_separator = cls(**kwargs).encode, ', '
+            else:
+                backend = get_json_backend(opts.get('backend'))
+                encode, item_separator = partial(backend.dumps, **kwargs), backend.separators[0]
+            separator = item_separator if indent is None else ',\n'
             
-            return json_str
+            batch = list(islice(entries, DEFAULT_ENCODE_BATCH_SIZE))
+            if not batch:
+                yield open_ + close
+                return
+            
+            yield open_ if indent is None else open_ + '\n'
+            while batch:
+                body = encode(dict(batch) if open_ == '{' else batch)
+                yield body[strip:-strip]
+                batch = list(islice(entries, DEFAULT_ENCODE_BATCH_SIZE))
+                if batch:
+                    yield separator
+            yield close if indent is None else '\n' + close
             
         except (TypeError, ValueError, OverflowError) as e:
             raise SerializationError(
@@ -164,11 +256,13 @@ class JsonSerializer(ASerialization):
         """
         Decode JSON string to data.
         
-        Uses Python's built-in json.loads().
+        Uses the configured JSON backend; decode hooks (object_hook,
+        parse_float, ...) and a custom decoder `cls` go through the stdlib
+        json.loads().
         
         Args:
             repr: JSON string (bytes or str)
-            options: JSON options (object_hook, parse_float, etc.)
+            options: JSON options (object_hook, parse_float, etc., backend)
         
         Returns:
             Decoded Python object
@@ -177,23 +271,17 @@ class JsonSerializer(ASerialization):
             SerializationError: If decoding fails
         """
         try:
+            opts = options or {}
+            hooks = {key: opts[key] for key in _DECODE_HOOKS if opts.get(key) is not None}
+            if not hooks:
+                return get_json_backend(opts.get('backend')).loads(repr)
+            
             # Convert bytes to str if needed
             if isinstance(repr, bytes):
                 repr = repr.decode('utf-8')
             
-            opts = options or {}
-            
             # Decode from JSON string
-            data = json.loads(
-                repr,
-                object_hook=opts.get('object_hook', None),
-                parse_float=opts.get('parse_float', None),
-                parse_int=opts.get('parse_int', None),
-                parse_constant=opts.get('parse_constant', None),
-                cls=opts.get('cls', None)
-            )
-            
-            return data
+            return json.loads(repr, **hooks)
             
         except (json.JSONDecodeError, ValueError, UnicodeDecodeError) as e:
             raise SerializationError(
@@ -202,6 +290,54 @@ class JsonSerializer(ASerialization):
                 original_error=e
             )
     
+    # ========================================================================
+    # STREAMING (Incremental parser)
+    # ========================================================================
+    
+    def iter_deserialize(
+        self,
+        src: Union[TextIO, BinaryIO, Iterator[Union[str, bytes]]],
+        prefix: Optional[str] = None
+    ) -> Iterator[Any]:
+        """
+        Yield values from a JSON stream as they complete.
+        
+        Only the item being decoded is held in memory, so huge arrays can be
+        processed chunk by chunk.
+        
+        Args:
+            src: File object, iterator of chunks, or a whole document
+            prefix: JSONPath-style item prefix (e.g. "$.records[*]");
+                    default: the elements of a root array, else the root value
+        
+        Yields:
+            Decoded items in document order
+        
+        Raises:
+            SerializationError: If the stream is not valid JSON
+        
+        Example:
+            >>> with open("export.json", "rb") as f:
+            ...     for record in serializer.iter_deserialize(f, prefix="$.records[*]"):
+            ...         process(record)
+        """
+        return iter_json_items(src, prefix)
+    
+    async def stream_deserialize(
+        self,
+        data_stream: AsyncIterator[Union[str, bytes]],
+        prefix: Optional[str] = None
+    ) -> AsyncIterator[Any]:
+        """
+        Async variant of iter_deserialize(): yield values as chunks arrive.
+        
+        Example:
+            >>> async for record in serializer.stream_deserialize(response.content.iter_chunked(65536)):
+            ...     await process(record)
+        """
+        async for item in aiter_json_items(data_stream, prefix):
+            yield item
+    
     # ========================================================================
     # ADVANCED FEATURES (Path-based operations)
     # ========================================================================
@@ -216,15 +352,18 @@ class JsonSerializer(ASerialization):
         """
         Atomically update a single path in a JSON file using JSONPointer.
         
-        Uses jsonpointer library for efficient path operations. For large files,
-        this still loads the entire file but provides atomic write guarantees.
-        Future optimizations could use streaming JSON parsers for true partial updates.
+        The file is never decoded as a whole: the target value is located by
+        a byte-offset scanner and the new value is spliced between the
+        copied prefix and suffix through AtomicFileWriter, so the rest of
+        the document keeps its exact bytes and formatting. Missing object
+        members and "-" (array append) are inserted into their container.
         
         Args:
             file_path: Path to the JSON file
             path: JSONPointer path (e.g., "/users/0/name")
             value: Value to set at the specified path
-            **options: Options (backup=True, etc.)
+            **options: Options (backup=True, offset_index=False/True/sidecar
+                       path, plus encode() options for the new value)
         
         Raises:
             SerializationError: If update fails
@@ -235,9 +374,6 @@ class JsonSerializer(ASerialization):
             >>> serializer = JsonSerializer()
             >>> serializer.atomic_update_path("config.json", "/database/host", "localhost")
         """
-        # Import jsonpointer (lazy loaded via lazy_package system)
-        import jsonpointer
-        
         try:
             path_obj = Path(file_path)
             if not path_obj.exists():
@@ -247,27 +383,21 @@ class JsonSerializer(ASerialization):
             from ...utils.path_ops import validate_path_security
             validate_path_security(path)
             
-            # Load entire file (for now - future: streaming parser for large files)
-            data = self.load_file(file_path, **options)
-            
-            # Use jsonpointer to set value
-            jsonpointer.set_pointer(data, path, value)
+            encoded = self.encode(value, options=options or None)
+            index = self._offset_index(path_obj, options)
             
-            # Save atomically using AtomicFileWriter
-            from ....common.atomic import AtomicFileWriter
-            
-            repr_data = self.encode(data, options=options or None)
-            path_obj.parent.mkdir(parents=True, exist_ok=True)
-            
-            backup = options.get('backup', True)
-            with AtomicFileWriter(path_obj, backup=backup) as writer:
-                if isinstance(repr_data, bytes):
-                    writer.write(repr_data)
-                else:
-                    encoding = options.get('encoding', 'utf-8')
-                    writer.write(repr_data.encode(encoding))
+            # Splice the new value in place (atomic, no full-file load)
+            patch_json_pointer(
+                path_obj,
+                path,
+                encoded.encode(options.get('encoding', 'utf-8')),
+                backup=options.get('backup', True),
+                index=index
+            )
+            if index is not None:
+                index.save()
                     
-        except (FileNotFoundError, ValueError, KeyError, jsonpointer.JsonPointerException) as e:
+        except (FileNotFoundError, ValueError, KeyError):
             raise
         except Exception as e:
             raise SerializationError(
@@ -285,14 +415,17 @@ class JsonSerializer(ASerialization):
         """
         Read a single path from a JSON file using JSONPointer.
         
-        Uses jsonpointer library for efficient path operations. For large files,
-        this still loads the entire file. Future optimizations could use streaming
-        JSON parsers for true partial reads.
+        Only the target value is decoded: the memory-mapped file is scanned
+        up to it, skipping unrelated subtrees by bracket counting, so the
+        cost grows with the value's offset rather than the file size. With
+        offset_index, resolved offsets are kept in a sidecar file and
+        repeated lookups jump straight to the value (or its nearest
+        indexed ancestor).
         
         Args:
             file_path: Path to the JSON file
             path: JSONPointer path (e.g., "/users/0/name")
-            **options: Options
+            **options: Options (offset_index=False/True/sidecar path)
         
         Returns:
             Value at the specified path
@@ -305,9 +438,6 @@ class JsonSerializer(ASerialization):
             >>> serializer = JsonSerializer()
             >>> host = serializer.atomic_read_path("config.json", "/database/host")
         """
-        # Import jsonpointer (lazy loaded via lazy_package system)
-        import jsonpointer
-        
         try:
             path_obj = Path(file_path)
             if not path_obj.exists():
@@ -317,15 +447,19 @@ class JsonSerializer(ASerialization):
             from ...utils.path_ops import validate_path_security
             validate_path_security(path)
             
-            # Load entire file (for now - future: streaming parser for large files)
-            data = self.load_file(file_path, **options)
+            # A malformed pointer cannot name an existing path
+            try:
+                split_json_pointer(path)
+            except ValueError as e:
+                raise KeyError(f"Path not found: {path}") from e
             
-            # Use jsonpointer to get value
-            return jsonpointer.resolve_pointer(data, path)
+            index = self._offset_index(path_obj, options)
+            value = read_json_pointer(path_obj, path, index=index)
+            if index is not None:
+                index.save()
+            return value
             
-        except (FileNotFoundError, jsonpointer.JsonPointerException) as e:
-            if isinstance(e, jsonpointer.JsonPointerException):
-                raise KeyError(f"Path not found: {path}") from e
+        except (FileNotFoundError, KeyError):
             raise
         except Exception as e:
             raise SerializationError(
@@ -334,6 +468,14 @@ class JsonSerializer(ASerialization):
                 original_error=e
             ) from e
     
+    @staticmethod
+    def _offset_index(path_obj: Path, options: dict) -> Optional[JsonOffsetIndex]:
+        """Sidecar offset index requested via the offset_index option, if any."""
+        sidecar = options.get('offset_index', False)
+        if not sidecar:
+            return None
+        return JsonOffsetIndex.for_file(path_obj, None if sidecar is True else sidecar)
+    
     def query(
         self, 
         file_path: Union[str, Path], 
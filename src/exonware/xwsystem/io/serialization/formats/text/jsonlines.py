@@ -22,12 +22,13 @@ Priority 4 (Performance): Memory-efficient streaming
 Priority 5 (Extensibility): Compatible with standard JSON
 """
 
-from typing import Any, Dict, Optional, Union, List
+from typing import Any, Dict, Iterator, Optional, Union, List
+from itertools import islice
 from pathlib import Path
-import json
 
-from ...base import ASerialization
+from ...base import ASerialization, DEFAULT_ENCODE_BATCH_SIZE
 from ...contracts import ISerialization
+from ...utils.json_backend import get_json_backend
 
 
 class JsonLinesSerializer(ASerialization):
@@ -68,13 +69,18 @@ class JsonLinesSerializer(ASerialization):
         """JSON Lines is a data exchange format."""
         return ["data", "serialization"]
     
+    @property
+    def supports_incremental_streaming(self) -> bool:
+        """JSON Lines is encoded one line at a time (iter_encode)."""
+        return True
+    
     def encode(self, data: Any, options: Optional[Dict[str, Any]] = None) -> str:
         """
         Encode data to JSON Lines string.
         
         Args:
             data: List of objects to encode (each becomes one line)
-            options: Encoding options
+            options: Encoding options (backend)
             
         Returns:
             JSON Lines string (one JSON object per line)
@@ -83,11 +89,9 @@ class JsonLinesSerializer(ASerialization):
             # Single object - wrap in list
             data = [data]
         
-        lines = []
-        for item in data:
-            lines.append(json.dumps(item, ensure_ascii=False))
+        dumps = get_json_backend((options or {}).get('backend')).dumps
         
-        return '\n'.join(lines)
+        return '\n'.join([dumps(item) for item in data])
     
     def decode(self, data: Union[str, bytes], options: Optional[Dict[str, Any]] = None) -> List[Any]:
         """
@@ -95,7 +99,7 @@ class JsonLinesSerializer(ASerialization):
         
         Args:
             data: JSON Lines string or bytes
-            options: Decoding options
+            options: Decoding options (backend)
             
         Returns:
             List of decoded Python objects
@@ -103,6 +107,8 @@ class JsonLinesSerializer(ASerialization):
         if isinstance(data, bytes):
             data = data.decode('utf-8')
         
+        loads = get_json_backend((options or {}).get('backend')).loads
+        
         # Split by newlines and parse each line
         lines = data.strip().split('\n')
         results = []
@@ -110,7 +116,31 @@ class JsonLinesSerializer(ASerialization):
         for line in lines:
             line = line.strip()
             if line:  # Skip empty lines
-                results.append(json.loads(line))
+                results.append(loads(line))
         
         return results
-
+    
+    def iter_encode(self, data: Any, *, options: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """
+        Encode data to JSON Lines piece by piece.
+        
+        Accepts lists and iterators/generators (e.g. a database cursor);
+        lines are produced a batch at a time, so the full output is never
+        held in memory. The concatenated pieces equal encode(data).
+        
+        Args:
+            data: List or iterator of objects (each becomes one line)
+            options: Encoding options (backend)
+            
+        Yields:
+            JSON Lines text pieces
+        """
+        items = iter(data) if isinstance(data, (list, Iterator)) else iter([data])
+        dumps = get_json_backend((options or {}).get('backend')).dumps
+        
+        batch = list(islice(items, DEFAULT_ENCODE_BATCH_SIZE))
+        while batch:
+            yield '\n'.join([dumps(item) for item in batch])
+            batch = list(islice(items, DEFAULT_ENCODE_BATCH_SIZE))
+            if batch:
+                yield '\n'
@@ -13,10 +13,11 @@ Following I→A pattern:
 - Concrete: XmlSerializer
 """
 
-from typing import Any, Optional, Union
+from itertools import islice
+from typing import Any, Iterator, Optional, Union
 from pathlib import Path
 
-from ...base import ASerialization
+from ...base import ASerialization, DEFAULT_ENCODE_BATCH_SIZE
 from ....contracts import EncodeOptions, DecodeOptions
 from ....defs import CodecCapability
 from ....errors import SerializationError
@@ -104,6 +105,10 @@ class XmlSerializer(ASerialization):
     def supports_streaming(self) -> bool:
         return True  # XML supports streaming via SAX/iterparse
     
+    @property
+    def supports_incremental_streaming(self) -> bool:
+        return True  # Root children are encoded a batch at a time (iter_encode)
+    
     @property
     def capabilities(self) -> CodecCapability:
         return CodecCapability.BIDIRECTIONAL
@@ -166,6 +171,61 @@ class XmlSerializer(ASerialization):
                 original_error=e
             )
     
+    def iter_encode(self, value: Any, *, options: Optional[EncodeOptions] = None) -> Iterator[str]:
+        """
+        Encode data to XML piece by piece.
+        
+        The root element's children (dict entries, or list/iterator items)
+        are converted a batch at a time between the declaration and the
+        closing root tag. Pretty printing needs the whole DOM, so it falls
+        back to encode().
+        
+        Args:
+            value: Data to serialize (dicts, lists, iterators/generators)
+            options: Same options as encode()
+        
+        Yields:
+            XML text pieces
+        
+        Raises:
+            SerializationError: If encoding fails
+        """
+        opts = options or {}
+        if opts.get('pretty', False) or not isinstance(value, (dict, list, tuple, Iterator)):
+            yield self.encode(list(value) if isinstance(value, Iterator) else value, options=options)
+            return
+        
+        try:
+            is_dict = isinstance(value, dict)
+            entries = iter(value.items()) if is_dict else iter(value)
+            
+            def convert(batch: Any) -> str:
+                return dicttoxml.dicttoxml(
+                    batch,
+                    custom_root=opts.get('root', 'root'),
+                    attr_type=opts.get('attr_type', False),
+                    item_func=opts.get('item_func', lambda x: 'item')
+                ).decode('utf-8')
+            
+            # Declaration + root open tag, and the root close tag
+            shell = convert({})
+            close = f"</{opts.get('root', 'root')}>"
+            head = shell[:-len(close)]
+            
+            yield head
+            batch = list(islice(entries, DEFAULT_ENCODE_BATCH_SIZE))
+            while batch:
+                yield convert(dict(batch) if is_dict else batch)[len(head):-len(close)]
+                batch = list(islice(entries, DEFAULT_ENCODE_BATCH_SIZE))
+            yield close
+            
+        except Exception as e:
+            raise SerializationError(
+                f"Failed to encode XML: {e}",
+                format_name=self.format_name,
+                original_error=e
+            )
+    
     def decode(self, repr: Union[bytes, str], *, options: Optional[DecodeOptions] = None) -> Any:
         """
         Decode XML string to data.
@@ -13,10 +13,11 @@ Following I→A pattern:
 - Concrete: YamlSerializer
 """
 
-from typing import Any, Optional, Union
+from itertools import islice
+from typing import Any, Dict, Iterator, Optional, Union
 from pathlib import Path
 
-from ...base import ASerialization
+from ...base import ASerialization, DEFAULT_ENCODE_BATCH_SIZE
 from ....contracts import EncodeOptions, DecodeOptions
 from ....defs import CodecCapability
 from ....errors import SerializationError
@@ -88,6 +89,10 @@ class YamlSerializer(ASerialization):
     def supports_streaming(self) -> bool:
         return True  # YAML supports multiple documents
     
+    @property
+    def supports_incremental_streaming(self) -> bool:
+        return True  # Block-style top-level collections are encoded a batch at a time
+    
     @property
     def capabilities(self) -> CodecCapability:
         return CodecCapability.BIDIRECTIONAL
@@ -100,6 +105,17 @@ class YamlSerializer(ASerialization):
     # CORE ENCODE/DECODE (Using PyYAML library)
     # ========================================================================
     
+    @staticmethod
+    def _dump_options(opts: Dict[str, Any]) -> Dict[str, Any]:
+        """Map EncodeOptions to yaml.dump() keyword arguments."""
+        return {
+            'default_flow_style': opts.get('default_flow_style', False),
+            'sort_keys': opts.get('sort_keys', False),
+            'indent': opts.get('indent', 2),
+            'allow_unicode': opts.get('allow_unicode', True),
+            'Dumper': opts.get('Dumper', yaml.SafeDumper),
+        }
+    
     def encode(self, value: Any, *, options: Optional[EncodeOptions] = None) -> Union[bytes, str]:
         """
         Encode data to YAML string.
@@ -117,24 +133,57 @@ class YamlSerializer(ASerialization):
             SerializationError: If encoding fails
         """
         try:
-            opts = options or {}
+            # Encode to YAML string
+            yaml_str = yaml.dump(value, **self._dump_options(options or {}))
             
-            # Common YAML options
-            default_flow_style = opts.get('default_flow_style', False)
-            sort_keys = opts.get('sort_keys', False)
-            indent = opts.get('indent', 2)
+            return yaml_str
             
-            # Encode to YAML string
-            yaml_str = yaml.dump(
-                value,
-                default_flow_style=default_flow_style,
-                sort_keys=sort_keys,
-                indent=indent,
-                allow_unicode=opts.get('allow_unicode', True),
-                Dumper=opts.get('Dumper', yaml.SafeDumper)
+        except (yaml.YAMLError, TypeError) as e:
+            raise SerializationError(
+                f"Failed to encode YAML: {e}",
+                format_name=self.format_name,
+                original_error=e
             )
+    
+    def iter_encode(self, value: Any, *, options: Optional[EncodeOptions] = None) -> Iterator[str]:
+        """
+        Encode data to YAML piece by piece.
+        
+        Block-style top-level mappings and sequences (including
+        iterators/generators) are dumped a batch of entries at a time;
+        flow style and scalars fall back to encode(). Objects shared
+        between batches are repeated rather than aliased.
+        
+        Args:
+            value: Data to serialize
+            options: Same options as encode()
+        
+        Yields:
+            YAML text pieces
+        
+        Raises:
+            SerializationError: If encoding fails
+        """
+        kwargs = self._dump_options(options or {})
+        if kwargs['default_flow_style'] is not False or not isinstance(value, (dict, list, tuple, Iterator)):
+            yield self.encode(list(value) if isinstance(value, Iterator) else value, options=options)
+            return
+        
+        try:
+            is_dict = isinstance(value, dict)
+            if is_dict:
+                entries = iter(sorted(value.items()) if kwargs['sort_keys'] else value.items())
+            else:
+                entries = iter(value)
             
-            return yaml_str
+            batch = list(islice(entries, DEFAULT_ENCODE_BATCH_SIZE))
+            if not batch:
+                yield yaml.dump({} if is_dict else [], **kwargs)
+                return
+            
+            while batch:
+                yield yaml.dump(dict(batch) if is_dict else batch, **kwargs)
+                batch = list(islice(entries, DEFAULT_ENCODE_BATCH_SIZE))
             
         except (yaml.YAMLError, TypeError) as e:
             raise SerializationError(
@@ -781,34 +781,42 @@ class XWSerializer(ASerialization):
     # ============================================================================
     
     def batch_save(self, data_dict: Dict[Union[str, Path], Any], 
-                   format_hint: Optional[str] = None) -> Dict[str, bool]:
-        """Save multiple files in batch."""
+                   format_hint: Optional[str] = None, **batch_options) -> Dict[str, bool]:
+        """
+        Save multiple files in batch.
+        
+        Runs on a thread or process pool (see ASerialization.iter_batch_save;
+        batch_options: executor, max_workers, chunksize).
+        """
         results = {}
+        if format_hint is not None:
+            batch_options['format_hint'] = format_hint
         
         with performance_monitor("batch_save"):
-            for file_path, data in data_dict.items():
-                try:
-                    self.save_file(data, file_path, format_hint)
-                    results[str(file_path)] = True
-                except Exception as e:
-                    logger.error(f"Batch save failed for {file_path}: {e}")
-                    results[str(file_path)] = False
+            for result in self.iter_batch_save(data_dict, **batch_options):
+                if not result.success:
+                    logger.error(f"Batch save failed for {result.path}: {result.error}")
+                results[result.path] = result.success
         
         return results
     
     def batch_load(self, file_paths: List[Union[str, Path]], 
-                   format_hint: Optional[str] = None) -> Dict[str, Any]:
-        """Load multiple files in batch."""
+                   format_hint: Optional[str] = None, **batch_options) -> Dict[str, Any]:
+        """
+        Load multiple files in batch.
+        
+        Runs on a thread or process pool (see ASerialization.iter_batch_load;
+        batch_options: executor, max_workers, chunksize).
+        """
         results = {}
+        if format_hint is not None:
+            batch_options['format_hint'] = format_hint
         
         with performance_monitor("batch_load"):
-            for file_path in file_paths:
-                try:
-                    data = self.load_file(file_path, format_hint)
-                    results[str(file_path)] = data
-                except Exception as e:
-                    logger.error(f"Batch load failed for {file_path}: {e}")
-                    results[str(file_path)] = None
+            for result in self.iter_batch_load(file_paths, **batch_options):
+                if not result.success:
+                    logger.error(f"Batch load failed for {result.path}: {result.error}")
+                results[result.path] = result.value
         
         return results
     
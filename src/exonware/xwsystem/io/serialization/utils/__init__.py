@@ -19,6 +19,25 @@ from .path_ops import (
     validate_path_security,
     normalize_path,
 )
+from .json_stream import (
+    JsonStreamParser,
+    parse_item_prefix,
+    iter_json_items,
+    aiter_json_items,
+    iter_json_events,
+)
+from .json_backend import (
+    JsonBackend,
+    AVAILABLE_JSON_BACKENDS,
+    get_json_backend,
+)
+from .json_offsets import (
+    JsonOffsetIndex,
+    split_json_pointer,
+    locate_json_pointer,
+    read_json_pointer,
+    patch_json_pointer,
+)
 
 __all__ = [
     "PathOperationError",
@@ -28,5 +47,18 @@ __all__ = [
     "set_value_by_path",
     "validate_path_security",
     "normalize_path",
+    "JsonStreamParser",
+    "parse_item_prefix",
+    "iter_json_items",
+    "aiter_json_items",
+    "iter_json_events",
+    "JsonBackend",
+    "AVAILABLE_JSON_BACKENDS",
+    "get_json_backend",
+    "JsonOffsetIndex",
+    "split_json_pointer",
+    "locate_json_pointer",
+    "read_json_pointer",
+    "patch_json_pointer",
 ]
 
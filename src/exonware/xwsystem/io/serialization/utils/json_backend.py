@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+#exonware/xwsystem/src/exonware/xwsystem/io/serialization/utils/json_backend.py
+"""
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+
+Pluggable JSON backends with stdlib fallback.
+
+JsonSerializer, JsonLinesSerializer and XModel encode/decode through a
+JsonBackend instead of calling the json module directly. The fastest
+installed library is used by default (msgspec, orjson, ujson, then the
+stdlib); the choice can be pinned with PerformanceConfig
+(serialization.json_backend), the XSYSTEM_JSON_BACKEND environment variable
+or a per-call ``backend`` option.
+
+All backends accept the same options (indent, sort_keys, ensure_ascii,
+default), produce str or bytes, and lay text out as json.dumps() does
+(including its ", " / ": " separators when indent is None). When a library
+cannot produce that layout (a default hook, ensure_ascii on orjson/msgspec
+for non-ASCII text, compact output on orjson, tab indents, NaN/Infinity values, integers beyond
+64 bits, NaN literals on decode, ...) that call falls back to the stdlib.
+
+Differences that remain by design:
+- floats the stdlib writes in exponent form (below 1e-4 or from 1e16 up)
+  are written differently by msgspec and orjson: 1e16, 1e-7 and 0.00001
+  where json.dumps() writes 1e+16, 1e-07 and 1e-05. Both decode to the same
+  float; pin backend "json" when byte-identical float text matters
+- values the stdlib rejects (datetime, UUID, dataclasses, enums; msgspec
+  also bytes, sets, Decimal) are serialized natively when no default hook
+  is given, where json.dumps() raises TypeError
+- orjson decodes integers beyond 64 bits as float (msgspec keeps them exact)
+"""
+
+import json
+import math
+from abc import ABC, abstractmethod
+from importlib import import_module
+from importlib.util import find_spec
+from typing import Any, Callable, Dict, Optional, Tuple, Type, Union
+
+from ....config.logging_setup import get_logger
+
+logger = get_logger("xwsystem.serialization.json_backend")
+
+AUTO_JSON_BACKEND = "auto"
+
+
+class JsonBackend:
+    """
+    Stdlib json backend and base class of the fast backends.
+    
+    Subclasses set module_name and implement _encode()/_decode(); anything
+    they reject is handed to the stdlib implementation below.
+    """
+    
+    name = "json"
+    module_name: Optional[str] = None
+    separators: Tuple[str, str] = (", ", ": ")
+    
+    def dumps(
+        self,
+        value: Any,
+        *,
+        indent: Union[int, str, None] = None,
+        sort_keys: bool = False,
+        ensure_ascii: bool = False,
+        default: Optional[Callable[[Any], Any]] = None
+    ) -> str:
+        """Encode value to JSON text."""
+        return json.dumps(
+            value,
+            indent=indent,
+            separators=self.separators if indent is None else None,
+            sort_keys=sort_keys,
+            ensure_ascii=ensure_ascii,
+            default=default
+        )
+    
+    def dumps_bytes(self, value: Any, **options: Any) -> bytes:
+        """Encode value to UTF-8 JSON bytes (same options as dumps())."""
+        return self.dumps(value, **options).encode("utf-8")
+    
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """Decode JSON text or UTF-8 bytes."""
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            data = bytes(data).decode("utf-8")
+        return json.loads(data)
+    
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.name!r}>"
+
+
+def _has_non_finite(value: Any) -> bool:
+    """Whether value contains NaN/Infinity floats (fast libraries write them as null)."""
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+            stack.extend(item.keys())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
+
+class _FastJsonBackend(JsonBackend, ABC):
+    """Common fallback handling of the third-party backends."""
+    
+    supports_ensure_ascii = False
+    
+    def __init__(self):
+        self._lib = import_module(self.module_name)
+    
+    @abstractmethod
+    def _encode(
+        self,
+        value: Any,
+        indent: Union[int, str, None],
+        sort_keys: bool,
+        ensure_ascii: bool
+    ) -> Union[str, bytes, None]:
+        """Encode with the library; None if the options are unsupported."""
+    
+    @abstractmethod
+    def _decode(self, data: Union[str, bytes]) -> Any:
+        """Decode with the library."""
+    
+    def _fast_encode(self, value: Any, options: Dict[str, Any]) -> Union[str, bytes, None]:
+        # Libraries only call default for types they do not handle themselves
+        if options.get("default") is not None:
+            return None
+        # Without ensure_ascii support, keep the output only if it is ASCII anyway
+        ascii_only = options.get("ensure_ascii") and not self.supports_ensure_ascii
+        try:
+            encoded = self._encode(
+                value,
+                options.get("indent"),
+                options.get("sort_keys", False),
+                options.get("ensure_ascii", False)
+            )
+        except (TypeError, ValueError, OverflowError, RecursionError):
+            # Out-of-range integers, unsupported keys, NaN on ujson, cycles,
+            # or a genuinely unserializable value (re-raised by the stdlib)
+            return None
+        if ascii_only and encoded is not None and not encoded.isascii():
+            return None
+        # NaN/Infinity come out as null; only scan the value when null appears
+        if encoded is not None and ("null" if isinstance(encoded, str) else b"null") in encoded:
+            if _has_non_finite(value):
+                return None
+        return encoded
+    
+    def dumps(self, value: Any, **options: Any) -> str:
+        encoded = self._fast_encode(value, options)
+        if encoded is None:
+            return super().dumps(value, **options)
+        return encoded.decode("utf-8") if isinstance(encoded, bytes) else encoded
+    
+    def dumps_bytes(self, value: Any, **options: Any) -> bytes:
+        encoded = self._fast_encode(value, options)
+        if encoded is None:
+            return super().dumps(value, **options).encode("utf-8")
+        return encoded if isinstance(encoded, bytes) else encoded.encode("utf-8")
+    
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return self._decode(data)
+        except ValueError:
+            # NaN/Infinity literals, out-of-range numbers - or invalid JSON,
+            # in which case the stdlib raises its usual error
+            return super().loads(data)
+
+
+class MsgspecJsonBackend(_FastJsonBackend):
+    """msgspec.json backend (indent None or any positive integer)."""
+    
+    name = "msgspec"
+    module_name = "msgspec"
+    
+    def __init__(self):
+        super().__init__()
+        self._decoder = self._lib.json.Decoder()
+        self._encoder = self._lib.json.Encoder()
+    
+    def _encode(self, value, indent, sort_keys, ensure_ascii):
+        if indent is not None and (isinstance(indent, str) or indent <= 0):
+            return None
+        if sort_keys:
+            encoded = self._lib.json.encode(value, order="sorted")
+        else:
+            encoded = self._encoder.encode(value)
+        # indent=0 formats on one line with the stdlib's ", " / ": " separators
+        return self._lib.json.format(encoded, indent=0 if indent is None else indent)
+    
+    def _decode(self, data):
+        return self._decoder.decode(data)
+
+
+class OrjsonBackend(_FastJsonBackend):
+    """orjson backend (encodes indent=2 only: orjson has no spaced single-line output)."""
+    
+    name = "orjson"
+    module_name = "orjson"
+    
+    def _encode(self, value, indent, sort_keys, ensure_ascii):
+        if indent != 2:
+            return None
+        option = self._lib.OPT_NON_STR_KEYS | self._lib.OPT_INDENT_2
+        if sort_keys:
+            option |= self._lib.OPT_SORT_KEYS
+        return self._lib.dumps(value, option=option)
+    
+    def _decode(self, data):
+        return self._lib.loads(data)
+
+
+class UjsonBackend(_FastJsonBackend):
+    """ujson backend (any positive integer indent, ensure_ascii supported)."""
+    
+    name = "ujson"
+    module_name = "ujson"
+    supports_ensure_ascii = True
+    
+    def _encode(self, value, indent, sort_keys, ensure_ascii):
+        if indent is not None and (isinstance(indent, str) or indent <= 0):
+            return None
+        options = {} if indent else {"separators": self.separators}
+        # ujson releases without the separators argument raise TypeError (stdlib fallback)
+        return self._lib.dumps(
+            value,
+            indent=indent or 0,
+            sort_keys=sort_keys,
+            ensure_ascii=ensure_ascii,
+            escape_forward_slashes=False,
+            **options
+        )
+    
+    def _decode(self, data):
+        return self._lib.loads(data)
+
+
+# Preference order for "auto"
+JSON_BACKENDS: Dict[str, Type[JsonBackend]] = {
+    "msgspec": MsgspecJsonBackend,
+    "orjson": OrjsonBackend,
+    "ujson": UjsonBackend,
+    "json": JsonBackend,
+}
+
+# Probed without importing, so the lazy-install hook never pulls a backend in
+AVAILABLE_JSON_BACKENDS: Tuple[str, ...] = tuple(
+    name for name, backend_class in JSON_BACKENDS.items()
+    if backend_class.module_name is None or find_spec(backend_class.module_name) is not None
+)
+
+_instances: Dict[str, JsonBackend] = {}
+
+
+def _create_backend(name: str) -> JsonBackend:
+    if name == AUTO_JSON_BACKEND:
+        name = AVAILABLE_JSON_BACKENDS[0]
+    elif name not in JSON_BACKENDS:
+        raise ValueError(
+            f"Unknown JSON backend {name!r}; expected one of: "
+            f"{', '.join((AUTO_JSON_BACKEND, *JSON_BACKENDS))}"
+        )
+    elif name not in AVAILABLE_JSON_BACKENDS:
+        logger.warning(f"JSON backend {name!r} is not installed, falling back to stdlib json")
+        name = "json"
+    
+    try:
+        return JSON_BACKENDS[name]()
+    except ImportError as e:
+        logger.warning(f"JSON backend {name!r} failed to load ({e}), falling back to stdlib json")
+        return JsonBackend()
+
+
+def get_json_backend(name: Optional[str] = None) -> JsonBackend:
+    """
+    Get a JSON backend instance.
+    
+    Args:
+        name: "auto", "msgspec", "orjson", "ujson" or "json"; default: the
+              configured serialization.json_backend (XSYSTEM_JSON_BACKEND)
+    
+    Returns:
+        Shared backend instance (stdlib json if the library is missing)
+    
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    if name is None:
+        from ....config.performance import get_serialization_limits
+        name = get_serialization_limits().json_backend
+    
+    backend = _instances.get(name)
+    if backend is None:
+        backend = _instances[name] = _create_backend(name)
+    return backend
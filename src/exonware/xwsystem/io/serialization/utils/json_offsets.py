@@ -0,0 +1,547 @@
+#!/usr/bin/env python3
+#exonware/xwsystem/src/exonware/xwsystem/io/serialization/utils/json_offsets.py
+"""
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+
+Byte-offset access to values inside JSON files.
+
+A JSON Pointer is resolved by scanning the memory-mapped file: members and
+elements off the pointer are skipped by a bracket scanner without being
+decoded, so a lookup costs time proportional to the value's offset, not
+the document size. Only the target value is decoded. Updates splice the new
+value between the copied prefix and suffix byte ranges through
+AtomicFileWriter.
+
+An optional sidecar JsonOffsetIndex remembers resolved offsets, so repeated
+lookups into the same (unchanged) file jump straight to the value or to
+its nearest indexed ancestor.
+"""
+
+import json
+import mmap
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from ...common.atomic import AtomicFileWriter
+from ..errors import JsonError
+
+# Bytes copied per write while splicing
+COPY_CHUNK_SIZE = 1024 * 1024
+
+INDEX_SUFFIX = ".idx"
+_INDEX_VERSION = 1
+
+_BOM = b"\xef\xbb\xbf"
+_WS = re.compile(rb"[ \t\n\r]*")
+_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+# Everything up to the next bracket, skipping complete strings
+_SKIP_TO_BRACKET = re.compile(rb'(?:[^"\[\]{}]+|"[^"\\]*(?:\\.[^"\\]*)*")*', re.DOTALL)
+_SCALAR = re.compile(rb"[^,\]}\s]+")
+_ARRAY_INDEX = re.compile(r"0|[1-9][0-9]*")
+
+_OPEN_OBJECT = ord("{")
+_OPEN_ARRAY = ord("[")
+_QUOTE = ord('"')
+
+Span = Tuple[int, int]
+
+
+def split_json_pointer(pointer: str) -> List[str]:
+    """
+    Split an RFC 6901 JSON Pointer into unescaped reference tokens.
+    
+    Unlike parse_json_pointer(), tokens stay strings: whether "0" is an
+    object key or an array index depends on the container it is applied to.
+    
+    Args:
+        pointer: JSON Pointer ("" or "/" for the root, "/users/0/name")
+    
+    Returns:
+        List of reference tokens
+    
+    Raises:
+        ValueError: If the pointer does not start with '/'
+    """
+    if pointer in ("", "/"):
+        return []
+    if not pointer.startswith("/"):
+        raise ValueError(f"JSONPointer path must start with '/', got: {pointer}")
+    return [token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/")]
+
+
+def join_json_pointer(tokens: List[str]) -> str:
+    """Build a normalized JSON Pointer from reference tokens."""
+    return "".join("/" + token.replace("~", "~0").replace("/", "~1") for token in tokens)
+
+
+def _skip_ws(buf: Any, pos: int) -> int:
+    return _WS.match(buf, pos).end()
+
+
+def _truncated(pos: int) -> JsonError:
+    return JsonError(f"Unexpected end of JSON document at byte {pos}")
+
+
+def skip_value(buf: Any, pos: int) -> int:
+    """
+    Return the offset just past the JSON value starting at pos.
+    
+    Containers are skipped by counting brackets between complete strings,
+    so nothing inside them is decoded.
+    """
+    try:
+        first = buf[pos]
+    except IndexError:
+        raise _truncated(pos) from None
+    if first == _QUOTE:
+        match = _STRING.match(buf, pos)
+        if match is None:
+            raise _truncated(pos)
+        return match.end()
+    if first not in (_OPEN_OBJECT, _OPEN_ARRAY):
+        match = _SCALAR.match(buf, pos)
+        if match is None:
+            raise JsonError(f"Expected a JSON value at byte {pos}")
+        return match.end()
+    
+    depth = 0
+    end = len(buf)
+    while True:
+        pos = _SKIP_TO_BRACKET.match(buf, pos).end()
+        if pos >= end:
+            raise _truncated(pos)
+        if buf[pos] in (_OPEN_OBJECT, _OPEN_ARRAY):
+            depth += 1
+        else:
+            depth -= 1
+        pos += 1
+        if depth == 0:
+            return pos
+
+
+def _expect(buf: Any, pos: int, char: bytes) -> int:
+    """Skip whitespace, require char, return the offset after it."""
+    pos = _skip_ws(buf, pos)
+    if buf[pos:pos + 1] != char:
+        raise JsonError(f"Expected {char.decode()!r} at byte {pos}")
+    return pos + 1
+
+
+def _decode_key(raw: bytes) -> str:
+    if b"\\" in raw:
+        return json.loads(raw)
+    return raw[1:-1].decode("utf-8")
+
+
+def find_child(buf: Any, pos: int, token: str) -> Optional[int]:
+    """
+    Find the member or element `token` of the container starting at pos.
+    
+    Args:
+        buf: Document bytes (bytes or mmap)
+        pos: Offset of the container's opening bracket
+        token: Object key, or array index as a string
+    
+    Returns:
+        Offset of the child value, or None if it does not exist
+    
+    Raises:
+        KeyError: If the value at pos is not a container, or the token is
+                  not a valid index for an array
+        JsonError: If the document is malformed
+    """
+    first = buf[pos]
+    if first == _OPEN_OBJECT:
+        pos = _skip_ws(buf, pos + 1)
+        if buf[pos:pos + 1] == b"}":
+            return None
+        while True:
+            match = _STRING.match(buf, pos)
+            if match is None:
+                raise JsonError(f"Expected an object key at byte {pos}")
+            key = _decode_key(buf[match.start():match.end()])
+            pos = _skip_ws(buf, _expect(buf, match.end(), b":"))
+            if key == token:
+                return pos
+            pos = _skip_ws(buf, skip_value(buf, pos))
+            if buf[pos:pos + 1] == b"}":
+                return None
+            pos = _skip_ws(buf, _expect(buf, pos, b","))
+    
+    if first == _OPEN_ARRAY:
+        if not _ARRAY_INDEX.fullmatch(token):
+            raise KeyError(f"Invalid array index: {token!r}")
+        remaining = int(token)
+        pos = _skip_ws(buf, pos + 1)
+        if buf[pos:pos + 1] == b"]":
+            return None
+        while True:
+            if remaining == 0:
+                return pos
+            remaining -= 1
+            pos = _skip_ws(buf, skip_value(buf, pos))
+            if buf[pos:pos + 1] == b"]":
+                return None
+            pos = _skip_ws(buf, _expect(buf, pos, b","))
+    
+    raise KeyError(f"Cannot resolve {token!r} inside a non-container value")
+
+
+def root_start(buf: Any) -> int:
+    """Return the offset of the document's root value (after BOM/whitespace)."""
+    pos = len(_BOM) if buf[:len(_BOM)] == _BOM else 0
+    pos = _skip_ws(buf, pos)
+    if pos >= len(buf):
+        raise JsonError("Empty JSON document")
+    return pos
+
+
+def root_span(buf: Any) -> Span:
+    """Return the (start, end) span of the document's root value."""
+    pos = root_start(buf)
+    return pos, skip_value(buf, pos)
+
+
+def _value_start(buf: Any, tokens: List[str], index: Optional["JsonOffsetIndex"]) -> int:
+    """Offset of the value at tokens, scanning from the nearest indexed ancestor."""
+    depth, pos = (0, None) if index is None else index.nearest(tokens)
+    if pos is None:
+        depth, pos = 0, root_start(buf)
+    
+    for i in range(depth, len(tokens)):
+        pos = find_child(buf, pos, tokens[i])
+        if pos is None:
+            raise KeyError(f"Path not found: {join_json_pointer(tokens)}")
+        if index is not None and i < len(tokens) - 1:
+            index.record(tokens[:i + 1], (pos, None))
+    return pos
+
+
+def locate_json_pointer(
+    buf: Any,
+    pointer: str,
+    index: Optional["JsonOffsetIndex"] = None
+) -> Span:
+    """
+    Locate the byte span of the value a JSON Pointer refers to.
+    
+    Args:
+        buf: Document bytes (bytes or mmap)
+        pointer: JSON Pointer
+        index: Optional offset index to start from / record into
+    
+    Returns:
+        (start, end) byte offsets of the value
+    
+    Raises:
+        KeyError: If the pointer does not resolve
+        JsonError: If the document is malformed
+    """
+    tokens = split_json_pointer(pointer)
+    start = _value_start(buf, tokens, index)
+    span = (start, skip_value(buf, start))
+    if index is not None:
+        index.record(tokens, span)
+    return span
+
+
+def _insertion_point(buf: Any, container: Span) -> Tuple[int, bool]:
+    """Offset after the last member/element of a container, and whether it is empty."""
+    close = container[1] - 1
+    pos = close
+    while pos > container[0] + 1 and buf[pos - 1:pos] in (b" ", b"\t", b"\n", b"\r"):
+        pos -= 1
+    return pos, pos == container[0] + 1
+
+
+class JsonOffsetIndex:
+    """
+    Sidecar index of value offsets in one JSON file.
+    
+    Maps normalized JSON Pointers to [start, end] byte offsets (end is None
+    for ancestors only passed through). The index is tied to the file's size
+    and modification time and resets itself when either changes; splices
+    made through patch_json_pointer() shift the stored offsets instead.
+    
+    Example:
+        index = JsonOffsetIndex.for_file("catalog.json")
+        for sku in skus:
+            price = read_json_pointer("catalog.json", f"/products/{sku}/price", index=index)
+        index.save()
+    """
+    
+    def __init__(self, file_path: Union[str, Path], index_path: Optional[Union[str, Path]] = None):
+        """
+        Initialize offset index.
+        
+        Args:
+            file_path: JSON file the offsets refer to
+            index_path: Sidecar location (default: <file>.idx)
+        """
+        self.file_path = Path(file_path)
+        self.index_path = (
+            Path(index_path) if index_path else self.file_path.with_name(self.file_path.name + INDEX_SUFFIX)
+        )
+        self.entries: Dict[str, List[Optional[int]]] = {}
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._dirty = False
+    
+    @classmethod
+    def for_file(cls, file_path: Union[str, Path], index_path: Optional[Union[str, Path]] = None) -> "JsonOffsetIndex":
+        """Load the sidecar for file_path (an empty index if missing or stale)."""
+        index = cls(file_path, index_path)
+        index.load()
+        return index
+    
+    def _file_stamp(self) -> Tuple[int, int]:
+        stat = self.file_path.stat()
+        return stat.st_size, stat.st_mtime_ns
+    
+    def load(self) -> None:
+        """Read the sidecar, discarding it if the file has changed since."""
+        self.entries = {}
+        self._stamp = self._file_stamp()
+        self._dirty = False
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return
+        if (
+            stored.get("version") == _INDEX_VERSION
+            and stored.get("size") == self._stamp[0]
+            and stored.get("mtime_ns") == self._stamp[1]
+        ):
+            self.entries = stored.get("entries", {})
+    
+    def validate(self) -> None:
+        """Reset the index if the file was modified by someone else."""
+        if self._stamp != self._file_stamp():
+            self.entries = {}
+            self._stamp = self._file_stamp()
+            self._dirty = True
+    
+    def save(self) -> None:
+        """Write the sidecar if it changed."""
+        if not self._dirty:
+            return
+        with AtomicFileWriter(self.index_path, mode="w") as f:
+            json.dump(
+                {
+                    "version": _INDEX_VERSION,
+                    "size": self._stamp[0],
+                    "mtime_ns": self._stamp[1],
+                    "entries": self.entries,
+                },
+                f,
+                separators=(",", ":"),
+            )
+        self._dirty = False
+    
+    def nearest(self, tokens: List[str]) -> Tuple[int, Optional[int]]:
+        """Deepest indexed prefix of tokens: (depth, start offset) or (0, None)."""
+        for depth in range(len(tokens), -1, -1):
+            entry = self.entries.get(join_json_pointer(tokens[:depth]))
+            if entry is not None:
+                return depth, entry[0]
+        return 0, None
+    
+    def lookup(self, tokens: List[str]) -> Optional[Span]:
+        """Full (start, end) span of tokens if indexed."""
+        entry = self.entries.get(join_json_pointer(tokens))
+        if entry is not None and entry[1] is not None:
+            return entry[0], entry[1]
+        return None
+    
+    def record(self, tokens: List[str], span: Tuple[int, Optional[int]]) -> None:
+        """Remember the span of tokens."""
+        key = join_json_pointer(tokens)
+        if self.entries.get(key) != list(span):
+            self.entries[key] = list(span)
+            self._dirty = True
+    
+    def splice(self, tokens: List[str], start: int, end: int, length: int, replaced: bool = True) -> None:
+        """
+        Shift offsets after bytes [start, end) were replaced by `length` bytes.
+        
+        Args:
+            tokens: The replaced value, or the container that was inserted into
+            start: First replaced byte
+            end: End of the replaced bytes (== start for insertions)
+            length: Number of bytes written instead
+            replaced: False if bytes were inserted into the container at tokens
+        """
+        delta = length - (end - start)
+        pointer = join_json_pointer(tokens)
+        for key in list(self.entries):
+            entry = self.entries[key]
+            if replaced and (key == pointer or key.startswith(pointer + "/")):
+                del self.entries[key]
+            elif key == "" or key == pointer or pointer.startswith(key + "/"):
+                # Encloses the change: only its end moves
+                if entry[1] is not None:
+                    entry[1] += delta
+            elif entry[0] >= end:
+                entry[0] += delta
+                if entry[1] is not None:
+                    entry[1] += delta
+        if replaced:
+            self.entries[pointer] = [start, start + length]
+        self._stamp = self._file_stamp()
+        self._dirty = True
+
+
+def _open_map(path: Path) -> Tuple[Any, Any]:
+    """Open path and map it read-only; empty files map to b''."""
+    f = open(path, "rb")
+    try:
+        if os.fstat(f.fileno()).st_size == 0:
+            return f, b""
+        return f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except BaseException:
+        f.close()
+        raise
+
+
+def read_json_pointer(
+    file_path: Union[str, Path],
+    pointer: str,
+    index: Optional[JsonOffsetIndex] = None
+) -> Any:
+    """
+    Decode only the value at a JSON Pointer.
+    
+    Args:
+        file_path: JSON file
+        pointer: JSON Pointer
+        index: Optional offset index (validated against the file first)
+    
+    Returns:
+        Decoded value
+    
+    Raises:
+        KeyError: If the pointer does not resolve
+        JsonError: If the document is malformed
+    """
+    if index is not None:
+        index.validate()
+    f, buf = _open_map(Path(file_path))
+    try:
+        span = index.lookup(split_json_pointer(pointer)) if index is not None else None
+        if span is None:
+            span = locate_json_pointer(buf, pointer, index)
+        try:
+            return json.loads(buf[span[0]:span[1]])
+        except ValueError as e:
+            raise JsonError(f"Invalid JSON value at {pointer!r}: {e}", e) from e
+    finally:
+        if isinstance(buf, mmap.mmap):
+            buf.close()
+        f.close()
+
+
+def patch_json_pointer(
+    file_path: Union[str, Path],
+    pointer: str,
+    encoded_value: bytes,
+    backup: bool = True,
+    index: Optional[JsonOffsetIndex] = None
+) -> None:
+    """
+    Replace (or add) the value at a JSON Pointer by splicing bytes.
+    
+    Existing values are replaced in place; a missing object member or an
+    array "-" reference is inserted after the container's last entry.
+    Everything else is copied byte for byte, so formatting is preserved.
+    
+    Args:
+        file_path: JSON file
+        pointer: JSON Pointer (the parent container must exist)
+        encoded_value: New value as UTF-8 JSON text
+        backup: Whether AtomicFileWriter writes a .backup.<ts> copy of the
+                previous file (kept after the update)
+        index: Optional offset index, shifted to match the new file
+    
+    Raises:
+        KeyError: If the parent container does not exist
+        ValueError: If pointer refers to the root
+        JsonError: If the document is malformed
+    """
+    path = Path(file_path)
+    tokens = split_json_pointer(pointer)
+    if not tokens:
+        raise ValueError("Cannot set root in place")
+    if index is not None:
+        index.validate()
+    
+    f, buf = _open_map(path)
+    try:
+        span = index.lookup(tokens) if index is not None else None
+        if span is None:
+            parent = _value_start(buf, tokens[:-1], index)
+            if tokens[-1] == "-" and buf[parent] == _OPEN_ARRAY:
+                start = None
+            else:
+                start = find_child(buf, parent, tokens[-1])
+            span = None if start is None else (start, skip_value(buf, start))
+        
+        replaced = span is not None
+        if replaced:
+            start, end, insert = span[0], span[1], encoded_value
+            changed = tokens
+        elif buf[parent] == _OPEN_OBJECT or tokens[-1] == "-":
+            start, empty = _insertion_point(buf, (parent, skip_value(buf, parent)))
+            end = start
+            if buf[parent] == _OPEN_OBJECT:
+                key = json.dumps(tokens[-1], ensure_ascii=False).encode("utf-8")
+                insert = key + b": " + encoded_value
+            else:
+                insert = encoded_value
+            if not empty:
+                insert = b", " + insert
+            changed = tokens[:-1]
+        else:
+            raise KeyError(f"Path not found: {pointer}")
+        
+        writer = AtomicFileWriter(path, mode="wb", backup=backup)
+        out = writer.start()
+        try:
+            with memoryview(buf) as view:
+                for offset in range(0, start, COPY_CHUNK_SIZE):
+                    out.write(view[offset:min(offset + COPY_CHUNK_SIZE, start)])
+                out.write(insert)
+                for offset in range(end, len(buf), COPY_CHUNK_SIZE):
+                    out.write(view[offset:offset + COPY_CHUNK_SIZE])
+        except BaseException:
+            writer.rollback()
+            raise
+    finally:
+        if isinstance(buf, mmap.mmap):
+            buf.close()
+        f.close()
+    
+    # Commit after the map is closed (Windows cannot replace a mapped file)
+    writer.commit()
+    if index is not None:
+        index.splice(changed, start, end, len(insert), replaced=replaced)
+
+
+__all__ = [
+    "INDEX_SUFFIX",
+    "JsonOffsetIndex",
+    "split_json_pointer",
+    "join_json_pointer",
+    "skip_value",
+    "find_child",
+    "root_start",
+    "root_span",
+    "locate_json_pointer",
+    "read_json_pointer",
+    "patch_json_pointer",
+]
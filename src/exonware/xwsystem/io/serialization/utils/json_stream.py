@@ -0,0 +1,615 @@
+#!/usr/bin/env python3
+#exonware/xwsystem/src/exonware/xwsystem/io/serialization/utils/json_stream.py
+"""
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+
+Incremental (push) JSON parser for streaming deserialization.
+
+Chunks are fed as they arrive. The parser either reports tokenizer events,
+or - given a JSONPath-style prefix such as "$.records[*]" - yields only the
+values at that path, each decoded with json.loads() as soon as its closing
+bracket arrives. Subtrees off the path are skipped by a bracket scanner
+without being decoded.
+
+Performance:
+    - Memory is bounded by the largest single item plus one chunk
+    - Item bodies are located with a regex scanner and decoded in C
+      (json.loads), so Python only touches structural characters
+    - Items split across chunks are joined once, never re-scanned
+"""
+
+import codecs
+import json
+import re
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+from ..errors import JsonError
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Wildcard path component ('[*]' or '.*')
+WILDCARD = "*"
+
+_WS = re.compile(r'[ \t\n\r]*')
+_NUMBER = re.compile(r'-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?')
+# Characters that may still extend a number at the end of a chunk
+_NUMBER_TAIL = re.compile(r'[-+0-9.eE]*\Z')
+# Everything up to the next bracket, skipping complete strings
+_SKIP_TO_BRACKET = re.compile(r'(?:[^"\[\]{}]+|"[^"\\]*(?:\\.[^"\\]*)*")*', re.DOTALL)
+_STRING_TAIL = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_PREFIX_TOKEN = re.compile(
+    r"\.([A-Za-z_$][\w$-]*)|\.\*|\[\*\]|\[(\d+)\]|\[(['\"])(.*?)\3\]"
+)
+_LITERALS = (
+    ("true", True),
+    ("false", False),
+    ("null", None),
+    ("NaN", float("nan")),
+    ("Infinity", float("inf")),
+    ("-Infinity", float("-inf")),
+)
+_LONGEST_LITERAL = max(len(literal) for literal, _ in _LITERALS)
+_scanstring = json.decoder.scanstring
+_DECODER = json.JSONDecoder()
+
+# Frame states
+_VALUE = 0
+_VALUE_OR_END = 1
+_KEY = 2
+_KEY_OR_END = 3
+_COLON = 4
+_COMMA_OR_END = 5
+
+# What to do with a value
+_DESCEND = 0
+_CAPTURE = 1
+_SKIP = 2
+_KEY_TOKEN = 3
+
+PathType = Tuple[Union[str, int], ...]
+
+
+def parse_item_prefix(prefix: str) -> PathType:
+    """
+    Parse a JSONPath-style item prefix into path components.
+    
+    Supported: "$" (the root), ".name", "['any key']", "[3]" and the
+    wildcards "[*]" / ".*" (every array element / object value).
+    
+    Args:
+        prefix: Prefix such as "$.records[*]"
+    
+    Returns:
+        Tuple of keys, indexes and WILDCARD
+    
+    Raises:
+        ValueError: If the prefix is not supported
+    """
+    if not prefix.startswith("$"):
+        raise ValueError(f"Item prefix must start with '$', got {prefix!r}")
+    components: List[Union[str, int]] = []
+    pos = 1
+    while pos < len(prefix):
+        match = _PREFIX_TOKEN.match(prefix, pos)
+        if match is None:
+            raise ValueError(f"Unsupported item prefix {prefix!r} at position {pos}")
+        name, index, _, quoted = match.groups()
+        if name is not None:
+            components.append(name)
+        elif index is not None:
+            components.append(int(index))
+        elif quoted is not None:
+            components.append(quoted)
+        else:
+            components.append(WILDCARD)
+        pos = match.end()
+    return tuple(components)
+
+
+def _decode_string(token: str) -> str:
+    """Decode a complete JSON string token (quotes included)."""
+    return _scanstring(token, 1)[0]
+
+
+def _open_escape(text: str, start: int) -> bool:
+    """Whether text ends with an unpaired backslash (escape split across chunks)."""
+    count = 0
+    index = len(text) - 1
+    while index >= start and text[index] == "\\":
+        count += 1
+        index -= 1
+    return count % 2 == 1
+
+
+class JsonStreamParser:
+    """
+    Push parser for JSON text arriving in chunks.
+    
+    Item mode (default) returns (path, value) pairs for every value at
+    `prefix`; without a prefix, the elements of a root array are returned
+    one by one (any other root value is returned whole). Event mode returns
+    (path, event, value) tuples - start_map, map_key, end_map, start_array,
+    end_array, value - with values at `prefix` reported as single 'item'
+    events.
+    
+    Example:
+        parser = JsonStreamParser("$.records[*]")
+        for chunk in response.iter_content(65536):
+            for path, record in parser.feed(chunk):
+                handle(record)
+        parser.close()
+    """
+    
+    def __init__(
+        self,
+        prefix: Optional[str] = None,
+        *,
+        events: bool = False,
+        loads: Callable[[str], Any] = json.loads
+    ):
+        """
+        Initialize parser.
+        
+        Args:
+            prefix: JSONPath-style item prefix (see parse_item_prefix)
+            events: Report tokenizer events instead of items only
+            loads: Function decoding one complete item's JSON text
+        """
+        self._pattern: Optional[PathType] = parse_item_prefix(prefix) if prefix is not None else None
+        self._events = events
+        self._loads = loads
+        # With the stdlib decoder, items are decoded straight from the buffer
+        self._scan_once = _DECODER.scan_once if loads is json.loads else None
+        self._decoder = None
+        
+        self._buffer = ""
+        self._pos = 0
+        self._base = 0  # characters discarded before the buffer
+        self._stack: List[list] = []  # [is_object, key or index, state]
+        self._done = False
+        self._closed = False
+        self._out: List[tuple] = []
+        
+        # Bracket scanner state (a string or container spanning chunks)
+        self._scanning = False
+        self._scan_kind = _SKIP
+        self._scan_path: PathType = ()
+        self._scan_start = 0
+        self._scan_depth = 0
+        self._scan_in_string = False
+        self._scan_escape = False
+        self._parts: List[str] = []
+    
+    @property
+    def offset(self) -> int:
+        """Characters consumed so far."""
+        return self._base + self._pos
+    
+    def feed(self, chunk: Union[str, bytes]) -> List[tuple]:
+        """
+        Feed the next chunk of JSON text.
+        
+        Args:
+            chunk: Text or UTF-8 bytes (multi-byte characters may be split)
+        
+        Returns:
+            Items or events completed by this chunk
+        
+        Raises:
+            JsonError: If the text is not valid JSON
+        """
+        if self._closed:
+            raise JsonError("Cannot feed a closed JSON stream parser")
+        text = self._decode(chunk, final=False)
+        if not text:
+            return self._drain()
+        
+        if self._scanning:
+            end = self._scan(text, 0)
+            if end < 0:
+                if self._scan_kind != _SKIP:
+                    self._parts.append(text)
+                self._base += len(text)
+                return self._drain()
+            self._scanning = False
+            token = "".join(self._parts) + text[:end] if self._scan_kind != _SKIP else ""
+            self._parts = []
+            self._buffer = text
+            self._pos = end
+            self._finish_scan(token, self._scan_start)
+        elif self._pos:
+            self._base += self._pos
+            self._buffer = self._buffer[self._pos:] + text
+            self._pos = 0
+        else:
+            self._buffer += text
+        
+        self._parse(final=False)
+        return self._drain()
+    
+    def close(self) -> List[tuple]:
+        """
+        Signal end of input.
+        
+        Returns:
+            Items or events completed by the end of input
+        
+        Raises:
+            JsonError: If the document is incomplete
+        """
+        if self._closed:
+            return []
+        tail = self._decode(b"" if self._decoder is not None else "", final=True)
+        self._closed = True
+        if self._scanning:
+            raise JsonError(f"Incomplete JSON document: unterminated value at offset {self._scan_start}")
+        if tail:
+            self._buffer = self._buffer[self._pos:] + tail
+            self._base += self._pos
+            self._pos = 0
+        self._parse(final=True)
+        if not self._done:
+            raise JsonError(f"Incomplete JSON document at offset {self.offset}")
+        return self._drain()
+    
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    
+    def _decode(self, chunk: Union[str, bytes], final: bool) -> str:
+        if isinstance(chunk, str):
+            return chunk
+        if self._decoder is None:
+            # utf-8-sig drops a leading byte order mark
+            self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        try:
+            return self._decoder.decode(chunk, final)
+        except UnicodeDecodeError as e:
+            raise JsonError(f"Invalid UTF-8 in JSON stream: {e}", e)
+    
+    def _drain(self) -> List[tuple]:
+        out = self._out
+        self._out = []
+        return out
+    
+    def _error(self, message: str, pos: int) -> JsonError:
+        return JsonError(f"{message} at offset {self._base + pos}")
+    
+    def _path(self) -> PathType:
+        return tuple(frame[1] for frame in self._stack)
+    
+    def _action(self, path: PathType) -> int:
+        """Decide whether the value at path is captured, descended into or skipped."""
+        pattern = self._pattern
+        if pattern is None:
+            return _DESCEND
+        if len(path) > len(pattern):
+            return _DESCEND if self._events else _SKIP
+        for actual, wanted in zip(path, pattern):
+            if wanted != actual and wanted is not WILDCARD:
+                return _DESCEND if self._events else _SKIP
+        return _CAPTURE if len(path) == len(pattern) else _DESCEND
+    
+    def _value_done(self) -> None:
+        if self._stack:
+            self._stack[-1][2] = _COMMA_OR_END
+        else:
+            self._done = True
+    
+    def _emit(self, action: int, path: PathType, value: Any) -> None:
+        if action == _CAPTURE:
+            self._out.append((path, "item", value) if self._events else (path, value))
+        elif action == _DESCEND and self._events:
+            self._out.append((path, "value", value))
+    
+    def _scan(self, text: str, pos: int) -> int:
+        """
+        Advance the bracket scanner over text.
+        
+        Returns:
+            End index of the scanned string/container, or -1 if it continues
+        """
+        if self._scan_in_string:
+            if self._scan_escape:
+                if pos >= len(text):
+                    return -1
+                pos += 1
+                self._scan_escape = False
+            match = _STRING_TAIL.match(text, pos)
+            if match is None:
+                self._scan_escape = _open_escape(text, pos)
+                return -1
+            self._scan_in_string = False
+            pos = match.end()
+            if self._scan_depth == 0:
+                return pos
+        
+        depth = self._scan_depth
+        size = len(text)
+        skip = _SKIP_TO_BRACKET.match
+        while True:
+            pos = skip(text, pos).end()
+            if pos >= size:
+                self._scan_depth = depth
+                return -1
+            char = text[pos]
+            if char == '"':
+                # Unterminated string: resume inside it with the next chunk
+                self._scan_in_string = True
+                self._scan_escape = _open_escape(text, pos + 1)
+                self._scan_depth = depth
+                return -1
+            pos += 1
+            if char == "[" or char == "{":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    self._scan_depth = 0
+                    return pos
+    
+    def _begin_scan(self, buf: str, pos: int, kind: int, path: PathType) -> int:
+        """Scan a string or container starting at pos; -1 if it spans chunks."""
+        self._scan_kind = kind
+        self._scan_path = path
+        self._scan_start = self._base + pos
+        self._scan_depth = 0
+        # A string is scanned from its opening quote (depth stays 0)
+        self._scan_in_string = buf[pos] == '"'
+        self._scan_escape = False
+        end = self._scan(buf, pos + 1 if self._scan_in_string else pos)
+        if end >= 0:
+            self._finish_scan(buf[pos:end] if kind != _SKIP else "", self._scan_start)
+            return end
+        if kind != _SKIP:
+            self._parts = [buf[pos:]]
+        self._scanning = True
+        self._base += len(buf)
+        self._buffer = ""
+        self._pos = 0
+        return -1
+    
+    def _finish_scan(self, token: str, start: int) -> None:
+        kind = self._scan_kind
+        if kind == _KEY_TOKEN:
+            frame = self._stack[-1]
+            frame[1] = _decode_string(token)
+            frame[2] = _COLON
+            if self._events:
+                self._out.append((self._scan_path, "map_key", frame[1]))
+            return
+        if kind == _CAPTURE:
+            try:
+                value = self._loads(token)
+            except (ValueError, TypeError) as e:
+                raise JsonError(f"Invalid JSON value at offset {start}: {e}", e)
+            self._emit(_CAPTURE, self._scan_path, value)
+        elif kind == _DESCEND:
+            # Only strings reach here (containers are descended into)
+            try:
+                value = _decode_string(token)
+            except ValueError as e:
+                raise JsonError(f"Invalid JSON string at offset {start}: {e}", e)
+            self._emit(_DESCEND, self._scan_path, value)
+        self._value_done()
+    
+    def _scalar(self, buf: str, pos: int, final: bool) -> Tuple[Any, int]:
+        """Parse a number or literal; end is -1 if it may continue in the next chunk."""
+        match = _NUMBER.match(buf, pos)
+        if match is not None:
+            end = match.end()
+            if not final and _NUMBER_TAIL.match(buf, end):
+                return None, -1
+            token = match.group()
+            if "." in token or "e" in token or "E" in token:
+                return float(token), end
+            return int(token), end
+        for literal, value in _LITERALS:
+            if buf.startswith(literal, pos):
+                return value, pos + len(literal)
+        if not final and len(buf) - pos < _LONGEST_LITERAL:
+            return None, -1
+        raise self._error(f"Unexpected character {buf[pos]!r}", pos)
+    
+    def _parse(self, final: bool) -> None:
+        """Consume as much of the buffer as possible."""
+        buf = self._buffer
+        pos = self._pos
+        size = len(buf)
+        stack = self._stack
+        events = self._events
+        
+        while True:
+            pos = _WS.match(buf, pos).end()
+            if pos >= size:
+                break
+            if self._done:
+                raise self._error("Extra data after JSON document", pos)
+            
+            char = buf[pos]
+            state = stack[-1][2] if stack else _VALUE
+            
+            if state == _VALUE or (state == _VALUE_OR_END and char != "]"):
+                path = self._path()
+                if not stack and self._pattern is None and not events:
+                    # No prefix: stream a root array's elements, else the root value
+                    self._pattern = (WILDCARD,) if char == "[" else ()
+                action = self._action(path)
+                if char == "{" or char == "[":
+                    if action == _DESCEND:
+                        if events:
+                            self._out.append((path, "start_map" if char == "{" else "start_array", None))
+                        stack.append([True, None, _KEY_OR_END] if char == "{" else [False, 0, _VALUE_OR_END])
+                        pos += 1
+                        continue
+                elif char != '"':
+                    value, end = self._scalar(buf, pos, final)
+                    if end < 0:
+                        break
+                    self._emit(action, path, value)
+                    self._value_done()
+                    pos = end
+                    continue
+                if action == _CAPTURE and self._scan_once is not None:
+                    # Fast path: decode the item in place; a failure means it is
+                    # incomplete (or invalid) and the bracket scanner decides which
+                    try:
+                        value, end = self._scan_once(buf, pos)
+                    except (StopIteration, ValueError):
+                        pass
+                    else:
+                        self._out.append((path, "item", value) if events else (path, value))
+                        self._value_done()
+                        pos = end
+                        continue
+                end = self._begin_scan(buf, pos, action, path)
+                if end < 0:
+                    return
+                pos = end
+                continue
+            
+            if state == _COMMA_OR_END:
+                frame = stack[-1]
+                if char == ",":
+                    if frame[0]:
+                        frame[2] = _KEY
+                    else:
+                        frame[1] += 1
+                        frame[2] = _VALUE
+                    pos += 1
+                    continue
+                if char != ("}" if frame[0] else "]"):
+                    raise self._error(
+                        f"Expecting ',' or '{'}' if frame[0] else ']'}', got {char!r}", pos
+                    )
+            
+            if char == "}" and state in (_KEY_OR_END, _COMMA_OR_END) and stack[-1][0]:
+                stack.pop()
+                if events:
+                    self._out.append((self._path(), "end_map", None))
+                self._value_done()
+                pos += 1
+                continue
+            if char == "]" and state in (_VALUE_OR_END, _COMMA_OR_END):
+                stack.pop()
+                if events:
+                    self._out.append((self._path(), "end_array", None))
+                self._value_done()
+                pos += 1
+                continue
+            
+            if state == _KEY or state == _KEY_OR_END:
+                if char != '"':
+                    raise self._error(f"Expecting property name, got {char!r}", pos)
+                end = self._begin_scan(buf, pos, _KEY_TOKEN, self._path()[:-1])
+                if end < 0:
+                    return
+                pos = end
+                continue
+            
+            if state == _COLON:
+                if char != ":":
+                    raise self._error(f"Expecting ':', got {char!r}", pos)
+                stack[-1][2] = _VALUE
+                pos += 1
+                continue
+            
+            raise self._error(f"Unexpected character {char!r}", pos)
+        
+        self._pos = pos
+
+
+def _iter_source(source: Any, chunk_size: int) -> Iterator[Union[str, bytes]]:
+    """Chunks from a file-like object, a whole document, or an iterable of chunks."""
+    if hasattr(source, "read"):
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    elif isinstance(source, (str, bytes, bytearray)):
+        yield bytes(source) if isinstance(source, bytearray) else source
+    else:
+        yield from source
+
+
+def iter_json_items(
+    source: Union[Any, Iterable[Union[str, bytes]]],
+    prefix: Optional[str] = None,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    loads: Callable[[str], Any] = json.loads,
+    with_path: bool = False
+) -> Iterator[Any]:
+    """
+    Yield JSON values at a prefix as they complete.
+    
+    Args:
+        source: File-like object, str/bytes document or iterable of chunks
+        prefix: JSONPath-style prefix (default: root array elements, or the root)
+        chunk_size: Read size for file-like sources
+        loads: Function decoding one item's JSON text
+        with_path: Yield (path, value) pairs instead of values
+    
+    Yields:
+        Decoded values in document order
+    
+    Example:
+        with open("export.json", "rb") as f:
+            for record in iter_json_items(f, "$.records[*]"):
+                process(record)
+    """
+    parser = JsonStreamParser(prefix, loads=loads)
+    for chunk in _iter_source(source, chunk_size):
+        for path, value in parser.feed(chunk):
+            yield (path, value) if with_path else value
+    for path, value in parser.close():
+        yield (path, value) if with_path else value
+
+
+async def aiter_json_items(
+    stream: AsyncIterator[Union[str, bytes]],
+    prefix: Optional[str] = None,
+    *,
+    loads: Callable[[str], Any] = json.loads,
+    with_path: bool = False
+) -> AsyncIterator[Any]:
+    """Async variant of iter_json_items() over an async iterator of chunks."""
+    parser = JsonStreamParser(prefix, loads=loads)
+    async for chunk in stream:
+        for path, value in parser.feed(chunk):
+            yield (path, value) if with_path else value
+    for path, value in parser.close():
+        yield (path, value) if with_path else value
+
+
+def iter_json_events(
+    source: Union[Any, Iterable[Union[str, bytes]]],
+    prefix: Optional[str] = None,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[Tuple[PathType, str, Any]]:
+    """
+    Yield (path, event, value) tokenizer events.
+    
+    Values at `prefix` (if given) are reported as one 'item' event each.
+    """
+    parser = JsonStreamParser(prefix, events=True)
+    for chunk in _iter_source(source, chunk_size):
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+__all__ = [
+    "DEFAULT_CHUNK_SIZE",
+    "WILDCARD",
+    "JsonStreamParser",
+    "parse_item_prefix",
+    "iter_json_items",
+    "aiter_json_items",
+    "iter_json_events",
+]
@@ -22,10 +22,14 @@ from pathlib import Path
 from typing import Generic, TypeVar, Union, Optional, Iterator, Any
 
 from ..contracts import ICodecIO, IPagedCodecIO, IDataSource, IPagedDataSource
+from ..defs import CodecCapability
 
 T = TypeVar('T')  # Model type
 R = TypeVar('R')  # Representation type (bytes or str)
 
+# Read size when feeding streaming codecs
+STREAM_CHUNK_SIZE = 64 * 1024
+
 
 class CodecIO(Generic[T, R], ICodecIO[T, R]):
     """
@@ -303,16 +307,19 @@ class PagedCodecIO(CodecIO[T, R], IPagedCodecIO[T, R]):
         """Get underlying paged data source."""
         return self._source
     
-    def iter_items(self, page_size: int = 1000, **opts) -> Iterator[T]:
+    def iter_items(self, page_size: int = 1000, prefix: Optional[str] = None, **opts) -> Iterator[T]:
         """
         Iterate over decoded items page by page.
         
-        NOTE: This assumes the codec can decode individual items from chunks.
-        For line-based formats (JSONL, CSV), this works naturally.
-        For formats that require complete documents (JSON), use load() instead.
+        Codecs with the STREAMING capability (JSON) are fed raw chunks and
+        yield each item as soon as it is complete, so a huge document needs
+        only as much memory as its largest item; page_size is not used then.
+        For line-based formats (JSONL, CSV), each page is decoded on its own.
         
         Args:
             page_size: Items per page
+            prefix: Item path for streaming codecs (e.g. "$.records[*]";
+                    default: the elements of a root array)
             **opts: Codec decode options
         
         Yields:
@@ -323,7 +330,18 @@ class PagedCodecIO(CodecIO[T, R], IPagedCodecIO[T, R]):
             jsonl_io = PagedCodecIO.from_file("huge.jsonl")
             for record in jsonl_io.iter_items(page_size=100):
                 process(record)  # Already decoded!
+            
+            # Stream the records array of a 3GB JSON export
+            json_io = PagedCodecIO.from_file("export.json")
+            for record in json_io.iter_items(prefix="$.records[*]"):
+                process(record)
         """
+        capabilities = getattr(self._codec, 'capabilities', None)
+        if capabilities is not None and CodecCapability.STREAMING in capabilities:
+            chunks = self.paged_source.iter_chunks(STREAM_CHUNK_SIZE, **opts)
+            yield from self._codec.iter_deserialize(chunks, prefix=prefix)
+            return
+        
         for page_content in self.paged_source.iter_pages(page_size, **opts):
             # Decode the page
             try:
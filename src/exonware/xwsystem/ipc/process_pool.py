@@ -16,11 +16,16 @@ import functools
 import logging
 import multiprocessing as mp
 import time
+from collections import deque
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional, Union
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Union
 
 logger = logging.getLogger(__name__)
 
+# Chunks kept submitted per worker while imap() is consumed
+_CHUNKS_IN_FLIGHT_PER_WORKER = 2
+
 
 @dataclass
 class TaskResult:
@@ -33,6 +38,11 @@ class TaskResult:
     worker_pid: Optional[int] = None
 
 
+def _run_chunk(fn: Callable, items: List[Any]) -> List[Any]:
+    """Apply fn to one chunk of items inside a worker process."""
+    return [fn(item) for item in items]
+
+
 class ProcessPool:
     """
     Production-grade process pool with monitoring and error handling.
@@ -164,6 +174,84 @@ class ProcessPool:
             logger.error(f"Failed to submit task {task_id}: {e}")
             raise
     
+    def imap(self,
+             fn: Callable,
+             iterable: Iterable[Any],
+             chunksize: int = 1,
+             ordered: bool = True,
+             timeout: Optional[float] = None) -> Iterator[Any]:
+        """
+        Lazily apply fn to every item of iterable in the worker processes.
+        
+        Items are submitted in chunks of chunksize, so one pickling round
+        trip carries many small tasks. At most max_workers * 2 chunks are
+        in flight: iterable is read, and new chunks submitted, only as
+        results are consumed. Results are yielded in input order, or chunk
+        by chunk as workers finish when ordered is False. An exception
+        raised by fn propagates when its chunk is reached, and chunks not
+        yet started are cancelled.
+        
+        Args:
+            fn: Picklable function taking one item
+            iterable: Items to process
+            chunksize: Items per submitted task
+            ordered: Yield in input order (False: as chunks complete)
+            timeout: Timeout per chunk result (overrides default)
+            
+        Yields:
+            fn(item) for every item
+        """
+        if chunksize <= 0:
+            raise ValueError(f"chunksize must be positive, got {chunksize}")
+        
+        items = iter(iterable)
+        in_flight = self.max_workers * _CHUNKS_IN_FLIGHT_PER_WORKER
+        pending: Deque[concurrent.futures.Future] = deque()
+        exhausted = False
+        
+        try:
+            while True:
+                while not exhausted and len(pending) < in_flight:
+                    chunk = list(islice(items, chunksize))
+                    if not chunk:
+                        exhausted = True
+                        break
+                    pending.append(self._executor.submit(_run_chunk, fn, chunk))
+                    self._stats['tasks_submitted'] += 1
+                if not pending:
+                    return
+                
+                try:
+                    if ordered:
+                        future = pending.popleft()
+                    else:
+                        done, _ = concurrent.futures.wait(
+                            pending, timeout=timeout or self.timeout,
+                            return_when=concurrent.futures.FIRST_COMPLETED
+                        )
+                        if not done:
+                            raise concurrent.futures.TimeoutError("No chunk completed within the timeout")
+                        future = done.pop()
+                        pending.remove(future)
+                    results = future.result(timeout=timeout or self.timeout)
+                except Exception:
+                    self._stats['tasks_failed'] += 1
+                    raise
+                self._stats['tasks_completed'] += 1
+                yield from results
+        finally:
+            for future in pending:
+                future.cancel()
+    
+    def map(self, fn: Callable, iterable: Iterable[Any], chunksize: int = 1) -> List[Any]:
+        """
+        Apply fn to every item in the worker processes (see imap()).
+        
+        Returns:
+            Results in input order
+        """
+        return list(self.imap(fn, iterable, chunksize=chunksize))
+    
     def get_result(self, task_id: str, timeout: Optional[float] = None) -> Optional[Any]:
         """
         Get result of a completed task.
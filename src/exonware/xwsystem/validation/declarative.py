@@ -20,6 +20,37 @@ from ..config.logging_setup import get_logger
 
 logger = get_logger("xsystem.validation.declarative")
 
+# Types every JSON backend writes exactly as json.dumps() does
+_JSON_SCALARS = frozenset((str, int, float, bool, type(None)))
+
+
+def _json_compatible(value: Any) -> Any:
+    """
+    Apply model_dump_json()'s str() fallback ahead of encoding.
+    
+    Values json.dumps() cannot encode become str(value), as its default=str
+    hook did, so the JSON backend needs no hook and keeps its fast path.
+    """
+    if type(value) in _JSON_SCALARS:
+        return value
+    # Containers of plain scalars (the common case) are checked in C and kept
+    if isinstance(value, dict):
+        if _JSON_SCALARS.issuperset(map(type, value.values())):
+            return value
+        return {key: _json_compatible(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        if _JSON_SCALARS.issuperset(map(type, value)):
+            return value
+        return [_json_compatible(item) for item in value]
+    # Subclasses of JSON types are written as their base value by json.dumps()
+    if isinstance(value, str):
+        return str.__str__(value)
+    if isinstance(value, int):
+        return int.__int__(value)
+    if isinstance(value, float):
+        return float.__float__(value)
+    return str(value)
+
 
 class ValidationError(Exception):
     """Raised when validation fails."""
@@ -447,9 +478,11 @@ class XModel(metaclass=ModelMeta):
         return cls(**data)
     
     @classmethod
-    def model_validate_json(cls, json_data: str) -> 'XModel':
-        """Create and validate model from JSON string."""
-        data = json.loads(json_data)
+    def model_validate_json(cls, json_data: Union[str, bytes]) -> 'XModel':
+        """Create and validate model from JSON string (configured JSON backend)."""
+        # Import here to avoid circular imports
+        from ..io.serialization.utils.json_backend import get_json_backend
+        data = get_json_backend().loads(json_data)
         return cls.model_validate(data)
     
     def model_dump(self, 
@@ -486,9 +519,10 @@ class XModel(metaclass=ModelMeta):
         return data
     
     def model_dump_json(self, **kwargs) -> str:
-        """Export model to JSON string."""
-        data = self.model_dump(**kwargs)
-        return json.dumps(data, default=str)
+        """Export model to JSON string (configured JSON backend)."""
+        from ..io.serialization.utils.json_backend import get_json_backend
+        data = _json_compatible(self.model_dump(**kwargs))
+        return get_json_backend().dumps(data, ensure_ascii=True)
     
     @classmethod
     def model_json_schema(cls) -> Dict[str, Any]:
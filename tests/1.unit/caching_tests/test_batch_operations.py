@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Unit tests for batch get_many/put_many/delete_many across cache implementations.
+
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+from exonware.xwsystem.caching import (
+    AsyncLFUCache,
+    AsyncLRUCache,
+    AsyncTTLCache,
+    LFUCache,
+    LRUCache,
+    ReadThroughCache,
+    TTLCache,
+)
+from exonware.xwsystem.caching.disk_cache import DiskCache
+from exonware.xwsystem.caching.two_tier_cache import TwoTierCache
+
+
+class _CountingLock:
+    """RLock wrapper counting acquisitions."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.acquisitions = 0
+
+    def __enter__(self):
+        self.acquisitions += 1
+        return self._lock.__enter__()
+
+    def __exit__(self, *exc):
+        return self._lock.__exit__(*exc)
+
+
+@pytest.mark.xsystem_unit
+class TestInMemoryBatchOperations:
+    """Test native batch operations on in-memory caches."""
+
+    @pytest.mark.parametrize("factory", [
+        lambda: LRUCache(capacity=100),
+        lambda: LFUCache(capacity=100),
+        lambda: TTLCache(capacity=100, ttl=60, cleanup_interval=0),
+    ])
+    def test_roundtrip(self, factory):
+        """Test put_many/get_many/delete_many semantics and hit/miss stats."""
+        cache = factory()
+        assert cache.put_many({f"k{i}": i for i in range(10)}) == 10
+
+        found = cache.get_many([f"k{i}" for i in range(15)])
+        assert found == {f"k{i}": i for i in range(10)}
+        stats = cache.get_stats()
+        assert stats['hits'] == 10
+        assert stats['misses'] == 5
+
+        assert cache.delete_many(["k0", "k1", "missing"]) == 2
+        assert cache.size() == 8
+
+    @pytest.mark.parametrize("factory", [
+        lambda: LRUCache(capacity=100),
+        lambda: LFUCache(capacity=100),
+        lambda: TTLCache(capacity=100, ttl=60, cleanup_interval=0),
+    ])
+    def test_single_lock_acquisition(self, factory):
+        """Test each batch operation takes the cache lock once."""
+        cache = factory()
+        cache._lock = lock = _CountingLock()
+
+        cache.put_many({i: i for i in range(50)})
+        cache.get_many(list(range(50)))
+        cache.delete_many(list(range(50)))
+
+        assert lock.acquisitions == 3
+
+    def test_lru_batch_respects_capacity_and_order(self):
+        """Test put_many evicts in LRU order and get_many refreshes recency."""
+        cache = LRUCache(capacity=3)
+        cache.put_many({"a": 1, "b": 2, "c": 3})
+        cache.get_many(["a"])
+        cache.put_many({"d": 4})
+
+        assert cache.get("b") is None
+        assert cache.get_many(["a", "c", "d"]) == {"a": 1, "c": 3, "d": 4}
+        assert cache.get_stats()['evictions'] == 1
+
+    def test_ttl_put_many_custom_ttl(self):
+        """Test put_many applies one TTL to the whole batch."""
+        cache = TTLCache(capacity=10, ttl=60, cleanup_interval=0)
+        cache.put_many({"a": 1, "b": 2}, ttl=0.02)
+        cache.put("c", 3)
+        time.sleep(0.05)
+
+        assert cache.get_many(["a", "b", "c"]) == {"c": 3}
+
+    def test_subclass_get_is_honored(self):
+        """Test read-through loading still happens for batched misses."""
+        cache = ReadThroughCache(capacity=10, loader=lambda key: key * 2)
+        cache.put(1, "cached")
+
+        assert cache.get_many([1, 2, 3]) == {1: "cached", 2: 4, 3: 6}
+        assert cache.get_stats()['loader_calls'] == 2
+
+    def test_async_caches(self):
+        """Test async batch operations."""
+        async def run(cache):
+            await cache.put_many({"a": 1, "b": 2})
+            found = await cache.get_many(["a", "b", "c"])
+            deleted = await cache.delete_many(["a", "c"])
+            return found, deleted, await cache.size()
+
+        async def run_all():
+            caches = [AsyncLRUCache(capacity=10), AsyncLFUCache(capacity=10),
+                      AsyncTTLCache(capacity=10, ttl=60, cleanup_interval=0)]
+            return [await run(cache) for cache in caches]
+
+        for found, deleted, size in asyncio.run(run_all()):
+            assert found == {"a": 1, "b": 2}
+            assert deleted == 1
+            assert size == 1
+
+
+@pytest.mark.xsystem_unit
+class TestPersistentBatchOperations:
+    """Test batch operations on DiskCache and TwoTierCache."""
+
+    def test_disk_cache_batches(self, tmp_path):
+        """Test segment and blob values are fetched in one call."""
+        with DiskCache(cache_dir=str(tmp_path), inline_threshold=256, max_io_workers=4) as cache:
+            items = {f"small_{i}": i for i in range(20)}
+            items.update({f"blob_{i}": bytes([i]) * 1024 for i in range(8)})
+            assert cache.put_many(items) == len(items)
+            assert len(list(cache.blobs_dir.glob("*/*.pkl"))) == 8
+
+            found = cache.get_many(list(items) + ["missing"])
+            assert found == items
+            stats = cache.get_stats()
+            assert stats['hits'] == len(items)
+            assert stats['misses'] == 1
+
+            assert cache.delete_many(["small_0", "blob_0", "missing"]) == 2
+            assert cache.size() == len(items) - 2
+            assert len(list(cache.blobs_dir.glob("*/*.pkl"))) == 7
+
+    def test_disk_cache_batch_expiry_and_eviction(self, tmp_path):
+        """Test expired keys are dropped and max_size holds for batches."""
+        with DiskCache(cache_dir=str(tmp_path), max_size=5) as cache:
+            cache.put_many({"t1": 1, "t2": 2}, ttl=0.02)
+            time.sleep(0.05)
+            assert cache.get_many(["t1", "t2"]) == {}
+            assert cache.size() == 0
+
+            cache.put_many({f"k{i}": i for i in range(8)})
+            assert cache.size() == 5
+
+    def test_two_tier_bulk_promotion(self, tmp_path):
+        """Test disk hits are promoted to memory in one batch."""
+        cache = TwoTierCache(memory_size=100, disk_cache_dir=str(tmp_path))
+        try:
+            cache.put_many({f"k{i}": i for i in range(10)})
+            cache.memory_cache.clear()
+            cache.put_many({"hot": "h"})
+
+            found = cache.get_many([f"k{i}" for i in range(10)] + ["hot", "missing"])
+            assert len(found) == 11
+            stats = cache.get_stats()
+            assert stats['memory_hits'] == 1
+            assert stats['disk_hits'] == 10
+            assert stats['promotions'] == 10
+            assert stats['misses'] == 1
+            assert cache.memory_cache.get_many([f"k{i}" for i in range(10)]) == {
+                f"k{i}": i for i in range(10)
+            }
+
+            assert cache.delete_many(["k0", "k1"]) == 2
+            assert cache.get_many(["k0", "k1"]) == {}
+        finally:
+            cache.disk_cache.close()
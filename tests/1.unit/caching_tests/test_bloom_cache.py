@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Unit tests for bit-packed, scalable Bloom filters and BloomFilterCache.
+
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+"""
+
+import pytest
+from exonware.xwsystem.caching import (
+    BloomFilter,
+    BloomFilterCache,
+    ScalableBloomFilter,
+    SimpleBloomFilter,
+)
+from exonware.xwsystem.caching.bloom_cache import optimal_bloom_parameters
+from exonware.xwsystem.caching.errors import CacheError
+
+
+def _false_positive_rate(bloom, count: int = 20_000) -> float:
+    return sum(bloom.might_contain(f"absent_{i}") for i in range(count)) / count
+
+
+@pytest.mark.xsystem_unit
+class TestBloomFilter:
+    """Test the fixed-size Bloom filter."""
+
+    def test_no_false_negatives_and_target_error_rate(self):
+        """Test every added item is found and FP rate is near the target."""
+        bloom = BloomFilter(expected_items=10_000, error_rate=0.01)
+        for i in range(10_000):
+            bloom.add(f"key_{i}")
+
+        assert all(f"key_{i}" in bloom for i in range(10_000))
+        assert _false_positive_rate(bloom) < 0.02
+
+    def test_automatic_sizing_and_bit_packing(self):
+        """Test size/hash count follow the standard formulas and bits are packed."""
+        bits, hashes = optimal_bloom_parameters(1_000_000, 0.01)
+        assert 9_500_000 < bits < 9_700_000
+        assert hashes == 7
+
+        bloom = BloomFilter(expected_items=1_000_000, error_rate=0.01)
+        assert len(bloom.to_bytes()) < bits // 8 + 64
+
+        with pytest.raises(ValueError):
+            BloomFilter(expected_items=0)
+        with pytest.raises(ValueError):
+            BloomFilter(error_rate=1.5)
+
+    def test_add_reports_new_items(self):
+        """Test add() returns False for repeated items and len counts distinct ones."""
+        bloom = BloomFilter(expected_items=100)
+        assert bloom.add("a") is True
+        assert bloom.add("a") is False
+        assert len(bloom) == 1
+
+    def test_serialization_roundtrip(self):
+        """Test to_bytes/from_bytes preserve membership and parameters."""
+        bloom = BloomFilter(expected_items=1000, error_rate=0.001)
+        bloom.update(range(500))
+
+        restored = BloomFilter.from_bytes(bloom.to_bytes())
+
+        assert restored.size == bloom.size
+        assert restored.hash_count == bloom.hash_count
+        assert len(restored) == 500
+        assert all(i in restored for i in range(500))
+
+        with pytest.raises(CacheError):
+            BloomFilter.from_bytes(b"garbage")
+
+    def test_simple_bloom_filter_compatibility(self):
+        """Test the legacy (size, hash_count) constructor still works."""
+        bloom = SimpleBloomFilter(size=10_000, hash_count=3)
+        bloom.add("user:1")
+        assert bloom.size == 10_000
+        assert bloom.hash_count == 3
+        assert bloom.might_contain("user:1")
+        bloom.clear()
+        assert bloom.items_added == 0
+        assert not bloom.might_contain("user:1")
+
+
+@pytest.mark.xsystem_unit
+class TestScalableBloomFilter:
+    """Test the growing Bloom filter."""
+
+    def test_grows_and_keeps_error_rate_bounded(self):
+        """Test inserting 100x the initial capacity keeps FP rate bounded."""
+        bloom = ScalableBloomFilter(initial_capacity=100, error_rate=0.01)
+        for i in range(10_000):
+            bloom.add(i)
+
+        assert len(bloom.filters) > 1
+        assert all(i in bloom for i in range(10_000))
+        assert _false_positive_rate(bloom) < 0.05
+
+    def test_serialization_roundtrip(self):
+        """Test all stages are serialized."""
+        bloom = ScalableBloomFilter(initial_capacity=10)
+        bloom.update(f"k{i}" for i in range(100))
+
+        restored = ScalableBloomFilter.from_bytes(bloom.to_bytes())
+
+        assert len(restored.filters) == len(bloom.filters)
+        assert all(f"k{i}" in restored for i in range(100))
+
+
+@pytest.mark.xsystem_unit
+@pytest.mark.xsystem_performance
+class TestBloomFilterCache:
+    """Test BloomFilterCache with the new filters."""
+
+    def test_negative_lookups_and_hits(self):
+        """Test absent keys are rejected by the filter and present keys are found."""
+        cache = BloomFilterCache(capacity=1000)
+        for i in range(1000):
+            cache.put(f"key_{i}", i)
+
+        assert cache.get("key_7") == 7
+        for i in range(1000):
+            cache.get(f"missing_{i}")
+
+        stats = cache.get_stats()
+        assert stats['bloom_negatives'] > 950
+        assert stats['bloom_hits'] == 1
+
+    def test_automatic_rebuild_after_churn(self):
+        """Test evicted keys stop matching without a manual rebuild."""
+        cache = BloomFilterCache(capacity=100, rebuild_factor=2.0)
+        for i in range(1000):
+            cache.put(i, i)
+
+        stats = cache.get_stats()
+        assert stats['bloom_rebuilds'] >= 4
+        assert stats['bloom_items'] <= 200
+        assert all(cache.might_contain(i) for i in range(900, 1000))
+        assert sum(cache.might_contain(i) for i in range(500)) < 50
+
+    @pytest.mark.parametrize("rebuild_factor", [1.0, 0.5, 0])
+    def test_rebuild_factor_must_exceed_one(self, rebuild_factor):
+        """Test factors that would rebuild on every put of a full cache are rejected."""
+        with pytest.raises(ValueError, match="rebuild_factor"):
+            BloomFilterCache(capacity=10, rebuild_factor=rebuild_factor)
+
+    def test_fixed_size_filter(self):
+        """Test bloom_size selects a fixed-size filter."""
+        cache = BloomFilterCache(capacity=10, bloom_size=4096)
+        cache.put("a", 1)
+        assert cache.get_stats()['bloom_size'] == 4096
+        cache.clear()
+        assert not cache.might_contain("a")
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Unit tests for streaming cache snapshots and SnapshotWarmingStrategy.
+
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+"""
+
+import time
+import pytest
+from exonware.xwsystem.caching import (
+    LRUCache,
+    OptimizedLFUCache,
+    ShardedLRUCache,
+    SnapshotWarmingStrategy,
+    TTLCache,
+    ValueCodec,
+    iter_snapshot,
+    load_snapshot,
+    save_snapshot,
+    warm_cache,
+)
+from exonware.xwsystem.caching.errors import CacheDeserializationError, CacheIntegrityError
+
+
+@pytest.mark.xsystem_unit
+class TestCacheSnapshots:
+    """Test snapshot round trips, metadata preservation and integrity checks."""
+    
+    def test_lru_order_roundtrip(self, tmp_path):
+        """Test LRU order survives, so the same keys are evicted next."""
+        cache = LRUCache(capacity=100)
+        cache.put_many({i: {"n": i} for i in range(100)})
+        cache.get(0)
+        path = tmp_path / "lru.snap"
+        
+        stats = save_snapshot(cache, path, chunk_bytes=512)
+        assert stats['records'] == 100 and stats['chunks'] > 1
+        
+        restored = LRUCache(capacity=100)
+        assert load_snapshot(restored, path, workers=3) == 100
+        assert restored.keys() == cache.keys()
+        assert restored.get(50) == {"n": 50}
+    
+    def test_lfu_frequencies_roundtrip(self, tmp_path):
+        """Test frequencies are restored and drive eviction."""
+        cache = OptimizedLFUCache(capacity=3)
+        cache.put_many({"a": 1, "b": 2, "c": 3})
+        for _ in range(5):
+            cache.get("a")
+        cache.get("c")
+        save_snapshot(cache, tmp_path / "lfu.snap", compression="none")
+        
+        restored = OptimizedLFUCache(capacity=3)
+        load_snapshot(restored, tmp_path / "lfu.snap")
+        restored.put("d", 4)
+        assert set(restored.keys()) == {"a", "c", "d"}
+        assert [r.frequency for r in iter_snapshot(tmp_path / "lfu.snap")] == [1, 2, 6]
+    
+    def test_ttl_remaining_preserved(self, tmp_path):
+        """Test TTL entries keep their remaining lifetime, not a fresh one."""
+        cache = TTLCache(capacity=10, ttl=60, cleanup_interval=0)
+        cache.put("short", 1, ttl=0.3)
+        cache.put("long", 2)
+        save_snapshot(cache, tmp_path / "ttl.snap")
+        
+        restored = TTLCache(capacity=10, ttl=60, cleanup_interval=0)
+        assert load_snapshot(restored, tmp_path / "ttl.snap") == 2
+        time.sleep(0.4)
+        assert restored.get("short") is None
+        assert restored.get("long") == 2
+    
+    def test_background_save_and_compressed_values(self, tmp_path):
+        """Test background snapshots of a codec-backed cache load into a plain one."""
+        cache = LRUCache(capacity=10, value_codec=ValueCodec(threshold=0))
+        cache.put("big", list(range(5000)))
+        future = save_snapshot(cache, tmp_path / "bg.snap", background=True)
+        assert future.result(timeout=10)['records'] == 1
+        
+        plain = LRUCache(capacity=10)
+        load_snapshot(plain, tmp_path / "bg.snap")
+        assert plain.get("big") == list(range(5000))
+    
+    def test_sharded_cache(self, tmp_path):
+        """Test sharded caches snapshot every shard."""
+        cache = ShardedLRUCache(capacity=64, shard_count=4)
+        cache.put_many({f"k{i}": i for i in range(40)})
+        save_snapshot(cache, tmp_path / "sharded.snap")
+        
+        restored = ShardedLRUCache(capacity=64, shard_count=4)
+        assert load_snapshot(restored, tmp_path / "sharded.snap") == 40
+        assert restored.get_many([f"k{i}" for i in range(40)]) == {f"k{i}": i for i in range(40)}
+    
+    def test_corruption_detected(self, tmp_path):
+        """Test checksum and format errors are reported."""
+        cache = LRUCache(capacity=10)
+        cache.put("k", "v" * 100)
+        path = tmp_path / "bad.snap"
+        save_snapshot(cache, path, compression="none")
+        
+        data = bytearray(path.read_bytes())
+        data[-40] ^= 0xFF
+        path.write_bytes(bytes(data))
+        with pytest.raises(CacheIntegrityError):
+            load_snapshot(LRUCache(capacity=10), path)
+        
+        path.write_bytes(b"not a snapshot at all")
+        with pytest.raises(CacheDeserializationError):
+            load_snapshot(LRUCache(capacity=10), path)
+    
+    def test_snapshot_warming_strategy(self, tmp_path):
+        """Test warming restores the snapshot and loads only missing keys."""
+        strategy = SnapshotWarmingStrategy(tmp_path / "warm.snap")
+        source = LRUCache(capacity=100)
+        source.put_many({i: i * 10 for i in range(5)})
+        strategy.save(source)
+        
+        loaded = []
+        
+        def loader(key):
+            loaded.append(key)
+            return key * 10
+        
+        cache = LRUCache(capacity=100)
+        assert warm_cache(cache, loader, list(range(8)), strategy=strategy) == 8
+        assert loaded == [5, 6, 7]
+        assert cache.get(3) == 30
+        
+        missing = SnapshotWarmingStrategy(tmp_path / "none.snap")
+        assert missing.warm(LRUCache(capacity=10), [1], loader) == 1
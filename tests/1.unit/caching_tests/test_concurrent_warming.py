@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Unit tests for concurrent cache warming and RateLimiter pacing.
+
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+from exonware.xwsystem.caching import (
+    AsyncLRUCache,
+    ConcurrentWarmingStrategy,
+    LRUCache,
+    MemoryBoundedLRUCache,
+    RateLimiter,
+    warm_cache,
+)
+from exonware.xwsystem.caching.warming import warm_cache_async
+
+
+@pytest.mark.xsystem_unit
+class TestConcurrentWarming:
+    """Test bounded concurrency, batch loaders, budgets and progress."""
+    
+    def test_loads_overlap_up_to_max_workers(self):
+        """Test slow loaders run concurrently but never above max_workers."""
+        active = [0]
+        peak = [0]
+        lock = threading.Lock()
+        
+        def loader(key):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+            return key * 2
+        
+        cache = LRUCache(capacity=1000)
+        strategy = ConcurrentWarmingStrategy(max_workers=8)
+        started = time.perf_counter()
+        assert warm_cache(cache, loader, list(range(80)), strategy=strategy) == 80
+        
+        assert time.perf_counter() - started < 0.5
+        assert 1 < peak[0] <= 8
+        assert cache.get(7) == 14
+        assert strategy.last_stats['loaded'] == 80
+        assert strategy.last_stats['stopped_early'] is False
+    
+    def test_loader_many_batches_and_failures(self):
+        """Test batch loaders, missing keys and failing batches are counted."""
+        calls = []
+        
+        def loader_many(keys):
+            calls.append(len(keys))
+            if 13 in keys:
+                raise IOError("backend down")
+            return {key: str(key) for key in keys if key % 5}
+        
+        cache = LRUCache(capacity=1000)
+        strategy = ConcurrentWarmingStrategy(max_workers=4, loader_many=loader_many, batch_size=10)
+        progress = []
+        loaded = warm_cache(cache, None, list(range(50)), strategy=strategy,
+                            on_progress=lambda done, total: progress.append((done, total)))
+        
+        # Batch 10-19 fails; every 5th key is missing from the other batches
+        assert loaded == 32
+        assert sorted(calls) == [10] * 5
+        assert cache.get(1) == "1" and 5 not in cache and 11 not in cache
+        stats = strategy.last_stats
+        assert (stats['failed'], stats['skipped'], stats['batches']) == (18, 0, 5)
+        assert max(progress) == (32, 50)
+    
+    def test_stops_at_capacity_and_memory_budget(self):
+        """Test warming stops once further loads would only evict."""
+        loads = []
+        cache = LRUCache(capacity=20)
+        strategy = ConcurrentWarmingStrategy(max_workers=1)
+        warm_cache(cache, lambda key: loads.append(key) or key, list(range(100)), strategy=strategy)
+        assert len(loads) == 20
+        assert strategy.last_stats['stopped_early'] is True
+        assert strategy.last_stats['skipped'] == 80
+        
+        bounded = MemoryBoundedLRUCache(capacity=10_000, memory_budget_mb=0.05)
+        strategy = ConcurrentWarmingStrategy(max_workers=1, budget_fraction=0.9)
+        loaded = warm_cache(bounded, lambda key: "x" * 1000, list(range(1000)), strategy=strategy)
+        assert loaded < 1000
+        assert bounded.get_stats()['evictions'] == 0
+        assert strategy.last_stats['stopped_early'] is True
+    
+    def test_rate_limiter_paces_loads(self):
+        """Test the rate limiter spaces loads without counting rejections."""
+        limiter = RateLimiter(max_ops_per_second=200, burst_capacity=10)
+        cache = LRUCache(capacity=100)
+        strategy = ConcurrentWarmingStrategy(max_workers=4, rate_limiter=limiter,
+                                             loader_many=lambda keys: {k: k for k in keys},
+                                             batch_size=25)
+        started = time.perf_counter()
+        assert warm_cache(cache, None, list(range(50)), strategy=strategy) == 50
+        
+        # 10 burst tokens, then 40 more at 200/s
+        assert time.perf_counter() - started >= 0.15
+        assert limiter.get_stats()['rejected_requests'] == 0
+        assert limiter.wait(5, timeout=0.001) is False
+        with pytest.raises(ValueError):
+            limiter.reserve(11)
+    
+    def test_progress_bar_object(self):
+        """Test progress is streamed to any object with update(n)."""
+        
+        class Bar:
+            def __init__(self):
+                self.count = 0
+            
+            def update(self, n=1):
+                self.count += n
+        
+        bar = Bar()
+        strategy = ConcurrentWarmingStrategy(max_workers=3, progress=bar)
+        warm_cache(LRUCache(capacity=100), lambda key: key, list(range(30)), strategy=strategy)
+        assert bar.count == 30
+    
+    def test_async_warming(self):
+        """Test async loaders run concurrently into an async cache."""
+        active = [0]
+        peak = [0]
+        
+        async def loader(key):
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            await asyncio.sleep(0.01)
+            active[0] -= 1
+            if key == 3:
+                raise KeyError(key)
+            return -key
+        
+        cache = AsyncLRUCache(capacity=100)
+        assert warm_cache_async(cache, loader, list(range(40)), max_concurrency=10) == 39
+        assert 1 < peak[0] <= 10
+        assert asyncio.run(cache.get(5)) == -5
+        
+        sync_cache = LRUCache(capacity=100)
+        assert warm_cache_async(sync_cache, None, list(range(10)),
+                                loader_many=lambda keys: {k: k for k in keys}) == 10
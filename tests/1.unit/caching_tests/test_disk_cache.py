@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the SQLite-indexed, segment-backed DiskCache.
+
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+"""
+
+import hashlib
+import pickle
+import threading
+import time
+import pytest
+from exonware.xwsystem.caching.disk_cache import DiskCache
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return str(tmp_path / "disk_cache")
+
+
+@pytest.mark.xsystem_unit
+class TestDiskCache:
+    """Test DiskCache storage engine."""
+
+    def test_basic_operations(self, cache_dir):
+        """Test set/get/delete/exists/size keep the existing API."""
+        with DiskCache(cache_dir=cache_dir) as cache:
+            assert cache.set("a", {"x": 1}) is True
+            assert cache.set("b", [1, 2, 3]) is True
+
+            assert cache.get("a") == {"x": 1}
+            assert cache.get("missing") is None
+            assert cache.exists("b") is True
+            assert cache.size() == 2
+
+            assert cache.delete("a") is True
+            assert cache.delete("a") is False
+            assert cache.size() == 1
+
+            stats = cache.get_stats()
+            assert stats['hits'] == 1
+            assert stats['misses'] == 1
+
+    def test_small_values_packed_large_values_in_files(self, cache_dir):
+        """Test small values go to segments and large values to blob files."""
+        with DiskCache(cache_dir=cache_dir, max_size=1000, inline_threshold=1024) as cache:
+            for i in range(100):
+                cache.set(f"small_{i}", i)
+            cache.set("large", b"x" * 10_000)
+
+            assert len(list(cache.segments_dir.glob("*.seg"))) == 1
+            assert len(list(cache.blobs_dir.glob("*/*.pkl"))) == 1
+            assert cache.get("small_42") == 42
+            assert cache.get("large") == b"x" * 10_000
+
+            # Overwrite a blob with a small value: the blob file is removed
+            cache.set("large", "small now")
+            assert cache.get("large") == "small now"
+            assert list(cache.blobs_dir.glob("*/*.pkl")) == []
+
+    def test_lru_eviction(self, cache_dir):
+        """Test least recently used entries are evicted at max_size."""
+        with DiskCache(cache_dir=cache_dir, max_size=3) as cache:
+            cache.set("a", 1)
+            time.sleep(0.01)
+            cache.set("b", 2)
+            time.sleep(0.01)
+            cache.set("c", 3)
+            time.sleep(0.01)
+            assert cache.get("a") == 1
+            cache.set("d", 4)
+
+            assert cache.size() == 3
+            assert cache.exists("b") is False
+            assert cache.get("a") == 1
+            assert cache.get_stats()['evictions'] == 1
+
+    def test_ttl_expiry(self, cache_dir):
+        """Test expired entries are not returned."""
+        with DiskCache(cache_dir=cache_dir) as cache:
+            cache.set("k", "v", ttl=0.05)
+            assert cache.get("k") == "v"
+            time.sleep(0.1)
+            assert cache.get("k") is None
+            assert cache.size() == 0
+
+    def test_persistence_across_instances(self, cache_dir):
+        """Test the index and segments survive reopening."""
+        with DiskCache(cache_dir=cache_dir) as cache:
+            for i in range(50):
+                cache.set(f"k{i}", f"v{i}")
+            cache.set("big", b"y" * 100_000)
+
+        with DiskCache(cache_dir=cache_dir) as cache:
+            assert cache.size() == 51
+            assert cache.get("k7") == "v7"
+            assert cache.get("big") == b"y" * 100_000
+            cache.set("k50", "v50")
+            assert cache.get("k50") == "v50"
+
+    def test_compaction_reclaims_dead_bytes(self, cache_dir):
+        """Test overwritten data is reclaimed and live data stays readable."""
+        with DiskCache(cache_dir=cache_dir, max_size=10_000, segment_size=4096) as cache:
+            for round_ in range(5):
+                for i in range(100):
+                    cache.set(f"k{i}", f"value-{round_}-{i}" * 3)
+
+            assert cache.get_stats()['dead_bytes'] > 0
+            assert cache.compact() > 0
+            assert cache.get_stats()['compactions'] > 0
+            assert all(cache.get(f"k{i}") == f"value-4-{i}" * 3 for i in range(100))
+
+        with DiskCache(cache_dir=cache_dir, max_size=10_000, segment_size=4096) as cache:
+            assert cache.get("k99") == "value-4-99" * 3
+
+    def test_clear(self, cache_dir):
+        """Test clear removes entries, segments and blobs."""
+        with DiskCache(cache_dir=cache_dir, inline_threshold=16) as cache:
+            cache.set("a", "x" * 100)
+            cache.set("b", 1)
+            assert cache.clear() is True
+            assert cache.size() == 0
+            assert cache.get("a") is None
+            cache.set("c", 3)
+            assert cache.get("c") == 3
+
+    def test_rolled_back_batch_keeps_released_storage(self, cache_dir, monkeypatch):
+        """Test storage released by a failed put_many is only deleted after COMMIT."""
+        with DiskCache(cache_dir=cache_dir, inline_threshold=1024) as cache:
+            cache.set("big", b"a" * 5000)
+            cache.set("small", "old")
+            write_value = cache._write_value
+
+            def failing_write(key, data):
+                if key == "boom":
+                    raise OSError("disk full")
+                return write_value(key, data)
+
+            monkeypatch.setattr(cache, "_write_value", failing_write)
+            assert cache.put_many({"big": "now small", "small": b"b" * 5000, "boom": 1}) == 0
+
+            assert cache.get("big") == b"a" * 5000
+            assert cache.get("small") == "old"
+            assert cache.size() == 2
+            assert len(list(cache.blobs_dir.glob("*/*.pkl"))) == 1
+
+
+    def test_migrates_legacy_layout(self, tmp_path):
+        """Test entries written by the old pickle-per-key layout are imported."""
+        legacy_dir = tmp_path / "legacy"
+        legacy_dir.mkdir()
+        key_file = legacy_dir / f"{hashlib.sha256(b'old').hexdigest()}.pkl"
+        key_file.write_bytes(pickle.dumps("old value"))
+        now = time.time()
+        with open(legacy_dir / "metadata.pkl", 'wb') as f:
+            pickle.dump({'old': {'size': 10, 'created': now, 'last_access': now}}, f)
+
+        with DiskCache(cache_dir=str(legacy_dir)) as cache:
+            assert cache.get("old") == "old value"
+        assert not key_file.exists()
+        assert not (legacy_dir / "metadata.pkl").exists()
+
+
+@pytest.mark.xsystem_unit
+class TestDiskCacheSharedDirectory:
+    """Test several DiskCache instances (or processes) on one cache_dir."""
+
+    def test_interleaved_writers_read_their_own_values(self, cache_dir):
+        """Test appends from different instances never overlap."""
+        with DiskCache(cache_dir=cache_dir) as a, DiskCache(cache_dir=cache_dir) as b:
+            a.set("k1", "from a")
+            b.set("k2", "from b")
+            a.set("k3", "from a again")
+
+            for cache in (a, b):
+                assert cache.get("k1") == "from a"
+                assert cache.get("k2") == "from b"
+                assert cache.get("k3") == "from a again"
+                assert cache.size() == 3
+
+            b.delete("k1")
+            assert a.get("k1") is None
+            assert a.size() == 2
+
+    def test_concurrent_writers_with_rollover_and_compaction(self, cache_dir):
+        """Test concurrent writers, segment rollover and compaction stay consistent."""
+        caches = [DiskCache(cache_dir=cache_dir, max_size=10_000, segment_size=2048) for _ in range(2)]
+        try:
+            def writer(cache, name):
+                for round_ in range(3):
+                    for i in range(60):
+                        cache.set(f"{name}{i}", f"{name}-{round_}-{i}" * 4)
+
+            threads = [threading.Thread(target=writer, args=(cache, name)) for cache, name in zip(caches, "ab")]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            caches[1].compact()
+            for cache in caches:
+                assert cache.size() == 120
+                for name in "ab":
+                    assert all(cache.get(f"{name}{i}") == f"{name}-2-{i}" * 4 for i in range(60))
+
+            caches[0].clear()
+            caches[1].set("after", 1)
+            assert caches[0].get("after") == 1
+            assert caches[0].get("a1") is None
+        finally:
+            for cache in caches:
+                cache.close()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Unit tests for DistributedCache: hash ring, replication, near-cache and transports.
+
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+"""
+
+import time
+import pytest
+from exonware.xwsystem.caching import (
+    CacheNodeServer,
+    DistributedCache,
+    DistributedCacheNode,
+    HashRing,
+    LocalTransport,
+    TCPTransport,
+)
+from exonware.xwsystem.caching.errors import DistributedCacheError
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.mark.xsystem_unit
+class TestHashRing:
+    """Test consistent hashing."""
+    
+    def test_distribution_and_replicas(self):
+        """Test keys spread over nodes and replica sets are distinct."""
+        ring = HashRing(["a", "b", "c"])
+        owners = [ring.get_node(f"k{i}".encode()) for i in range(3000)]
+        for node in "abc":
+            assert 700 < owners.count(node) < 1300
+        
+        replicas = ring.get_nodes(b"key", 2)
+        assert len(set(replicas)) == 2
+        assert ring.get_nodes(b"key", 5) == ring.get_nodes(b"key", 3)
+    
+    def test_adding_node_moves_few_keys(self):
+        """Test only about 1/N of the keys change owner when a node joins."""
+        ring = HashRing(["a", "b", "c"])
+        keys = [f"k{i}".encode() for i in range(3000)]
+        before = {key: ring.get_node(key) for key in keys}
+        ring.add_node("d")
+        moved = [key for key in keys if ring.get_node(key) != before[key]]
+        
+        assert all(ring.get_node(key) == "d" for key in moved)
+        assert 450 < len(moved) < 1100
+
+
+@pytest.mark.xsystem_unit
+class TestDistributedCache:
+    """Test the client over in-process nodes."""
+    
+    def test_basic_operations(self):
+        """Test put/get/delete and batch operations across nodes."""
+        with DistributedCache.local(num_nodes=3) as cache:
+            cache.put("a", {"x": 1})
+            assert cache.get("a") == {"x": 1}
+            assert cache.get("missing", "d") == "d"
+            
+            assert cache.put_many({f"k{i}": i for i in range(30)}) == 30
+            assert cache.get_many(["k0", "k29", "nope"]) == {"k0": 0, "k29": 29}
+            assert cache.size() == 31
+            assert cache.delete_many(["k0", "k1", "nope"]) == 2
+            assert cache.delete("a") is True
+            assert sorted(cache.keys()) == sorted(f"k{i}" for i in range(2, 30))
+            
+            sizes = [node['size'] for node in cache.get_node_info()['nodes'].values()]
+            assert sum(sizes) == 28 and all(size > 0 for size in sizes)
+    
+    def test_multi_get_one_request_per_node(self):
+        """Test get_many sends one batched request to each node."""
+        calls = []
+        
+        class CountingTransport(LocalTransport):
+            def get_many(self, keys):
+                calls.append(len(keys))
+                return super().get_many(keys)
+        
+        nodes = {f"n{i}": CountingTransport(DistributedCacheNode()) for i in range(3)}
+        with DistributedCache(nodes) as cache:
+            cache.put_many({i: i for i in range(60)})
+            assert len(cache.get_many(list(range(60)))) == 60
+        assert len(calls) == 3 and sum(calls) == 60
+    
+    def test_replication_failover(self):
+        """Test reads fail over to a replica when a node is down."""
+        class FlakyTransport(LocalTransport):
+            down = False
+            
+            def get_many(self, keys):
+                if self.down:
+                    raise DistributedCacheError("down")
+                return super().get_many(keys)
+        
+        nodes = {f"n{i}": FlakyTransport(DistributedCacheNode()) for i in range(3)}
+        with DistributedCache(nodes, replicas=2) as cache:
+            cache.put_many({i: i * 10 for i in range(50)})
+            assert sum(transport.size() for transport in nodes.values()) == 100
+            assert cache.delete(0) is True
+            
+            nodes["n1"].down = True
+            assert cache.get_many(list(range(1, 50))) == {i: i * 10 for i in range(1, 50)}
+            assert cache.get_stats()['failovers'] > 0
+    
+    def test_near_cache_invalidation(self):
+        """Test another client's write invalidates this client's near-cache."""
+        nodes = [DistributedCacheNode() for _ in range(2)]
+        
+        def client():
+            return DistributedCache({f"n{i}": LocalTransport(node) for i, node in enumerate(nodes)},
+                                    near_cache_size=100)
+        
+        with client() as reader, client() as writer:
+            writer.put("k", "v1")
+            assert reader.get("k") == "v1"
+            assert reader.get("k") == "v1"
+            assert reader.get_stats()['near_hits'] == 1
+            
+            writer.put("k", "v2")
+            assert reader.get("k") == "v2"
+            writer.delete("k")
+            assert reader.get("k") is None
+            assert writer.get_stats()['invalidations'] == 0
+    
+    def test_sync_copies_keys_to_new_node(self):
+        """Test sync() repairs ownership after a node joins."""
+        with DistributedCache.local(num_nodes=2) as cache:
+            cache.put_many({i: i for i in range(200)})
+            cache.add_node("late", LocalTransport(DistributedCacheNode()))
+            
+            copied = cache.sync()
+            assert copied > 0
+            assert cache.get_many(list(range(200))) == {i: i for i in range(200)}
+    
+    def test_no_nodes(self):
+        """Test operations without nodes raise DistributedCacheError."""
+        cache = DistributedCache()
+        assert cache.is_connected() is False
+        with pytest.raises(DistributedCacheError):
+            cache.put("k", "v")
+
+
+@pytest.mark.xsystem_unit
+class TestTCPTransport:
+    """Test the TCP node server and pooled transport."""
+    
+    def test_roundtrip_with_ttl_and_invalidation(self):
+        """Test cache operations and invalidation messages over TCP."""
+        with CacheNodeServer() as first, CacheNodeServer() as second:
+            addresses = [f"{host}:{port}" for host, port in (first.address, second.address)]
+            with DistributedCache(addresses, near_cache_size=10) as reader, \
+                    DistributedCache(addresses) as writer:
+                writer.put_many({f"k{i}": [i] for i in range(20)})
+                assert reader.get_many([f"k{i}" for i in range(20)]) == {f"k{i}": [i] for i in range(20)}
+                assert reader.delete_many(["k0", "k1"]) == 2
+                
+                writer.set("short", b"\x00", ttl=0.05)
+                assert reader.get("short") == b"\x00"
+                
+                writer.put("k5", "changed")
+                assert _wait_for(lambda: reader.get("k5") == "changed")
+                assert _wait_for(lambda: reader.get("short") is None)
+                assert reader.size() == 18
+    
+    def test_unreachable_node(self):
+        """Test a dead address surfaces as DistributedCacheError."""
+        with CacheNodeServer() as server:
+            address = server.address
+        transport = TCPTransport(address, timeout=0.5)
+        with pytest.raises(DistributedCacheError):
+            transport.get_many([b"k"])
+        transport.close()
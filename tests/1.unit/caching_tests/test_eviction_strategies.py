@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Unit tests for indexed eviction strategies and PluggableCache victim selection.
+
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+"""
+
+import pytest
+from exonware.xwsystem.caching import (
+    AEvictionStrategy,
+    FIFOEvictionStrategy,
+    LFUEvictionStrategy,
+    LRUEvictionStrategy,
+    PluggableCache,
+    RandomEvictionStrategy,
+    SizeBasedEvictionStrategy,
+    TTLEvictionStrategy,
+)
+
+
+@pytest.mark.xsystem_unit
+class TestIndexedEvictionStrategies:
+    """Test victim order of the built-in strategies."""
+
+    def test_lru(self):
+        """Test the least recently accessed key is evicted."""
+        cache = PluggableCache(capacity=3, strategy=LRUEvictionStrategy())
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.put("c", 3)
+        cache.get("a")
+        cache.put("d", 4)
+
+        assert set(cache.keys()) == {"a", "c", "d"}
+
+    def test_fifo_ignores_access(self):
+        """Test the oldest inserted key is evicted even if accessed."""
+        cache = PluggableCache(capacity=2, strategy=FIFOEvictionStrategy())
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert set(cache.keys()) == {"b", "c"}
+
+    def test_lfu_buckets(self):
+        """Test the least frequently used key goes first, oldest on ties."""
+        cache = PluggableCache(capacity=3, strategy=LFUEvictionStrategy())
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.put("c", 3)
+        for _ in range(3):
+            cache.get("a")
+        cache.get("c")
+
+        cache.put("d", 4)
+        assert "b" not in cache.keys()
+        cache.put("e", 5)  # c (2 uses) outlives d (1 use)
+        assert set(cache.keys()) == {"a", "c", "e"}
+
+    def test_lfu_min_bucket_after_delete(self):
+        """Test deleting the only minimum-frequency key moves the minimum up."""
+        strategy = LFUEvictionStrategy()
+        cache = PluggableCache(capacity=10, strategy=strategy)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("b")
+        cache.delete("a")
+
+        assert strategy.victim() == "b"
+
+    def test_size_based(self):
+        """Test the largest value is evicted."""
+        cache = PluggableCache(capacity=3, strategy=SizeBasedEvictionStrategy())
+        cache.put("small", "x")
+        cache.put("large", "x" * 10000)
+        cache.put("medium", "x" * 100)
+        cache.put("new", "y")
+
+        assert "large" not in cache.keys()
+
+    def test_ttl_heap_with_deletes(self):
+        """Test the soonest-expiring live key is chosen after deletions."""
+        strategy = TTLEvictionStrategy()
+        for i, ttl in enumerate([50, 10, 30, 20]):
+            strategy.on_insert(f"k{i}", None, {'ttl': ttl})
+        strategy.on_delete("k1")
+
+        assert strategy.victim() == "k3"
+
+    def test_random_tracks_membership(self):
+        """Test random victims are always live keys."""
+        strategy = RandomEvictionStrategy()
+        for i in range(20):
+            strategy.on_insert(i, None, {})
+        for i in range(0, 20, 2):
+            strategy.on_delete(i)
+
+        assert all(strategy.victim() % 2 == 1 for _ in range(50))
+
+    def test_clear_resets_index(self):
+        """Test clear() leaves no stale keys in the strategy index."""
+        strategy = LRUEvictionStrategy()
+        cache = PluggableCache(capacity=2, strategy=strategy)
+        cache.put("a", 1)
+        cache.clear()
+
+        assert strategy.victim() is None
+
+    def test_shared_strategy_instance_keeps_capacity(self):
+        """Test caches given one strategy instance each index their own keys."""
+        strategy = LRUEvictionStrategy()
+        first = PluggableCache(capacity=3, strategy=strategy)
+        second = PluggableCache(capacity=3, strategy=strategy)
+        for i in range(10):
+            first.put(("first", i), i)
+            second.put(("second", i), i)
+
+        assert first.size() == 3
+        assert second.size() == 3
+        assert first.get_strategy() is strategy
+        assert second.get_strategy() is not strategy
+
+    def test_eviction_discards_foreign_victims(self):
+        """Test keys the cache does not hold are dropped from the index, not skipped."""
+        strategy = LRUEvictionStrategy()
+        cache = PluggableCache(capacity=2, strategy=strategy)
+        strategy.on_insert("stray", None, {})
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.put("c", 3)
+
+        assert cache.size() == 2
+        assert set(cache.keys()) == {"b", "c"}
+
+    def test_strategy_switch_rebuilds_index(self):
+        """Test set_strategy() indexes existing keys in insertion order."""
+        cache = PluggableCache(capacity=3, strategy=LRUEvictionStrategy())
+        for key in "abc":
+            cache.put(key, key)
+        cache.get("a")
+
+        cache.set_strategy(FIFOEvictionStrategy())
+        cache.put("d", "d")
+        assert set(cache.keys()) == {"b", "c", "d"}
+
+    def test_indexed_eviction_skips_item_list(self):
+        """Test indexed strategies never receive the full item list."""
+        class CountingLRU(LRUEvictionStrategy):
+            scans = 0
+
+            def select_victim(self, cache_items):
+                CountingLRU.scans += 1
+                return super().select_victim(cache_items)
+
+        cache = PluggableCache(capacity=5, strategy=CountingLRU())
+        for i in range(50):
+            cache.put(i, i)
+
+        assert CountingLRU.scans == 0
+        assert cache.get_stats()['evictions'] == 45
+
+    def test_legacy_strategy_still_supported(self):
+        """Test a strategy implementing only select_victim() gets the item list."""
+        class LargestKey(AEvictionStrategy):
+            def select_victim(self, cache_items):
+                return max(item[0] for item in cache_items)
+
+            def on_access(self, key, metadata):
+                pass
+
+            def on_insert(self, key, value, metadata):
+                pass
+
+            def on_delete(self, key):
+                pass
+
+            def get_strategy_name(self):
+                return "LARGEST_KEY"
+
+        cache = PluggableCache(capacity=2, strategy=LargestKey())
+        cache.put(1, "a")
+        cache.put(9, "b")
+        cache.put(5, "c")
+
+        assert set(cache.keys()) == {1, 5}
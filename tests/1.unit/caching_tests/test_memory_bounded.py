@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Unit tests for deep size estimation and memory-bounded caches.
+
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+"""
+
+import pytest
+import sys
+from exonware.xwsystem.caching import (
+    MemoryBoundedLRUCache,
+    MemoryBoundedLFUCache,
+    deep_sizeof,
+    estimate_object_size,
+    register_size_estimator,
+    unregister_size_estimator,
+)
+
+
+class _Blob:
+    """Custom type for estimator registry tests."""
+
+    def __init__(self, size: int):
+        self.size = size
+
+
+@pytest.mark.xsystem_unit
+class TestDeepSizeof:
+    """Test deep size estimation."""
+
+    def test_dict_of_strings_counts_payload(self):
+        """Test container contents are included (not shallow getsizeof)."""
+        data = {i: "x" * 10_000 for i in range(100)}
+
+        assert sys.getsizeof(data) < 10_000
+        assert deep_sizeof(data) >= 100 * 10_000
+        assert estimate_object_size(data) == deep_sizeof(data)
+        assert estimate_object_size(data, deep=False) == sys.getsizeof(data)
+
+    def test_shared_references_counted_once(self):
+        """Test the same object referenced twice is only counted once."""
+        payload = "y" * 50_000
+        assert deep_sizeof([payload, payload]) < 2 * 50_000
+
+    def test_sampling_large_containers(self):
+        """Test sampled estimate of a large container is close to exact."""
+        data = [str(i) * 20 for i in range(10_000)]
+
+        exact = deep_sizeof(data, sample_threshold=10**9)
+        sampled = deep_sizeof(data, sample_threshold=100, sample_size=50)
+
+        assert abs(sampled - exact) / exact < 0.2
+
+    def test_depth_bound_and_cycles(self):
+        """Test deeply nested and cyclic structures terminate."""
+        nested = []
+        current = nested
+        for _ in range(10_000):
+            child = []
+            current.append(child)
+            current = child
+
+        cyclic = {}
+        cyclic['self'] = cyclic
+
+        assert deep_sizeof(nested, max_depth=8) > 0
+        assert deep_sizeof(cyclic) > 0
+
+    def test_objects_and_custom_estimators(self):
+        """Test instance attributes and registered per-type estimators."""
+        blob = _Blob(1_000_000)
+        assert deep_sizeof(blob) < 1_000_000
+
+        register_size_estimator(_Blob, lambda obj, ctx: obj.size)
+        try:
+            assert deep_sizeof(blob) == 1_000_000
+            assert deep_sizeof([blob]) > 1_000_000
+        finally:
+            assert unregister_size_estimator(_Blob) is True
+
+    def test_buffer_like_objects(self):
+        """Test memoryview and nbytes-exposing (numpy-like) objects."""
+        class FakeArray:
+            nbytes = 8_000_000
+
+        assert deep_sizeof(memoryview(bytes(100_000))) >= 100_000
+        assert deep_sizeof(FakeArray()) >= 8_000_000
+
+
+@pytest.mark.xsystem_unit
+@pytest.mark.xsystem_performance
+class TestMemoryBoundedCaches:
+    """Test memory budgets with deep sizing and weighers."""
+
+    def test_lru_budget_uses_deep_size(self):
+        """Test nested payloads are charged for their real size."""
+        cache = MemoryBoundedLRUCache(capacity=1000, memory_budget_mb=1.0)
+        for i in range(50):
+            cache.put(i, {"payload": "x" * 100_000})
+
+        stats = cache.get_memory_stats()
+        assert cache.size() < 11
+        assert stats['current_memory_bytes'] <= stats['memory_budget_bytes']
+
+    @pytest.mark.parametrize("cache_class", [MemoryBoundedLRUCache, MemoryBoundedLFUCache])
+    def test_custom_weigher(self, cache_class):
+        """Test weigher= replaces size estimation."""
+        calls = []
+
+        def weigher(key, value):
+            calls.append(key)
+            return 100 * 1024
+
+        cache = cache_class(capacity=1000, memory_budget_mb=1.0, weigher=weigher)
+        for i in range(20):
+            cache.put(i, i)
+
+        assert calls == list(range(20))
+        assert cache.size() == 10
+        assert cache.get_stats()['current_memory_bytes'] == 10 * 100 * 1024
+
+    @pytest.mark.parametrize("cache_class", [MemoryBoundedLRUCache, MemoryBoundedLFUCache])
+    def test_accounting_survives_count_eviction_and_updates(self, cache_class):
+        """Test capacity evictions and overwrites keep memory accounting exact."""
+        cache = cache_class(capacity=3, memory_budget_mb=1.0, weigher=lambda k, v: len(v))
+        for i in range(10):
+            cache.put(i, "x" * 10)
+        cache.put(9, "x" * 50)
+
+        assert cache.size() == 3
+        assert cache.get_stats()['current_memory_bytes'] == 10 + 10 + 50
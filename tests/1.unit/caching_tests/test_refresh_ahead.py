@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Unit tests for refresh-ahead (stale-while-revalidate / XFetch) caches.
+
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+from exonware.xwsystem.caching import (
+    AsyncRefreshAheadCache,
+    RefreshAheadCache,
+    warm_cache,
+)
+
+
+class _VersionedLoader:
+    """Loader returning an increasing version per call."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, key):
+        time.sleep(self.delay)
+        with self.lock:
+            self.calls += 1
+            return f"{key}:v{self.calls}"
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> bool:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.mark.xsystem_unit
+@pytest.mark.xsystem_performance
+class TestRefreshAheadCache:
+    """Test the thread-pool refresh-ahead cache."""
+
+    def test_stale_value_served_while_refreshing(self):
+        """Test an expired entry inside the grace window is served immediately."""
+        loader = _VersionedLoader(delay=0.1)
+        cache = RefreshAheadCache(ttl=0.05, stale_ttl=5.0, beta=0, loader=loader, cleanup_interval=0)
+        try:
+            assert cache.get("k") == "k:v1"
+            time.sleep(0.1)
+
+            start = time.perf_counter()
+            assert cache.get("k") == "k:v1"
+            assert time.perf_counter() - start < 0.05
+
+            assert _wait_for(lambda: cache.get("k") == "k:v2")
+            stats = cache.get_stats()
+            assert stats['stale_hits'] >= 1
+            assert stats['refreshes'] == 1
+            assert loader.calls == 2
+        finally:
+            cache.shutdown()
+
+    def test_past_grace_window_loads_synchronously(self):
+        """Test an entry past ttl + stale_ttl is reloaded on the caller's thread."""
+        loader = _VersionedLoader()
+        cache = RefreshAheadCache(ttl=0.02, stale_ttl=0.02, beta=0, loader=loader, cleanup_interval=0)
+        try:
+            cache.get("k")
+            time.sleep(0.06)
+            assert cache.get("k") == "k:v2"
+            assert cache.get_stats()['stale_hits'] == 0
+        finally:
+            cache.shutdown()
+
+    def test_xfetch_refreshes_before_expiry(self):
+        """Test slow loaders get refreshed early, before the entry goes stale."""
+        loader = _VersionedLoader()
+        cache = RefreshAheadCache(ttl=1.0, stale_ttl=0, beta=1.0, loader=loader, cleanup_interval=0)
+        try:
+            # Pretend the value took as long as its TTL to compute
+            cache.put("k", "k:v0", load_time=1.0)
+            for _ in range(50):
+                cache.get("k")
+
+            assert _wait_for(lambda: loader.calls >= 1)
+            assert cache.get_stats()['early_refreshes'] >= 1
+            assert cache.get_stats()['stale_hits'] == 0
+        finally:
+            cache.shutdown()
+
+    def test_background_refresh_deduplicated_and_errors_keep_stale(self):
+        """Test one refresh per key and failed refreshes keep serving stale data."""
+        calls = []
+
+        def failing_loader(key):
+            calls.append(key)
+            time.sleep(0.05)
+            raise IOError("backend down")
+
+        cache = RefreshAheadCache(ttl=0.01, stale_ttl=5.0, beta=0, loader=failing_loader, cleanup_interval=0)
+        try:
+            cache.put("k", "stale")
+            time.sleep(0.03)
+            for _ in range(20):
+                assert cache.get("k") == "stale"
+
+            assert _wait_for(lambda: cache.get_stats()['refresh_errors'] == 1)
+            assert len(calls) == 1
+        finally:
+            cache.shutdown()
+
+    def test_no_loader_expires_at_ttl(self):
+        """Test stale values are not served when nothing can revalidate them."""
+        cache = RefreshAheadCache(ttl=0.02, stale_ttl=5.0, cleanup_interval=0)
+        try:
+            cache.put("k", "v")
+            assert cache.get_remaining_ttl("k") > 0
+            time.sleep(0.04)
+            assert cache.get("k", "default") == "default"
+        finally:
+            cache.shutdown()
+
+    def test_warming_records_load_time(self):
+        """Test warm_cache stores measured load times for early refresh."""
+        cache = RefreshAheadCache(ttl=60.0, cleanup_interval=0)
+        try:
+            loader = _VersionedLoader(delay=0.01)
+            assert warm_cache(cache, loader, ["a", "b"]) == 2
+            assert all(cache._cache[key].load_time >= 0.01 for key in ("a", "b"))
+        finally:
+            cache.shutdown()
+
+    def test_invalid_arguments(self):
+        """Test invalid refresh configuration is rejected."""
+        with pytest.raises(ValueError):
+            RefreshAheadCache(stale_ttl=-1, cleanup_interval=0)
+        with pytest.raises(ValueError):
+            RefreshAheadCache(beta=-0.5, cleanup_interval=0)
+
+
+@pytest.mark.xsystem_unit
+class TestAsyncRefreshAheadCache:
+    """Test the asyncio refresh-ahead cache."""
+
+    def test_stale_while_revalidate(self):
+        """Test stale hits return immediately and refresh in a task."""
+        calls = []
+
+        async def loader(key):
+            calls.append(key)
+            await asyncio.sleep(0.02)
+            return f"{key}:v{len(calls)}"
+
+        async def run():
+            cache = AsyncRefreshAheadCache(ttl=0.05, stale_ttl=5.0, beta=0, loader=loader,
+                                           cleanup_interval=0)
+            first = await asyncio.gather(*(cache.get("k") for _ in range(10)))
+            await asyncio.sleep(0.08)
+            stale = await cache.get("k")
+            await asyncio.sleep(0.1)
+            fresh = await cache.get("k")
+            stats = await cache.get_stats()
+            await cache.shutdown()
+            return first, stale, fresh, stats
+
+        first, stale, fresh, stats = asyncio.run(run())
+
+        assert first == ["k:v1"] * 10
+        assert stale == "k:v1"
+        assert fresh == "k:v2"
+        assert stats['refreshes'] == 1
+        assert stats['loader_calls'] == 2
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Unit tests for lock-striped sharded caches.
+
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+"""
+
+import pytest
+import threading
+import time
+from exonware.xwsystem.caching import ShardedLRUCache, ShardedTTLCache
+
+
+@pytest.mark.xsystem_unit
+@pytest.mark.xsystem_performance
+class TestShardedLRUCache:
+    """Test sharded LRU cache."""
+
+    def test_basic_operations(self):
+        """Test basic get/put/delete operations."""
+        cache = ShardedLRUCache(capacity=64, shard_count=4)
+
+        cache.put("k1", "v1")
+        cache.put("k2", "v2")
+
+        assert cache.get("k1") == "v1"
+        assert cache.get("missing", "default") == "default"
+        assert "k2" in cache
+        assert cache.delete("k2") is True
+        assert cache.delete("k2") is False
+        assert cache.size() == 1
+
+    def test_capacity_split_across_shards(self):
+        """Test total capacity is distributed exactly over shards."""
+        cache = ShardedLRUCache(capacity=10, shard_count=4)
+
+        assert sum(shard.capacity for shard in cache.shards) == 10
+
+        for i in range(1000):
+            cache.put(f"key_{i}", i)
+
+        assert cache.size() <= 10
+
+    def test_shard_count_never_exceeds_capacity(self):
+        """Test that tiny caches don't create empty shards."""
+        cache = ShardedLRUCache(capacity=3, shard_count=16)
+        assert cache.shard_count == 3
+
+    def test_aggregated_stats(self):
+        """Test get_stats() sums counters over all shards."""
+        cache = ShardedLRUCache(capacity=100, shard_count=8)
+
+        for i in range(20):
+            cache.put(f"key_{i}", i)
+        for i in range(20):
+            cache.get(f"key_{i}")
+        for i in range(5):
+            cache.get(f"missing_{i}")
+
+        stats = cache.get_stats()
+        assert stats['hits'] == 20
+        assert stats['misses'] == 5
+        assert stats['size'] == 20
+        assert stats['shard_count'] == 8
+        assert sum(stats['shard_sizes']) == 20
+        assert abs(stats['hit_rate'] - 20 / 25) < 1e-9
+
+    def test_batch_operations(self):
+        """Test get_many/put_many/delete_many route to the right shards."""
+        cache = ShardedLRUCache(capacity=100, shard_count=4)
+
+        assert cache.put_many({f"k{i}": i for i in range(10)}) == 10
+        assert cache.get_many(["k1", "k2", "nope"]) == {"k1": 1, "k2": 2}
+        assert cache.delete_many(["k1", "k2", "nope"]) == 2
+        assert cache.size() == 8
+
+    def test_invalid_arguments(self):
+        """Test invalid capacity and shard count are rejected."""
+        with pytest.raises(ValueError):
+            ShardedLRUCache(capacity=0)
+        with pytest.raises(ValueError):
+            ShardedLRUCache(capacity=10, shard_count=0)
+
+    def test_concurrent_access(self):
+        """Test concurrent readers and writers keep the cache consistent."""
+        cache = ShardedLRUCache(capacity=1000, shard_count=16)
+        errors = []
+
+        def worker(thread_id: int):
+            try:
+                for i in range(500):
+                    key = f"key_{thread_id}_{i % 50}"
+                    cache.put(key, i)
+                    cache.get(key)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not errors
+        assert cache.size() == 400
+        assert cache.get_stats()['hits'] == 8 * 500
+
+
+@pytest.mark.xsystem_unit
+class TestShardedTTLCache:
+    """Test sharded TTL cache."""
+
+    def test_basic_operations_and_ttl(self):
+        """Test per-entry TTL is honoured by the owning shard."""
+        with ShardedTTLCache(capacity=64, ttl=60, shard_count=4, cleanup_interval=0) as cache:
+            assert cache.put("k1", "v1") is True
+            cache.put("k2", "v2", ttl=-1)
+
+            assert cache.get("k1") == "v1"
+            assert cache.get("k2") is None
+            assert "k1" in cache
+            assert cache.get_remaining_ttl("k1") > 0
+
+            stats = cache.get_stats()
+            assert stats['expirations'] == 1
+            assert stats['hits'] == 1
+
+    def test_single_cleanup_thread_sweeps_all_shards(self):
+        """Test one cleanup thread (not one per shard) removes expired entries."""
+        cache = ShardedTTLCache(capacity=64, ttl=0.05, shard_count=8, cleanup_interval=0.05)
+        cleanup_threads = lambda: [t for t in threading.enumerate() if cache.name in t.name]
+        try:
+            assert len(cleanup_threads()) == 1
+            assert all(shard._cleanup_thread is None for shard in cache.shards)
+
+            for i in range(32):
+                cache.put(f"k{i}", i)
+            deadline = time.time() + 5
+            while cache.get_stats()['size'] and time.time() < deadline:
+                time.sleep(0.02)
+
+            assert cache.get_stats()['size'] == 0
+            assert cache.get_stats()['cleanups'] > 0
+        finally:
+            cache.shutdown()
+        assert cleanup_threads() == []
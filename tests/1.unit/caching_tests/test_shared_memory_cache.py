@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the cross-process SharedMemoryCache.
+
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+"""
+
+import multiprocessing
+import pickle
+import time
+import pytest
+from exonware.xwsystem.caching import SharedMemoryCache
+from exonware.xwsystem.caching.errors import CacheValueSizeError
+
+
+def _worker_put(cache, start):
+    for i in range(start, start + 50):
+        cache.put(f"w{i}", i * 2)
+
+
+@pytest.fixture
+def cache():
+    with SharedMemoryCache(capacity=8, slot_size=128) as shared:
+        yield shared
+
+
+@pytest.mark.xsystem_unit
+class TestSharedMemoryCache:
+    """Test the shared-memory slab cache."""
+    
+    def test_basic_operations(self, cache):
+        """Test put/get/delete with mixed key and value types."""
+        cache.put("a", {"x": 1})
+        cache.put(2, [1, 2])
+        cache.put(b"raw", "bytes key")
+        cache.put(("t", 1), None)
+        
+        assert cache.get("a") == {"x": 1}
+        assert cache.get(2) == [1, 2]
+        assert cache.get("2") is None
+        assert cache.get(b"raw") == "bytes key"
+        assert cache.get(("t", 1), "default") is None
+        assert cache.size() == 4
+        
+        cache.put("a", "replaced")
+        assert cache.get("a") == "replaced"
+        assert cache.size() == 4
+        
+        assert cache.delete("a") is True
+        assert cache.delete("a") is False
+        assert set(cache.keys()) == {2, b"raw", ("t", 1)}
+    
+    def test_clock_eviction_keeps_referenced(self, cache):
+        """Test CLOCK evicts unreferenced entries before recently read ones."""
+        for i in range(8):
+            cache.put(i, i)
+        cache.evict()  # first sweep clears every reference bit
+        cache.get(5)
+        for i in range(100, 106):
+            cache.put(i, i)
+        
+        assert cache.size() == 8
+        assert cache.get(5) == 5
+        assert cache.get_stats()['evictions'] == 6  # evict() + 5 CLOCK evictions
+    
+    def test_churn_keeps_index_consistent(self):
+        """Test heavy insert/delete churn (tombstones and index rebuilds)."""
+        with SharedMemoryCache(capacity=16, slot_size=64) as cache:
+            for i in range(2000):
+                cache.put(i, i)
+                if i % 3 == 0:
+                    cache.delete(i)
+            live = cache.items()
+            
+            assert len(live) == cache.size() <= 16
+            assert all(cache.get(key) == value for key, value in live)
+    
+    def test_batch_operations(self, cache):
+        """Test native batch get/put/delete."""
+        assert cache.put_many({f"k{i}": i for i in range(5)}) == 5
+        assert cache.get_many(["k0", "k4", "missing"]) == {"k0": 0, "k4": 4}
+        assert cache.delete_many(["k0", "k1", "missing"]) == 2
+        assert cache.size() == 3
+    
+    def test_value_size_limit(self, cache):
+        """Test entries larger than a slot are rejected."""
+        with pytest.raises(CacheValueSizeError):
+            cache.put("big", "x" * 500)
+    
+    def test_ttl(self):
+        """Test expired entries read as misses and are evicted first."""
+        with SharedMemoryCache(capacity=4, slot_size=64, ttl=0.05) as cache:
+            cache.put("k", "v")
+            assert cache.get("k") == "v"
+            time.sleep(0.1)
+            assert cache.get("k") is None
+            assert cache.keys() == []
+    
+    def test_attach_shares_data(self, cache):
+        """Test a second handle sees writes and geometry from the first."""
+        other = SharedMemoryCache.attach(cache.name)
+        try:
+            cache.put("shared", 42)
+            assert other.get("shared") == 42
+            assert other.capacity == 8
+            assert other.slot_size == 128
+            
+            other.clear()
+            assert cache.get("shared") is None
+        finally:
+            other.close()
+    
+    def test_pickles_as_attachment(self, cache):
+        """Test pickling reattaches by name instead of copying data."""
+        cache.put("k", "v")
+        clone = pickle.loads(pickle.dumps(cache))
+        try:
+            assert clone.name == cache.name
+            assert clone.get("k") == "v"
+        finally:
+            clone.close()
+    
+    def test_visible_across_processes(self, cache):
+        """Test writes from worker processes are visible to the parent."""
+        ctx = multiprocessing.get_context("spawn")
+        workers = [ctx.Process(target=_worker_put, args=(cache, n * 50)) for n in range(2)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(60)
+            assert worker.exitcode == 0
+        
+        # 100 writes through 8 slots: the survivors are consistent
+        items = cache.items()
+        assert len(items) == 8
+        assert all(value == int(key[1:]) * 2 for key, value in items)
+        assert cache.get_stats()['evictions'] == 92
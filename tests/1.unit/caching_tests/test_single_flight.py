@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Unit tests for single-flight loader coalescing.
+
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+from exonware.xwsystem.caching import (
+    AsyncLRUCache,
+    AsyncSingleFlight,
+    ReadThroughCache,
+    SingleFlight,
+    xw_async_cached,
+    xwcached,
+)
+from exonware.xwsystem.caching.errors import CacheTimeoutError
+
+
+def _run_threads(target, count: int = 10) -> list:
+    """Start count threads behind a barrier and collect their results."""
+    barrier = threading.Barrier(count)
+    results = []
+
+    def run():
+        barrier.wait()
+        try:
+            results.append(target())
+        except Exception as e:
+            results.append(e)
+
+    threads = [threading.Thread(target=run) for _ in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+@pytest.mark.xsystem_unit
+class TestSingleFlight:
+    """Test sync and async single-flight groups."""
+
+    def test_concurrent_calls_share_one_load(self):
+        """Test concurrent callers for one key trigger a single call."""
+        flight = SingleFlight()
+        calls = []
+
+        def load():
+            calls.append(1)
+            time.sleep(0.1)
+            return "value"
+
+        results = _run_threads(lambda: flight.do("k", load))
+
+        assert results == ["value"] * 10
+        assert len(calls) == 1
+        assert flight.get_stats()['coalesced'] == 9
+        assert flight.in_flight() == 0
+
+    def test_failure_propagates_to_all_waiters(self):
+        """Test the loader's exception is raised in every caller."""
+        flight = SingleFlight()
+
+        def load():
+            time.sleep(0.1)
+            raise KeyError("missing")
+
+        results = _run_threads(lambda: flight.do("k", load))
+
+        assert len(results) == 10
+        assert all(isinstance(r, KeyError) for r in results)
+
+    def test_wait_timeout(self):
+        """Test waiters give up after timeout while the leader completes."""
+        flight = SingleFlight()
+        started = threading.Event()
+
+        def slow():
+            started.set()
+            time.sleep(0.3)
+            return 1
+
+        leader = threading.Thread(target=lambda: flight.do("k", slow))
+        leader.start()
+        started.wait()
+        with pytest.raises(CacheTimeoutError):
+            flight.do("k", slow, timeout=0.05)
+        leader.join()
+
+    def test_async_coalescing_and_failure(self):
+        """Test async callers share one await and one failure."""
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def load():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "value"
+
+        async def fail():
+            await asyncio.sleep(0.05)
+            raise ValueError("boom")
+
+        async def run():
+            ok = await asyncio.gather(*(flight.do("k", load) for _ in range(20)))
+            bad = await asyncio.gather(*(flight.do("k", fail) for _ in range(5)),
+                                       return_exceptions=True)
+            return ok, bad
+
+        ok, bad = asyncio.run(run())
+
+        assert ok == ["value"] * 20
+        assert len(calls) == 1
+        assert all(isinstance(e, ValueError) for e in bad)
+
+    def test_async_leader_cancellation_promotes_waiter(self):
+        """Test cancelling the leader does not fail the waiters."""
+        flight = AsyncSingleFlight()
+
+        async def load():
+            await asyncio.sleep(0.05)
+            return "value"
+
+        async def run():
+            leader = asyncio.create_task(flight.do("k", load))
+            await asyncio.sleep(0)
+            waiter = asyncio.create_task(flight.do("k", load))
+            await asyncio.sleep(0)
+            leader.cancel()
+            return await waiter
+
+        assert asyncio.run(run()) == "value"
+
+
+@pytest.mark.xsystem_unit
+@pytest.mark.xsystem_performance
+class TestCoalescedCaches:
+    """Test coalescing in read-through caches and decorators."""
+
+    def test_read_through_stampede(self):
+        """Test a hot-key miss storm calls the loader once."""
+        calls = []
+
+        def loader(key):
+            calls.append(key)
+            time.sleep(0.1)
+            return f"loaded:{key}"
+
+        cache = ReadThroughCache(capacity=10, loader=loader)
+        results = _run_threads(lambda: cache.get("hot"))
+
+        assert results == ["loaded:hot"] * 10
+        assert calls == ["hot"]
+        assert cache.get_stats()['loader_calls'] == 1
+
+    def test_read_through_error_modes(self):
+        """Test loader failures return default or propagate when configured."""
+        def loader(key):
+            raise IOError("backend down")
+
+        assert ReadThroughCache(loader=loader).get("k", "fallback") == "fallback"
+        with pytest.raises(IOError):
+            ReadThroughCache(loader=loader, raise_on_load_error=True).get("k")
+
+    def test_xwcached_sync_coalesces(self):
+        """Test the sync decorator runs the function once per concurrent miss."""
+        calls = []
+
+        @xwcached()
+        def compute(x):
+            calls.append(x)
+            time.sleep(0.1)
+            return x * 2
+
+        assert _run_threads(lambda: compute(21)) == [42] * 10
+        assert calls == [21]
+
+    def test_xwcached_on_coroutine(self):
+        """Test xwcached caches awaited results of coroutine functions."""
+        calls = []
+
+        @xwcached()
+        async def compute(x):
+            calls.append(x)
+            await asyncio.sleep(0.05)
+            return x * 2
+
+        async def run():
+            first = await asyncio.gather(*(compute(5) for _ in range(10)))
+            second = await compute(5)
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        assert first == [10] * 10
+        assert second == 10
+        assert calls == [5]
+
+    def test_async_cached_and_get_or_load(self):
+        """Test xw_async_cached and AsyncLRUCache.get_or_load coalesce."""
+        calls = []
+
+        @xw_async_cached()
+        async def compute(x):
+            calls.append(x)
+            await asyncio.sleep(0.05)
+            return x + 1
+
+        cache = AsyncLRUCache(capacity=10)
+
+        async def loader(key):
+            calls.append(key)
+            await asyncio.sleep(0.05)
+            return key.upper()
+
+        async def run():
+            decorated = await asyncio.gather(*(compute(1) for _ in range(10)))
+            loaded = await asyncio.gather(*(cache.get_or_load("abc", loader) for _ in range(10)))
+            return decorated, loaded
+
+        decorated, loaded = asyncio.run(run())
+
+        assert decorated == [2] * 10
+        assert loaded == ["ABC"] * 10
+        assert calls == [1, "abc"]
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Unit tests for SnapshotCache (lock-free reads, copy-on-write updates).
+
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+"""
+
+import threading
+import pytest
+from exonware.xwsystem.caching import ReadMostlyCache, SnapshotCache, xwcached
+
+
+@pytest.mark.xsystem_unit
+class TestSnapshotCache:
+    """Test snapshot semantics, bounding and concurrent reads."""
+    
+    def test_basic_operations(self):
+        """Test put/get/delete, batch operations and stats."""
+        cache = SnapshotCache()
+        cache.put("a", 1)
+        assert cache.put_many({"b": 2, "c": 3}) == 2
+        assert cache.get("a") == 1
+        assert cache.get("missing", "d") == "d"
+        assert cache.get_many(["a", "c", "x"]) == {"a": 1, "c": 3}
+        assert cache.delete("a") is True
+        assert cache.delete("a") is False
+        assert cache.delete_many(["b", "x"]) == 1
+        assert cache.keys() == ["c"]
+        
+        stats = cache.get_stats()
+        assert stats['type'] == 'Snapshot'
+        assert stats['hits'] == 3 and stats['misses'] == 2
+        assert ReadMostlyCache is SnapshotCache
+    
+    def test_snapshots_are_immutable(self):
+        """Test a taken snapshot is unaffected by later writes."""
+        cache = SnapshotCache()
+        cache.replace({"x": 1, "y": 2})
+        view = cache.snapshot()
+        version = cache.version
+        
+        cache.put("x", 10)
+        cache.replace({"z": 3})
+        assert dict(view) == {"x": 1, "y": 2}
+        assert cache.items() == [("z", 3)]
+        assert cache.version == version + 2
+        with pytest.raises(TypeError):
+            view["x"] = 5
+    
+    def test_bounded_fifo(self):
+        """Test the oldest inserted entries are evicted first."""
+        cache = SnapshotCache(capacity=3)
+        cache.put_many({i: i for i in range(5)})
+        assert cache.keys() == [2, 3, 4]
+        assert cache.is_full()
+        cache.evict()
+        assert cache.keys() == [3, 4]
+        assert cache.get_stats()['evictions'] == 3
+        with pytest.raises(ValueError):
+            SnapshotCache(capacity=0)
+    
+    def test_get_or_put_computes_once(self):
+        """Test concurrent misses run the factory once."""
+        cache = SnapshotCache()
+        calls = []
+        barrier = threading.Barrier(8)
+        
+        def worker():
+            barrier.wait()
+            cache.get_or_put("k", lambda: calls.append(1) or "v")
+        
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert cache.get("k") == "v"
+        assert len(calls) == 1
+    
+    def test_concurrent_reads_see_consistent_snapshots(self):
+        """Test readers never observe a half-applied batch write."""
+        cache = SnapshotCache()
+        cache.put_many({"a": 0, "b": 0})
+        stop = threading.Event()
+        torn = []
+        
+        def reader():
+            while not stop.is_set():
+                values = cache.get_many(["a", "b"])
+                if values["a"] != values["b"]:
+                    torn.append(values)
+        
+        readers = [threading.Thread(target=reader) for _ in range(4)]
+        for thread in readers:
+            thread.start()
+        for i in range(1, 2000):
+            cache.put_many({"a": i, "b": i})
+        stop.set()
+        for thread in readers:
+            thread.join()
+        
+        assert torn == []
+        assert cache.get("a") == 1999
+    
+    def test_read_mostly_decorator(self):
+        """Test xwcached(read_mostly=True) caches in a SnapshotCache."""
+        calls = []
+        
+        @xwcached(read_mostly=True)
+        def lookup(name):
+            calls.append(name)
+            return name.upper()
+        
+        assert lookup("json") == "JSON"
+        assert lookup("json") == "JSON"
+        assert calls == ["json"]
+        assert isinstance(lookup.cache, SnapshotCache)
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Unit tests for cache statistics modes and the zero-overhead hot path.
+
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+"""
+
+import logging
+import threading
+import pytest
+from exonware.xwsystem.caching import (
+    LFUCache,
+    LRUCache,
+    OptimizedLFUCache,
+    ShardedLRUCache,
+    StatsMode,
+    TTLCache,
+)
+from exonware.xwsystem.caching import lru_cache as lru_module
+
+
+_FACTORIES = [
+    lambda mode: LRUCache(capacity=2, stats=mode),
+    lambda mode: LFUCache(capacity=2, stats=mode),
+    lambda mode: OptimizedLFUCache(capacity=2, stats=mode),
+    lambda mode: TTLCache(capacity=2, ttl=60, cleanup_interval=0, stats=mode),
+]
+
+
+class _FormatCounter:
+    """Hashable key that counts how often it is rendered into a string."""
+
+    formatted = 0
+
+    def __format__(self, spec):
+        _FormatCounter.formatted += 1
+        return "key"
+
+    __str__ = __repr__ = lambda self: format(self)
+
+
+@pytest.mark.xsystem_unit
+class TestStatsModes:
+    """Test shared, per-thread and disabled statistics."""
+
+    @pytest.mark.parametrize("factory", _FACTORIES)
+    def test_per_thread_counts_are_merged(self, factory):
+        """Test counts from several threads all show up in get_stats()."""
+        cache = factory(StatsMode.PER_THREAD)
+        cache.put("a", 1)
+
+        def worker():
+            for _ in range(100):
+                cache.get("a")
+                cache.get("missing")
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = cache.get_stats()
+        assert stats['hits'] == 400
+        assert stats['misses'] == 400
+        assert stats['stats_mode'] == "per_thread"
+
+    @pytest.mark.parametrize("factory", _FACTORIES)
+    def test_disabled_counts_nothing(self, factory):
+        """Test the disabled mode skips hit/miss counting."""
+        cache = factory("disabled")
+        cache.put("a", 1)
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+
+        stats = cache.get_stats()
+        assert stats['hits'] == 0
+        assert stats['misses'] == 0
+
+    def test_per_thread_evictions_and_reset(self):
+        """Test evictions are counted per thread and reset_stats clears them."""
+        cache = LRUCache(capacity=2, stats="per_thread")
+        for i in range(5):
+            cache.put(i, i)
+        cache.get(4)
+        assert cache.get_stats()['evictions'] == 3
+
+        cache.reset_stats()
+        stats = cache.get_stats()
+        assert (stats['hits'], stats['misses'], stats['evictions']) == (0, 0, 0)
+
+    @pytest.mark.parametrize("cache_class", [LRUCache, LFUCache, OptimizedLFUCache])
+    @pytest.mark.parametrize("mode", ["disabled", "per_thread"])
+    def test_manual_evict_follows_mode(self, cache_class, mode):
+        """Test evict() never writes the shared counter outside the shared mode."""
+        cache = cache_class(capacity=4, stats=mode)
+        cache.put("a", 1)
+        cache.put("b", 2)
+
+        cache.evict()
+
+        assert cache.size() == 1
+        assert cache._evictions == 0
+        assert cache.get_stats()['evictions'] == (1 if mode == "per_thread" else 0)
+
+    def test_sharded_cache_passes_mode_to_shards(self):
+        """Test sharded caches configure every shard."""
+        cache = ShardedLRUCache(capacity=64, shard_count=4, stats="disabled")
+        assert all(shard.stats_mode is StatsMode.DISABLED for shard in cache.shards)
+
+    def test_invalid_mode_rejected(self):
+        """Test unknown modes raise ValueError."""
+        with pytest.raises(ValueError):
+            LRUCache(stats="sometimes")
+
+
+@pytest.mark.xsystem_unit
+@pytest.mark.xsystem_performance
+class TestHotPathOverhead:
+    """Test the hit/miss path avoids clock reads and log formatting."""
+
+    def test_no_clock_reads_without_ttl(self, monkeypatch):
+        """Test get/put never read the clock when no TTL is configured."""
+        cache = LRUCache(capacity=8)
+        calls = []
+        monkeypatch.setattr(lru_module.time, "time", lambda: calls.append(1) or 0.0)
+
+        cache.put("a", 1)
+        cache.get("a")
+        cache.get("missing")
+        assert calls == []
+
+    def test_ttl_still_expires(self, monkeypatch):
+        """Test the TTL path keeps working with lazily taken timestamps."""
+        now = [1000.0]
+        monkeypatch.setattr(lru_module.time, "time", lambda: now[0])
+        cache = LRUCache(capacity=8, ttl=10)
+
+        cache.put("a", 1)
+        now[0] += 5
+        assert cache.get("a") == 1
+        now[0] += 11
+        assert cache.get("a") is None
+
+    def test_debug_messages_not_formatted_when_disabled(self, caplog):
+        """Test keys are only rendered into log messages with debug logging on."""
+        key = _FormatCounter()
+        _FormatCounter.formatted = 0
+        cache = LRUCache(capacity=8)
+
+        with caplog.at_level(logging.INFO, logger=lru_module.logger.name):
+            cache.put(key, 1)
+            cache.get(key)
+            cache.delete(key)
+        assert _FormatCounter.formatted == 0
+
+        with caplog.at_level(logging.DEBUG, logger=lru_module.logger.name):
+            cache.put(key, 1)
+            cache.get(key)
+        assert _FormatCounter.formatted > 0
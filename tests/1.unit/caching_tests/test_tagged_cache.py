@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Unit tests for TaggedCache generation-based invalidation and hierarchical tags.
+
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+"""
+
+import pytest
+from exonware.xwsystem.caching import TaggedCache
+
+
+@pytest.mark.xsystem_unit
+class TestTaggedCache:
+    """Test tag invalidation, cleanup and index accounting."""
+    
+    def test_invalidate_by_tag(self):
+        """Test invalidated entries become misses immediately."""
+        cache = TaggedCache(capacity=100)
+        cache.put("u1", 1, tags=["user", "active"])
+        cache.put("u2", 2, tags=["user"])
+        cache.put("p1", 3, tags=["product"])
+        
+        assert cache.invalidate_by_tag("user") == 2
+        assert cache.get("u1") is None
+        assert "u2" not in cache
+        assert cache.get("p1") == 3
+        assert cache.get_keys_by_tag("active") == set()
+        assert cache.keys() == ["p1"]
+        assert cache.invalidate_by_tag("missing") == 0
+    
+    def test_rewrite_after_invalidation_is_fresh(self):
+        """Test entries written after an invalidation survive it."""
+        cache = TaggedCache(capacity=100)
+        cache.put("k", "old", tags=["t"])
+        cache.invalidate_by_tag("t")
+        cache.put("k", "new", tags=["t"])
+        
+        assert cache.get("k") == "new"
+        assert cache.get_keys_by_tag("t") == {"k"}
+        assert cache.purge_stale() == 0
+    
+    def test_invalidation_is_lazy_and_swept(self):
+        """Test invalidation touches no entries and writes sweep them in batches."""
+        cache = TaggedCache(capacity=10_000, sweep_batch=100)
+        cache.put_many({f"item{i}": i for i in range(5000)}, tags=["catalog"])
+        
+        assert cache.invalidate_by_tag("catalog") == 5000
+        assert cache.size() == 5000
+        assert cache.get_stats()['pending_stale'] == 5000
+        
+        cache.put("other", 1)
+        assert cache.size() == 4901
+        assert cache.purge_stale() == 4900
+        stats = cache.get_stats()
+        assert stats['pending_stale'] == 0
+        assert stats['tagged_entries'] == 0
+    
+    def test_hierarchical_tags(self):
+        """Test 'prefix:*' invalidates every tag below the prefix only."""
+        cache = TaggedCache(capacity=100)
+        cache.put("orders", 1, tags=["user:42:orders"])
+        cache.put("cart", 2, tags=["user:42:cart:items"])
+        cache.put("profile", 3, tags=["user:42"])
+        cache.put("other", 4, tags=["user:7:orders"])
+        
+        assert cache.get_keys_by_tag("user:42:*") == {"orders", "cart"}
+        assert cache.invalidate_by_tag("user:42:*") == 2
+        assert cache.get("orders") is None
+        assert cache.get("cart") is None
+        assert cache.get("profile") == 3
+        assert cache.get("other") == 4
+        
+        cache.put("orders", 5, tags=["user:42:orders"])
+        assert cache.get("orders") == 5
+    
+    def test_eviction_cleans_index(self):
+        """Test LRU evictions remove tag links."""
+        cache = TaggedCache(capacity=10)
+        for i in range(1000):
+            cache.put(i, i, tags=[f"t{i % 3}", "all"])
+        
+        stats = cache.get_stats()
+        assert stats['tagged_entries'] == 10
+        assert stats['tag_links'] == 20
+        assert sum(len(cache.get_keys_by_tag(f"t{n}")) for n in range(3)) == 10
+        
+        cache.evict()
+        assert cache.get_stats()['tagged_entries'] == 9
+        cache.clear()
+        assert cache.get_all_tags() == set()
+    
+    def test_delete_and_retag(self):
+        """Test delete and untagged rewrites drop tag links."""
+        cache = TaggedCache(capacity=10)
+        cache.put("a", 1, tags=["x"])
+        cache.put("b", 2, tags=["x"])
+        assert cache.delete_many(["a"]) == 1
+        cache.put("b", 3)
+        
+        assert cache.get_all_tags() == set()
+        assert cache.get_tags("b") == set()
+        with pytest.raises(ValueError):
+            cache.put("c", 1, tags=["bad:*"])
+        assert "c" not in cache
+    
+    def test_non_string_tags(self):
+        """Test any hashable tag is accepted; only strings are hierarchical."""
+        cache = TaggedCache(capacity=10)
+        cache.put("a", 1, tags=[1, ("tenant", 7), "", "v*"])
+        cache.put("b", 2, tags=[1])
+        
+        assert cache.get_tags("a") == {1, ("tenant", 7), "", "v*"}
+        assert cache.get_keys_by_tag(1) == {"a", "b"}
+        assert cache.invalidate_by_tag(("tenant", 7)) == 1
+        assert cache.get("a") is None
+        assert cache.invalidate_by_tags([1]) == 1
+        assert cache.get("b") is None
+    
+    def test_index_memory(self):
+        """Test index memory accounting grows with tagged entries."""
+        cache = TaggedCache(capacity=1000)
+        empty = cache.get_index_memory()['total']
+        cache.put_many({i: i for i in range(500)}, tags=["a:b", "c"])
+        
+        memory = cache.get_index_memory()
+        assert memory['total'] > empty
+        assert memory['entries'] > memory['hierarchy']
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Unit tests for W-TinyLFU admission-controlled cache.
+
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+"""
+
+import pytest
+from exonware.xwsystem.caching import TinyLFUCache, LRUCache
+from exonware.xwsystem.caching.tinylfu_cache import CountMinSketch, _spread_hash
+
+
+@pytest.mark.xsystem_unit
+class TestCountMinSketch:
+    """Test count-min sketch frequency estimation."""
+
+    def test_estimate_and_saturation(self):
+        """Test counters estimate frequency and saturate at 15."""
+        sketch = CountMinSketch(width=64, sample_size=10_000)
+        h = _spread_hash("hot")
+
+        for _ in range(5):
+            sketch.increment(h)
+        assert sketch.estimate(h) == 5
+
+        for _ in range(50):
+            sketch.increment(h)
+        assert sketch.estimate(h) == CountMinSketch.MAX_COUNT
+
+    def test_aging_halves_counters(self):
+        """Test periodic reset halves every counter."""
+        sketch = CountMinSketch(width=64, sample_size=8)
+        h = _spread_hash("key")
+
+        for _ in range(7):
+            sketch.increment(h)
+        assert sketch.estimate(h) == 7
+
+        assert sketch.increment(h) is True
+        assert sketch.estimate(h) == 4
+        assert sketch.resets == 1
+
+
+@pytest.mark.xsystem_unit
+@pytest.mark.xsystem_performance
+class TestTinyLFUCache:
+    """Test W-TinyLFU cache."""
+
+    def test_basic_operations(self):
+        """Test basic get/put/delete operations."""
+        cache = TinyLFUCache(capacity=100)
+
+        cache.put("k1", "v1")
+        cache.put("k2", "v2")
+        cache.put("k1", "v1b")
+
+        assert cache.get("k1") == "v1b"
+        assert cache.get("missing", "default") == "default"
+        assert "k2" in cache
+        assert cache.delete("k2") is True
+        assert cache.delete("k2") is False
+        assert cache.size() == 1
+        assert dict(cache.items()) == {"k1": "v1b"}
+
+    def test_capacity_respected(self):
+        """Test cache never exceeds capacity."""
+        for capacity in (1, 2, 10, 100):
+            cache = TinyLFUCache(capacity=capacity)
+            for i in range(capacity * 20):
+                cache.put(i, i)
+                cache.get(i % 7)
+            assert cache.size() <= capacity
+
+    def test_scan_resistance(self):
+        """Test a one-off scan of cold keys does not flush the hot set."""
+        cache = TinyLFUCache(capacity=100)
+        hot_keys = [f"hot_{i}" for i in range(50)]
+
+        for _ in range(20):
+            for key in hot_keys:
+                if cache.get(key) is None:
+                    cache.put(key, key)
+
+        for i in range(10_000):
+            cache.put(f"scan_{i}", i)
+
+        survivors = sum(1 for key in hot_keys if key in cache)
+        assert survivors >= 45
+        assert cache.get_stats()['rejected'] > 0
+
+    def test_beats_lru_on_loop(self):
+        """Test TinyLFU retains part of a loop slightly larger than the cache."""
+        trace = [i % 120 for i in range(12_000)]
+
+        def hit_rate(cache) -> float:
+            hits = 0
+            for key in trace:
+                if cache.get(key) is None:
+                    cache.put(key, key)
+                else:
+                    hits += 1
+            return hits / len(trace)
+
+        assert hit_rate(LRUCache(capacity=100)) == 0.0
+        assert hit_rate(TinyLFUCache(capacity=100)) > 0.5
+
+    def test_stats_and_clear(self):
+        """Test statistics and clear."""
+        cache = TinyLFUCache(capacity=10)
+        cache.put("a", 1)
+        cache.get("a")
+        cache.get("b")
+
+        stats = cache.get_stats()
+        assert stats['type'] == 'TinyLFU'
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+
+        cache.clear()
+        assert cache.size() == 0
+
+    def test_invalid_arguments(self):
+        """Test invalid configuration is rejected."""
+        with pytest.raises(ValueError):
+            TinyLFUCache(capacity=0)
+        with pytest.raises(ValueError):
+            TinyLFUCache(capacity=10, window_ratio=1.5)
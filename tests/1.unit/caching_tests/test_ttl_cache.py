@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Unit tests for heap-indexed TTL cache.
+
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+"""
+
+import pytest
+import asyncio
+import time
+from exonware.xwsystem.caching.ttl_cache import TTLCache, AsyncTTLCache
+
+
+@pytest.mark.xsystem_unit
+@pytest.mark.xsystem_performance
+class TestTTLCache:
+    """Test TTL cache with OrderedDict LRU and expiry heap."""
+
+    def test_lru_eviction_order(self):
+        """Test that least recently used entry is evicted."""
+        cache = TTLCache(capacity=3, ttl=60, cleanup_interval=0)
+        for key in ("a", "b", "c"):
+            cache.put(key, key)
+
+        cache.get("a")
+        cache.put("d", "d")
+
+        assert cache.keys() == ["c", "a", "d"]
+        assert cache.get_stats()['evictions'] == 1
+
+    def test_expired_entries_reclaimed_before_lru(self):
+        """Test that a full cache drops an expired entry instead of a live one."""
+        cache = TTLCache(capacity=2, ttl=60, cleanup_interval=0)
+        cache.put("live", 1)
+        cache.put("dead", 2, ttl=-1)
+
+        cache.put("new", 3)
+
+        assert cache.get("live") == 1
+        assert cache.get("new") == 3
+        stats = cache.get_stats()
+        assert stats['evictions'] == 0
+        assert stats['expirations'] == 1
+
+    def test_fractional_ttl(self):
+        """Test sub-second default TTL is not truncated."""
+        cache = TTLCache(capacity=10, ttl=0.5, cleanup_interval=0)
+        cache.put("k", "v")
+        assert cache.get("k") == "v"
+
+    def test_incremental_cleanup(self):
+        """Test cleanup removes every expired entry in bounded batches."""
+        cache = TTLCache(capacity=5000, ttl=60, cleanup_interval=0, cleanup_batch_size=100)
+        for i in range(2000):
+            cache.put(f"dead_{i}", i, ttl=-1 if i % 2 else 0.01)
+        for i in range(100):
+            cache.put(f"live_{i}", i)
+
+        time.sleep(0.02)
+        removed = cache._cleanup_expired()
+
+        assert removed > 0
+        assert cache.size() == 100
+        stats = cache.get_stats()
+        assert stats['expirations'] == 2000
+        assert stats['cleanups'] == 1
+
+    def test_overwrites_do_not_grow_heap_unbounded(self):
+        """Test stale heap records are compacted."""
+        cache = TTLCache(capacity=10, ttl=60, cleanup_interval=0)
+        for i in range(10000):
+            cache.put("same", i)
+
+        assert cache.get("same") == 9999
+        assert len(cache._expiry_heap) < 200
+
+    def test_cleanup_is_not_a_full_scan(self):
+        """Test cleanup cost tracks expired entries, not cache size."""
+        cache = TTLCache(capacity=200000, ttl=600, cleanup_interval=0)
+        for i in range(100000):
+            cache.put(i, i)
+
+        start = time.perf_counter()
+        for _ in range(100):
+            cache._cleanup_expired()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        assert elapsed_ms < 50, f"Cleanup too slow: {elapsed_ms:.3f}ms"
+
+
+@pytest.mark.xsystem_unit
+class TestAsyncTTLCache:
+    """Test async TTL cache."""
+
+    def test_async_operations(self):
+        """Test async put/get/expiry/eviction."""
+        async def run():
+            cache = AsyncTTLCache(capacity=2, ttl=60, cleanup_interval=0)
+            await cache.put("x", 1)
+            await cache.put("y", 2, ttl=-1)
+            assert await cache.get("y") is None
+
+            await cache.put("y", 2)
+            await cache.get("x")
+            await cache.put("z", 3)
+            assert await cache.get("y") is None
+            assert await cache.get("x") == 1
+
+            await cache.put("dead", 4, ttl=-1)
+            assert await cache._cleanup_expired() == 1
+            return await cache.get_stats()
+
+        stats = asyncio.run(run())
+        assert stats['evictions'] == 2
+        assert stats['expirations'] == 2
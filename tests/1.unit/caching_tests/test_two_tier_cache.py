@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Unit tests for TwoTierCache concurrency, deferred writes and admission policies.
+
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+"""
+
+import asyncio
+import threading
+import pytest
+from exonware.xwsystem.caching import AsyncTwoTierCache, PromoteAfterHits, TwoTierCache
+
+
+@pytest.mark.xsystem_unit
+class TestTwoTierCache:
+    """Test the threaded two-tier cache."""
+
+    def test_memory_hits_do_not_wait_on_disk(self, tmp_path):
+        """Test a memory hit completes while a disk read is blocked."""
+        with TwoTierCache(memory_size=10, disk_cache_dir=str(tmp_path)) as cache:
+            cache.set("hot", "h")
+            cache.disk_cache.set("cold", "c")
+
+            entered, release = threading.Event(), threading.Event()
+            disk_get = cache.disk_cache.get
+
+            def slow_get(key):
+                entered.set()
+                release.wait(5)
+                return disk_get(key)
+
+            cache.disk_cache.get = slow_get
+            reader = threading.Thread(target=cache.get, args=("cold",))
+            reader.start()
+            try:
+                assert entered.wait(5)
+                assert cache.get("hot") == "h"
+            finally:
+                release.set()
+                reader.join(5)
+            assert cache.get_stats()['disk_hits'] == 1
+
+    def test_promote_after_hits(self, tmp_path):
+        """Test keys reach memory only after N disk hits."""
+        policy = PromoteAfterHits(hits=2)
+        with TwoTierCache(memory_size=10, disk_cache_dir=str(tmp_path), admission=policy) as cache:
+            cache.disk_cache.put_many({"a": 1, "b": 2})
+
+            assert cache.get("a") == 1
+            assert "a" not in cache.memory_cache
+            assert cache.get("a") == 1
+            assert "a" in cache.memory_cache
+
+            assert cache.get_many(["b"]) == {"b": 2}
+            assert cache.get_many(["b"]) == {"b": 2}
+            stats = cache.get_stats()
+            assert stats['disk_hits'] == 4
+            assert stats['promotions'] == 2
+            assert stats['admission_policy'] == "PromoteAfterHits"
+
+    def test_write_admission_demotes(self, tmp_path):
+        """Test rejected writes go to disk only and drop the stale memory copy."""
+        policy = PromoteAfterHits(hits=1, admit_writes=False)
+        with TwoTierCache(memory_size=10, disk_cache_dir=str(tmp_path), admission=policy) as cache:
+            cache.memory_cache.put("k", "old")
+            cache.set("k", "new")
+
+            assert "k" not in cache.memory_cache
+            assert cache.get("k") == "new"
+
+    def test_write_behind(self, tmp_path):
+        """Test deferred disk writes are readable, batched and deletable."""
+        with TwoTierCache(memory_size=2, disk_cache_dir=str(tmp_path), write_behind=True,
+                          flush_interval=60) as cache:
+            cache.put_many({f"k{i}": i for i in range(5)})
+            cache.set("t", "short", ttl=30)
+            assert cache.disk_cache.size() == 0
+            assert cache.get_stats()['pending_writes'] == 6
+
+            # Evicted from memory, still served from the queue
+            assert cache.get("k0") == 0
+            assert cache.delete("k1") is True
+
+            assert cache.flush() == 5
+            assert cache.disk_cache.size() == 5
+            assert cache.disk_cache.get("k1") is None
+            assert cache.get_stats()['deferred_writes'] == 6
+
+    def test_background_writer_and_close(self, tmp_path):
+        """Test the background writer drains full batches and close() flushes the rest."""
+        cache = TwoTierCache(memory_size=100, disk_cache_dir=str(tmp_path), write_behind=True,
+                             flush_interval=60, write_batch_size=10)
+        cache.put_many({f"k{i}": i for i in range(10)})
+        cache.set("tail", "t")
+        cache.close()
+
+        with TwoTierCache(memory_size=100, disk_cache_dir=str(tmp_path)) as reopened:
+            assert reopened.size() == 11
+
+
+@pytest.mark.xsystem_unit
+class TestAsyncTwoTierCache:
+    """Test the async two-tier cache."""
+
+    def test_async_roundtrip(self, tmp_path):
+        """Test async reads, writes, promotion and close."""
+        async def run():
+            async with AsyncTwoTierCache(memory_size=10, disk_cache_dir=str(tmp_path),
+                                         write_behind=True) as cache:
+                await cache.put_many({"a": 1, "b": 2})
+                await cache.set("c", 3)
+                cache.memory_cache.clear()
+
+                found = await cache.get_many(["a", "b", "missing"])
+                value = await cache.get("c")
+                hot = await cache.get("a")
+                deleted = await cache.delete("b")
+                exists = await cache.exists("b")
+                stats = await cache.get_stats()
+            return found, value, hot, deleted, exists, stats
+
+        found, value, hot, deleted, exists, stats = asyncio.run(run())
+        assert found == {"a": 1, "b": 2}
+        assert value == 3
+        assert hot == 1
+        assert deleted is True
+        assert exists is False
+        assert stats['memory_hits'] == 1
+        assert stats['disk_hits'] == 3
+        assert stats['misses'] == 1
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the cache value codec (serialization + compression).
+
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+"""
+
+import pytest
+from exonware.xwsystem.caching import (
+    EncodedValue,
+    LRUCache,
+    MemoryBoundedLRUCache,
+    ValueCodec,
+)
+from exonware.xwsystem.caching.disk_cache import DiskCache
+from exonware.xwsystem.caching.errors import CacheConfigurationError
+
+
+def _payload(rows=2000):
+    return {"rows": [{"id": i, "name": f"item{i}", "tags": ["a", "b"]} for i in range(rows)]}
+
+
+@pytest.mark.xsystem_unit
+class TestValueCodec:
+    """Test encoding thresholds, formats and statistics."""
+    
+    def test_threshold_and_roundtrip(self):
+        """Test small values pass through and large ones are compressed."""
+        codec = ValueCodec(threshold=1024)
+        assert codec.encode("small") == "small"
+        
+        encoded = codec.encode(_payload())
+        assert isinstance(encoded, EncodedValue)
+        assert encoded.compressed
+        assert encoded.stored_size * 3 < encoded.raw_size
+        assert codec.encode(encoded) is encoded
+        assert codec.decode(encoded) == _payload()
+        
+        stats = codec.get_stats()
+        assert stats['encoded'] == 1 and stats['passthrough'] == 1
+        assert stats['decoded'] == 1 and stats['ratio'] > 3
+    
+    def test_small_scalars_are_not_serialized(self, monkeypatch):
+        """Test values sized without serializing skip the encode on put."""
+        codec = ValueCodec(threshold=1024)
+        serialize = codec._serialize
+        calls = []
+        monkeypatch.setattr(codec, "_serialize", lambda value: calls.append(value) or serialize(value))
+        
+        for value in (None, True, 1.5, 2 ** 40, "x" * 200, b"y" * 900, bytearray(10)):
+            assert codec.encode(value) is value
+        assert calls == []
+        
+        # Sizes the bound cannot settle are measured by serializing
+        assert codec.encode("z" * 500) == "z" * 500
+        assert isinstance(codec.encode("z" * 5000), EncodedValue)
+        assert len(calls) == 2
+        assert codec.get_stats()['passthrough'] == 8
+    
+    def test_incompressible_value_kept_uncompressed(self):
+        """Test compression is dropped when it does not shrink the value."""
+        import os
+        codec = ValueCodec(threshold=16)
+        encoded = codec.encode(os.urandom(4096))
+        assert not encoded.compressed
+        assert len(codec.decode(encoded)) == 4096
+    
+    def test_msgpack_frames(self):
+        """Test dumps/loads frames describe their own serializer."""
+        codec = ValueCodec(serializer="msgpack", threshold=0)
+        frame = codec.dumps(_payload(100))
+        assert ValueCodec().loads(frame) == _payload(100)
+    
+    def test_invalid_configuration(self):
+        """Test unknown serializers/compressors are rejected."""
+        with pytest.raises(CacheConfigurationError):
+            ValueCodec(serializer="yaml")
+        with pytest.raises(CacheConfigurationError):
+            ValueCodec(compression="rar")
+
+
+@pytest.mark.xsystem_unit
+class TestCachesWithValueCodec:
+    """Test value_codec on LRUCache, MemoryBoundedLRUCache and DiskCache."""
+    
+    def test_lru_cache(self):
+        """Test values are stored encoded and decoded on every read path."""
+        cache = LRUCache(capacity=10, value_codec=ValueCodec())
+        cache.put("big", _payload())
+        cache.put_many({"small": 1, "big2": _payload(500)})
+        
+        assert cache.get("big") == _payload()
+        assert cache.get_many(["big2", "small"]) == {"big2": _payload(500), "small": 1}
+        assert dict(cache.items())["big"] == _payload()
+        assert _payload() in cache.values()
+        
+        entry = cache.get_entry_codec_stats("big")
+        assert entry['compressed'] and entry['decodes'] >= 1
+        assert cache.get_entry_codec_stats("small") is None
+        assert cache.get_stats()['value_codec']['encoded'] == 2
+    
+    def test_memory_budget_holds_more_entries(self):
+        """Test a memory-bounded cache fits more compressed entries."""
+        def fill(cache):
+            for i in range(50):
+                cache.put(i, _payload())
+            return cache.size()
+        
+        plain = fill(MemoryBoundedLRUCache(capacity=1000, memory_budget_mb=2))
+        compressed = fill(MemoryBoundedLRUCache(capacity=1000, memory_budget_mb=2,
+                                                value_codec=ValueCodec()))
+        assert compressed >= 3 * plain
+    
+    def test_disk_cache(self, tmp_path):
+        """Test DiskCache stores frames and still reads plain pickled entries."""
+        with DiskCache(cache_dir=str(tmp_path)) as plain:
+            plain.set("legacy", {"x": 1})
+        
+        with DiskCache(cache_dir=str(tmp_path), value_codec=ValueCodec(threshold=0)) as cache:
+            cache.set("big", _payload())
+            assert cache.get("big") == _payload()
+            assert cache.get("legacy") == {"x": 1}
+            assert cache.get_stats()['value_codec']['compressed'] == 1
+        
+        with DiskCache(cache_dir=str(tmp_path)) as reopened:
+            assert reopened.get("big") == _payload()
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the write-behind pipeline (batching, coalescing, eviction, backpressure).
+
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+Version: 0.0.1.409
+Generation Date: 17-Oct-2026
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+from exonware.xwsystem.caching import AsyncWriteBehindCache, WriteBehindCache
+from exonware.xwsystem.caching.errors import CacheError, CacheTimeoutError
+
+
+@pytest.mark.xsystem_unit
+class TestWriteBehindCache:
+    """Test the threaded write-behind cache."""
+
+    def test_writer_many_batches(self):
+        """Test dirty entries reach writer_many in batch_size chunks."""
+        batches = []
+        cache = WriteBehindCache(capacity=100, writer_many=lambda items: batches.append(dict(items)),
+                                 batch_size=4, auto_start=False)
+        cache.put_many({i: i for i in range(10)})
+
+        assert cache.flush() == 10
+        assert [len(batch) for batch in batches] == [4, 4, 2]
+        assert cache.get_stats()['batch_writes'] == 3
+
+    def test_coalescing_and_no_lru_skew(self):
+        """Test repeated puts write once and flush does not touch hit stats."""
+        writes = []
+        cache = WriteBehindCache(capacity=10, writer=lambda k, v: writes.append((k, v)), auto_start=False)
+        for value in range(5):
+            cache.put("a", value)
+        cache.put("b", 1)
+
+        assert cache.flush() == 2
+        assert writes == [("a", 4), ("b", 1)]
+        stats = cache.get_stats()
+        assert stats['coalesced_writes'] == 4
+        assert stats['hits'] == 0
+        assert stats['misses'] == 0
+
+    def test_evicted_dirty_entries_are_flushed(self):
+        """Test LRU eviction never drops unflushed writes."""
+        written = {}
+        cache = WriteBehindCache(capacity=2, writer_many=written.update, auto_start=False)
+        cache.put_many({"a": 1, "b": 2, "c": 3})
+
+        assert cache.size() == 2
+        assert cache.get("a") == 1  # still readable from the queue
+        assert cache.get_stats()['evicted_dirty'] == 1
+        assert cache.flush() == 3
+        assert written == {"a": 1, "b": 2, "c": 3}
+
+    def test_failed_writes_are_requeued(self):
+        """Test a failed batch is retried without overwriting newer values."""
+        calls = []
+
+        def flaky(items):
+            calls.append(dict(items))
+            if len(calls) == 1:
+                raise IOError("db down")
+
+        cache = WriteBehindCache(capacity=10, writer_many=flaky, auto_start=False)
+        cache.put_many({"a": 1, "b": 2})
+        assert cache.flush() == 0
+        cache.put("a", 10)
+
+        assert cache.flush() == 2
+        assert calls[-1] == {"a": 10, "b": 2}
+        assert cache.get_stats()['write_errors'] == 1
+
+    def test_delete_drops_pending_write(self):
+        """Test deleted keys are not written."""
+        written = {}
+        cache = WriteBehindCache(capacity=10, writer_many=written.update, auto_start=False)
+        cache.put_many({"a": 1, "b": 2})
+        assert cache.delete("a") is True
+
+        cache.flush()
+        assert written == {"b": 2}
+
+    def test_delete_during_flush_is_not_read_or_retried(self):
+        """Test a key deleted while its write is in flight stays deleted."""
+        calls, reads = [], []
+
+        def failing_once(items):
+            calls.append(dict(items))
+            if len(calls) == 1:
+                assert cache.delete("a") is True
+                reads.append(cache.get("a"))
+                raise IOError("db down")
+
+        cache = WriteBehindCache(capacity=10, writer_many=failing_once, auto_start=False)
+        cache.put_many({"a": 1, "b": 2})
+        assert cache.flush() == 0
+
+        assert reads == [None]
+        assert cache.get("a") is None
+        assert cache.flush() == 1
+        assert calls[-1] == {"b": 2}
+
+    def test_put_after_delete_during_flush_is_kept(self):
+        """Test a key re-put after an in-flight delete is readable and written."""
+        calls = []
+
+        def writer_many(items):
+            calls.append(dict(items))
+            if len(calls) == 1:
+                cache.delete("a")
+                cache.put("a", 5)
+
+        cache = WriteBehindCache(capacity=10, writer_many=writer_many, auto_start=False)
+        cache.put("a", 1)
+        cache.flush()
+
+        assert cache.get("a") == 5
+        assert cache.flush() == 1
+        assert calls[-1] == {"a": 5}
+
+    def test_backpressure_inline_flush(self):
+        """Test a full queue is drained by the producer when no flusher runs."""
+        batches = []
+        cache = WriteBehindCache(capacity=100, writer_many=lambda items: batches.append(len(items)),
+                                 max_dirty=3, auto_start=False)
+        for i in range(7):
+            cache.put(i, i)
+
+        assert batches == [3, 3]
+        assert cache.get_stats()['dirty_entries'] == 1
+
+    def test_backpressure_stalled_writer_raises(self):
+        """Test a full queue with a failing writer raises instead of spinning."""
+        def broken(items):
+            raise IOError("db down")
+
+        cache = WriteBehindCache(capacity=100, writer_many=broken, max_dirty=2, auto_start=False)
+        cache.put_many({"a": 1, "b": 2})
+        with pytest.raises(CacheError):
+            cache.put("c", 3)
+
+    def test_backpressure_waits_for_flusher(self):
+        """Test producers block on the background flusher and time out."""
+        release = threading.Event()
+        written = {}
+
+        def slow(items):
+            release.wait(5)
+            written.update(items)
+
+        cache = WriteBehindCache(capacity=100, writer_many=slow, flush_interval=60,
+                                 max_dirty=2, put_timeout=0.1)
+        try:
+            cache.put_many({"a": 1, "b": 2})
+            cache.put("c", 3)  # wakes the flusher, which takes a and b
+            cache.put("d", 4)
+            with pytest.raises(CacheTimeoutError):
+                cache.put("e", 5)  # flusher is stuck in the writer
+
+            release.set()
+            deadline = time.time() + 5
+            while "b" not in written and time.time() < deadline:
+                time.sleep(0.01)
+            cache.put("e", 5)
+            assert cache.get_stats()['backpressure_waits'] >= 2
+        finally:
+            release.set()
+            cache.stop_flusher()
+        assert written == {"a": 1, "b": 2, "c": 3, "d": 4, "e": 5}
+
+
+@pytest.mark.xsystem_unit
+class TestAsyncWriteBehindCache:
+    """Test the asyncio write-behind cache."""
+
+    def test_async_pipeline(self):
+        """Test coroutine writer_many, eviction safety and flush on exit."""
+        batches = []
+
+        async def save(items):
+            await asyncio.sleep(0)
+            batches.append(dict(items))
+
+        async def run():
+            async with AsyncWriteBehindCache(capacity=2, writer_many=save, flush_interval=60,
+                                             batch_size=3) as cache:
+                await cache.put_many({"a": 1, "b": 2, "c": 3})
+                await cache.put("c", 30)
+                value = await cache.get("a")
+                stats = await cache.get_stats()
+            return value, stats
+
+        value, stats = asyncio.run(run())
+        assert value == 1
+        assert stats['evicted_dirty'] == 1
+        assert stats['coalesced_writes'] == 1
+        merged = {}
+        for batch in batches:
+            merged.update(batch)
+        assert merged == {"a": 1, "b": 2, "c": 30}
+
+    def test_async_backpressure(self):
+        """Test put() waits for the flusher task to drain a full queue."""
+        written = {}
+
+        async def run():
+            cache = AsyncWriteBehindCache(capacity=100, writer_many=written.update,
+                                          flush_interval=60, max_dirty=2, put_timeout=5)
+            for i in range(6):
+                await cache.put(i, i)
+            stats = await cache.get_stats()
+            await cache.stop_flusher()
+            return stats
+
+        stats = asyncio.run(run())
+        assert stats['backpressure_waits'] >= 1
+        assert written == {i: i for i in range(6)}
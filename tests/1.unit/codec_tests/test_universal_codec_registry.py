@@ -183,6 +183,16 @@ class TestCodecInstanceCaching:
         codec2 = populated_registry.detect('config.json')
         
         assert codec1 is codec2
+    
+    def test_detection_cache_is_bounded(self, populated_registry):
+        """Test per-path detection results stay bounded and out of the lookup snapshot."""
+        from exonware.xwsystem.io.codec.registry import DETECT_CACHE_SIZE
+        
+        for i in range(DETECT_CACHE_SIZE * 2):
+            assert populated_registry.detect(f'data/file{i}.json') is populated_registry.get_by_id('json')
+        
+        assert len(populated_registry._detections) == DETECT_CACHE_SIZE
+        assert populated_registry._lookups.size() <= 4
 
 
 @pytest.mark.xsystem_unit
@@ -0,0 +1,108 @@
+"""
+Unit tests for io.serialization.batch (batch_load/batch_save executors)
+
+Tests serial, thread and process batch operations, result ordering,
+per-file error capture and executor selection.
+Following GUIDELINES_TEST.md structure and eXonware testing standards.
+
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+"""
+
+import pytest
+from exonware.xwsystem.io.serialization import BatchResult, JsonSerializer, YamlSerializer
+from exonware.xwsystem.io.serialization.batch import AUTO_PROCESS_MIN_FILES, resolve_executor
+
+EXECUTORS = ["serial", "thread", "process", "auto"]
+
+
+@pytest.fixture
+def documents(tmp_path):
+    return {str(tmp_path / f"doc{i:03d}.yaml"): {"id": i, "tags": ["a", "b"]} for i in range(40)}
+
+
+@pytest.mark.xsystem_unit
+class TestBatchOperations:
+    """Test batch_save/batch_load and their streaming variants."""
+    
+    @pytest.mark.parametrize("executor", EXECUTORS)
+    def test_save_then_load_round_trip(self, documents, executor):
+        """Test every executor writes and reads back all files in input order."""
+        serializer = YamlSerializer()
+        
+        saved = serializer.batch_save(documents, executor=executor, max_workers=2, chunksize=3)
+        loaded = serializer.batch_load(list(documents), executor=executor, max_workers=2, chunksize=3)
+        
+        assert saved == {path: True for path in documents}
+        assert list(loaded) == list(documents)
+        assert loaded == documents
+    
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_unordered_results_cover_every_file(self, documents, executor):
+        """Test as-completed streaming yields each file exactly once."""
+        serializer = YamlSerializer()
+        serializer.batch_save(documents, executor="serial")
+        
+        results = list(serializer.iter_batch_load(list(documents), executor=executor, ordered=False, chunksize=5))
+        
+        assert sorted(result.path for result in results) == sorted(documents)
+        assert all(result.success for result in results)
+    
+    @pytest.mark.parametrize("executor", EXECUTORS)
+    def test_per_file_errors_are_captured(self, tmp_path, executor):
+        """Test failing files are reported without aborting the batch."""
+        good = tmp_path / "good.json"
+        broken = tmp_path / "broken.json"
+        good.write_text('{"ok": true}', encoding="utf-8")
+        broken.write_text('{"ok": ', encoding="utf-8")
+        
+        results = list(JsonSerializer().iter_batch_load(
+            [good, broken, tmp_path / "missing.json"], executor=executor, max_workers=2
+        ))
+        
+        assert [result.success for result in results] == [True, False, False]
+        assert results[0] == BatchResult(str(good), True, {"ok": True})
+        assert "SerializationError" in results[1].error
+        assert results[2].error.startswith("FileNotFoundError")
+    
+    def test_save_errors_are_captured(self, tmp_path):
+        """Test unserializable data fails only its own file."""
+        data = {str(tmp_path / "a.json"): {"a": 1}, str(tmp_path / "b.json"): {"b": object()}}
+        
+        assert JsonSerializer().batch_save(data, executor="thread") == {
+            str(tmp_path / "a.json"): True,
+            str(tmp_path / "b.json"): False,
+        }
+        assert not (tmp_path / "b.json").exists()
+    
+    def test_invalid_arguments_raise_immediately(self):
+        """Test bad executor/worker/chunk settings fail before any work."""
+        serializer = JsonSerializer()
+        
+        with pytest.raises(ValueError, match="Unknown batch executor"):
+            serializer.iter_batch_load(["a.json"], executor="gpu")
+        with pytest.raises(ValueError, match="max_workers"):
+            serializer.iter_batch_load(["a.json"], max_workers=0)
+        with pytest.raises(ValueError, match="chunksize"):
+            serializer.iter_batch_save({"a.json": 1}, chunksize=0)
+
+
+@pytest.mark.xsystem_unit
+class TestExecutorSelection:
+    """Test how "auto" picks an executor."""
+    
+    def test_cpu_bound_formats_use_processes_for_large_batches(self):
+        """Test YAML batches go to processes once they are large enough."""
+        paths = [f"f{i}.yaml" for i in range(AUTO_PROCESS_MIN_FILES)]
+        
+        assert resolve_executor(YamlSerializer(), paths, "auto") == "process"
+        assert resolve_executor(YamlSerializer(), paths[:10], "auto") == "thread"
+    
+    def test_io_bound_formats_use_threads(self):
+        """Test JSON batches stay on threads; single files run serially."""
+        paths = [f"f{i}.json" for i in range(AUTO_PROCESS_MIN_FILES)]
+        
+        assert resolve_executor(JsonSerializer(), paths, "auto") == "thread"
+        assert resolve_executor(JsonSerializer(), paths[:1], "auto") == "serial"
+        assert resolve_executor(JsonSerializer(), paths, "process") == "process"
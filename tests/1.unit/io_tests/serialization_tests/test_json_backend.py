@@ -0,0 +1,219 @@
+"""
+Unit tests for io.serialization.utils.json_backend module
+
+Tests backend selection, option normalization and stdlib fallback of the
+pluggable JSON backends used by JSON, JSON Lines and XModel.
+Following GUIDELINES_TEST.md structure and eXonware testing standards.
+
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+"""
+
+import json
+import math
+import pytest
+from datetime import datetime
+from exonware.xwsystem.config.performance import PerformanceConfig, get_performance_config
+from exonware.xwsystem.io.errors import SerializationError
+from exonware.xwsystem.io.serialization import JsonLinesSerializer, JsonSerializer
+from exonware.xwsystem.io.serialization.utils import json_backend
+from exonware.xwsystem.io.serialization.utils.json_backend import (
+    AVAILABLE_JSON_BACKENDS,
+    JsonBackend,
+    get_json_backend,
+)
+from exonware.xwsystem.validation.declarative import XModel
+
+DOCUMENT = {"name": "náme", "path": "a/b", "items": [1, 2.5, None, True], "nested": {"z": [], "a": {}}}
+
+
+class Person(XModel):
+    name: str
+    age: int = 0
+
+
+class Event(XModel):
+    name: str
+    at: datetime
+
+
+@pytest.fixture(params=AVAILABLE_JSON_BACKENDS)
+def backend(request):
+    return get_json_backend(request.param)
+
+
+@pytest.mark.xsystem_unit
+class TestJsonBackends:
+    """Test every installed backend behaves like the stdlib."""
+    
+    @pytest.mark.parametrize("options", [{}, {"indent": 2}, {"indent": 4}, {"sort_keys": True}, {"ensure_ascii": True}])
+    def test_round_trip(self, backend, options):
+        """Test encoded text decodes back to the same value."""
+        assert backend.loads(backend.dumps(DOCUMENT, **options)) == DOCUMENT
+        assert backend.loads(backend.dumps_bytes(DOCUMENT, **options)) == DOCUMENT
+    
+    @pytest.mark.parametrize("indent", [2, 4, "\t"])
+    def test_indented_output_matches_stdlib(self, backend, indent):
+        """Test indented output is byte-identical to json.dumps."""
+        expected = json.dumps(DOCUMENT, indent=indent, sort_keys=True, ensure_ascii=False)
+        
+        assert backend.dumps(DOCUMENT, indent=indent, sort_keys=True) == expected
+    
+    @pytest.mark.parametrize("options", [{}, {"sort_keys": True}, {"ensure_ascii": True}])
+    def test_unindented_output_matches_stdlib(self, backend, options):
+        """Test single-line output keeps the stdlib's ", " / ": " separators."""
+        expected = json.dumps(DOCUMENT, **dict({"ensure_ascii": False}, **options))
+        
+        assert backend.dumps(DOCUMENT, **options) == expected
+        assert backend.dumps_bytes(DOCUMENT, **options) == expected.encode("utf-8")
+    
+    @pytest.mark.parametrize("value", [
+        {"x": float("nan"), "y": [float("inf"), -float("inf")], "z": None},
+        {"when": datetime(2026, 10, 17, 12, 30), "raw": b"\x00\xff"},
+    ], ids=["non-finite", "default-hook"])
+    def test_output_matches_stdlib(self, backend, value):
+        """Test NaN/Infinity and default-hook values are written as json.dumps writes them."""
+        for options in ({}, {"indent": 2}):
+            expected = json.dumps(value, default=str, ensure_ascii=False, **options)
+            
+            assert backend.dumps(value, default=str, **options) == expected
+    
+    def test_exponent_floats_round_trip(self, backend):
+        """Test floats in exponent form decode to the same value (their text may differ)."""
+        value = [1e16, 1e-7, 1e-5, 1.5e300, -2.5e-12]
+        
+        assert backend.loads(backend.dumps(value)) == value
+        assert json.loads(backend.dumps(value, indent=2)) == value
+    
+    def test_default_hook(self, backend):
+        """Test the default hook converts unsupported values."""
+        assert backend.loads(backend.dumps({"v": complex(1, 2)}, default=str)) == {"v": "(1+2j)"}
+    
+    def test_values_outside_library_range_fall_back(self, backend):
+        """Test big integers and NaN literals still round trip."""
+        assert backend.loads(backend.dumps({"big": 2 ** 80})) == {"big": 2 ** 80}
+        assert backend.loads("[NaN]")[0] != backend.loads("[NaN]")[0]
+    
+    def test_errors_are_stdlib_errors(self, backend):
+        """Test failures surface as the stdlib's TypeError/ValueError."""
+        cycle = []
+        cycle.append(cycle)
+        
+        with pytest.raises(json.JSONDecodeError):
+            backend.loads('{"a": ')
+        with pytest.raises(TypeError):
+            backend.dumps({"v": object()})
+        with pytest.raises(ValueError):
+            backend.dumps(cycle)
+
+
+@pytest.mark.xsystem_unit
+class TestJsonBackendSelection:
+    """Test auto-selection and configuration overrides."""
+    
+    def test_auto_prefers_fastest_available(self):
+        """Test auto resolves to the first installed library."""
+        assert get_json_backend("auto").name == AVAILABLE_JSON_BACKENDS[0]
+        assert AVAILABLE_JSON_BACKENDS[-1] == "json"
+    
+    def test_unknown_backend_raises(self):
+        """Test unknown names are rejected."""
+        with pytest.raises(ValueError, match="Unknown JSON backend"):
+            get_json_backend("simdjson")
+    
+    def test_missing_library_falls_back_to_stdlib(self, monkeypatch):
+        """Test a configured but uninstalled library resolves to stdlib json."""
+        monkeypatch.setattr(json_backend, "AVAILABLE_JSON_BACKENDS", ("json",))
+        monkeypatch.setattr(json_backend, "_instances", {})
+        
+        assert type(get_json_backend("orjson")) is JsonBackend
+    
+    def test_environment_override(self, monkeypatch):
+        """Test XSYSTEM_JSON_BACKEND sets serialization.json_backend."""
+        monkeypatch.setenv("XSYSTEM_JSON_BACKEND", "JSON")
+        
+        config = PerformanceConfig()
+        
+        assert config.limits.serialization.json_backend == "json"
+        assert config.get_serialization_config()["json_backend"] == "json"
+    
+    def test_configured_backend_is_used(self):
+        """Test get_json_backend() follows PerformanceConfig at call time."""
+        limits = get_performance_config().limits.serialization
+        previous = limits.json_backend
+        try:
+            limits.json_backend = "json"
+            assert JsonSerializer().encode({"a": 1}) == '{"a": 1}'
+            assert get_json_backend().name == "json"
+        finally:
+            limits.json_backend = previous
+
+
+@pytest.mark.xsystem_unit
+class TestSerializersUseBackend:
+    """Test JSON, JSON Lines and XModel go through the backend."""
+    
+    @pytest.mark.parametrize("options", [{}, {"indent": 2}, {"sort_keys": True}])
+    def test_json_iter_encode_matches_encode(self, backend, options):
+        """Test incremental pieces join to encode() for every backend."""
+        serializer = JsonSerializer()
+        options = dict(options, backend=backend.name)
+        records = [dict(DOCUMENT, id=i) for i in range(2500)]
+        
+        assert "".join(serializer.iter_encode(records, options=options)) == serializer.encode(records, options=options)
+        assert serializer.decode(serializer.encode(records, options=options).encode("utf-8"), options=options) == records
+    
+    def test_json_keeps_nan(self):
+        """Test NaN is written as NaN and read back, not turned into null."""
+        serializer = JsonSerializer()
+        
+        encoded = serializer.encode({"x": float("nan")})
+        
+        assert encoded == '{"x": NaN}'
+        assert math.isnan(serializer.decode(encoded)["x"])
+    
+    def test_json_decode_hooks_use_stdlib(self):
+        """Test decode hooks are still honoured."""
+        data = JsonSerializer().decode('{"x": 1.5}', options={"parse_float": str})
+        
+        assert data == {"x": "1.5"}
+    
+    def test_json_unknown_backend_raises_serialization_error(self):
+        """Test a bad backend option is reported as a SerializationError."""
+        with pytest.raises(SerializationError):
+            JsonSerializer().encode({"a": 1}, options={"backend": "nope"})
+    
+    def test_jsonl_round_trip(self, backend):
+        """Test JSON Lines encodes one backend line per record."""
+        serializer = JsonLinesSerializer()
+        records = [DOCUMENT, {"id": 2}]
+        
+        encoded = serializer.encode(records, options={"backend": backend.name})
+        
+        assert encoded.split("\n")[1] == backend.dumps({"id": 2})
+        assert serializer.decode(encoded, options={"backend": backend.name}) == records
+    
+    def test_xmodel_json_round_trip(self):
+        """Test XModel dumps and validates through the configured backend."""
+        person = Person(name="Ada", age=36)
+        
+        dumped = person.model_dump_json()
+        
+        assert dumped == get_json_backend().dumps({"name": "Ada", "age": 36})
+        assert Person.model_validate_json(dumped.encode("utf-8")).model_dump() == {"name": "Ada", "age": 36}
+    
+    def test_xmodel_json_matches_stdlib(self):
+        """Test model_dump_json still formats datetimes with its default=str hook."""
+        event = Event(name="launch", at=datetime(2026, 10, 17, 12, 30))
+        
+        assert event.model_dump_json() == json.dumps(event.model_dump(), default=str)
+    
+    @pytest.mark.parametrize("name", ["launch", "\u00e9\U0001f600"], ids=["ascii", "non-ascii"])
+    def test_xmodel_json_matches_stdlib_for_any_backend(self, backend, name, monkeypatch):
+        """Test every backend reproduces the stdlib text, escaping non-ASCII and str()-ing other values."""
+        monkeypatch.setattr(get_performance_config().limits.serialization, "json_backend", backend.name)
+        event = Event(name=name, at=datetime(2026, 10, 17, 12, 30))
+        event.extra = {"when": [datetime(2026, 1, 1)], "path": (1, 2.5, None)}
+        
+        assert event.model_dump_json() == json.dumps(event.model_dump(), default=str)
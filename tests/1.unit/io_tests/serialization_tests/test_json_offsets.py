@@ -0,0 +1,162 @@
+"""
+Unit tests for io.serialization.utils.json_offsets module
+
+Tests byte-offset JSON Pointer reads, spliced updates and the sidecar
+offset index used by JsonSerializer.atomic_read_path/atomic_update_path.
+Following GUIDELINES_TEST.md structure and eXonware testing standards.
+
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+"""
+
+import copy
+import json
+import os
+import pytest
+from exonware.xwsystem.io.serialization import JsonSerializer
+from exonware.xwsystem.io.serialization.utils.json_offsets import (
+    JsonOffsetIndex,
+    locate_json_pointer,
+    split_json_pointer,
+)
+
+DOCUMENT = {
+    "meta": {"note": "quote \" brace } bracket ] {", "a/b~c": 1, "ключ": [1, 2]},
+    "users": [{"id": i, "name": f"user{i}", "tags": ["x", "y"]} for i in range(500)],
+    "empty": {},
+    "list": [],
+    "flag": True,
+}
+
+
+def _resolve(document, pointer):
+    value = document
+    for token in split_json_pointer(pointer):
+        value = value[int(token)] if isinstance(value, list) else value[token]
+    return value
+
+
+@pytest.fixture(params=[None, 2], ids=["compact", "indented"])
+def json_file(request, tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps(DOCUMENT, indent=request.param, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+@pytest.mark.xsystem_unit
+class TestJsonOffsets:
+    """Test pointer resolution over raw bytes."""
+    
+    @pytest.mark.parametrize("pointer", [
+        "", "/meta/note", "/meta/a~1b~0c", "/meta/ключ/1", "/users/499/tags/1", "/empty", "/list", "/flag",
+    ])
+    def test_read_matches_full_load(self, json_file, pointer):
+        """Test partial reads return the same value as a full load."""
+        assert JsonSerializer().atomic_read_path(json_file, pointer) == _resolve(DOCUMENT, pointer)
+    
+    @pytest.mark.parametrize("pointer", ["/missing", "/users/500", "/users/01", "/users/name", "/flag/0", "meta"])
+    def test_missing_pointer_raises_key_error(self, json_file, pointer):
+        """Test unresolvable pointers raise KeyError."""
+        with pytest.raises(KeyError):
+            JsonSerializer().atomic_read_path(json_file, pointer)
+    
+    def test_span_is_exact_value_bytes(self):
+        """Test located spans cover exactly the value text."""
+        raw = b'{"a": [1, {"b": "}"}], "c": 2}'
+        
+        start, end = locate_json_pointer(raw, "/a/1")
+        
+        assert raw[start:end] == b'{"b": "}"}'
+
+
+@pytest.mark.xsystem_unit
+class TestJsonSplicedUpdates:
+    """Test atomic_update_path splicing without a full-file load."""
+    
+    @pytest.mark.parametrize("pointer, value", [
+        ("/meta/note", "replaced"),
+        ("/users/3", {"id": -1}),
+        ("/meta/new", [1, 2]),
+        ("/empty/first", None),
+        ("/list/-", "appended"),
+        ("/users/-", {"id": 500}),
+    ])
+    def test_update_matches_json_pointer_semantics(self, json_file, pointer, value):
+        """Test replacements and insertions produce the expected document."""
+        expected = copy.deepcopy(DOCUMENT)
+        parent = _resolve(expected, "/" + "/".join(pointer.split("/")[1:-1]))
+        token = pointer.rsplit("/", 1)[1]
+        if token == "-":
+            parent.append(value)
+        elif isinstance(parent, list):
+            parent[int(token)] = value
+        else:
+            parent[token] = value
+        
+        JsonSerializer().atomic_update_path(json_file, pointer, value, backup=False)
+        
+        assert json.loads(json_file.read_text(encoding="utf-8")) == expected
+        assert os.listdir(json_file.parent) == ["data.json"]
+    
+    def test_backup_is_kept(self, json_file):
+        """Test backup=True (the default) leaves the previous file as a backup."""
+        before = json_file.read_bytes()
+        
+        JsonSerializer().atomic_update_path(json_file, "/flag", False)
+        
+        backups = list(json_file.parent.glob("data.json.backup.*"))
+        assert len(backups) == 1
+        assert backups[0].read_bytes() == before
+    
+    def test_update_preserves_other_bytes(self, tmp_path):
+        """Test formatting outside the replaced value is kept byte for byte."""
+        path = tmp_path / "config.json"
+        path.write_text('{\n    "host":   "old",\n    "port": 80\n}\n', encoding="utf-8")
+        
+        JsonSerializer().atomic_update_path(path, "/host", "new")
+        
+        assert path.read_text(encoding="utf-8") == '{\n    "host":   "new",\n    "port": 80\n}\n'
+    
+    def test_missing_parent_raises_key_error(self, json_file):
+        """Test updates below a missing container are rejected untouched."""
+        before = json_file.read_bytes()
+        
+        with pytest.raises(KeyError):
+            JsonSerializer().atomic_update_path(json_file, "/nope/child", 1)
+        
+        assert json_file.read_bytes() == before
+
+
+@pytest.mark.xsystem_unit
+class TestJsonOffsetIndex:
+    """Test the sidecar offset index."""
+    
+    def test_index_is_written_and_reused(self, json_file):
+        """Test repeated lookups are served from the sidecar."""
+        serializer = JsonSerializer()
+        
+        assert serializer.atomic_read_path(json_file, "/users/250/name", offset_index=True) == "user250"
+        
+        index = JsonOffsetIndex.for_file(json_file)
+        assert index.lookup(["users", "250", "name"]) is not None
+        assert index.nearest(["users", "250", "id"])[0] == 2
+    
+    def test_index_follows_spliced_updates(self, json_file):
+        """Test offsets are shifted by updates made through the index."""
+        serializer = JsonSerializer()
+        serializer.atomic_read_path(json_file, "/users/400/name", offset_index=True)
+        
+        serializer.atomic_update_path(json_file, "/meta/note", "a much longer note than before", offset_index=True)
+        
+        assert serializer.atomic_read_path(json_file, "/users/400/name", offset_index=True) == "user400"
+        assert serializer.atomic_read_path(json_file, "/meta/note", offset_index=True) == "a much longer note than before"
+    
+    def test_stale_index_is_discarded(self, json_file):
+        """Test an index is reset when the file changes behind its back."""
+        serializer = JsonSerializer()
+        serializer.atomic_read_path(json_file, "/flag", offset_index=True)
+        
+        json_file.write_text(json.dumps({"pad": "x" * 100, "flag": False}), encoding="utf-8")
+        
+        assert serializer.atomic_read_path(json_file, "/flag", offset_index=True) is False
@@ -0,0 +1,137 @@
+"""
+Unit tests for io.serialization.utils.json_stream module
+
+Tests the incremental JSON parser and its JsonSerializer wiring.
+Following GUIDELINES_TEST.md structure and eXonware testing standards.
+
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+"""
+
+import asyncio
+import json
+import pytest
+from exonware.xwsystem.io.serialization import JsonSerializer, SerializationError
+from exonware.xwsystem.io.serialization.utils.json_stream import (
+    JsonStreamParser,
+    iter_json_events,
+    iter_json_items,
+    parse_item_prefix,
+    WILDCARD,
+)
+
+DOCUMENT = {
+    "meta": {"count": 3, "note": "quote \" brace { bracket ] back \\", "nested": [1, [2, {"x": "]"}]]},
+    "records": [
+        {"id": i, "name": f"náme{i}", "values": [i * 1.5, None, True, -1e5]}
+        for i in range(50)
+    ],
+    "tail": "end",
+}
+
+
+def _chunks(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.xsystem_unit
+class TestJsonStreamParser:
+    """Test item extraction, events and error reporting."""
+    
+    @pytest.mark.parametrize("size", [1, 3, 7, 64, 1 << 20])
+    def test_items_at_prefix_any_chunking(self, size):
+        """Test items match json.loads regardless of chunk boundaries."""
+        chunks = _chunks(json.dumps(DOCUMENT, ensure_ascii=False).encode("utf-8"), size)
+        
+        assert list(iter_json_items(chunks, "$.records[*]")) == DOCUMENT["records"]
+        assert list(iter_json_items(chunks, "$.meta.nested[1][1].x")) == ["]"]
+        assert list(iter_json_items(chunks, "$.meta.*")) == list(DOCUMENT["meta"].values())
+        assert list(iter_json_items(chunks, "$.tail")) == ["end"]
+        assert list(iter_json_items(chunks)) == [DOCUMENT]
+    
+    def test_default_prefix_streams_root_array(self):
+        """Test a root array is streamed element by element."""
+        assert list(iter_json_items(['[1, "a", ', '{"b": [2]}, nu', 'll, 1.', '5e1]'])) == [1, "a", {"b": [2]}, None, 15.0]
+        assert list(iter_json_items(["4", "2"])) == [42]
+    
+    def test_item_paths(self):
+        """Test with_path reports the concrete path of every item."""
+        items = list(iter_json_items(['{"a": [{"b": 1}, {"b": 2}]}'], "$.a[*].b", with_path=True))
+        assert items == [(("a", 0, "b"), 1), (("a", 1, "b"), 2)]
+        assert parse_item_prefix("$['x y'][3].*") == ("x y", 3, WILDCARD)
+        with pytest.raises(ValueError):
+            parse_item_prefix("records[*]")
+    
+    def test_events(self):
+        """Test tokenizer events, with captured values as single item events."""
+        events = list(iter_json_events(_chunks('{"a": [1, {"b": null}], "c": "d"}', 2)))
+        assert events == [
+            ((), "start_map", None),
+            ((), "map_key", "a"),
+            (("a",), "start_array", None),
+            (("a", 0), "value", 1),
+            (("a", 1), "start_map", None),
+            (("a", 1), "map_key", "b"),
+            (("a", 1, "b"), "value", None),
+            (("a", 1), "end_map", None),
+            (("a",), "end_array", None),
+            ((), "map_key", "c"),
+            (("c",), "value", "d"),
+            ((), "end_map", None),
+        ]
+        items = [event for event in iter_json_events(['{"a": [1, {"b": null}]}'], "$.a[*]") if event[1] == "item"]
+        assert items == [(("a", 0), "item", 1), (("a", 1), "item", {"b": None})]
+    
+    @pytest.mark.parametrize("text", [
+        "[1,]", '{"a" 1}', "[1 2]", '{"a": 1', "[tru]", '{"a": 1}x', "", '{"a": 1,}', '[{"a" 1}]',
+    ])
+    def test_invalid_json_raises(self, text):
+        """Test malformed or truncated documents raise SerializationError."""
+        with pytest.raises(SerializationError):
+            list(iter_json_items([text]))
+    
+    def test_memory_bounded_by_item(self):
+        """Test the buffer never holds more than one item plus one chunk."""
+        data = json.dumps({"records": [{"id": i, "pad": "x" * 100} for i in range(2000)]}).encode()
+        parser = JsonStreamParser("$.records[*]")
+        largest = 0
+        count = 0
+        for chunk in _chunks(data, 1024):
+            count += len(parser.feed(chunk))
+            largest = max(largest, len(parser._buffer) - parser._pos + sum(map(len, parser._parts)))
+        count += len(parser.close())
+        
+        assert count == 2000
+        assert largest < 1024 + 200
+        assert parser.offset == len(data)
+
+
+@pytest.mark.xsystem_unit
+class TestJsonStreamingIntegration:
+    """Test JsonSerializer uses the incremental parser."""
+    
+    def test_serializer_iter_deserialize(self, tmp_path):
+        """Test iter_deserialize over chunks and file objects."""
+        serializer = JsonSerializer()
+        assert serializer.supports_streaming
+        chunks = list(serializer.iter_serialize(DOCUMENT["records"], chunk_size=100))
+        assert list(serializer.iter_deserialize(chunks)) == DOCUMENT["records"]
+        
+        path = tmp_path / "doc.json"
+        path.write_text(json.dumps(DOCUMENT), encoding="utf-8")
+        with open(path, "rb") as f:
+            assert list(serializer.iter_deserialize(f, prefix="$.records[*].id")) == list(range(50))
+    
+    def test_stream_deserialize_async(self):
+        """Test the async stream yields items as chunks arrive."""
+        serializer = JsonSerializer()
+        
+        async def source():
+            for chunk in _chunks(json.dumps(DOCUMENT).encode(), 32):
+                yield chunk
+        
+        async def collect():
+            return [item async for item in serializer.stream_deserialize(source(), prefix="$.records[*]")]
+        
+        assert asyncio.run(collect()) == DOCUMENT["records"]
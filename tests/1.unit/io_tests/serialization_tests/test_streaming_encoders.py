@@ -0,0 +1,144 @@
+"""
+Unit tests for incremental encoding (iter_encode) and streamed save_file
+
+Tests that streaming encoders match encode(), accept generators as
+top-level arrays, and that save_file stays atomic while streaming.
+Following GUIDELINES_TEST.md structure and eXonware testing standards.
+
+Company: eXonware.com
+Author: Eng. Muhammad AlShehri
+Email: connect@exonware.com
+"""
+
+import json
+import os
+import pytest
+from exonware.xwsystem.io.errors import SerializationError
+from exonware.xwsystem.io.serialization import (
+    CsvSerializer,
+    JsonLinesSerializer,
+    JsonSerializer,
+    XmlSerializer,
+    YamlSerializer,
+)
+
+RECORDS = [{"id": i, "name": f"náme{i}", "tags": ["a", "b"]} for i in range(2500)]
+MAPPING = {f"key{i:05d}": {"value": i, "ok": i % 2 == 0} for i in range(2100)}
+
+
+def _failing_records(count):
+    for i in range(count):
+        yield {"id": i}
+    raise RuntimeError("source failed")
+
+
+@pytest.mark.xsystem_unit
+class TestIterEncode:
+    """Test that joined iter_encode() pieces equal encode()."""
+    
+    @pytest.mark.parametrize("options", [None, {"indent": 2}, {"pretty": True, "sort_keys": True}, {"indent": "\t"}])
+    @pytest.mark.parametrize("value", [RECORDS, MAPPING, [], {}, [1], {"a": None}, (1, 2), 42, "text"])
+    def test_json_matches_encode(self, value, options):
+        """Test JSON pieces match json.dumps for every container shape."""
+        serializer = JsonSerializer()
+        assert "".join(serializer.iter_encode(value, options=options)) == serializer.encode(value, options=options)
+    
+    @pytest.mark.parametrize("serializer, options", [
+        (JsonSerializer(), {"indent": 2}),
+        (JsonLinesSerializer(), None),
+        (CsvSerializer(), {"delimiter": ";"}),
+        (XmlSerializer(), {"root": "records"}),
+        (YamlSerializer(), None),
+    ])
+    def test_generator_is_top_level_array(self, serializer, options):
+        """Test generators encode exactly like the equivalent list."""
+        rows = [{"id": i, "name": f"n{i}"} for i in range(2500)]
+        
+        streamed = "".join(serializer.iter_encode((row for row in rows), options=options))
+        
+        assert streamed == serializer.encode(rows, options=options)
+    
+    @pytest.mark.parametrize("serializer", [XmlSerializer(), YamlSerializer()])
+    @pytest.mark.parametrize("options", [None, {"sort_keys": True}, {"attr_type": True}])
+    def test_mapping_matches_encode(self, serializer, options):
+        """Test XML/YAML mappings are split into batches without changing output."""
+        assert "".join(serializer.iter_encode(MAPPING, options=options)) == serializer.encode(MAPPING, options=options)
+    
+    def test_pieces_are_bounded(self):
+        """Test no piece holds the whole document."""
+        pieces = list(JsonSerializer().iter_encode(iter(RECORDS)))
+        
+        assert len(pieces) > 3
+        assert max(len(piece) for piece in pieces) < len(json.dumps(RECORDS)) / 2
+    
+    def test_iter_serialize_rechunks(self):
+        """Test iter_serialize yields exact chunk sizes from incremental pieces."""
+        expected = JsonSerializer().encode(RECORDS)
+        chunks = list(JsonSerializer().iter_serialize(iter(RECORDS), chunk_size=1000))
+        
+        assert "".join(chunks) == expected
+        assert all(len(chunk) == 1000 for chunk in chunks[:-1])
+    
+    def test_supports_incremental_streaming(self):
+        """Test streaming formats report incremental support."""
+        for serializer in (JsonSerializer(), JsonLinesSerializer(), CsvSerializer(), XmlSerializer(), YamlSerializer()):
+            assert serializer.supports_incremental_streaming is True
+
+
+@pytest.mark.xsystem_unit
+class TestStreamingSaveFile:
+    """Test save_file streaming through AtomicFileWriter."""
+    
+    def test_save_generator_round_trip(self, tmp_path):
+        """Test a generator is saved as a JSON array and loads back."""
+        path = tmp_path / "records.json"
+        
+        JsonSerializer().save_file((row for row in RECORDS), path, write_buffer_size=4096)
+        
+        assert JsonSerializer().load_file(path) == RECORDS
+    
+    def test_save_jsonl_generator(self, tmp_path):
+        """Test JSON Lines saves one line per generated item."""
+        path = tmp_path / "records.jsonl"
+        
+        JsonLinesSerializer().save_file((row for row in RECORDS), path)
+        
+        assert JsonLinesSerializer().load_file(path) == RECORDS
+    
+    def test_failure_mid_stream_keeps_existing_file(self, tmp_path):
+        """Test a failing source leaves the previous file and no temp files."""
+        path = tmp_path / "records.json"
+        JsonSerializer().save_file({"version": 1}, path)
+        
+        with pytest.raises(SerializationError, match="source failed"):
+            JsonSerializer().save_file(_failing_records(5000), path)
+        
+        assert JsonSerializer().load_file(path) == {"version": 1}
+        assert os.listdir(tmp_path) == ["records.json"]
+    
+    def test_new_file_is_not_owner_only(self, tmp_path):
+        """Test streamed files get regular permissions, not mkstemp's 0600."""
+        path = tmp_path / "records.json"
+        
+        JsonSerializer().save_file([1, 2, 3], path)
+        
+        if os.name != "nt":
+            umask = os.umask(0)
+            os.umask(umask)
+            assert path.stat().st_mode & 0o777 == 0o666 & ~umask
+    
+    def test_save_streams_through_write_chunks(self, tmp_path, monkeypatch):
+        """Test save_file hands the encoder's pieces to AtomicFileWriter.write_chunks."""
+        from exonware.xwsystem.io.common.atomic import AtomicFileWriter
+        counts = []
+        write_chunks = AtomicFileWriter.write_chunks
+        monkeypatch.setattr(
+            AtomicFileWriter, "write_chunks",
+            lambda self, chunks: counts.append(write_chunks(self, chunks)) or counts[-1]
+        )
+        path = tmp_path / "records.json"
+        
+        JsonSerializer().save_file(RECORDS, path)
+        
+        assert len(counts) == 1 and counts[0] > 1
+        assert json.loads(path.read_text(encoding="utf-8")) == RECORDS
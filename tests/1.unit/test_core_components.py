@@ -106,6 +106,24 @@ class TestAtomicFileWriter:
             
             assert target_file.exists()
             assert target_file.read_text() == original_content
+    
+    def test_commit_backup_is_kept_unless_dropped(self):
+        """Test commit keeps the backup by default and removes it on request."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            target_file = Path(temp_dir) / "test.txt"
+            target_file.write_text("v1")
+            
+            for keep_backup, expected in ((True, 1), (False, 0)):
+                writer = AtomicFileWriter(target_path=str(target_file), mode="w", backup=True)
+                writer.start().write("v2")
+                writer.commit(keep_backup=keep_backup)
+                
+                backups = list(Path(temp_dir).glob("test.txt.backup.*"))
+                assert len(backups) == expected
+                for backup in backups:
+                    backup.unlink()
+            
+            assert target_file.read_text() == "v2"
 
 
 @pytest.mark.xwsystem_unit
@@ -290,6 +290,30 @@ class TestProcessPool:
             stats = pool.get_stats()
             assert stats['tasks_submitted'] == 2
             assert stats['max_workers'] == 2
+    
+    def test_imap_chunks_and_order(self):
+        """Test imap submits chunks and streams results ordered or as completed."""
+        with ProcessPool(max_workers=2) as pool:
+            assert list(pool.imap(_fabric_identity, range(25), chunksize=4)) == list(range(25))
+            assert sorted(pool.imap(_fabric_identity, range(25), chunksize=4, ordered=False)) == list(range(25))
+            assert pool.map(_fabric_identity, ["a", "b"]) == ["a", "b"]
+            assert pool.get_stats()['tasks_submitted'] == 7 + 7 + 2
+    
+    def test_imap_reads_iterable_as_consumed(self):
+        """Test imap keeps only a bounded window of chunks in flight."""
+        consumed = []
+        
+        def items():
+            for i in range(100):
+                consumed.append(i)
+                yield i
+        
+        with ProcessPool(max_workers=1) as pool:
+            results = pool.imap(_fabric_identity, items(), chunksize=5)
+            assert next(results) == 0
+            assert len(consumed) <= 3 * 5
+            assert list(results) == list(range(1, 100))
+            assert len(consumed) == 100
 
 
 class TestAsyncProcessPool: